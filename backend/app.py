@@ -1,6 +1,5 @@
 """Flask application factory, runtime bootstrap, and request lifecycle wiring."""
 
-from contextlib import contextmanager
 import logging
 import os
 import re
@@ -18,7 +17,7 @@ except ImportError:  # pragma: no cover - optional dependency
     _talisman_available = False
 from jinja2 import ChoiceLoader, FileSystemLoader
 from jinja2.bccache import FileSystemBytecodeCache
-from sqlalchemy import event, exists, func, or_
+from sqlalchemy import event, func
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import with_loader_criteria
 
@@ -31,6 +30,11 @@ from core.shared.utils.assets import static_url
 from shared.error_handlers import register_error_handlers
 from shared.app_cli import register_cli_commands
 from shared.app_runtime import configure_request_logging, extend_csp_for_static_assets
+from shared.cache.visibility_cache import (
+    VISIBILITY_SKIP_SESSION_FLAG,
+    visible_folder_ids,
+    without_visibility_filters,
+)
 
 # Scryfall helpers
 from core.domains.cards.services import scryfall_cache as sc
@@ -79,20 +83,8 @@ def _warn_if_weak_secret_key(app: Flask) -> None:
 
 
 _visibility_filters_registered = False
-_VISIBILITY_SKIP_SESSION_FLAG = "_skip_visibility_filters"
-
-@contextmanager
-def _without_visibility_filters():
-    """Temporarily disable per-request visibility hooks for auth loader queries."""
-    depth = int(db.session.info.get(_VISIBILITY_SKIP_SESSION_FLAG, 0) or 0)
-    db.session.info[_VISIBILITY_SKIP_SESSION_FLAG] = depth + 1
-    try:
-        yield
-    finally:
-        if depth > 0:
-            db.session.info[_VISIBILITY_SKIP_SESSION_FLAG] = depth
-        else:
-            db.session.info.pop(_VISIBILITY_SKIP_SESSION_FLAG, None)
+_VISIBILITY_SKIP_SESSION_FLAG = VISIBILITY_SKIP_SESSION_FLAG
+_without_visibility_filters = without_visibility_filters
 
 
 def _register_visibility_filters(card_model, folder_model) -> None:
@@ -125,38 +117,19 @@ def _register_visibility_filters(card_model, folder_model) -> None:
         if user_id_int <= 0:
             return
 
-        from models import FolderShare, UserFriend  # local import to avoid early import issues
-
-        share_exists = (
-            exists()
-            .where((FolderShare.folder_id == folder_model.id) & (FolderShare.shared_user_id == user_id_int))
-            .correlate(folder_model)
-        )
-        friend_exists = (
-            exists()
-            .where(
-                (UserFriend.user_id == user_id_int)
-                & (UserFriend.friend_user_id == folder_model.owner_user_id)
-            )
-            .correlate(folder_model)
-        )
-        scope_clause = or_(
-            folder_model.owner_user_id == user_id_int,
-            folder_model.owner_user_id.is_(None),
-            folder_model.is_public.is_(True),
-            share_exists,
-            friend_exists,
-        )
+        # One indexed IN over a precomputed (cached) id set instead of correlated
+        # share/friend EXISTS per row; plain ids also keep the statement cacheable.
+        visible_ids = tuple(visible_folder_ids(user_id_int))
 
         execute_state.statement = execute_state.statement.options(
             with_loader_criteria(
                 folder_model,
-                lambda cls: scope_clause,
+                lambda cls: cls.id.in_(visible_ids),
                 include_aliases=True,
             ),
             with_loader_criteria(
                 card_model,
-                lambda cls: cls.folder.has(scope_clause),
+                lambda cls: cls.folder_id.in_(visible_ids),
                 include_aliases=True,
             ),
         )
@@ -387,8 +360,11 @@ def create_app():
         "api_docs.openapi_spec",
         "observability.metrics",
         "observability.stats",
+        "observability.queries",
+        "observability.prometheus",
         "observability.health",
         "static",
+        "views.card_image_file",
     }
 
     @app.before_request
@@ -498,21 +474,27 @@ def create_app():
 
     fallback = _fallback_enabled()
 
-    # Warm caches, create tables, ensure FTS
+    # Create tables, ensure FTS; in-memory caches load in the warmup below.
     with app.app_context():
         validate_sqlite_database(app)
-        try:
-            ensure_cache_loaded()
-        except Exception as e:
-            app.logger.warning("Scryfall cache not loaded at init: %s", e)
 
         # Import models after db is bound
         from models import Card, Folder, WishlistItem  # noqa: F401
+        from core.domains.cards.services.card_valuation_service import register_card_valuation_listeners
         from core.domains.decks.services.deck_service import register_deck_stats_listeners
+        from core.domains.games.services.game_metrics_rollup_service import register_game_metrics_listeners
+        from core.domains.games.services.game_public_dashboard_service import register_public_dashboard_listeners
         from shared.cache.request_cache import register_request_cache_listeners
+        from shared.cache.runtime_cache import register_collection_generation_listeners
+        from shared.cache.visibility_cache import register_visibility_cache_listeners
         _register_visibility_filters(Card, Folder)
+        register_visibility_cache_listeners()
         register_deck_stats_listeners()
+        register_card_valuation_listeners()
+        register_game_metrics_listeners()
+        register_public_dashboard_listeners()
         register_request_cache_listeners()
+        register_collection_generation_listeners()
         ensure_runtime_schema_fallbacks(app, fallback_enabled=fallback)
 
         # Ensure FTS5 virtual table + triggers exist (fixes the cards_fts error)
@@ -600,6 +582,10 @@ def create_app():
         resp.headers.setdefault("X-Frame-Options", "DENY")
         return resp
 
+    # Scryfall cache, rules, symbols and spellbook (see shared.warmup and /readyz).
+    from shared.warmup import start_warmup
+    start_warmup(app)
+
     return app
 
 
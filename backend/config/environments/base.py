@@ -88,6 +88,20 @@ class BaseConfig:
     }
     STATIC_ASSET_BASE_URL = os.getenv("STATIC_ASSET_BASE_URL")
     PUBLIC_GAME_DASHBOARD_OWNER_ID = os.getenv("PUBLIC_GAME_DASHBOARD_OWNER_ID")
+    PUBLIC_GAMES_PAGE_SIZE = int(os.getenv("PUBLIC_GAMES_PAGE_SIZE", 50))
+    # Per-request SQL statement stats (shared.database.query_stats).
+    QUERY_STATS_ENABLED = os.getenv("QUERY_STATS_ENABLED", "1").lower() in {"1", "true", "yes", "on"}
+    SERVER_TIMING_ENABLED = os.getenv("SERVER_TIMING_ENABLED", "1").lower() in {"1", "true", "yes", "on"}
+    QUERY_NPLUSONE_THRESHOLD = int(os.getenv("QUERY_NPLUSONE_THRESHOLD", 10))
+    QUERY_BUDGET_DEFAULT = int(os.getenv("QUERY_BUDGET_DEFAULT", 0))  # 0 disables the default budget
+    QUERY_BUDGETS = os.getenv("QUERY_BUDGETS", "")  # "endpoint=max,endpoint=max"
+    QUERY_BUDGET_STRICT = os.getenv("QUERY_BUDGET_STRICT", "0").lower() in {"1", "true", "yes", "on"}
+    # Shared directory for cross-worker latency histograms (shared.histograms); defaults to <instance>/metrics.
+    METRICS_DIR = os.getenv("METRICS_DIR")
+    # Startup warmup of in-memory caches (shared.warmup): manual, background or inline.
+    # gunicorn.conf.py selects the web server's mode; CLI and job processes stay manual.
+    STARTUP_WARMUP = os.getenv("STARTUP_WARMUP", "manual").strip().lower()
+    WARMUP_WAIT_SECONDS = float(os.getenv("WARMUP_WAIT_SECONDS", "2"))
 
     # Email (SMTP) — used for password reset
     APP_NAME = os.getenv("APP_NAME", "DragonsVault")
@@ -5,3 +5,7 @@ from .base import BaseConfig
 
 class TestingConfig(BaseConfig):
     TESTING = True
+    # Routes that exceed a configured QUERY_BUDGETS entry fail the test instead of logging.
+    QUERY_BUDGET_STRICT = True
+    # Tests expect caches to be loaded before the first request.
+    STARTUP_WARMUP = "inline"
@@ -35,6 +35,11 @@ class Card(db.Model):
             "lang",
             "is_foil",
         ),
+        db.Index(
+            "ix_cards_folder_unit_price",
+            "folder_id",
+            "unit_price",
+        ),
     )
 
     id = db.Column(db.Integer, primary_key=True)
@@ -74,6 +79,12 @@ class Card(db.Model):
     color_identity_mask = db.Column(db.Integer, nullable=True)
     layout = db.Column(db.String(32), nullable=True)
     faces_json = db.Column(db.JSON, nullable=True)
+
+    # Materialized valuation for the row's exact print and finish, refreshed in
+    # bulk by card_valuation_service whenever Scryfall/price-service data changes.
+    unit_price = db.Column(db.Float, nullable=True)
+    price_currency = db.Column(db.String(4), nullable=True)
+    price_updated_at = db.Column(db.DateTime, nullable=True)
     created_at = db.Column(db.DateTime, nullable=False, default=utcnow, index=True)
     updated_at = db.Column(db.DateTime, nullable=False, default=utcnow, onupdate=utcnow, index=True)
     archived_at = db.Column(db.DateTime, nullable=True, index=True)
@@ -13,6 +13,7 @@ def register_web_routes() -> None:
         return
     _web_routes_registered = True
 
+    from . import card_images  # noqa: F401
     from . import cards  # noqa: F401
     from . import card_detail  # noqa: F401
     from . import importer  # noqa: F401
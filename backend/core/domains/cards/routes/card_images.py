@@ -0,0 +1,22 @@
+"""Serve the local card image cache (nginx serves it directly in production)."""
+
+from __future__ import annotations
+
+from flask import send_from_directory
+
+from core.domains.cards.services.card_image_cache import URL_PREFIX, image_cache_root
+from core.routes.base import views
+
+_IMMUTABLE_MAX_AGE = 365 * 24 * 3600
+
+
+@views.get(f"{URL_PREFIX}/<path:filename>")
+def card_image_file(filename: str):
+    """Content-addressed image files never change, so cache them forever."""
+    response = send_from_directory(image_cache_root(), filename, max_age=_IMMUTABLE_MAX_AGE)
+    response.cache_control.public = True
+    response.cache_control.immutable = True
+    return response
+
+
+__all__ = ["card_image_file"]
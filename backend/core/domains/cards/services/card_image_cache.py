@@ -0,0 +1,362 @@
+"""Local, content-addressed cache of Scryfall card images.
+
+Pages normally point ``<img>`` tags at ``cards.scryfall.io``, so every cold
+page load goes to Scryfall and offline or self-hosted installs render blanks.
+:func:`sync_card_images` downloads the images that owned cards and decks
+actually reference into ``<data root>/card-images``::
+
+    originals/ab/<sha256>.jpg      Scryfall "normal" image, named by content
+    thumbs/<size>/<sha256>.webp    WebP thumbnail per template size (Pillow)
+    index.json                     Scryfall image key -> digest + thumbs
+
+:func:`localize_image_url` maps any Scryfall size URL of a cached image to a
+``/card-images/...`` path (served by nginx, with a Flask fallback) and leaves
+every other URL untouched, so callers can apply it unconditionally. The index
+is re-read at most every ``_INDEX_RECHECK_SECONDS``; the hot path is a regex
+match and a dict lookup.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+from flask import current_app
+
+from core.domains.cards.services import scryfall_runtime_service as runtime_service
+from shared.http_client import safe_get
+
+try:  # pragma: no cover - optional dependency
+    from PIL import Image
+except ImportError:  # pragma: no cover
+    Image = None  # type: ignore
+
+__all__ = [
+    "THUMBNAIL_WIDTHS",
+    "URL_PREFIX",
+    "image_cache_root",
+    "image_key",
+    "local_image_path",
+    "localize_image_url",
+    "referenced_image_urls",
+    "store_card_image",
+    "sync_card_images",
+]
+
+URL_PREFIX = "/card-images"
+# Widths of Scryfall's "small" and "normal" renditions, which is what the
+# templates lay out for.
+THUMBNAIL_WIDTHS = {"small": 146, "normal": 488}
+_WEBP_QUALITY = 82
+_INDEX_NAME = "index.json"
+_INDEX_RECHECK_SECONDS = 30.0
+_DEFAULT_SYNC_LIMIT = 2000
+_DEFAULT_CONCURRENCY = 4
+_DEFAULT_RATE_PER_SECOND = 8.0
+_HEADERS = {
+    "User-Agent": "DragonsVault-ImageCache/1.0 (+https://github.com/JBSmith29/DragonsVault.app)",
+    "Accept": "image/jpeg,image/*;q=0.8",
+}
+
+_SCRYFALL_IMAGE_RE = re.compile(
+    r"^https://cards\.scryfall\.io/(?P<size>small|normal|large|png)/(?P<face>front|back)/"
+    r"(?P<path>[0-9a-f]/[0-9a-f]/[0-9a-f-]+)\.(?:jpg|png)(?:\?.*)?$"
+)
+
+_snapshot_lock = threading.Lock()
+_snapshot: dict[str, Any] = {"root": None, "checked_at": 0.0, "mtime_ns": None, "entries": {}}
+
+
+def image_cache_root() -> Path:
+    """Directory holding the image cache, next to the Scryfall bulk files."""
+    root = runtime_service.data_root(
+        current_app=current_app,
+        guess_instance_data_root_fn=lambda: runtime_service.guess_instance_data_root(file_path=__file__),
+    )
+    return Path(root) / "card-images"
+
+
+def image_key(url: Optional[str]) -> Optional[str]:
+    """Size-independent key ("front/a/b/<uuid>") for a Scryfall image URL."""
+    match = _SCRYFALL_IMAGE_RE.match(url or "")
+    if not match:
+        return None
+    return f"{match.group('face')}/{match.group('path')}"
+
+
+def _original_relpath(digest: str) -> str:
+    return f"originals/{digest[:2]}/{digest}.jpg"
+
+
+def _thumb_relpath(size: str, digest: str) -> str:
+    return f"thumbs/{size}/{digest}.webp"
+
+
+def _load_index(root: Path) -> dict[str, dict]:
+    try:
+        with open(root / _INDEX_NAME, "r", encoding="utf-8") as handle:
+            data = json.load(handle)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _write_index(root: Path, entries: dict[str, dict]) -> None:
+    root.mkdir(parents=True, exist_ok=True)
+    tmp_path = root / f".{_INDEX_NAME}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as handle:
+        json.dump(entries, handle, separators=(",", ":"), sort_keys=True)
+    os.replace(tmp_path, root / _INDEX_NAME)
+    _set_snapshot(root, entries)
+
+
+def _set_snapshot(root: Path, entries: dict[str, dict]) -> None:
+    try:
+        mtime_ns = (root / _INDEX_NAME).stat().st_mtime_ns
+    except OSError:
+        mtime_ns = None
+    with _snapshot_lock:
+        _snapshot.update(root=root, checked_at=time.monotonic(), mtime_ns=mtime_ns, entries=entries)
+
+
+def _index_entries() -> dict[str, dict]:
+    """The cached index, re-stat'ed at most every ``_INDEX_RECHECK_SECONDS``."""
+    now = time.monotonic()
+    if _snapshot["root"] is not None and now - _snapshot["checked_at"] < _INDEX_RECHECK_SECONDS:
+        return _snapshot["entries"]
+    try:
+        root = image_cache_root()
+        mtime_ns = (root / _INDEX_NAME).stat().st_mtime_ns
+    except Exception:
+        root, mtime_ns = _snapshot["root"], None
+    with _snapshot_lock:
+        if root == _snapshot["root"] and mtime_ns == _snapshot["mtime_ns"]:
+            _snapshot["checked_at"] = now
+            return _snapshot["entries"]
+    entries = _load_index(root) if (root is not None and mtime_ns is not None) else {}
+    with _snapshot_lock:
+        _snapshot.update(root=root, checked_at=now, mtime_ns=mtime_ns, entries=entries)
+    return entries
+
+
+def localize_image_url(url: Optional[str]) -> Optional[str]:
+    """Return the local path for a cached Scryfall image, else ``url`` unchanged.
+
+    "small" URLs prefer the small WebP thumbnail and "normal" the normal one;
+    "large"/"png" (and any size without a thumbnail) get the cached original.
+    """
+    if not url:
+        return url
+    entries = _index_entries()
+    if not entries:
+        return url
+    match = _SCRYFALL_IMAGE_RE.match(url)
+    if not match:
+        return url
+    entry = entries.get(f"{match.group('face')}/{match.group('path')}")
+    if not entry:
+        return url
+    digest = entry["sha256"]
+    size = match.group("size")
+    if size in (entry.get("thumbs") or ()):
+        return f"{URL_PREFIX}/{_thumb_relpath(size, digest)}"
+    return f"{URL_PREFIX}/{_original_relpath(digest)}"
+
+
+def local_image_path(url: Optional[str]) -> Optional[Path]:
+    """Filesystem path of the cached original JPEG for ``url``, if present."""
+    key = image_key(url)
+    entry = _index_entries().get(key) if key else None
+    if not entry:
+        return None
+    path = image_cache_root() / _original_relpath(entry["sha256"])
+    return path if path.is_file() else None
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    with open(tmp_path, "wb") as handle:
+        handle.write(data)
+    os.replace(tmp_path, path)
+
+
+def _write_thumbnails(root: Path, digest: str, data: bytes) -> list[str]:
+    """Render WebP thumbnails for each template size; [] without Pillow."""
+    if Image is None:
+        return []
+    try:
+        with Image.open(io.BytesIO(data)) as source:
+            rgb = source.convert("RGB")
+    except Exception:
+        return []
+    built: list[str] = []
+    for size, width in THUMBNAIL_WIDTHS.items():
+        path = root / _thumb_relpath(size, digest)
+        if not path.exists():
+            thumb = rgb.copy()
+            thumb.thumbnail((width, width * 2))
+            buffer = io.BytesIO()
+            thumb.save(buffer, "WEBP", quality=_WEBP_QUALITY, method=4)
+            _write_atomic(path, buffer.getvalue())
+        built.append(size)
+    return built
+
+
+def store_card_image(root: Path, data: bytes) -> dict:
+    """Write one downloaded image (and its thumbnails) and return its index entry."""
+    digest = hashlib.sha256(data).hexdigest()
+    original = root / _original_relpath(digest)
+    if not original.exists():
+        _write_atomic(original, data)
+    return {"sha256": digest, "thumbs": _write_thumbnails(root, digest, data)}
+
+
+def _print_image_urls(print_obj: Optional[dict]) -> list[str]:
+    if not print_obj:
+        return []
+    uris = print_obj.get("image_uris") or {}
+    if uris.get("normal"):
+        return [uris["normal"]]
+    urls = []
+    for face in print_obj.get("card_faces") or []:
+        url = ((face or {}).get("image_uris") or {}).get("normal")
+        if url:
+            urls.append(url)
+    return urls
+
+
+def referenced_image_urls() -> dict[str, str]:
+    """``{image_key: normal_url}`` for every print that a stored card row uses."""
+    from extensions import db
+    from models import Card
+    from core.domains.cards.services import scryfall_cache as sc
+
+    if not sc.ensure_cache_loaded():
+        return {}
+    wanted: dict[str, str] = {}
+    rows = db.session.query(Card.set_code, Card.collector_number, Card.name).distinct().all()
+    for set_code, collector_number, name in rows:
+        try:
+            print_obj = sc.find_by_set_cn(set_code, collector_number, name)
+        except Exception:
+            print_obj = None
+        for url in _print_image_urls(print_obj):
+            key = image_key(url)
+            if key:
+                wanted.setdefault(key, url)
+    return wanted
+
+
+class _RateLimiter:
+    """Space request starts at least ``1 / per_second`` apart across threads."""
+
+    def __init__(self, per_second: float):
+        self.interval = 1.0 / per_second if per_second and per_second > 0 else 0.0
+        self.lock = threading.Lock()
+        self.next_at = 0.0
+
+    def wait(self) -> None:
+        if not self.interval:
+            return
+        with self.lock:
+            now = time.monotonic()
+            start = max(now, self.next_at)
+            self.next_at = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+
+def _fetch_image(url: str) -> bytes:
+    resp = safe_get(url, headers=_HEADERS)
+    resp.raise_for_status()
+    content_type = (resp.headers.get("Content-Type") or "").split(";")[0].strip().lower()
+    if content_type and not content_type.startswith("image/"):
+        raise ValueError(f"Unexpected content type {content_type!r} for {url}")
+    return resp.content
+
+
+def sync_card_images(
+    *,
+    limit: Optional[int] = None,
+    concurrency: Optional[int] = None,
+    rate_per_second: Optional[float] = None,
+    urls: Optional[Dict[str, str]] = None,
+    fetch: Callable[[str], bytes] = _fetch_image,
+    log: Any = None,
+) -> dict:
+    """Download missing referenced images, at most ``limit`` per run.
+
+    Downloads run on ``concurrency`` threads behind a shared rate limiter;
+    files and thumbnails are written on the calling thread and the index is
+    saved once at the end. Cached images that predate Pillow being installed
+    get their thumbnails on the next run. Returns counters for logging.
+    """
+    config = current_app.config
+    limit = limit if limit is not None else int(config.get("CARD_IMAGE_SYNC_LIMIT", _DEFAULT_SYNC_LIMIT))
+    concurrency = max(1, concurrency or int(config.get("CARD_IMAGE_SYNC_CONCURRENCY", _DEFAULT_CONCURRENCY)))
+    rate = rate_per_second if rate_per_second is not None else float(
+        config.get("CARD_IMAGE_SYNC_RATE", _DEFAULT_RATE_PER_SECOND)
+    )
+
+    root = image_cache_root()
+    entries = dict(_load_index(root))
+    wanted = urls if urls is not None else referenced_image_urls()
+    missing = [
+        (key, url)
+        for key, url in wanted.items()
+        if key not in entries or not (root / _original_relpath(entries[key]["sha256"])).is_file()
+    ]
+    queued = missing[:limit] if limit and limit > 0 else missing
+
+    thumbnails_built = 0
+    if Image is not None:
+        for key in wanted:
+            entry = entries.get(key)
+            if entry and set(entry.get("thumbs") or ()) != set(THUMBNAIL_WIDTHS):
+                original = root / _original_relpath(entry["sha256"])
+                if original.is_file():
+                    entry["thumbs"] = _write_thumbnails(root, entry["sha256"], original.read_bytes())
+                    thumbnails_built += 1
+
+    limiter = _RateLimiter(rate)
+
+    def _download(url: str) -> bytes:
+        limiter.wait()
+        return fetch(url)
+
+    downloaded = failed = 0
+    if queued:
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(queued))) as pool:
+            futures = {pool.submit(_download, url): key for key, url in queued}
+            for future in as_completed(futures):
+                key = futures[future]
+                try:
+                    entries[key] = store_card_image(root, future.result())
+                    downloaded += 1
+                except Exception as exc:
+                    failed += 1
+                    if log is not None:
+                        log.warning("Card image download failed: key=%s error=%s", key, exc)
+
+    if downloaded or thumbnails_built or not (root / _INDEX_NAME).exists():
+        _write_index(root, entries)
+    return {
+        "referenced": len(wanted),
+        "cached": len(wanted) - len(missing),
+        "queued": len(queued),
+        "downloaded": downloaded,
+        "failed": failed,
+        "remaining": len(missing) - downloaded,
+        "thumbnails_built": thumbnails_built,
+        "thumbnails_enabled": Image is not None,
+    }
+
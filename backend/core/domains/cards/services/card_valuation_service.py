@@ -0,0 +1,246 @@
+"""Materialized per-card valuations for price-ranked collection queries.
+
+Each ``Card`` row stores the unit price of its exact print and finish
+(``unit_price``), the currency that price was resolved in
+(``price_currency``) and when it was computed (``price_updated_at``). Top-N
+lists, price sorting and collection totals then become indexed SQL instead of
+resolving every owned print through the Scryfall cache per request.
+
+Valuations come from the same source the card list displays
+(``prices_for_print_exact``: the price service, then the prices embedded in
+the cached Scryfall print), so price sorting agrees with the shown numbers.
+They are refreshed in bulk after a ``default_cards`` reload, after CSV
+imports and by a queued job when a price-ranked view finds never-priced
+rows. Without a job queue, small scopes are priced inline instead so price
+sorting never degrades to arbitrary order.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from typing import Any, Iterable
+
+from flask import current_app, has_app_context
+from sqlalchemy import bindparam, event, func, inspect
+
+from core.domains.cards.services import scryfall_cache as sc
+from core.domains.cards.services.collection_card_list_view_service import price_and_currency_from_exact_prices
+from core.domains.cards.services.pricing import prices_for_print_exact
+from core.shared.utils.time import utcnow
+from extensions import cache, db
+from models import Card, Folder
+from shared.cache.runtime_cache import COLLECTION_OWNERS_OPTION
+from shared.mtg import _bulk_print_lookup
+
+VALUATION_CURRENCIES: tuple[str, ...] = ("usd", "eur", "tix")
+
+_REFRESH_BATCH_SIZE = 1000
+_CURRENCY_PREFIXES = {"usd": "$", "eur": "EUR ", "tix": "TIX "}
+_PRINT_IDENTITY_ATTRS = ("name", "set_code", "collector_number", "lang", "is_foil", "oracle_id")
+# One queued pricing job per folder set is enough while it is pending.
+_QUEUE_MARKER_TTL = 300
+# Never-priced rows a request may price itself when no job queue is available.
+_INLINE_PRICING_LIMIT = 500
+_LISTENERS_REGISTERED = False
+
+
+def format_valuation(unit_price: float | None, currency: str | None) -> str | None:
+    """Render a stored valuation the same way the price helpers format prices."""
+    if unit_price is None or unit_price <= 0:
+        return None
+    prefix = _CURRENCY_PREFIXES.get((currency or "usd").lower(), "$")
+    return f"{prefix}{unit_price:,.2f}".replace(",", "")
+
+
+def _valuation_rows(cards: list[Any], priced_at) -> list[dict[str, Any]]:
+    print_map = _bulk_print_lookup(cards)
+    rows: list[dict[str, Any]] = []
+    for card in cards:
+        print_data = print_map.get(card.id)
+        prices = prices_for_print_exact(print_data) if print_data else {}
+        value, currency = price_and_currency_from_exact_prices(prices, bool(card.is_foil))
+        rows.append(
+            {
+                "card_id": card.id,
+                "value": value,
+                "currency": currency,
+                "priced_at": priced_at,
+            }
+        )
+    return rows
+
+
+def _update_statement():
+    table = Card.__table__
+    # updated_at is pinned to itself so a price refresh does not look like a user edit.
+    return (
+        table.update()
+        .where(table.c.id == bindparam("card_id"))
+        .values(
+            unit_price=bindparam("value"),
+            price_currency=bindparam("currency"),
+            price_updated_at=bindparam("priced_at"),
+            updated_at=table.c.updated_at,
+        )
+    )
+
+
+def refresh_card_valuations(
+    *,
+    folder_ids: Iterable[int] | None = None,
+    only_missing: bool = False,
+    batch_size: int = _REFRESH_BATCH_SIZE,
+) -> int:
+    """Recompute stored valuations in batches and return the number of rows written.
+
+    ``folder_ids`` scopes the refresh to specific folders; ``only_missing``
+    restricts it to rows that have never been priced. Nothing is written when the
+    Scryfall cache is unavailable so rows are not stamped with empty prices.
+    """
+    if not sc.cache_ready():
+        try:
+            sc.ensure_cache_loaded()
+        except Exception:
+            return 0
+        if not sc.cache_ready():
+            return 0
+
+    scoped_ids = sorted({int(fid) for fid in folder_ids or [] if fid}) if folder_ids is not None else None
+    if scoped_ids is not None and not scoped_ids:
+        return 0
+
+    query = db.session.query(
+        Card.id,
+        Card.name,
+        Card.set_code,
+        Card.collector_number,
+        Card.oracle_id,
+        Card.is_foil,
+        Folder.owner_user_id,
+    ).outerjoin(Folder, Folder.id == Card.folder_id)
+    if scoped_ids is not None:
+        query = query.filter(Card.folder_id.in_(scoped_ids))
+    if only_missing:
+        query = query.filter(Card.price_updated_at.is_(None))
+
+    statement = _update_statement()
+    priced_at = utcnow()
+    written = 0
+    last_id = 0
+    batch_size = max(1, int(batch_size or _REFRESH_BATCH_SIZE))
+    while True:
+        batch = query.filter(Card.id > last_id).order_by(Card.id.asc()).limit(batch_size).all()
+        if not batch:
+            break
+        last_id = batch[-1].id
+        rows = _valuation_rows(batch, priced_at)
+        # Only the owners of these rows need their collection caches dropped.
+        owners = {row.owner_user_id or 0 for row in batch}
+        db.session.execute(statement, rows, execution_options={COLLECTION_OWNERS_OPTION: owners})
+        written += len(rows)
+    if written:
+        db.session.commit()
+    return written
+
+
+def ensure_card_valuations(folder_ids: Iterable[int]) -> bool:
+    """Make sure never-valued rows in ``folder_ids`` get priced; True when pricing was queued or done.
+
+    Called from price-ranked views. Normally it only queues a job and unpriced
+    rows sort last until it runs. When jobs cannot be queued (disabled, RQ
+    missing, Redis down) up to ``_INLINE_PRICING_LIMIT`` rows are priced in
+    the request; larger scopes wait for the next import or refresh.
+    """
+    scoped_ids = sorted({int(fid) for fid in folder_ids or [] if fid})
+    if not scoped_ids:
+        return False
+    missing = (
+        db.session.query(Card.id)
+        .filter(Card.folder_id.in_(scoped_ids), Card.price_updated_at.is_(None))
+        .first()
+    )
+    if missing is None:
+        return False
+    digest = hashlib.blake2b(repr(scoped_ids).encode("utf-8"), digest_size=8).hexdigest()
+    marker = f"card_valuations_queued:{digest}"
+    try:
+        if not cache.add(marker, 1, timeout=_QUEUE_MARKER_TTL):
+            return False
+    except Exception:
+        pass
+    from shared.jobs.jobs import enqueue_card_valuations
+
+    try:
+        enqueue_card_valuations(scoped_ids)
+    except RuntimeError as exc:
+        missing_count = (
+            db.session.query(func.count(Card.id))
+            .filter(Card.folder_id.in_(scoped_ids), Card.price_updated_at.is_(None))
+            .scalar()
+        ) or 0
+        if missing_count <= _INLINE_PRICING_LIMIT:
+            # Nothing is pending, so rows added later must not wait for the marker.
+            try:
+                cache.delete(marker)
+            except Exception:
+                pass
+            return refresh_card_valuations(folder_ids=scoped_ids, only_missing=True) > 0
+        if has_app_context():
+            current_app.logger.warning(
+                "Card valuations not queued (%s); %s rows stay unpriced until the next refresh.", exc, missing_count
+            )
+        return False
+    return True
+
+
+def collection_values(folder_ids: Iterable[int]) -> dict[str, float]:
+    """Return ``SUM(unit_price * quantity)`` per valuation currency, in ``VALUATION_CURRENCIES`` order."""
+    scoped_ids = sorted({int(fid) for fid in folder_ids or [] if fid})
+    if not scoped_ids:
+        return {}
+    total = func.sum(Card.unit_price * Card.quantity)
+    rows = (
+        db.session.query(Card.price_currency, total)
+        .filter(
+            Card.folder_id.in_(scoped_ids),
+            Card.price_currency.isnot(None),
+            Card.unit_price.isnot(None),
+        )
+        .group_by(Card.price_currency)
+        .all()
+    )
+    totals = {currency: float(value) for currency, value in rows if value}
+    return {currency: totals[currency] for currency in VALUATION_CURRENCIES if currency in totals}
+
+
+def register_card_valuation_listeners() -> None:
+    """Reset stored valuations when a card's print or finish changes."""
+    global _LISTENERS_REGISTERED
+    if _LISTENERS_REGISTERED:
+        return
+    _LISTENERS_REGISTERED = True
+
+    @event.listens_for(db.session, "before_flush")
+    def _invalidate_changed_valuations(session, _flush_context, _instances):
+        for obj in session.dirty:
+            if not isinstance(obj, Card):
+                continue
+            try:
+                state = inspect(obj)
+                changed = any(state.attrs[attr].history.has_changes() for attr in _PRINT_IDENTITY_ATTRS)
+            except Exception:
+                continue
+            if changed:
+                obj.unit_price = None
+                obj.price_currency = None
+                obj.price_updated_at = None
+
+
+__all__ = [
+    "VALUATION_CURRENCIES",
+    "collection_values",
+    "ensure_card_valuations",
+    "format_valuation",
+    "refresh_card_valuations",
+    "register_card_valuation_listeners",
+]
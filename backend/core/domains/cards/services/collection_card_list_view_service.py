@@ -75,19 +75,21 @@ def format_exact_price(prices: dict | None, is_foil: bool) -> str | None:
     return _format(prices.get("tix"), "TIX ")
 
 
-def price_value_from_exact_prices(prices: dict | None, is_foil: bool) -> float | None:
+def price_and_currency_from_exact_prices(prices: dict | None, is_foil: bool) -> tuple[float | None, str | None]:
+    """Return ``(value, currency)`` for a finish, preferring USD, then EUR, then TIX."""
     if not prices:
-        return None
-    keys = ("usd_foil", "usd", "usd_etched") if is_foil else ("usd", "usd_foil", "usd_etched")
-    for key in keys:
-        value = _price_to_float(prices.get(key))
-        if value is not None:
-            return value
-    for key in ("eur", "eur_foil", "tix"):
-        value = _price_to_float(prices.get(key))
-        if value is not None:
-            return value
-    return None
+        return None, None
+    usd_keys = ("usd_foil", "usd", "usd_etched") if is_foil else ("usd", "usd_foil", "usd_etched")
+    for currency, keys in (("usd", usd_keys), ("eur", ("eur", "eur_foil")), ("tix", ("tix",))):
+        for key in keys:
+            value = _price_to_float(prices.get(key))
+            if value is not None:
+                return value, currency
+    return None, None
+
+
+def price_value_from_exact_prices(prices: dict | None, is_foil: bool) -> float | None:
+    return price_and_currency_from_exact_prices(prices, is_foil)[0]
 
 
 def _rarity_badge_class(label: str | None) -> str | None:
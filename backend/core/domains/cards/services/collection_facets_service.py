@@ -9,7 +9,12 @@ from sqlalchemy import func, or_
 from extensions import db
 from models import Card, Folder
 from core.domains.cards.services.scryfall_cache import cache_epoch, cache_ready, ensure_cache_loaded, set_name_for_code
-from shared.cache.runtime_cache import cache_fetch as _cache_fetch, user_cache_key as _user_cache_key
+from shared.cache.runtime_cache import (
+    COLLECTION_CACHE_TTL,
+    cache_fetch as _cache_fetch,
+    collection_generation as _collection_generation,
+    user_cache_key as _user_cache_key,
+)
 from shared.mtg import _lookup_print_data
 
 RARITY_CHOICE_ORDER: list[tuple[str, str]] = [
@@ -39,7 +44,7 @@ def card_browser_facets():
         folders = db.session.query(Folder.id, Folder.name).order_by(Folder.name.asc()).all()
         return sets, langs, folders
 
-    return _cache_fetch(f"facets:{user_key}", 300, _build)
+    return _cache_fetch(f"facets:{user_key}:{_collection_generation()}", COLLECTION_CACHE_TTL, _build)
 
 
 def collection_rarity_options() -> list[dict[str, str]]:
@@ -109,7 +114,11 @@ def collection_rarity_options() -> list[dict[str, str]]:
 
         return options
 
-    return _cache_fetch(f"rarity_options:{user_key}:{cache_epoch()}", 300, _build)
+    return _cache_fetch(
+        f"rarity_options:{user_key}:{_collection_generation()}:{cache_epoch()}",
+        COLLECTION_CACHE_TTL,
+        _build,
+    )
 
 
 def set_options_with_names(codes: Iterable[str]) -> list[dict[str, str]]:
@@ -14,7 +14,12 @@ from core.domains.cards.services.scryfall_cache import cache_epoch, cache_ready,
 from core.domains.cards.viewmodels.card_vm import TypeBreakdownVM
 from core.domains.decks.viewmodels.folder_vm import CollectionBucketVM, FolderOptionVM
 from core.domains.games.services.stats import get_folder_stats
-from shared.cache.runtime_cache import cache_fetch as _cache_fetch, user_cache_key as _user_cache_key
+from shared.cache.runtime_cache import (
+    COLLECTION_CACHE_TTL,
+    cache_fetch as _cache_fetch,
+    collection_generation as _collection_generation,
+    user_cache_key as _user_cache_key,
+)
 from shared.mtg import _collection_rows_with_fallback
 
 
@@ -123,8 +128,8 @@ def collection_overview():
             return stats_list, total_rows, total_qty, by_set
 
         stats_list, total_rows, total_qty, by_set = _cache_fetch(
-            f"collection_stats:{user_key}:{filters_key}",
-            120,
+            f"collection_stats:{user_key}:{_collection_generation()}:{filters_key}",
+            COLLECTION_CACHE_TTL,
             _collection_stats,
         )
         stats_by_id = {stat["folder_id"]: {"rows": stat["rows"], "qty": stat["qty"]} for stat in stats_list}
@@ -154,7 +159,7 @@ def collection_overview():
 
     base_types = ["Artifact", "Battle", "Creature", "Enchantment", "Instant", "Land", "Planeswalker", "Sorcery"]
     if folder_ids and have_cache:
-        type_cache_key = f"collection_types:{user_key}:{filters_key}:{cache_epoch()}"
+        type_cache_key = f"collection_types:{user_key}:{_collection_generation()}:{filters_key}:{cache_epoch()}"
 
         def _type_breakdown():
             rows = (
@@ -200,7 +205,7 @@ def collection_overview():
                     type_totals[value] += qty
             return [(value, type_totals.get(value, 0)) for value in base_types if type_totals.get(value, 0) > 0]
 
-        type_breakdown = _cache_fetch(type_cache_key, 300, _type_breakdown)
+        type_breakdown = _cache_fetch(type_cache_key, COLLECTION_CACHE_TTL, _type_breakdown)
     else:
         type_breakdown = []
 
@@ -14,19 +14,17 @@ from extensions import db
 from models import Card, Folder, User, UserFriend
 from models.role import OracleCoreRoleTag, OracleEvergreenTag, Role, SubRole
 from core.domains.cards.services import scryfall_cache as sc
+from core.domains.cards.services.card_valuation_service import ensure_card_valuations
 from core.domains.cards.services.collection_card_list_view_service import (
     build_collection_card_list_items,
     image_from_print_payload,
-    price_value_from_exact_prices,
 )
 from core.domains.cards.services.collection_request_service import CollectionBrowserRequest
 from core.domains.cards.services.role_search_util import (
     role_query_like_patterns,
     split_role_query_terms,
 )
-from core.domains.cards.services.pricing import (
-    prices_for_print_exact as _prices_for_print_exact,
-)
+from shared.database.search import ilike_any
 from shared.mtg import (
     _bulk_print_lookup,
     _color_letters_list,
@@ -151,7 +149,8 @@ def _base_card_query(params: CollectionBrowserRequest):
         # Each comma-separated term is required (AND), and within a term a match
         # is a core-role tag, an evergreen keyword tag, OR the card's own type
         # line — so land types, subtypes and card types are searchable directly,
-        # and multiple keywords ("flying, trample") can be combined.
+        # and multiple keywords ("flying, trample") can be combined. ILIKE on the
+        # bare columns lets Postgres use the pg_trgm indexes (shared.database.search).
         for term in split_role_query_terms(params.role_query_text):
             term_patterns = role_query_like_patterns(term)
             if not term_patterns:
@@ -159,16 +158,16 @@ def _base_card_query(params: CollectionBrowserRequest):
             role_match = (
                 db.session.query(OracleCoreRoleTag.id)
                 .filter(OracleCoreRoleTag.oracle_id == Card.oracle_id)
-                .filter(or_(*[func.lower(OracleCoreRoleTag.role).ilike(pattern) for pattern in term_patterns]))
+                .filter(ilike_any(OracleCoreRoleTag.role, term_patterns))
                 .exists()
             )
             evergreen_match = (
                 db.session.query(OracleEvergreenTag.id)
                 .filter(OracleEvergreenTag.oracle_id == Card.oracle_id)
-                .filter(or_(*[func.lower(OracleEvergreenTag.keyword).ilike(pattern) for pattern in term_patterns]))
+                .filter(ilike_any(OracleEvergreenTag.keyword, term_patterns))
                 .exists()
             )
-            type_match = or_(*[func.lower(Card.type_line).ilike(pattern) for pattern in term_patterns])
+            type_match = ilike_any(Card.type_line, term_patterns)
             query = query.filter(or_(role_match, evergreen_match, type_match))
     if params.role_list or params.subrole_list:
         query = query.distinct()
@@ -314,7 +313,13 @@ def _ordered_cards_page(query, params: CollectionBrowserRequest, metadata_resolv
         )
         query = query.outerjoin(evergreen_subq, evergreen_subq.c.oracle_id == Card.oracle_id)
         order_col = func.coalesce(evergreen_subq.c.evergreen_tag, "")
-    elif params.sort in {"price", "art"}:
+    elif params.sort == "price":
+        scoped_folder_ids = [
+            folder_id for (folder_id,) in query.order_by(None).with_entities(Card.folder_id).distinct().all()
+        ]
+        ensure_card_valuations(scoped_folder_ids)
+        order_col = Card.unit_price
+    elif params.sort == "art":
         order_col = Card.id
     elif params.sort == "folder":
         query = query.outerjoin(Folder, Folder.id == Card.folder_id)
@@ -337,7 +342,7 @@ def _ordered_cards_page(query, params: CollectionBrowserRequest, metadata_resolv
     cards: list[Card] = []
     ordered_ids: list[int] = []
     total = 0
-    full_sort_keys = {"price", "art", "ctype", "type", "rar", "rarity", "colors", "colour"}
+    full_sort_keys = {"art", "ctype", "type", "rar", "rarity", "colors", "colour"}
     if params.sort in full_sort_keys:
         all_cards = (
             query.order_by(Card.id.asc())
@@ -357,22 +362,7 @@ def _ordered_cards_page(query, params: CollectionBrowserRequest, metadata_resolv
             sc.ensure_cache_loaded()
         full_print_map = _bulk_print_lookup(all_cards)
 
-        if params.sort == "price":
-            price_values = {}
-            for card_obj in all_cards:
-                print_data = full_print_map.get(card_obj.id, {})
-                prices = _prices_for_print_exact(print_data) if print_data else {}
-                price_values[card_obj.id] = price_value_from_exact_prices(prices, bool(card_obj.is_foil))
-
-            def _price_sort_key(card_obj):
-                value = price_values.get(card_obj.id)
-                missing = value is None
-                if params.reverse:
-                    return (missing, -(value or 0.0))
-                return (missing, value or 0.0)
-
-            ordered_ids = [card_obj.id for card_obj in sorted(all_cards, key=_price_sort_key)]
-        elif params.sort == "art":
+        if params.sort == "art":
             art_missing = {}
             for card_obj in all_cards:
                 print_data = full_print_map.get(card_obj.id, {})
@@ -460,6 +450,10 @@ def _ordered_cards_page(query, params: CollectionBrowserRequest, metadata_resolv
         return cards, total, page, pages, start, end
 
     order_expr = order_col.desc() if params.reverse else order_col.asc()
+    order_exprs = [order_expr, Card.id.asc()]
+    if params.sort == "price":
+        # Unpriced rows sort last in both directions.
+        order_exprs.insert(0, Card.unit_price.is_(None).asc())
     total = query.order_by(None).count()
     pages = max(1, ceil(total / params.per)) if params.per else 1
     page = min(params.page, pages)
@@ -478,7 +472,7 @@ def _ordered_cards_page(query, params: CollectionBrowserRequest, metadata_resolv
                 Folder.owner,
             ),
         )
-        .order_by(order_expr, Card.id.asc())
+        .order_by(*order_exprs)
         .limit(params.per)
         .offset(offset)
         .all()
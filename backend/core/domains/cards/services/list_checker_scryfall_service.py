@@ -1,7 +1,15 @@
-"""Scryfall metadata helpers for list checker results."""
+"""Scryfall metadata helpers for list checker results.
+
+Name and face lookups come from an index built once per Scryfall cache epoch,
+so resolving a pasted list costs O(list length) rather than a catalog walk.
+"""
 
 from __future__ import annotations
 
+import sys
+from functools import lru_cache
+from typing import Iterable, NamedTuple
+
 from core.domains.cards.services import scryfall_cache
 from shared.mtg import _normalize_name
 
@@ -30,60 +38,128 @@ def normalize_type(value: str | None) -> str:
     return text.split("—", 1)[0].strip()
 
 
-def build_scryfall_lookup_maps():
-    name_to_sid = {}
-    face_to_sid = {}
-    name_to_meta = {}
-    face_to_meta = {}
+class CardLookup(NamedTuple):
+    """Preferred print for a normalized card or face name (English wins)."""
+
+    sid: str | None
+    lang: str
+    oracle_id: str | None
+    rarity: str
+    color_identity: str
+    type: str
+
+
+@lru_cache(maxsize=2)
+def _lookup_index(_epoch: int) -> tuple[dict[str, CardLookup], dict[str, CardLookup]]:
+    """Return ``(by_name, by_face)`` over the whole catalog.
+
+    Cached on the cache epoch so the full-catalog walk happens once per load
+    instead of on every list check. Repeated labels are interned so the many
+    per-name tuples share their strings.
+    """
+    by_name: dict[str, CardLookup] = {}
+    by_face: dict[str, CardLookup] = {}
+    if not scryfall_cache.ensure_cache_loaded():
+        return by_name, by_face
+
+    normalized: dict[str, str] = {}
+    labels: dict[tuple, tuple[str, str, str]] = {}
+
+    def _norm(raw: str) -> str:
+        value = normalized.get(raw)
+        if value is None:
+            value = normalized[raw] = _normalize_name(raw)
+        return value
+
+    def _wants(index: dict[str, CardLookup], key: str, lang: str) -> bool:
+        previous = index.get(key)
+        return previous is None or (previous.lang != "en" and lang == "en")
+
+    for print_row in scryfall_cache.get_all_prints():
+        raw_name = print_row.get("name") or ""
+        normalized_name = _norm(raw_name)
+        if not normalized_name:
+            continue
+        lang = sys.intern((print_row.get("lang") or "en").lower())
+        face_keys = ()
+        if "//" in raw_name:
+            face_keys = tuple(
+                key for key in (_norm(piece.strip()) for piece in raw_name.split("//", 1)) if key
+            )
+        targets = [(by_name, normalized_name)] if _wants(by_name, normalized_name, lang) else []
+        targets.extend((by_face, key) for key in face_keys if _wants(by_face, key, lang))
+        if not targets:
+            continue  # another printing already won every key this print maps to
+
+        ci_raw = print_row.get("color_identity") or print_row.get("colors") or []
+        label_key = (print_row.get("rarity"), tuple(ci_raw), print_row.get("type_line"))
+        label = labels.get(label_key)
+        if label is None:
+            ci_letters, _ = scryfall_cache.normalize_color_identity(ci_raw)
+            label = labels[label_key] = (
+                sys.intern(normalize_rarity(print_row.get("rarity"))),
+                sys.intern(ci_letters),
+                sys.intern(normalize_type(print_row.get("type_line"))),
+            )
+        entry = CardLookup(print_row.get("id"), lang, print_row.get("oracle_id"), *label)
+        for index, key in targets:
+            index[key] = entry
+    return by_name, by_face
+
+
+def lookup_cards(normalized_names: Iterable[str]) -> dict[str, CardLookup]:
+    """Resolve normalized names (full name first, then face) in O(len(names))."""
+    try:
+        by_name, by_face = _lookup_index(scryfall_cache.cache_epoch())
+    except Exception:
+        return {}
+    found: dict[str, CardLookup] = {}
+    for key in normalized_names:
+        entry = by_name.get(key) or by_face.get(key)
+        if entry is not None:
+            found[key] = entry
+    return found
+
+
+def _sid_tuple(entry: CardLookup) -> tuple:
+    return (entry.sid, entry.lang, entry.oracle_id)
 
+
+def _meta(entry: CardLookup) -> dict[str, str]:
+    return {
+        "lang": entry.lang,
+        "rarity": entry.rarity,
+        "color_identity": entry.color_identity,
+        "type": entry.type,
+    }
+
+
+def build_scryfall_lookup_maps(normalized_names: Iterable[str] | None = None):
+    """Return ``(name_to_sid, face_to_sid, name_to_meta, face_to_meta)``.
+
+    With ``normalized_names`` only those keys are materialized, which is what a
+    list check needs; without it the full catalog maps are returned.
+    """
     try:
-        if scryfall_cache.ensure_cache_loaded():
-            from core.domains.cards.services.scryfall_cache import get_all_prints
-
-            for print_row in get_all_prints():
-                normalized_name = _normalize_name(print_row.get("name") or "")
-                if not normalized_name:
-                    continue
-
-                sid = print_row.get("id")
-                lang = (print_row.get("lang") or "en").lower()
-                oracle_id = print_row.get("oracle_id")
-                rarity_label = normalize_rarity(print_row.get("rarity"))
-                ci_raw = print_row.get("color_identity") or print_row.get("colors") or []
-                ci_letters, _ = scryfall_cache.normalize_color_identity(ci_raw)
-                type_label = normalize_type(print_row.get("type_line"))
-                meta = {"rarity": rarity_label, "color_identity": ci_letters, "type": type_label}
-
-                previous = name_to_sid.get(normalized_name)
-                if previous is None or (previous[1] != "en" and lang == "en"):
-                    name_to_sid[normalized_name] = (sid, lang, oracle_id)
-                previous_meta = name_to_meta.get(normalized_name)
-                if previous_meta is None or (previous_meta["lang"] != "en" and lang == "en"):
-                    name_to_meta[normalized_name] = {"lang": lang, **meta}
-
-                raw_name = print_row.get("name") or ""
-                if "//" not in raw_name:
-                    continue
-
-                front_face, back_face = [piece.strip() for piece in raw_name.split("//", 1)]
-                for face_name in (front_face, back_face):
-                    normalized_face = _normalize_name(face_name)
-                    if not normalized_face:
-                        continue
-                    previous_face = face_to_sid.get(normalized_face)
-                    if previous_face is None or (previous_face[1] != "en" and lang == "en"):
-                        face_to_sid[normalized_face] = (sid, lang, oracle_id)
-                    previous_face_meta = face_to_meta.get(normalized_face)
-                    if previous_face_meta is None or (previous_face_meta["lang"] != "en" and lang == "en"):
-                        face_to_meta[normalized_face] = {"lang": lang, **meta}
+        by_name, by_face = _lookup_index(scryfall_cache.cache_epoch())
     except Exception:
         return {}, {}, {}, {}
-
-    return name_to_sid, face_to_sid, name_to_meta, face_to_meta
+    if normalized_names is not None:
+        wanted = set(normalized_names)
+        by_name = {key: by_name[key] for key in wanted if key in by_name}
+        by_face = {key: by_face[key] for key in wanted if key in by_face}
+    return (
+        {key: _sid_tuple(entry) for key, entry in by_name.items()},
+        {key: _sid_tuple(entry) for key, entry in by_face.items()},
+        {key: _meta(entry) for key, entry in by_name.items()},
+        {key: _meta(entry) for key, entry in by_face.items()},
+    )
 
 
 __all__ = [
+    "CardLookup",
     "build_scryfall_lookup_maps",
+    "lookup_cards",
     "normalize_rarity",
     "normalize_type",
 ]
@@ -42,7 +42,7 @@ def compute_list_checker(pasted: str):
         if normalized_name in BASIC_LAND_SLUGS:
             snapshot.available_count[normalized_name] = max(snapshot.available_count[normalized_name], 9999)
 
-    name_to_sid, face_to_sid, name_to_meta, face_to_meta = scryfall_service.build_scryfall_lookup_maps()
+    name_to_sid, face_to_sid, name_to_meta, face_to_meta = scryfall_service.build_scryfall_lookup_maps(keys)
 
     folder_ids = set()
     for breakdown in (
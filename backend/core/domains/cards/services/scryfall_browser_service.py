@@ -6,7 +6,7 @@ import re
 from math import ceil
 
 from flask import render_template, request, url_for
-from sqlalchemy import func, or_
+from sqlalchemy import func
 
 from extensions import db
 from models import Card, Folder
@@ -35,6 +35,7 @@ from core.domains.cards.services.scryfall_shared_service import (
     _type_badges,
 )
 from core.shared.utils.symbols_cache import ensure_symbols_cache, render_mana_html
+from shared.database.search import ilike_any
 from shared.mtg import API_PAGE_SIZE, _collection_metadata
 from core.domains.cards.viewmodels.card_vm import ScryfallCardVM
 
@@ -276,7 +277,7 @@ def scryfall_browser():
         matching_roles = {
             oid
             for (oid,) in db.session.query(OracleCoreRoleTag.oracle_id)
-            .filter(or_(*[func.lower(OracleCoreRoleTag.role).ilike(pattern) for pattern in term_patterns]))
+            .filter(ilike_any(OracleCoreRoleTag.role, term_patterns))
             .distinct()
             .all()
             if oid
@@ -284,7 +285,7 @@ def scryfall_browser():
         matching_evergreen = {
             oid
             for (oid,) in db.session.query(OracleEvergreenTag.oracle_id)
-            .filter(or_(*[func.lower(OracleEvergreenTag.keyword).ilike(pattern) for pattern in term_patterns]))
+            .filter(ilike_any(OracleEvergreenTag.keyword, term_patterns))
             .distinct()
             .all()
             if oid
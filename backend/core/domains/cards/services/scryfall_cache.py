@@ -8,6 +8,7 @@ from flask import current_app
 from functools import lru_cache
 
 from core.domains.cards.services import scryfall_catalog_service as catalog
+from core.domains.cards.services.card_image_cache import localize_image_url
 from core.domains.cards.services import scryfall_cache_state_service as state_service
 from core.domains.cards.services import scryfall_http_service as http_service
 from core.domains.cards.services import scryfall_index_service as index_service
@@ -17,6 +18,7 @@ from core.domains.cards.services import scryfall_rulings_service as rulings_serv
 from core.domains.cards.services import scryfall_runtime_service as runtime_service
 from core.domains.cards.services import scryfall_set_metadata_service as set_metadata_service
 from core.domains.cards.services import scryfall_set_profile_service as set_profile
+from shared import warmup
 
 # -----------------------------------------------------------------------------
 # In-memory flags/state
@@ -65,6 +67,9 @@ def ensure_cache_loaded(path: str | None = None, force: bool = False) -> bool:
         except Exception:
             pass
 
+    if not force and not warmup.wait_for("scryfall_cache"):
+        # Still loading in the startup warmup thread; callers degrade meanwhile.
+        return False
     if _cache_loaded and _cache:
         return True
 
@@ -117,13 +122,10 @@ def _human_bytes(n: int) -> str:
 
 def _image_uris(card_obj: Dict[str, Any]) -> Dict[str, Optional[str]]:
     iu = card_obj.get("image_uris")
-    if iu:
-        return {"small": iu.get("small"), "normal": iu.get("normal"), "large": iu.get("large")}
-    faces = card_obj.get("card_faces") or []
-    if faces and isinstance(faces, list):
-        iu = (faces[0] or {}).get("image_uris") or {}
-        return {"small": iu.get("small"), "normal": iu.get("normal"), "large": iu.get("large")}
-    return {"small": None, "normal": None, "large": None}
+    if not iu:
+        faces = card_obj.get("card_faces") or []
+        iu = ((faces[0] or {}).get("image_uris") or {}) if faces and isinstance(faces, list) else {}
+    return {size: localize_image_url(iu.get(size)) for size in ("small", "normal", "large")}
 
 def _cn_variants(cn: str) -> List[str]:
     return index_service.cn_variants(cn)
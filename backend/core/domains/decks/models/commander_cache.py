@@ -10,6 +10,9 @@ class CommanderBracketCache(db.Model):
     folder_id = db.Column(db.Integer, db.ForeignKey("folder.id", ondelete="CASCADE"), primary_key=True)
     cache_epoch = db.Column(db.Integer, nullable=False)
     card_signature = db.Column(db.String(64), nullable=False, index=True)
+    # Cheap deck-content version (row count, quantity total, latest card edit)
+    # that lets listings reuse the payload without loading card rows.
+    source_version = db.Column(db.String(64), nullable=True)
     payload = db.Column(db.JSON, nullable=False)
     updated_at = db.Column(db.DateTime, nullable=False, default=utcnow, onupdate=utcnow)
 
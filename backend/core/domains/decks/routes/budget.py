@@ -36,6 +36,7 @@ def api_folder_budget_alternatives(folder_id: int):
         suggestions_per_card = int(request.args.get("per_card") or 5)
     except (TypeError, ValueError):
         suggestions_per_card = 5
+    rank_by_roles = (request.args.get("rank") or "roles").strip().lower() != "price"
 
     try:
         report = find_budget_alternatives(
@@ -43,6 +44,7 @@ def api_folder_budget_alternatives(folder_id: int):
             folder=folder,
             threshold_usd=threshold,
             suggestions_per_card=suggestions_per_card,
+            rank_by_roles=rank_by_roles,
         )
     except ValueError as exc:
         return jsonify({"error": "invalid_input", "detail": str(exc)}), 400
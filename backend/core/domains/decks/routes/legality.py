@@ -22,9 +22,9 @@ from flask_login import login_required
 
 from models import Folder
 from core.domains.decks.services.legality_service import (
-    SUPPORTED_FORMATS,
     available_formats,
     evaluate_folder_legality,
+    evaluate_folder_legality_all,
 )
 from core.routes.api import api_bp
 from shared.auth import ensure_folder_access
@@ -67,7 +67,5 @@ def api_folder_legality_all(folder_id: int):
     folder = get_or_404(Folder, folder_id)
     ensure_folder_access(folder, write=False, allow_shared=True)
 
-    reports = []
-    for fmt in SUPPORTED_FORMATS:
-        reports.append(evaluate_folder_legality(folder, fmt.key).to_dict())
-    return jsonify({"data": reports})
+    reports = evaluate_folder_legality_all(folder)
+    return jsonify({"data": [report.to_dict() for report in reports]})
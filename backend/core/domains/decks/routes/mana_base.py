@@ -2,17 +2,18 @@
 
 from __future__ import annotations
 
-from flask import jsonify
+from flask import jsonify, request
 from flask_login import login_required
 
 from models import Folder
 from core.domains.decks.services.mana_base_analysis_service import analyze_mana_base
+from core.domains.decks.services.mana_simulation_service import SimulationParams, simulate_folder
 from core.routes.api import api_bp
 from shared.auth import ensure_folder_access
 from shared.database import get_or_404
 
 
-__all__ = ["api_folder_mana_base"]
+__all__ = ["api_folder_mana_base", "api_folder_mana_simulation"]
 
 
 @api_bp.get("/folders/<int:folder_id>/mana-base")
@@ -22,3 +23,38 @@ def api_folder_mana_base(folder_id: int):
     ensure_folder_access(folder, write=False, allow_shared=True)
     report = analyze_mana_base(folder)
     return jsonify({"data": report.to_dict()})
+
+
+def _flag(name: str, default: bool) -> bool:
+    raw = (request.args.get(name) or "").strip().lower()
+    if not raw:
+        return default
+    return raw in {"1", "true", "yes", "on"}
+
+
+@api_bp.get("/folders/<int:folder_id>/mana-simulation")
+@login_required
+def api_folder_mana_simulation(folder_id: int):
+    folder = get_or_404(Folder, folder_id)
+    ensure_folder_access(folder, write=False, allow_shared=True)
+
+    defaults = SimulationParams()
+    try:
+        params = SimulationParams(
+            iterations=int(request.args.get("iterations") or defaults.iterations),
+            turns=int(request.args.get("turns") or defaults.turns),
+            on_play=(request.args.get("on") or "play").strip().lower() != "draw",
+            min_lands=int(request.args.get("min_lands") or defaults.min_lands),
+            max_lands=int(request.args.get("max_lands") or defaults.max_lands),
+            max_mulligans=int(request.args.get("mulligans") or defaults.max_mulligans),
+            # Multiplayer Commander grants a free first mulligan.
+            free_mulligan=_flag("free_mulligan", bool(folder.commander_oracle_id)),
+        )
+    except (TypeError, ValueError):
+        return jsonify({"error": "invalid_input"}), 400
+
+    try:
+        report = simulate_folder(folder, params)
+    except ValueError as exc:
+        return jsonify({"error": "invalid_input", "detail": str(exc)}), 400
+    return jsonify({"data": report})
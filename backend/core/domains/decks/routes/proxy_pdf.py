@@ -2,17 +2,17 @@
 
 from __future__ import annotations
 
-from io import BytesIO
-
-from flask import send_file
+from flask import Response, request, stream_with_context
 from flask_login import login_required
 from sqlalchemy.orm import selectinload
 
 from extensions import db
 from models import Folder
+from core.domains.cards.services import scryfall_cache as sc
+from core.domains.cards.services.card_image_cache import local_image_path
 from core.domains.decks.services.proxy_pdf_service import (
     ProxySlot,
-    render_proxy_pdf,
+    iter_proxy_pdf,
 )
 from core.routes.base import views
 from shared.auth import ensure_folder_access
@@ -31,6 +31,19 @@ def _slugify(name: str) -> str:
     )
 
 
+def _cached_art(slot: ProxySlot):
+    """Local JPEG for a slot's print from the card image cache, if downloaded."""
+    try:
+        print_obj = sc.find_by_set_cn(slot.set_code, slot.collector_number, slot.name)
+    except Exception:
+        return None
+    uris = (print_obj or {}).get("image_uris") or {}
+    if not uris:
+        faces = (print_obj or {}).get("card_faces") or []
+        uris = ((faces[0] or {}).get("image_uris") or {}) if faces else {}
+    return local_image_path(uris.get("normal"))
+
+
 @views.get("/folders/<int:folder_id>/proxy.pdf")
 @login_required
 def folder_proxy_pdf(folder_id: int):
@@ -60,12 +73,11 @@ def folder_proxy_pdf(folder_id: int):
             )
         )
 
-    pdf = render_proxy_pdf(deck, title=folder.name)
+    # ?art=1 prints cached card images; other cards keep the text layout.
+    image_for = _cached_art if request.args.get("art") in {"1", "true", "yes"} else None
     filename = f"{_slugify(folder.name)}-proxies.pdf"
-    response = send_file(
-        BytesIO(pdf),
+    return Response(
+        stream_with_context(iter_proxy_pdf(deck, title=folder.name, image_for=image_for)),
         mimetype="application/pdf",
-        as_attachment=True,
-        download_name=filename,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
     )
-    return response
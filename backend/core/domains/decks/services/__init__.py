@@ -20,6 +20,7 @@ __all__ = [
     "commander_cache",
     "commander_utils",
     "core_role_logic",
+    "deck_analytics",
     "deck_metadata_wizard_service",
     "deck_gallery_service",
     "deck_gallery_drawer_service",
@@ -6,20 +6,30 @@ card's "role" (defined by its primary type and oracle-role tagging when
 available). Suggestions come from the user's collection when possible so the
 final pick is already owned; otherwise we fall back to Scryfall cache entries
 that match the type line and color identity.
+
+Cache candidates come from an index built once per Scryfall cache epoch: the
+cheapest USD print of every oracle (by the prices embedded in the catalog),
+bucketed by primary type and color identity mask and pre-sorted by price, so
+each expensive card is a merge over at most 32 identity buckets instead of a
+catalog scan. Only the handful of candidates actually suggested are re-priced
+against the price service.
 """
 
 from __future__ import annotations
 
+import heapq
+import itertools
 from dataclasses import dataclass, field
 from decimal import Decimal
-from typing import Any, Iterable
+from functools import lru_cache
+from typing import Any, Iterable, NamedTuple
 
 from sqlalchemy.orm import selectinload
 
 from extensions import db
-from models import Card, Folder
+from models import Card, Folder, OracleCoreRoleTag
 from core.domains.cards.services import scryfall_cache as sc
-from core.domains.cards.services.pricing import price_has_value, prices_for_print
+from core.domains.cards.services.pricing import price_has_value, prices_for_print, prices_for_print_exact
 from shared.mtg import _lookup_print_data
 
 
@@ -32,6 +42,8 @@ __all__ = [
 
 DEFAULT_EXPENSIVE_THRESHOLD = Decimal("20.00")
 DEFAULT_SUGGESTIONS_PER_CARD = 5
+# Live price quotes fetched per requested suggestion before a search stage gives up.
+_LIVE_LOOKUPS_PER_PICK = 3
 
 
 @dataclass
@@ -95,10 +107,7 @@ class BudgetAlternativesReport:
 # ---------------------------------------------------------------------------
 
 
-def _usd_price(print_data: dict | None) -> Decimal | None:
-    if not print_data:
-        return None
-    prices = prices_for_print(print_data)
+def _usd_from_prices(prices: dict | None) -> Decimal | None:
     if not price_has_value(prices):
         return None
     try:
@@ -108,127 +117,342 @@ def _usd_price(print_data: dict | None) -> Decimal | None:
     return value if value > 0 else None
 
 
+def _usd_price(print_data: dict | None) -> Decimal | None:
+    if not print_data:
+        return None
+    return _usd_from_prices(prices_for_print(print_data))
+
+
+def _embedded_usd_price(print_data: dict | None) -> Decimal | None:
+    """USD price carried by the catalog print itself; never calls out."""
+    if not print_data:
+        return None
+    return _usd_from_prices(print_data.get("prices"))
+
+
+_PRIMARY_TYPES = ("planeswalker", "battle", "creature", "land", "artifact", "enchantment", "instant", "sorcery")
+_COLOR_BITS = {"W": 1, "U": 2, "B": 4, "R": 8, "G": 16}
+_ALL_COLORS_MASK = 31
+
+
 def _primary_type(type_line: str | None) -> str:
     lowered = (type_line or "").lower()
-    for label in ("planeswalker", "battle", "creature", "land", "artifact", "enchantment", "instant", "sorcery"):
+    for label in _PRIMARY_TYPES:
         if label in lowered:
             return label
     return ""
 
 
+def _type_labels(type_line: str | None) -> tuple[str, ...]:
+    """Every primary-type label a type line matches ("Artifact Creature" → both)."""
+    lowered = (type_line or "").lower()
+    return tuple(label for label in _PRIMARY_TYPES if label in lowered)
+
+
 def _color_identity_from_print(print_data: dict | None) -> list[str]:
     if not print_data:
         return []
     return sorted(str(ch).upper() for ch in (print_data.get("color_identity") or []) if ch)
 
 
-def _same_or_subset(colors_a: Iterable[str], colors_b: Iterable[str]) -> bool:
-    set_a, set_b = set(colors_a), set(colors_b)
-    return set_a.issubset(set_b)
+def _identity_mask(colors: Iterable[str]) -> int:
+    mask = 0
+    for ch in colors:
+        mask |= _COLOR_BITS.get(str(ch).upper(), 0)
+    return mask
+
+
+def _submasks(mask: int) -> list[int]:
+    """All identity masks that fit inside ``mask`` (including colorless)."""
+    out = []
+    sub = mask
+    while True:
+        out.append(sub)
+        if sub == 0:
+            return out
+        sub = (sub - 1) & mask
+
+
+class _Candidate(NamedTuple):
+    price_usd: Decimal
+    name: str
+    oracle_id: str
+    type_line: str | None
+    color_identity: tuple[str, ...]
+    identity_mask: int
+    types: tuple[str, ...]
+    print_data: dict | None = None
+
+
+def _suggestion(candidate: _Candidate, *, owned: bool) -> BudgetSuggestion:
+    return BudgetSuggestion(
+        name=candidate.name,
+        oracle_id=candidate.oracle_id,
+        type_line=candidate.type_line,
+        color_identity=list(candidate.color_identity),
+        price_usd=candidate.price_usd,
+        in_user_collection=owned,
+    )
+
+
+def _fits(candidate: _Candidate, *, primary_type: str, deck_mask: int | None, price_ceiling: Decimal) -> bool:
+    if primary_type not in candidate.types or candidate.price_usd > price_ceiling:
+        return False
+    return deck_mask is None or not (candidate.identity_mask & ~deck_mask)
+
+
+def _rank(
+    candidates: Iterable[_Candidate],
+    *,
+    role_counts: dict[str, int] | None,
+    limit: int | None = None,
+) -> list[_Candidate]:
+    """Order by shared core roles (most first), then cheapest."""
+    counts = role_counts or {}
+    ranked = sorted(candidates, key=lambda c: (-counts.get(c.oracle_id, 0), c.price_usd, c.name))
+    return ranked if limit is None else ranked[:limit]
 
 
 # ---------------------------------------------------------------------------
-# Collection candidate search
+# Scryfall cache candidate index
 # ---------------------------------------------------------------------------
 
 
-def _collection_candidates(
-    user_id: int,
+class _CandidateIndex(NamedTuple):
+    by_oracle: dict[str, _Candidate]
+    # (primary type, identity mask) → candidates sorted by cheapest USD print.
+    buckets: dict[tuple[str, int], tuple[_Candidate, ...]]
+
+
+@lru_cache(maxsize=2)
+def _candidate_index(_epoch: int) -> _CandidateIndex:
+    """Cheapest USD print per oracle, bucketed by type and identity mask.
+
+    Cached on the cache epoch so the catalog is walked once per load rather
+    than once per expensive card. Uses embedded catalog prices only: the index
+    is built during warmup, where a price-service call per unpriced print would
+    stall startup.
+    """
+    if not sc.cache_ready():
+        sc.ensure_cache_loaded()
+    all_prints = sc.get_all_prints() or {}
+    cheapest: dict[str, _Candidate] = {}
+    for print_obj in all_prints.values() if isinstance(all_prints, dict) else all_prints:
+        oracle_id = (print_obj.get("oracle_id") or "").strip()
+        if not oracle_id:
+            continue
+        price = _embedded_usd_price(print_obj)
+        if price is None:
+            continue
+        current = cheapest.get(oracle_id)
+        if current is not None and current.price_usd <= price:
+            continue
+        types = current.types if current is not None else _type_labels(print_obj.get("type_line"))
+        if not types:
+            continue
+        identity = tuple(_color_identity_from_print(print_obj))
+        cheapest[oracle_id] = _Candidate(
+            price_usd=price,
+            name=print_obj.get("name") or "Unknown",
+            oracle_id=oracle_id,
+            type_line=print_obj.get("type_line"),
+            color_identity=identity,
+            identity_mask=_identity_mask(identity),
+            types=types,
+            print_data=print_obj,
+        )
+    grouped: dict[tuple[str, int], list[_Candidate]] = {}
+    for candidate in cheapest.values():
+        for label in candidate.types:
+            grouped.setdefault((label, candidate.identity_mask), []).append(candidate)
+    buckets = {
+        key: tuple(sorted(group, key=lambda c: (c.price_usd, c.name)))
+        for key, group in grouped.items()
+    }
+    return _CandidateIndex(by_oracle=cheapest, buckets=buckets)
+
+
+def _cache_candidates(
     *,
     primary_type: str,
     deck_identity: set[str],
     exclude_oracle_ids: set[str],
     price_ceiling: Decimal,
+    limit: int,
+    role_counts: dict[str, int] | None = None,
 ) -> list[BudgetSuggestion]:
-    if not primary_type:
+    if not primary_type or limit <= 0:
         return []
+    index = _candidate_index(sc.cache_epoch())
+    deck_mask = _identity_mask(deck_identity) if deck_identity else None
+    picked: list[_Candidate] = []
+    seen: set[str] = set(exclude_oracle_ids)
+
+    # Role-sharing cards first: only oracles tagged with a shared role are looked at.
+    if role_counts:
+        tagged = (index.by_oracle.get(oracle_id) for oracle_id in role_counts if oracle_id not in seen)
+        fitting = (
+            c for c in tagged
+            if c is not None and _fits(c, primary_type=primary_type, deck_mask=deck_mask, price_ceiling=price_ceiling)
+        )
+        shared = _take_live_priced(
+            _rank(fitting, role_counts=role_counts), price_ceiling=price_ceiling, limit=limit, seen=seen
+        )
+        picked = _rank(shared, role_counts=role_counts)
+
+    # Then the cheapest cards that fit, merged across the identity buckets.
+    if len(picked) < limit:
+        masks = _submasks(deck_mask if deck_mask is not None else _ALL_COLORS_MASK)
+        streams = [index.buckets.get((primary_type, mask), ()) for mask in masks]
+        cheapest = itertools.takewhile(
+            lambda c: c.price_usd <= price_ceiling,
+            heapq.merge(*streams, key=lambda c: (c.price_usd, c.name)),
+        )
+        extra = _take_live_priced(cheapest, price_ceiling=price_ceiling, limit=limit - len(picked), seen=seen)
+        picked.extend(sorted(extra, key=lambda c: (c.price_usd, c.name)))
+    return [_suggestion(c, owned=False) for c in picked]
+
+
+def _live_priced(candidate: _Candidate) -> _Candidate:
+    """Re-price a picked candidate from the price service when it has a quote."""
+    price = _usd_from_prices(prices_for_print_exact(candidate.print_data))
+    if price is None or price == candidate.price_usd:
+        return candidate
+    return candidate._replace(price_usd=price)
+
+
+def _take_live_priced(
+    candidates: Iterable[_Candidate],
+    *,
+    price_ceiling: Decimal,
+    limit: int,
+    seen: set[str],
+) -> list[_Candidate]:
+    """Re-price candidates in order and keep the first ``limit`` still under the ceiling.
+
+    The index orders by embedded prices, so a live quote can push a candidate
+    over the ceiling; those are skipped, within a bounded number of lookups.
+    """
+    picked: list[_Candidate] = []
+    lookups = limit * _LIVE_LOOKUPS_PER_PICK
+    for candidate in candidates:
+        if len(picked) >= limit or lookups <= 0:
+            break
+        if candidate.oracle_id in seen:
+            continue
+        seen.add(candidate.oracle_id)
+        lookups -= 1
+        live = _live_priced(candidate)
+        if live.price_usd <= price_ceiling:
+            picked.append(live)
+    return picked
+
+
+# ---------------------------------------------------------------------------
+# Collection candidate search
+# ---------------------------------------------------------------------------
+
+
+def _owned_pool(user_id: int) -> list[_Candidate]:
+    """The user's priced cards, cheapest copy per oracle, loaded once per report."""
     query = (
         db.session.query(Card)
         .join(Folder, Folder.id == Card.folder_id)
         .filter(Folder.owner_user_id == user_id)
     )
-    candidates: list[BudgetSuggestion] = []
-    seen_oracles: set[str] = set()
+    by_oracle: dict[str, _Candidate] = {}
+    unkeyed: list[_Candidate] = []
     for card in query.limit(5000).all():
-        oracle_id = (card.oracle_id or "").strip()
-        if oracle_id and oracle_id in exclude_oracle_ids:
-            continue
-        if oracle_id and oracle_id in seen_oracles:
-            continue
-        type_line = (card.type_line or "").lower()
-        if primary_type not in type_line:
+        types = _type_labels(card.type_line)
+        if not types:
             continue
         pr = _lookup_print_data(card.set_code, card.collector_number, card.name, card.oracle_id)
-        identity = _color_identity_from_print(pr)
-        if deck_identity and not _same_or_subset(identity, deck_identity):
-            continue
         price = _usd_price(pr)
-        if price is None or price > price_ceiling:
+        if price is None:
             continue
-        if oracle_id:
-            seen_oracles.add(oracle_id)
-        candidates.append(
-            BudgetSuggestion(
-                name=card.name,
-                oracle_id=card.oracle_id,
-                type_line=card.type_line,
-                color_identity=identity,
-                price_usd=price,
-                in_user_collection=True,
-            )
+        oracle_id = (card.oracle_id or "").strip()
+        current = by_oracle.get(oracle_id) if oracle_id else None
+        if current is not None and current.price_usd <= price:
+            continue
+        identity = tuple(_color_identity_from_print(pr))
+        candidate = _Candidate(
+            price_usd=price,
+            name=card.name,
+            oracle_id=card.oracle_id,
+            type_line=card.type_line,
+            color_identity=identity,
+            identity_mask=_identity_mask(identity),
+            types=types,
         )
-    candidates.sort(key=lambda s: (s.price_usd or Decimal("0")))
-    return candidates
-
-
-# ---------------------------------------------------------------------------
-# Scryfall cache candidate search
-# ---------------------------------------------------------------------------
+        if oracle_id:
+            by_oracle[oracle_id] = candidate
+        else:
+            unkeyed.append(candidate)
+    return [*by_oracle.values(), *unkeyed]
 
 
-def _cache_candidates(
+def _collection_candidates(
+    pool: list[_Candidate],
     *,
     primary_type: str,
     deck_identity: set[str],
     exclude_oracle_ids: set[str],
     price_ceiling: Decimal,
-    limit: int,
+    role_counts: dict[str, int] | None = None,
 ) -> list[BudgetSuggestion]:
     if not primary_type:
         return []
-    if not sc.cache_ready():
-        sc.ensure_cache_loaded()
-    all_prints = sc.get_all_prints() or {}
-    results: list[BudgetSuggestion] = []
-    seen_oracles: set[str] = set()
-    for print_obj in all_prints.values() if isinstance(all_prints, dict) else all_prints:
-        if len(results) >= limit:
-            break
-        oracle_id = (print_obj.get("oracle_id") or "").strip()
-        if not oracle_id or oracle_id in exclude_oracle_ids or oracle_id in seen_oracles:
-            continue
-        type_line = (print_obj.get("type_line") or "").lower()
-        if primary_type not in type_line:
-            continue
-        identity = _color_identity_from_print(print_obj)
-        if deck_identity and not _same_or_subset(identity, deck_identity):
-            continue
-        price = _usd_price(print_obj)
-        if price is None or price > price_ceiling:
-            continue
-        seen_oracles.add(oracle_id)
-        results.append(
-            BudgetSuggestion(
-                name=print_obj.get("name") or "Unknown",
-                oracle_id=oracle_id,
-                type_line=print_obj.get("type_line"),
-                color_identity=identity,
-                price_usd=price,
-                in_user_collection=False,
-            )
+    deck_mask = _identity_mask(deck_identity) if deck_identity else None
+    fitting = (
+        c for c in pool
+        if not (c.oracle_id and c.oracle_id in exclude_oracle_ids)
+        and _fits(c, primary_type=primary_type, deck_mask=deck_mask, price_ceiling=price_ceiling)
+    )
+    return [_suggestion(c, owned=True) for c in _rank(fitting, role_counts=role_counts)]
+
+
+# ---------------------------------------------------------------------------
+# Core-role overlap
+# ---------------------------------------------------------------------------
+
+
+def _role_overlap(oracle_ids: set[str]) -> dict[str, dict[str, int]]:
+    """For each oracle, the count of core roles every other tagged oracle shares with it."""
+    if not oracle_ids:
+        return {}
+    try:
+        own_rows = (
+            db.session.query(OracleCoreRoleTag.oracle_id, OracleCoreRoleTag.role)
+            .filter(OracleCoreRoleTag.oracle_id.in_(oracle_ids))
+            .all()
         )
-    results.sort(key=lambda s: (s.price_usd or Decimal("0")))
-    return results[:limit]
+        roles_by_oracle: dict[str, set[str]] = {}
+        for oracle_id, role in own_rows:
+            roles_by_oracle.setdefault(oracle_id, set()).add(role)
+        wanted_roles = set().union(*roles_by_oracle.values()) if roles_by_oracle else set()
+        if not wanted_roles:
+            return {}
+        tagged_rows = (
+            db.session.query(OracleCoreRoleTag.oracle_id, OracleCoreRoleTag.role)
+            .filter(OracleCoreRoleTag.role.in_(wanted_roles))
+            .distinct()
+            .all()
+        )
+    except Exception:
+        db.session.rollback()
+        return {}
+    oracles_by_role: dict[str, set[str]] = {}
+    for oracle_id, role in tagged_rows:
+        oracles_by_role.setdefault(role, set()).add(oracle_id)
+    overlap: dict[str, dict[str, int]] = {}
+    for oracle_id, roles in roles_by_oracle.items():
+        counts: dict[str, int] = {}
+        for role in roles:
+            for other in oracles_by_role.get(role, ()):
+                if other != oracle_id:
+                    counts[other] = counts.get(other, 0) + 1
+        overlap[oracle_id] = counts
+    return overlap
 
 
 # ---------------------------------------------------------------------------
@@ -243,8 +467,13 @@ def find_budget_alternatives(
     threshold_usd: Decimal | str | float = DEFAULT_EXPENSIVE_THRESHOLD,
     max_price_multiplier: Decimal = Decimal("0.25"),
     suggestions_per_card: int = DEFAULT_SUGGESTIONS_PER_CARD,
+    rank_by_roles: bool = True,
 ) -> BudgetAlternativesReport:
-    """Return alternative suggestions for every card above the threshold."""
+    """Return alternative suggestions for every card above the threshold.
+
+    With ``rank_by_roles`` candidates sharing more stored core roles with the
+    expensive card rank first; otherwise (and as the tie-break) cheapest wins.
+    """
     threshold = Decimal(str(threshold_usd))
     if threshold <= 0:
         raise ValueError("threshold_usd must be positive")
@@ -258,10 +487,6 @@ def find_budget_alternatives(
     )
 
     deck_identity: set[str] = set()
-    for ch in (folder.commander_name or ""):
-        pass  # commander color identity is derived from the deck rows below
-
-    expensive_slots: list[ExpensiveSlot] = []
     exclude_oracles: set[str] = set()
     # Accumulate the deck-wide color identity from the card rows so we don't
     # recommend cards outside the deck's legal colors.
@@ -272,6 +497,7 @@ def find_budget_alternatives(
         if card.oracle_id:
             exclude_oracles.add(card.oracle_id)
 
+    expensive: list[tuple[Card, dict, Decimal, str]] = []
     for card in folder.cards:
         qty = max(0, int(card.quantity or 0))
         if qty <= 0:
@@ -283,13 +509,26 @@ def find_budget_alternatives(
         primary = _primary_type(card.type_line)
         if not primary:
             continue
+        expensive.append((card, pr, price, primary))
+
+    owned_pool = _owned_pool(user_id) if expensive else []
+    overlap = (
+        _role_overlap({card.oracle_id for card, *_ in expensive if card.oracle_id})
+        if rank_by_roles and expensive
+        else {}
+    )
+
+    expensive_slots: list[ExpensiveSlot] = []
+    for card, pr, price, primary in expensive:
         price_ceiling = (price * max_price_multiplier).quantize(Decimal("0.01"))
+        role_counts = overlap.get(card.oracle_id) if card.oracle_id else None
         owned = _collection_candidates(
-            user_id,
+            owned_pool,
             primary_type=primary,
             deck_identity=deck_identity,
             exclude_oracle_ids=exclude_oracles,
             price_ceiling=price_ceiling,
+            role_counts=role_counts,
         )
         alternatives = owned[:suggestions_per_card]
         if len(alternatives) < suggestions_per_card:
@@ -302,6 +541,7 @@ def find_budget_alternatives(
                     | {alt.oracle_id for alt in alternatives if alt.oracle_id},
                     price_ceiling=price_ceiling,
                     limit=needed,
+                    role_counts=role_counts,
                 )
             )
         expensive_slots.append(
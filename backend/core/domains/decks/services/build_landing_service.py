@@ -9,6 +9,7 @@ from sqlalchemy import func, or_
 from extensions import db
 from models import BuildSession, BuildSessionCard, Card, EdhrecCommanderTagCard, Folder, FolderRole
 from core.domains.cards.services import scryfall_cache as sc
+from core.domains.decks.services import deck_analytics
 from core.domains.decks.services.commander_brackets import BRACKET_RULESET_EPOCH, evaluate_commander_bracket, spellbook_dataset_epoch
 from core.domains.decks.services.commander_cache import compute_bracket_signature
 from core.domains.decks.services.deck_tags import get_deck_tag_groups
@@ -180,44 +181,12 @@ def _oracle_detail(oracle_id: str, cache: dict[str, dict]) -> dict:
     pr = prints[0]
     payload["type_line"] = pr.get("type_line") or ""
     payload["cmc"] = pr.get("cmc")
-    payload["mana_costs"] = _mana_costs_from_faces(pr)
-    payload["oracle_text"] = _oracle_text_from_faces(pr)
+    payload["mana_costs"] = deck_analytics.mana_costs_from_print(pr)
+    payload["oracle_text"] = deck_analytics.oracle_text_from_print(pr)
     cache[oracle_id] = payload
     return payload
 
 
-def _mana_costs_from_faces(print_obj: dict) -> list[str]:
-    faces = print_obj.get("card_faces") or []
-    face_costs: list[str] = []
-    for face in faces:
-        if not isinstance(face, dict):
-            continue
-        face_cost = face.get("mana_cost")
-        if face_cost:
-            face_costs.append(str(face_cost))
-    if face_costs:
-        return [cost for cost in face_costs if cost]
-    mana_cost = print_obj.get("mana_cost")
-    if mana_cost:
-        return [str(mana_cost)]
-    return []
-
-
-def _oracle_text_from_faces(print_obj: dict) -> str:
-    texts: list[str] = []
-    oracle_text = print_obj.get("oracle_text")
-    if oracle_text:
-        texts.append(str(oracle_text))
-    faces = print_obj.get("card_faces") or []
-    for face in faces:
-        if not isinstance(face, dict):
-            continue
-        face_text = face.get("oracle_text")
-        if face_text:
-            texts.append(str(face_text))
-    return " // ".join([t for t in texts if t])
-
-
 def _build_session_bracket_context(
     session_id: int,
     commander_oracle_id: str,
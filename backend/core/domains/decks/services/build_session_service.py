@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import os
-import re
 from collections import defaultdict
 from typing import Iterable
 
@@ -18,6 +17,7 @@ from core.domains.cards.services import scryfall_cache as sc
 from core.domains.decks.services.build_recommendation_service import build_recommendation_sections
 from core.domains.decks.services import build_session_mutation_service as mutation_service
 from core.domains.decks.services import build_session_page_context_service as page_context_service
+from core.domains.decks.services import deck_analytics
 from core.domains.decks.services.commander_brackets import BRACKET_RULESET_EPOCH, evaluate_commander_bracket, spellbook_dataset_epoch
 from core.domains.decks.services.commander_cache import compute_bracket_signature
 from core.domains.decks.services.deck_tags import get_deck_tag_category, get_deck_tag_groups, resolve_deck_tag_from_slug
@@ -629,54 +629,22 @@ def _group_session_cards_by_type(cards: list[dict]) -> list[dict]:
 
 
 def _deck_metrics(entries: Iterable[BuildSessionCard]) -> dict:
-    items = list(entries or [])
-    oracle_ids = {entry.card_oracle_id for entry in items if entry.card_oracle_id}
-    role_map = _oracle_role_map(oracle_ids)
-
-    total_cards = 0
-    land_count = 0
-    mana_pip_non_land = {c: 0 for c in ["W", "U", "B", "R", "G"]}
-    production_counts = {c: 0 for c in ["W", "U", "B", "R", "G", "C"]}
-    curve_buckets = {"0": 0, "1": 0, "2": 0, "3": 0, "4": 0, "5": 0, "6": 0, "7+": 0}
-    missing_cmc = 0
+    items = [
+        (int(entry.quantity or 0), (entry.card_oracle_id or "").strip())
+        for entry in entries or []
+        if (entry.card_oracle_id or "").strip()
+    ]
+    role_map = _oracle_role_map({oracle_id for _qty, oracle_id in items})
+
+    metrics = deck_analytics.deck_metrics(((qty, oracle_id, None) for qty, oracle_id in items), load_cache=True)
+    total_cards = metrics.total_cards
+    land_count = metrics.land_count
+    curve_buckets = metrics.curve
+    missing_cmc = metrics.missing_cmc
     role_counts = {key: 0 for key in _ROLE_BUCKETS}
-    detail_cache: dict[str, dict] = {}
-
-    for entry in items:
-        oracle_id = (entry.card_oracle_id or "").strip()
-        if not oracle_id:
-            continue
-        qty = int(entry.quantity or 0)
+    for qty, oracle_id in items:
         if qty <= 0:
             continue
-        total_cards += qty
-        meta = _oracle_detail(oracle_id, detail_cache)
-        type_line = (meta.get("type_line") or "").lower()
-        cmc_raw = meta.get("cmc")
-        if cmc_raw is None:
-            cmc = None
-        else:
-            try:
-                cmc = float(cmc_raw)
-            except (TypeError, ValueError):
-                cmc = None
-        if "land" in type_line:
-            land_count += qty
-        else:
-            for mana_cost in meta.get("mana_costs") or []:
-                _add_colored_pips(mana_cost, qty, mana_pip_non_land)
-        if meta.get("is_permanent"):
-            for ch in _colors_from_oracle_text_add(meta.get("oracle_text") or ""):
-                production_counts[ch] += qty
-        if "land" not in type_line:
-            if cmc is None:
-                missing_cmc += qty
-            else:
-                bucket_val = int(round(cmc))
-                if bucket_val < 0:
-                    bucket_val = 0
-                bucket = str(bucket_val) if bucket_val <= 6 else "7+"
-                curve_buckets[bucket] += qty
         roles = role_map.get(oracle_id, set())
         for key, bucket_roles in _ROLE_BUCKETS.items():
             if roles & bucket_roles:
@@ -688,7 +656,7 @@ def _deck_metrics(entries: Iterable[BuildSessionCard]) -> dict:
 
     total_curve = sum(curve_buckets.values()) or 1
     curve_rows = []
-    for label in ["0", "1", "2", "3", "4", "5", "6", "7+"]:
+    for label in deck_analytics.CURVE_BUCKETS:
         count = int(curve_buckets.get(label) or 0)
         pct = int(round(100.0 * count / total_curve)) if total_curve else 0
         curve_rows.append({"label": label, "count": count, "pct": pct})
@@ -697,8 +665,8 @@ def _deck_metrics(entries: Iterable[BuildSessionCard]) -> dict:
         "total_cards": total_cards,
         "land_count": land_count,
         "non_land_count": non_land_count,
-        "mana_pip_dist": _mana_pip_dist(mana_pip_non_land),
-        "land_mana_sources": _mana_source_dist(production_counts),
+        "mana_pip_dist": _mana_pip_dist(metrics.pips_non_land),
+        "land_mana_sources": _mana_source_dist(metrics.production),
         "curve_buckets": curve_buckets,
         "curve_rows": curve_rows,
         "missing_cmc": missing_cmc,
@@ -758,75 +726,13 @@ def _oracle_detail(oracle_id: str, cache: dict[str, dict]) -> dict:
     type_line = pr.get("type_line") or ""
     payload["type_line"] = type_line
     payload["cmc"] = pr.get("cmc")
-    payload["mana_costs"] = _mana_costs_from_faces(pr)
-    payload["oracle_text"] = _oracle_text_from_faces(pr)
-    payload["is_permanent"] = _is_permanent_type(type_line)
+    payload["mana_costs"] = deck_analytics.mana_costs_from_print(pr)
+    payload["oracle_text"] = deck_analytics.oracle_text_from_print(pr)
+    payload["is_permanent"] = deck_analytics.is_permanent_type(type_line)
     cache[oracle_id] = payload
     return payload
 
 
-def _mana_costs_from_faces(print_obj: dict) -> list[str]:
-    faces = print_obj.get("card_faces") or []
-    face_costs: list[str] = []
-    for face in faces:
-        if not isinstance(face, dict):
-            continue
-        face_cost = face.get("mana_cost")
-        if face_cost:
-            face_costs.append(str(face_cost))
-    if face_costs:
-        return [cost for cost in face_costs if cost]
-    mana_cost = print_obj.get("mana_cost")
-    if mana_cost:
-        return [str(mana_cost)]
-    return []
-
-
-def _oracle_text_from_faces(print_obj: dict) -> str:
-    texts: list[str] = []
-    oracle_text = print_obj.get("oracle_text")
-    if oracle_text:
-        texts.append(str(oracle_text))
-    faces = print_obj.get("card_faces") or []
-    for face in faces:
-        if not isinstance(face, dict):
-            continue
-        face_text = face.get("oracle_text")
-        if face_text:
-            texts.append(str(face_text))
-    return " // ".join([t for t in texts if t])
-
-
-def _is_permanent_type(type_line: str) -> bool:
-    lowered = (type_line or "").lower()
-    return any(token in lowered for token in ("land", "creature", "artifact", "enchantment", "planeswalker", "battle"))
-
-
-def _add_colored_pips(mana_cost: str, qty: int, counts: dict[str, int]) -> None:
-    for symbol in RE_COST_SYMBOL.findall(mana_cost or ""):
-        token = symbol.upper()
-        for ch in ("W", "U", "B", "R", "G"):
-            if ch in token:
-                counts[ch] += qty
-
-
-def _colors_from_oracle_text_add(text: str) -> set[str]:
-    out: set[str] = set()
-    if not text:
-        return out
-    upper = text.upper()
-    if "ADD" not in upper:
-        return out
-    for sym in RE_COST_SYMBOL.findall(text):
-        token = sym.upper()
-        for ch in ("W", "U", "B", "R", "G", "C"):
-            if ch in token:
-                out.add(ch)
-    if "ANY COLOR" in upper:
-        out.update({"W", "U", "B", "R", "G"})
-    return out
-
-
 def _mana_pip_dist(counts: dict[str, int]) -> list[tuple[str, str | None, int]]:
     dist: list[tuple[str, str | None, int]] = []
     for c in ["W", "U", "B", "R", "G"]:
@@ -1093,38 +999,18 @@ def _commander_drawer_payload(oracle_id: str | None, fallback_name: str | None)
 
 
 def _curve_rows_for_entries(entries: Iterable[BuildSessionCard]) -> list[dict]:
-    bins = {"0": 0, "1": 0, "2": 0, "3": 0, "4": 0, "5": 0, "6": 0, "7+": 0}
-    detail_cache: dict[str, dict] = {}
-    for entry in entries or []:
-        oracle_id = (entry.card_oracle_id or "").strip()
-        if not oracle_id:
-            continue
-        qty = int(entry.quantity or 0)
-        if qty <= 0:
-            continue
-        meta = _oracle_detail(oracle_id, detail_cache)
-        type_line = (meta.get("type_line") or "").lower()
-        if "land" in type_line:
-            continue
-        cmc_raw = meta.get("cmc")
-        if cmc_raw is None:
-            cmc = None
-        else:
-            try:
-                cmc = float(cmc_raw)
-            except (TypeError, ValueError):
-                cmc = None
-        if cmc is None:
-            continue
-        bucket_val = int(round(cmc))
-        if bucket_val < 0:
-            bucket_val = 0
-        bucket = str(bucket_val) if bucket_val <= 6 else "7+"
-        bins[bucket] += qty
-
+    metrics = deck_analytics.deck_metrics(
+        (
+            (int(entry.quantity or 0), (entry.card_oracle_id or "").strip(), None)
+            for entry in entries or []
+            if (entry.card_oracle_id or "").strip()
+        ),
+        load_cache=True,
+    )
+    bins = metrics.curve
     max_curve = max(bins.values()) if bins else 0
     rows = []
-    for bucket in ["0", "1", "2", "3", "4", "5", "6", "7+"]:
+    for bucket in deck_analytics.CURVE_BUCKETS:
         count = int(bins.get(bucket) or 0)
         if count <= 0:
             continue
@@ -1225,8 +1111,6 @@ _COLLECTION_TYPE_GROUPS = [
     ("Lands", ("land",)),
 ]
 
-RE_COST_SYMBOL = re.compile(r"\{([^}]+)\}")
-
 
 __all__ = [
     "add_card",
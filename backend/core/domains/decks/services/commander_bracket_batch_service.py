@@ -0,0 +1,192 @@
+"""Batch commander bracket evaluation for deck listings.
+
+The decks overview shows a bracket for every deck on the page. Each deck is
+first matched against its stored result by a cheap content version (row
+count, quantity total and latest card edit, all from one grouped query), so a
+page where nothing changed costs a couple of queries regardless of deck size.
+Only stale decks load their card rows; every distinct oracle among them is
+resolved to a slim bracket payload once and shared across decks, and fresh
+results are written back in a single commit.
+
+Scryfall lookups and the evaluator come from ``hooks`` (the deck gallery
+module), matching the other gallery context builders.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections import defaultdict
+from typing import Any, Iterable
+
+from sqlalchemy import func
+
+from extensions import db
+from models import Card, Folder
+from core.domains.decks.services.commander_cache import (
+    _normalize_epoch,
+    get_cached_bracket_rows,
+    store_cached_brackets,
+)
+
+__all__ = ["deck_source_versions", "evaluate_deck_brackets"]
+
+
+def _joined_oracle_text(print_obj: dict) -> str:
+    parts = []
+    text = print_obj.get("oracle_text")
+    if text:
+        parts.append(text)
+    for face in print_obj.get("card_faces") or []:
+        face_text = (face or {}).get("oracle_text")
+        if face_text:
+            parts.append(face_text)
+    return " // ".join(part for part in parts if part)
+
+
+def deck_source_versions(folders: Iterable[Folder], *, epoch: int) -> dict[int, str]:
+    """Content version per folder from one grouped query over its card rows."""
+    folder_list = [folder for folder in folders if folder is not None and folder.id]
+    if not folder_list:
+        return {}
+    stats = {
+        folder_id: (row_count, qty_sum, max_updated)
+        for folder_id, row_count, qty_sum, max_updated in (
+            db.session.query(
+                Card.folder_id,
+                func.count(Card.id),
+                func.coalesce(func.sum(Card.quantity), 0),
+                func.max(Card.updated_at),
+            )
+            .filter(Card.folder_id.in_([folder.id for folder in folder_list]))
+            .group_by(Card.folder_id)
+            .all()
+        )
+    }
+    versions: dict[int, str] = {}
+    for folder in folder_list:
+        row_count, qty_sum, max_updated = stats.get(folder.id, (0, 0, None))
+        raw = "|".join(
+            (
+                str(_normalize_epoch(epoch)),
+                folder.commander_oracle_id or "",
+                folder.commander_name or "",
+                str(int(row_count or 0)),
+                str(int(qty_sum or 0)),
+                max_updated.isoformat() if max_updated else "none",
+            )
+        )
+        versions[folder.id] = hashlib.sha1(raw.encode("utf-8")).hexdigest()
+    return versions
+
+
+class _PrintResolver:
+    """Resolve each oracle (or set/collector pair) to a slim bracket payload once."""
+
+    def __init__(self, hooks: Any):
+        self.hooks = hooks
+        self.by_oracle: dict[str, dict | None] = {}
+        self.by_set_cn: dict[tuple[str, str], dict | None] = {}
+
+    def _slim(self, print_obj: dict | None) -> dict | None:
+        if not print_obj:
+            return None
+        sc = self.hooks.sc
+        return {
+            "name": sc.display_name_for_print(print_obj) if hasattr(sc, "display_name_for_print") else print_obj.get("name"),
+            "type_line": sc.type_label_for_print(print_obj) if hasattr(sc, "type_label_for_print") else print_obj.get("type_line") or "",
+            "oracle_text": _joined_oracle_text(print_obj),
+            "mana_cost": print_obj.get("mana_cost"),
+            "mana_value": print_obj.get("cmc"),
+            "produced_mana": print_obj.get("produced_mana"),
+            "game_changer": bool(print_obj.get("game_changer")),
+        }
+
+    def payload(self, card: Card) -> dict:
+        base = None
+        oracle_id = card.oracle_id
+        if oracle_id:
+            if oracle_id not in self.by_oracle:
+                try:
+                    prints = self.hooks.prints_for_oracle(oracle_id) or []
+                except Exception:
+                    prints = []
+                self.by_oracle[oracle_id] = self._slim(prints[0] if prints else None)
+            base = self.by_oracle[oracle_id]
+        if base is None:
+            key = (card.set_code or "", str(card.collector_number or ""))
+            if key not in self.by_set_cn:
+                try:
+                    found = self.hooks.find_by_set_cn(card.set_code, card.collector_number, card.name)
+                except Exception:
+                    found = None
+                self.by_set_cn[key] = self._slim(found)
+            base = self.by_set_cn[key]
+        qty = int(card.quantity or 0) or 1
+        if base is not None:
+            return {**base, "name": base["name"] or card.name, "quantity": qty}
+        return {
+            "name": card.name,
+            "type_line": getattr(card, "type_line", "") or "",
+            "oracle_text": getattr(card, "oracle_text", "") or "",
+            "mana_cost": getattr(card, "mana_cost", None),
+            "mana_value": getattr(card, "mana_value", None),
+            "produced_mana": getattr(card, "produced_mana", None),
+            "quantity": qty,
+            "game_changer": bool(getattr(card, "game_changer", False)),
+        }
+
+
+def evaluate_deck_brackets(folders: Iterable[Folder], *, epoch: int, hooks: Any) -> dict[int, dict]:
+    """Return ``{folder_id: bracket_context}`` for many decks at once.
+
+    Stored results are reused when the deck's content version still matches;
+    otherwise the deck's cards are loaded and its card signature checked
+    before re-running the evaluator.
+    """
+    folder_map = {folder.id: folder for folder in folders if folder is not None and folder.id}
+    if not folder_map:
+        return {}
+    normalized_epoch = _normalize_epoch(epoch)
+    versions = deck_source_versions(folder_map.values(), epoch=epoch)
+    stored = get_cached_bracket_rows(folder_map)
+
+    results: dict[int, dict] = {}
+    stale: list[int] = []
+    for folder_id in folder_map:
+        row = stored.get(folder_id)
+        if (
+            row is not None
+            and row.payload
+            and row.cache_epoch == normalized_epoch
+            and row.source_version == versions.get(folder_id)
+        ):
+            results[folder_id] = row.payload
+        else:
+            stale.append(folder_id)
+    if not stale:
+        return results
+
+    cards_by_folder: dict[int, list[Card]] = defaultdict(list)
+    for card in Card.query.filter(Card.folder_id.in_(stale)).all():
+        cards_by_folder[card.folder_id].append(card)
+
+    resolver = _PrintResolver(hooks)
+    writes: list[tuple[int, str, dict, str | None]] = []
+    for folder_id in stale:
+        folder = folder_map[folder_id]
+        cards_payload = [resolver.payload(card) for card in cards_by_folder.get(folder_id, [])]
+        commander_stub = {
+            "oracle_id": hooks.primary_commander_oracle_id(folder.commander_oracle_id),
+            "name": hooks.primary_commander_name(folder.commander_name) or folder.commander_name,
+        }
+        signature = hooks.compute_bracket_signature(cards_payload, commander_stub, epoch=epoch)
+        row = stored.get(folder_id)
+        if row is not None and row.payload and row.cache_epoch == normalized_epoch and row.card_signature == signature:
+            ctx = row.payload
+        else:
+            ctx = hooks.evaluate_commander_bracket(cards_payload, commander_stub)
+        results[folder_id] = ctx
+        writes.append((folder_id, signature, ctx, versions.get(folder_id)))
+
+    store_cached_brackets(writes, epoch, existing=stored)
+    return results
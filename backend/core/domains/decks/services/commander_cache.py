@@ -15,7 +15,9 @@ from core.shared.utils.time import utcnow
 __all__ = [
     "compute_bracket_signature",
     "get_cached_bracket",
+    "get_cached_bracket_rows",
     "store_cached_bracket",
+    "store_cached_brackets",
 ]
 
 
@@ -115,6 +117,53 @@ def get_cached_bracket(folder_id: Optional[int], signature: str, epoch: int) ->
     return entry.payload or None
 
 
+def get_cached_bracket_rows(folder_ids: Iterable[int]) -> Dict[int, CommanderBracketCache]:
+    """Load the stored bracket rows for many folders in one query."""
+    ids = {int(fid) for fid in folder_ids if fid}
+    if not ids:
+        return {}
+    try:
+        rows = db.session.query(CommanderBracketCache).filter(CommanderBracketCache.folder_id.in_(ids)).all()
+    except Exception as exc:  # pragma: no cover - defensive fallback
+        current_app.logger.debug("Commander bracket cache batch lookup failed: %s", exc)
+        db.session.rollback()
+        return {}
+    return {row.folder_id: row for row in rows}
+
+
+def store_cached_brackets(
+    entries: Iterable[tuple[int, str, Dict[str, Any], Optional[str]]],
+    epoch: int,
+    *,
+    existing: Optional[Dict[int, CommanderBracketCache]] = None,
+) -> None:
+    """Persist many ``(folder_id, signature, payload, source_version)`` results with one commit."""
+    rows = dict(existing or {})
+    normalized = _normalize_epoch(epoch)
+    wrote = False
+    for folder_id, signature, payload, source_version in entries:
+        if not folder_id:
+            continue
+        entry = rows.get(folder_id)
+        if entry is None:
+            entry = CommanderBracketCache(folder_id=folder_id)
+            db.session.add(entry)
+            rows[folder_id] = entry
+        entry.card_signature = signature
+        entry.cache_epoch = normalized
+        entry.payload = payload
+        entry.source_version = source_version
+        entry.updated_at = utcnow()
+        wrote = True
+    if not wrote:
+        return
+    try:
+        db.session.commit()
+    except Exception as exc:  # pragma: no cover - defensive fallback
+        current_app.logger.warning("Unable to persist commander bracket cache batch: %s", exc)
+        db.session.rollback()
+
+
 def store_cached_bracket(folder_id: Optional[int], signature: str, epoch: int, payload: Dict[str, Any]) -> None:
     """Persist a freshly computed bracket payload for reuse."""
     if not folder_id:
@@ -133,6 +182,7 @@ def store_cached_bracket(folder_id: Optional[int], signature: str, epoch: int, p
     entry.card_signature = signature
     entry.cache_epoch = _normalize_epoch(epoch)
     entry.payload = payload
+    entry.source_version = None
     entry.updated_at = utcnow()
 
     try:
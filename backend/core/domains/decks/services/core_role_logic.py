@@ -5,21 +5,26 @@ from functools import lru_cache
 import json
 from pathlib import Path
 import re
-from typing import Iterable, Pattern, Tuple, Set
+import time
+from typing import Any, Dict, Iterable, Pattern, Tuple, Set
 
 
 CORE_ROLE_RULES_PATH = Path(__file__).resolve().parents[4] / "core-role" / "core-role-logic.json"
 _REMINDER_TEXT_RE = re.compile(r"\([^()]*\)")
 _WHITESPACE_RE = re.compile(r"\s+")
 _SIMPLE_TOKEN_RE = re.compile(r"^[a-z0-9]+$")
+_WORD_CHAR_RE = re.compile(r"\w")
 
 
 @dataclass(frozen=True)
 class CoreRoleRule:
     role: str
-    requires: Tuple[Pattern[str], ...]
-    optional: Tuple[Pattern[str], ...]
-    excludes: Tuple[Pattern[str], ...]
+    requires: Tuple[str, ...]
+    optional: Tuple[str, ...]
+    excludes: Tuple[str, ...]
+    # Bitsets over TokenMatcher token ids.
+    requires_mask: int = 0
+    excludes_mask: int = 0
 
 
 def _load_json(path: Path) -> dict:
@@ -58,59 +63,223 @@ def _normalize_text(text: str, normalization: dict) -> str:
     return out
 
 
-def _compile_token(token: str) -> Pattern[str] | None:
-    token = (token or "").strip().lower()
-    if not token:
-        return None
+def _clean_token(token: str) -> str:
+    return (token or "").strip().lower()
+
+
+def _token_pattern(token: str) -> str:
+    # Plain words only match whole words; anything else is a substring match.
     if _SIMPLE_TOKEN_RE.match(token):
-        return re.compile(r"\b" + re.escape(token) + r"\b")
-    return re.compile(re.escape(token))
+        return r"\b" + re.escape(token) + r"\b"
+    return re.escape(token)
+
+
+class TokenMatcher:
+    """Every rule token compiled into one regex; :meth:`scan` finds all of them in one pass.
+
+    The tokens form a trie rendered as a single pattern that, tried at each
+    offset inside a lookahead, returns the longest token starting there. Any
+    other token starting at that offset must be a prefix of it, so the prefix
+    tokens that match along with each token are worked out once up front.
+    The only thing left to check per match is the leading ``\\b`` of plain-word
+    tokens, which is the same for every token starting at that offset.
+    """
+
+    def __init__(self, tokens: Iterable[str]):
+        self.tokens: Tuple[str, ...] = tuple(dict.fromkeys(t for t in (_clean_token(v) for v in tokens) if t))
+        self.ids = {token: idx for idx, token in enumerate(self.tokens)}
+        self._regex = re.compile("(?=(" + self._trie_pattern() + "))") if self.tokens else None
+        # token -> (mask when the offset is not at a word boundary, mask when it is)
+        self._masks: dict[str, tuple[int, int]] = {}
+        for token in self.tokens:
+            mid_word = at_boundary = 0
+            for other in self.tokens:
+                if not token.startswith(other):
+                    continue
+                simple = bool(_SIMPLE_TOKEN_RE.match(other))
+                if simple and other != token and _WORD_CHAR_RE.match(token[len(other)]):
+                    continue  # trailing \b cannot hold inside ``token``
+                bit = 1 << self.ids[other]
+                at_boundary |= bit
+                if not simple:
+                    mid_word |= bit
+            self._masks[token] = (mid_word, at_boundary)
+
+    def _trie_pattern(self) -> str:
+        root: dict = {}
+        for token in self.tokens:
+            node = root
+            for ch in token:
+                node = node.setdefault(ch, {})
+            node[""] = {}
+
+        def emit(node: dict, prefix: str) -> str | None:
+            branches = [
+                re.escape(ch) + (emit(child, prefix + ch) or "")
+                for ch, child in sorted(node.items())
+                if ch
+            ]
+            end = None
+            if "" in node:
+                end = r"\b" if _SIMPLE_TOKEN_RE.match(prefix) else ""
+            if not branches:
+                return end
+            body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+            # Longer tokens first; fall back to the token ending here.
+            return body if end is None else f"(?:{body}|{end})"
+
+        return emit(root, "") or ""
+
+    def mask(self, tokens: Iterable[str]) -> int:
+        out = 0
+        for token in tokens:
+            idx = self.ids.get(_clean_token(token))
+            if idx is not None:
+                out |= 1 << idx
+        return out
+
+    def scan(self, text: str) -> int:
+        """Bitset of the ids of every token found in ``text``."""
+        if not text or self._regex is None:
+            return 0
+        found = 0
+        masks = self._masks
+        for match in self._regex.finditer(text):
+            start = match.start()
+            at_boundary = start == 0 or not _WORD_CHAR_RE.match(text[start - 1])
+            found |= masks[match.group(1)][at_boundary]
+        return found
+
+    def matched_tokens(self, text: str) -> Set[str]:
+        found = self.scan(text)
+        return {token for idx, token in enumerate(self.tokens) if found >> idx & 1}
 
 
 @lru_cache(maxsize=1)
-def _load_core_role_rules() -> tuple[dict, tuple[CoreRoleRule, ...]]:
+def _load_core_role_rules() -> tuple[dict, tuple[CoreRoleRule, ...], TokenMatcher]:
     data = _load_json(CORE_ROLE_RULES_PATH)
     normalization = data.get("normalization") or {}
-    rules = []
+    entries = []
     for entry in data.get("roles") or []:
         if not isinstance(entry, dict):
             continue
         role = (entry.get("role") or "").strip().lower()
         if not role:
             continue
-        requires = tuple(
-            token for token in (_compile_token(v) for v in (entry.get("requires") or [])) if token
-        )
-        optional = tuple(
-            token for token in (_compile_token(v) for v in (entry.get("optional") or [])) if token
+        entries.append(
+            (
+                role,
+                tuple(t for t in (_clean_token(v) for v in (entry.get("requires") or [])) if t),
+                tuple(t for t in (_clean_token(v) for v in (entry.get("optional") or [])) if t),
+                tuple(t for t in (_clean_token(v) for v in (entry.get("excludes") or [])) if t),
+            )
         )
-        excludes = tuple(
-            token for token in (_compile_token(v) for v in (entry.get("excludes") or [])) if token
+    matcher = TokenMatcher(token for _role, req, opt, exc in entries for token in (*req, *opt, *exc))
+    rules = tuple(
+        CoreRoleRule(
+            role=role,
+            requires=requires,
+            optional=optional,
+            excludes=excludes,
+            requires_mask=matcher.mask(requires),
+            excludes_mask=matcher.mask(excludes),
         )
-        rules.append(CoreRoleRule(role=role, requires=requires, optional=optional, excludes=excludes))
-    return normalization, tuple(rules)
+        for role, requires, optional, excludes in entries
+    )
+    return normalization, rules, matcher
 
 
 def core_role_label(role: str) -> str:
     return (role or "").replace("_", " ").replace("-", " ").title().strip()
 
 
+def _rule_text(name: str | None, type_line: str | None, oracle_text: str | None, normalization: dict) -> str:
+    text = " ".join(part for part in (name, type_line, oracle_text) if part)
+    return _normalize_text(text, normalization)
+
+
 def derive_core_roles(
     *,
     oracle_text: str | None,
     type_line: str | None = None,
     name: str | None = None,
 ) -> Set[str]:
-    normalization, rules = _load_core_role_rules()
-    text = " ".join(part for part in (name, type_line, oracle_text) if part)
-    normalized = _normalize_text(text, normalization)
+    normalization, rules, matcher = _load_core_role_rules()
+    normalized = _rule_text(name, type_line, oracle_text, normalization)
     if not normalized or not rules:
         return set()
+    found = matcher.scan(normalized)
     matches: Set[str] = set()
     for rule in rules:
-        if rule.requires and not all(rx.search(normalized) for rx in rule.requires):
+        if rule.requires_mask & ~found:
             continue
-        if rule.excludes and any(rx.search(normalized) for rx in rule.excludes):
+        if rule.excludes_mask & found:
             continue
         matches.add(rule.role)
     return matches
+
+
+@lru_cache(maxsize=1)
+def _per_token_patterns() -> dict[str, Pattern[str]]:
+    _normalization, _rules, matcher = _load_core_role_rules()
+    return {token: re.compile(_token_pattern(token)) for token in matcher.tokens}
+
+
+def _derive_core_roles_per_rule(normalized: str) -> Set[str]:
+    """The one-search-per-token evaluation the matcher replaced (benchmark baseline)."""
+    _normalization, rules, _matcher = _load_core_role_rules()
+    patterns = _per_token_patterns()
+    matches: Set[str] = set()
+    for rule in rules:
+        if rule.requires and not all(patterns[token].search(normalized) for token in rule.requires):
+            continue
+        if rule.excludes and any(patterns[token].search(normalized) for token in rule.excludes):
+            continue
+        matches.add(rule.role)
+    return matches
+
+
+def benchmark_core_roles(cards: Iterable[dict], *, rounds: int = 3) -> Dict[str, Any]:
+    """Time per-rule regex evaluation against the compiled matcher over ``cards``.
+
+    ``cards`` are dicts with ``name``/``type_line``/``oracle_text`` (e.g. one
+    per oracle). Normalization is done once up front so only rule evaluation
+    is timed; ``mismatches`` counts cards where the two disagree.
+    """
+    normalization, rules, matcher = _load_core_role_rules()
+    texts = [
+        _rule_text(card.get("name"), card.get("type_line"), card.get("oracle_text"), normalization)
+        for card in cards
+    ]
+    texts = [text for text in texts if text]
+    rounds = max(1, int(rounds))
+
+    def _compiled(normalized: str) -> Set[str]:
+        found = matcher.scan(normalized)
+        return {
+            rule.role
+            for rule in rules
+            if not (rule.requires_mask & ~found) and not (rule.excludes_mask & found)
+        }
+
+    timings: Dict[str, float] = {}
+    results: Dict[str, list] = {}
+    for label, fn in (("per_rule", _derive_core_roles_per_rule), ("compiled", _compiled)):
+        results[label] = [fn(text) for text in texts]
+        started = time.perf_counter()
+        for _ in range(rounds):
+            for text in texts:
+                fn(text)
+        timings[label] = (time.perf_counter() - started) / rounds
+
+    return {
+        "cards": len(texts),
+        "rules": len(rules),
+        "tokens": len(matcher.tokens),
+        "per_rule_seconds": round(timings["per_rule"], 4),
+        "compiled_seconds": round(timings["compiled"], 4),
+        "per_rule_us_per_card": round(timings["per_rule"] * 1e6 / len(texts), 2) if texts else 0.0,
+        "compiled_us_per_card": round(timings["compiled"] * 1e6 / len(texts), 2) if texts else 0.0,
+        "speedup": round(timings["per_rule"] / timings["compiled"], 2) if timings["compiled"] else None,
+        "mismatches": sum(1 for a, b in zip(results["per_rule"], results["compiled"]) if a != b),
+    }
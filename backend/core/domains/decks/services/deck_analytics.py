@@ -0,0 +1,362 @@
+"""Deck analytics over a per-oracle feature table.
+
+Deck stats, build sessions, deck comparisons and the mana-base report all
+need the same per-card facts: colored pips in the mana cost, mana value,
+whether the card is a land or a permanent, and which colors it can produce.
+Those used to be re-parsed from mana-cost strings and oracle text with
+regexes on every call, in several slightly different copies.
+
+:func:`features_from_print` / :func:`features_from_row` define the parsing
+once. The feature table precomputes it for every oracle in the Scryfall
+cache, once per cache epoch, as NumPy arrays. :func:`deck_metrics` then
+reduces a deck to quantity-weighted sums over those arrays. Cards whose
+oracle is not in the table (no cache loaded, custom rows) fall back to
+features parsed from the caller's row data.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Iterable, Optional, Sequence
+
+import numpy as np
+
+from core.domains.cards.services import scryfall_cache as sc
+
+__all__ = [
+    "COLORS",
+    "CURVE_BUCKETS",
+    "SOURCE_COLORS",
+    "CardFeatures",
+    "DeckMetrics",
+    "FeatureArrays",
+    "colored_pips",
+    "deck_features",
+    "deck_metrics",
+    "features_from_print",
+    "features_from_row",
+    "is_permanent_type",
+    "mana_costs_from_faces",
+    "mana_costs_from_print",
+    "oracle_text_from_print",
+    "produced_colors",
+]
+
+COLORS = ("W", "U", "B", "R", "G")
+SOURCE_COLORS = COLORS + ("C",)
+CURVE_BUCKETS = ("0", "1", "2", "3", "4", "5", "6", "7+")
+
+_COST_SYMBOL_RE = re.compile(r"\{([^}]+)\}")
+# "Add ..." up to the end of its sentence; "additional"/"added" do not match.
+_ADD_CLAUSE_RE = re.compile(r"\badd\b([^.\n]*)", re.IGNORECASE)
+_PERMANENT_TYPES = ("land", "artifact", "creature", "enchantment", "planeswalker", "battle")
+_BASIC_LAND_TYPES = (("plains", "W"), ("island", "U"), ("swamp", "B"), ("mountain", "R"), ("forest", "G"))
+
+
+# ---------------------------------------------------------------------------
+# Parsing
+# ---------------------------------------------------------------------------
+
+
+def _faces_list(faces_json: Any) -> list[dict]:
+    if not faces_json:
+        return []
+    if isinstance(faces_json, dict):
+        faces = faces_json.get("faces") or []
+    else:
+        faces = faces_json
+    return [face for face in faces if isinstance(face, dict)]
+
+
+def mana_costs_from_faces(faces_json: Any) -> list[str]:
+    """Mana costs from a ``Card.faces_json`` value (``{"faces": [...]}`` or a list)."""
+    return [str(face["mana_cost"]) for face in _faces_list(faces_json) if face.get("mana_cost")]
+
+
+def mana_costs_from_print(print_obj: dict) -> list[str]:
+    """Per-face mana costs of a Scryfall print, or its single ``mana_cost``."""
+    face_costs = mana_costs_from_faces(print_obj.get("card_faces"))
+    if face_costs:
+        return face_costs
+    mana_cost = print_obj.get("mana_cost")
+    return [str(mana_cost)] if mana_cost else []
+
+
+def oracle_text_from_print(print_obj: dict) -> str:
+    texts = [str(print_obj["oracle_text"])] if print_obj.get("oracle_text") else []
+    texts.extend(str(face["oracle_text"]) for face in _faces_list(print_obj.get("card_faces")) if face.get("oracle_text"))
+    return " // ".join(texts)
+
+
+def colored_pips(mana_costs: Iterable[str]) -> tuple[int, int, int, int, int]:
+    """W/U/B/R/G pip counts; hybrid and Phyrexian symbols count for each color they name."""
+    counts = [0, 0, 0, 0, 0]
+    for cost in mana_costs:
+        for symbol in _COST_SYMBOL_RE.findall(cost or ""):
+            upper = symbol.upper()
+            for idx, color in enumerate(COLORS):
+                if color in upper:
+                    counts[idx] += 1
+    return tuple(counts)  # type: ignore[return-value]
+
+
+def produced_colors(oracle_text: str | None, type_line: str | None = None) -> frozenset[str]:
+    """Colors (W/U/B/R/G/C) a card can add, from its text and basic land types.
+
+    A heuristic: exact mana symbols inside an "Add ..." clause count, and
+    "any color" in such a clause means all five. Costs ahead of the clause
+    ("{2}{W}, {T}: Add {G}.") and hybrid symbols are ignored.
+    """
+    out: set[str] = set()
+    for clause in _ADD_CLAUSE_RE.findall(oracle_text or ""):
+        upper = clause.upper()
+        out.update(symbol for symbol in _COST_SYMBOL_RE.findall(upper) if symbol in SOURCE_COLORS)
+        if "ANY COLOR" in upper:
+            out.update(COLORS)
+    lowered_type = (type_line or "").lower()
+    if "land" in lowered_type:
+        out.update(color for land_type, color in _BASIC_LAND_TYPES if land_type in lowered_type)
+    return frozenset(out)
+
+
+def is_permanent_type(type_line: str | None) -> bool:
+    lowered = (type_line or "").lower()
+    return any(token in lowered for token in _PERMANENT_TYPES)
+
+
+def _as_float(value: Any) -> Optional[float]:
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass(frozen=True, slots=True)
+class CardFeatures:
+    pips: tuple[int, int, int, int, int]
+    cmc: Optional[float]
+    is_land: bool
+    is_permanent: bool
+    produces: frozenset[str]
+
+
+UNKNOWN_FEATURES = CardFeatures(pips=(0, 0, 0, 0, 0), cmc=None, is_land=False, is_permanent=False, produces=frozenset())
+
+
+def _features(type_line: str | None, cmc: Any, mana_costs: Iterable[str], oracle_text: str | None) -> CardFeatures:
+    type_line = type_line or ""
+    return CardFeatures(
+        pips=colored_pips(mana_costs),
+        cmc=_as_float(cmc),
+        is_land="land" in type_line.lower(),
+        is_permanent=is_permanent_type(type_line),
+        produces=produced_colors(oracle_text, type_line),
+    )
+
+
+def features_from_print(print_obj: dict) -> CardFeatures:
+    return _features(
+        print_obj.get("type_line") or "",
+        print_obj.get("cmc"),
+        mana_costs_from_print(print_obj),
+        oracle_text_from_print(print_obj),
+    )
+
+
+def features_from_row(
+    *,
+    type_line: str | None,
+    mana_value: Any,
+    faces_json: Any = None,
+    oracle_text: str | None = None,
+    mana_cost: str | None = None,
+) -> CardFeatures:
+    """Features from stored card columns, for cards missing from the feature table."""
+    costs = mana_costs_from_faces(faces_json) or ([mana_cost] if mana_cost else [])
+    text = oracle_text or " // ".join(
+        face["oracle_text"] for face in _faces_list(faces_json) if face.get("oracle_text")
+    )
+    return _features(type_line, mana_value, costs, text)
+
+
+# ---------------------------------------------------------------------------
+# Feature table
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class FeatureArrays:
+    pips: np.ndarray  # (n, 5) int32
+    cmc: np.ndarray  # (n,) float64, NaN when unknown
+    is_land: np.ndarray  # (n,) bool
+    is_permanent: np.ndarray  # (n,) bool
+    produces: np.ndarray  # (n, 6) bool, SOURCE_COLORS order
+
+    @classmethod
+    def from_features(cls, features: Sequence[CardFeatures]) -> "FeatureArrays":
+        n = len(features)
+        return cls(
+            pips=np.array([f.pips for f in features], dtype=np.int32).reshape(n, len(COLORS)),
+            cmc=np.array([np.nan if f.cmc is None else f.cmc for f in features], dtype=np.float64),
+            is_land=np.array([f.is_land for f in features], dtype=bool),
+            is_permanent=np.array([f.is_permanent for f in features], dtype=bool),
+            produces=np.array(
+                [[color in f.produces for color in SOURCE_COLORS] for f in features], dtype=bool
+            ).reshape(n, len(SOURCE_COLORS)),
+        )
+
+
+@dataclass(frozen=True)
+class _FeatureTable:
+    index: dict[str, int]
+    arrays: FeatureArrays
+
+
+_EMPTY_TABLE = _FeatureTable(index={}, arrays=FeatureArrays.from_features([]))
+
+
+@lru_cache(maxsize=2)
+def _feature_table(_epoch: int) -> _FeatureTable:
+    """Features for every oracle in the loaded cache (first print seen per oracle)."""
+    all_prints = sc.get_all_prints() or {}
+    index: dict[str, int] = {}
+    features: list[CardFeatures] = []
+    for print_data in all_prints.values() if isinstance(all_prints, dict) else all_prints:
+        oracle_id = print_data.get("oracle_id")
+        if not oracle_id or oracle_id in index:
+            continue
+        index[oracle_id] = len(features)
+        features.append(features_from_print(print_data))
+    return _FeatureTable(index=index, arrays=FeatureArrays.from_features(features))
+
+
+def _current_table(load_cache: bool) -> _FeatureTable:
+    try:
+        if not sc.cache_ready() and not (load_cache and sc.ensure_cache_loaded()):
+            return _EMPTY_TABLE
+        return _feature_table(sc.cache_epoch())
+    except Exception:
+        return _EMPTY_TABLE
+
+
+# ---------------------------------------------------------------------------
+# Deck metrics
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class DeckMetrics:
+    total_cards: int
+    land_count: int
+    pips_all: dict[str, int]
+    pips_non_land: dict[str, int]
+    production: dict[str, int]  # permanents that can add each color
+    curve: dict[str, int]  # non-land cards per CURVE_BUCKETS label
+    missing_cmc: int  # non-land cards without a mana value
+    avg_cmc: Optional[float]  # over non-land cards with a mana value
+
+    @property
+    def curve_total(self) -> int:
+        return sum(self.curve.values())
+
+
+def _weighted_sums(arrays: FeatureArrays, rows: np.ndarray, qty: np.ndarray) -> np.ndarray:
+    """One flat vector of every quantity-weighted sum deck_metrics reports."""
+    is_land = arrays.is_land[rows]
+    non_land_qty = qty * ~is_land
+    cmc = arrays.cmc[rows]
+    known = ~np.isnan(cmc) & ~is_land
+    buckets = np.clip(np.rint(cmc[known]), 0, len(CURVE_BUCKETS) - 1).astype(np.int64)
+    pips = arrays.pips[rows]
+    return np.concatenate(
+        (
+            [qty.sum(), qty[is_land].sum(), non_land_qty[np.isnan(cmc)].sum()],
+            [(cmc[known] * qty[known]).sum(), qty[known].sum()],
+            qty @ pips,
+            non_land_qty @ pips,
+            (qty * arrays.is_permanent[rows]) @ arrays.produces[rows],
+            np.bincount(buckets, weights=qty[known], minlength=len(CURVE_BUCKETS)),
+        )
+    ).astype(np.float64)
+
+
+def deck_features(
+    entries: Iterable[tuple[Any, Optional[str], Optional[Callable[[], Optional[CardFeatures]]]]],
+    *,
+    load_cache: bool = False,
+) -> tuple[FeatureArrays, np.ndarray]:
+    """Feature rows and quantities for ``(quantity, oracle_id, fallback)`` entries.
+
+    Entries whose oracle is in the feature table use it; others call
+    ``fallback`` (if given) for features parsed from the caller's row, or
+    count as a non-land card with unknown mana value. Entries with no
+    positive quantity are dropped. ``load_cache`` loads the Scryfall cache
+    first when it is not ready yet.
+    """
+    table = _current_table(load_cache)
+    rows: list[int] = []
+    quantities: list[int] = []
+    extra: list[CardFeatures] = []
+    extra_qty: list[int] = []
+    for quantity, oracle_id, fallback in entries:
+        qty = int(quantity or 0)
+        if qty <= 0:
+            continue
+        row = table.index.get(oracle_id) if oracle_id else None
+        if row is not None:
+            rows.append(row)
+            quantities.append(qty)
+            continue
+        extra.append((fallback() if fallback else None) or UNKNOWN_FEATURES)
+        extra_qty.append(qty)
+
+    arrays = table.arrays
+    take = np.asarray(rows, dtype=np.int64)
+    parts = [
+        FeatureArrays(
+            pips=arrays.pips[take],
+            cmc=arrays.cmc[take],
+            is_land=arrays.is_land[take],
+            is_permanent=arrays.is_permanent[take],
+            produces=arrays.produces[take],
+        )
+    ]
+    if extra:
+        parts.append(FeatureArrays.from_features(extra))
+    merged = FeatureArrays(
+        **{name: np.concatenate([getattr(part, name) for part in parts]) for name in FeatureArrays.__dataclass_fields__}
+    )
+    return merged, np.asarray(quantities + extra_qty, dtype=np.int64)
+
+
+def deck_metrics(
+    entries: Iterable[tuple[Any, Optional[str], Optional[Callable[[], Optional[CardFeatures]]]]],
+    *,
+    load_cache: bool = False,
+) -> DeckMetrics:
+    """Reduce ``(quantity, oracle_id, fallback)`` entries to deck metrics (see :func:`deck_features`)."""
+    arrays, qty = deck_features(entries, load_cache=load_cache)
+    sums = _weighted_sums(arrays, np.arange(len(qty), dtype=np.int64), qty)
+
+    values = [int(round(v)) for v in sums]
+    total, lands, missing = values[:3]
+    cmc_qty = values[4]
+    offset = 5
+    pips_all = dict(zip(COLORS, values[offset:offset + 5]))
+    pips_non_land = dict(zip(COLORS, values[offset + 5:offset + 10]))
+    production = dict(zip(SOURCE_COLORS, values[offset + 10:offset + 16]))
+    curve = dict(zip(CURVE_BUCKETS, values[offset + 16:]))
+    return DeckMetrics(
+        total_cards=total,
+        land_count=lands,
+        pips_all=pips_all,
+        pips_non_land=pips_non_land,
+        production=production,
+        curve=curve,
+        missing_cmc=missing,
+        avg_cmc=(float(sums[3]) / cmc_qty) if cmc_qty else None,
+    )
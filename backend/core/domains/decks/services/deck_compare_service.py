@@ -15,10 +15,11 @@ allowed to read.
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Iterable
+from typing import Any
 
 from extensions import db
-from models import Card, Folder
+from models import Folder
+from core.domains.decks.services import deck_analytics
 
 
 __all__ = [
@@ -93,30 +94,11 @@ def _type_bucket(type_line: str | None) -> str:
     return "Other"
 
 
-def _curve_bucket(mana_value: float | None) -> str:
-    if mana_value is None:
-        return "unknown"
-    try:
-        value = float(mana_value)
-    except (TypeError, ValueError):
-        return "unknown"
-    if value < 0:
-        return "unknown"
-    bucket = int(round(value))
-    return str(bucket) if bucket <= 6 else "7+"
-
-
-def _colors_from_identity(card: Card) -> Iterable[str]:
-    raw = getattr(card, "color_identity", None) or ""
-    return [ch.upper() for ch in str(raw) if ch.isalpha()]
-
-
 def _snapshot(folder: Folder) -> _FolderSnapshot:
     cards = list(folder.cards or [])
     cards_by_key: dict[str, dict[str, Any]] = {}
     type_counts: dict[str, int] = {}
-    curve_counts: dict[str, int] = {}
-    pip_counts: dict[str, int] = {}
+    metric_entries = []
     total = 0
 
     for card in cards:
@@ -138,12 +120,24 @@ def _snapshot(folder: Folder) -> _FolderSnapshot:
         type_counts[_type_bucket(card.type_line)] = (
             type_counts.get(_type_bucket(card.type_line), 0) + qty
         )
-        if (card.type_line or "").lower().find("land") == -1:
-            curve_counts[_curve_bucket(card.mana_value)] = (
-                curve_counts.get(_curve_bucket(card.mana_value), 0) + qty
+        metric_entries.append(
+            (
+                qty,
+                card.oracle_id,
+                lambda card=card: deck_analytics.features_from_row(
+                    type_line=card.type_line,
+                    mana_value=card.mana_value,
+                    faces_json=card.faces_json,
+                    oracle_text=card.oracle_text,
+                ),
             )
-        for ch in _colors_from_identity(card):
-            pip_counts[ch] = pip_counts.get(ch, 0) + qty
+        )
+
+    metrics = deck_analytics.deck_metrics(metric_entries)
+    curve_counts = {label: count for label, count in metrics.curve.items() if count}
+    if metrics.missing_cmc:
+        curve_counts["unknown"] = metrics.missing_cmc
+    pip_counts = {color: count for color, count in metrics.pips_all.items() if count}
 
     return _FolderSnapshot(
         folder=folder,
@@ -6,20 +6,6 @@ from math import ceil
 from typing import Any
 
 
-def _joined_oracle_text(print_obj: dict | None) -> str:
-    if not print_obj:
-        return ""
-    parts = []
-    text = print_obj.get("oracle_text")
-    if text:
-        parts.append(text)
-    for face in print_obj.get("card_faces") or []:
-        face_text = (face or {}).get("oracle_text")
-        if face_text:
-            parts.append(face_text)
-    return " // ".join(part for part in parts if part)
-
-
 def build_decks_overview_context(*, hooks: Any) -> dict:
     sort = (hooks.request.args.get("sort") or "").strip().lower()
     direction = (hooks.request.args.get("dir") or "").strip().lower() or "desc"
@@ -270,85 +256,14 @@ def build_decks_overview_context(*, hooks: Any) -> dict:
         hooks._ensure_cache_ready()
         epoch = hooks.cache_epoch() + hooks.BRACKET_RULESET_EPOCH + hooks.spellbook_dataset_epoch()
 
-        oracle_cache: dict[str, dict | None] = {}
-        set_collector_cache: dict[tuple[str, str], dict | None] = {}
-
-        deck_cards_map: dict[int, list[dict]] = {}
-        card_rows = hooks.Card.query.filter(hooks.Card.folder_id.in_(deck_ids)).all()
-        for card_row in card_rows:
-            folder_id = card_row.folder_id
-            qty = int(getattr(card_row, "quantity", 0) or 0) or 1
-
-            print_obj = None
-            oracle_id = getattr(card_row, "oracle_id", None)
-            if oracle_id:
-                if oracle_id in oracle_cache:
-                    print_obj = oracle_cache[oracle_id]
-                else:
-                    try:
-                        prints = hooks.prints_for_oracle(oracle_id) or []
-                        print_obj = prints[0] if prints else None
-                    except Exception:
-                        print_obj = None
-                    oracle_cache[oracle_id] = print_obj
-            if print_obj is None:
-                key = (card_row.set_code or "", str(card_row.collector_number or ""))
-                if key in set_collector_cache:
-                    cached = set_collector_cache[key]
-                else:
-                    try:
-                        cached = hooks.find_by_set_cn(card_row.set_code, card_row.collector_number, card_row.name)
-                    except Exception:
-                        cached = None
-                    set_collector_cache[key] = cached
-                print_obj = cached
-
-            if print_obj:
-                payload = {
-                    "name": hooks.sc.display_name_for_print(print_obj) if hasattr(hooks.sc, "display_name_for_print") else print_obj.get("name") or card_row.name,
-                    "type_line": hooks.sc.type_label_for_print(print_obj) if hasattr(hooks.sc, "type_label_for_print") else print_obj.get("type_line") or "",
-                    "oracle_text": _joined_oracle_text(print_obj),
-                    "mana_cost": print_obj.get("mana_cost"),
-                    "mana_value": print_obj.get("cmc"),
-                    "produced_mana": print_obj.get("produced_mana"),
-                    "quantity": qty,
-                    "game_changer": bool(print_obj.get("game_changer")),
-                }
-            else:
-                payload = {
-                    "name": card_row.name,
-                    "type_line": getattr(card_row, "type_line", "") or "",
-                    "oracle_text": getattr(card_row, "oracle_text", "") or "",
-                    "mana_cost": getattr(card_row, "mana_cost", None),
-                    "mana_value": getattr(card_row, "mana_value", None),
-                    "produced_mana": getattr(card_row, "produced_mana", None),
-                    "quantity": qty,
-                    "game_changer": bool(getattr(card_row, "game_changer", False)),
-                }
-
-            deck_cards_map.setdefault(folder_id, []).append(payload)
-
+        deck_bracket_map = hooks.evaluate_deck_brackets(
+            [folder_map[folder_id] for folder_id in deck_ids if folder_id in folder_map],
+            epoch=epoch,
+            hooks=hooks,
+        )
         for deck in decks:
-            folder_id = deck["id"]
-            folder = folder_map.get(folder_id)
-            if not folder:
-                continue
-            cards_payload = deck_cards_map.get(folder_id, [])
-            commander_stub = {
-                "oracle_id": hooks.primary_commander_oracle_id(folder.commander_oracle_id),
-                "name": hooks.primary_commander_name(folder.commander_name) or folder.commander_name,
-            }
-            ctx = None
-            signature = None
-            if folder_id:
-                signature = hooks.compute_bracket_signature(cards_payload, commander_stub, epoch=epoch)
-                ctx = hooks.get_cached_bracket(folder_id, signature, epoch)
-            if not ctx:
-                ctx = hooks.evaluate_commander_bracket(cards_payload, commander_stub)
-                if folder_id and signature:
-                    hooks.store_cached_bracket(folder_id, signature, epoch, ctx)
-            deck_bracket_map[folder_id] = ctx
-            deck["bracket"] = ctx
+            if deck["id"] in deck_bracket_map:
+                deck["bracket"] = deck_bracket_map[deck["id"]]
 
     hooks.ensure_symbols_cache(force=False)
     if not hooks.sc.cache_ready():
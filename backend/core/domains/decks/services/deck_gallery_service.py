@@ -23,6 +23,7 @@ from core.domains.cards.services.scryfall_cache import (
 )
 from core.domains.decks.services import deck_gallery_drawer_service, deck_gallery_overview_service
 from core.domains.cards.viewmodels.card_vm import ImageSetVM
+from core.domains.decks.services.commander_bracket_batch_service import evaluate_deck_brackets
 from core.domains.decks.services.commander_brackets import (
     BRACKET_RULESET_EPOCH,
     evaluate_commander_bracket,
@@ -7,7 +7,6 @@ from __future__ import annotations
 
 import json
 import logging
-import re
 from typing import Any, Iterable
 
 from flask import current_app, has_app_context
@@ -16,76 +15,23 @@ from sqlalchemy.orm import Session
 
 from extensions import db
 from models import Card, DeckStats, FolderRole
+from core.domains.decks.services import deck_analytics
 from core.shared.utils.symbols_cache import colors_to_icons
 from core.shared.utils.time import utcnow
 
-RE_COST_SYMBOL = re.compile(r"\{([^}]+)\}")
-DECK_STATS_VERSION = 1
+# Bump when _deck_stats_payload changes so stored rows are recomputed on next read.
+DECK_STATS_VERSION = 2
 _DECK_STATS_DIRTY_KEY = "deck_stats_dirty"
 _DECK_STATS_RECOMPUTING = "deck_stats_recomputing"
 _LISTENERS_REGISTERED = False
 
 
-def _faces_list(faces_json) -> list[dict]:
-    if not faces_json:
-        return []
-    if isinstance(faces_json, dict):
-        faces = faces_json.get("faces") or []
-    else:
-        faces = faces_json
-    return [face for face in faces if isinstance(face, dict)]
-
-
-def _mana_costs_from_faces(faces_json) -> list[str]:
-    costs = [face.get("mana_cost") for face in _faces_list(faces_json) if face.get("mana_cost")]
-    return [cost for cost in costs if cost]
-
-
-def _add_colored_pips(cost_str: str | None, qty: int, counts: dict[str, int]) -> None:
-    if not cost_str:
-        return
-    for sym in RE_COST_SYMBOL.findall(cost_str):
-        s_val = sym.upper()
-        for ch in ("W", "U", "B", "R", "G"):
-            if ch in s_val:
-                counts[ch] += qty
-
-
-def _is_permanent_type(type_line: str | None) -> bool:
-    lowered = (type_line or "").lower()
-    return any(token in lowered for token in ("land", "artifact", "creature", "enchantment", "planeswalker", "battle"))
-
-
-def _colors_from_oracle_text_add(text: str | None) -> set[str]:
-    out: set[str] = set()
-    if not text:
-        return out
-    upper = text.upper()
-    if "ADD" not in upper:
-        return out
-    for sym in RE_COST_SYMBOL.findall(text):
-        symbol = sym.upper()
-        for ch in ("W", "U", "B", "R", "G", "C"):
-            if ch in symbol:
-                out.add(ch)
-    if "ANY COLOR" in upper:
-        out.update({"W", "U", "B", "R", "G"})
-    return out
-
-
 def _deck_stats_payload(folder_id: int, *, session=None) -> dict[str, Any]:
     sess = session or db.session
-    mana_pip_all = {c: 0 for c in ["W", "U", "B", "R", "G"]}
-    mana_pip_non_land = {c: 0 for c in ["W", "U", "B", "R", "G"]}
-    production_counts = {c: 0 for c in ["W", "U", "B", "R", "G", "C"]}
-    curve_bins = {"0": 0, "1": 0, "2": 0, "3": 0, "4": 0, "5": 0, "6": 0, "7+": 0}
-    missing_cmc = 0
-    total_mana = 0.0
-    total_mana_qty = 0
-
     rows = (
         sess.query(
             Card.quantity,
+            Card.oracle_id,
             Card.type_line,
             Card.mana_value,
             Card.faces_json,
@@ -94,60 +40,31 @@ def _deck_stats_payload(folder_id: int, *, session=None) -> dict[str, Any]:
         .filter(Card.folder_id == folder_id)
         .all()
     )
-
-    for qty, type_line, mana_value, faces_json, oracle_text in rows:
-        qty = int(qty or 0)
-        if qty <= 0:
-            continue
-        is_land = bool(type_line and "Land" in type_line)
-        text = oracle_text or ""
-        if not text and faces_json:
-            face_texts = [face.get("oracle_text") for face in _faces_list(faces_json) if face.get("oracle_text")]
-            if face_texts:
-                text = " // ".join(face_texts)
-
-        for mana_cost in _mana_costs_from_faces(faces_json):
-            _add_colored_pips(mana_cost, qty, mana_pip_all)
-            if not is_land:
-                _add_colored_pips(mana_cost, qty, mana_pip_non_land)
-
-        if not is_land:
-            if mana_value is None:
-                missing_cmc += qty
-            else:
-                try:
-                    mv = float(mana_value)
-                except Exception:
-                    mv = None
-                if mv is None:
-                    missing_cmc += qty
-                else:
-                    total_mana += mv * qty
-                    total_mana_qty += qty
-                    bucket_val = int(round(mv))
-                    if bucket_val < 0:
-                        bucket_val = 0
-                    bucket = str(bucket_val) if bucket_val <= 6 else "7+"
-                    curve_bins[bucket] += qty
-
-        colors = _colors_from_oracle_text_add(text)
-        if colors and _is_permanent_type(type_line):
-            for ch in colors:
-                production_counts[ch] += qty
-
-    avg_mana = (total_mana / total_mana_qty) if total_mana_qty else None
+    metrics = deck_analytics.deck_metrics(
+        (
+            row.quantity,
+            row.oracle_id,
+            lambda row=row: deck_analytics.features_from_row(
+                type_line=row.type_line,
+                mana_value=row.mana_value,
+                faces_json=row.faces_json,
+                oracle_text=row.oracle_text,
+            ),
+        )
+        for row in rows
+    )
 
     return {
-        "avg_mana": avg_mana,
+        "avg_mana": metrics.avg_cmc,
         "curve": {
-            "bins": curve_bins,
-            "missing": missing_cmc,
-            "total": sum(curve_bins.values()),
+            "bins": metrics.curve,
+            "missing": metrics.missing_cmc,
+            "total": metrics.curve_total,
         },
         "pips": {
-            "all": mana_pip_all,
-            "non_land": mana_pip_non_land,
-            "production": production_counts,
+            "all": metrics.pips_all,
+            "non_land": metrics.pips_non_land,
+            "production": metrics.production,
         },
     }
 
@@ -12,6 +12,7 @@ from extensions import db
 from models import Card
 from core.domains.cards.services import scryfall_cache as sc
 from core.domains.cards.services.scryfall_cache import cache_ready, ensure_cache_loaded, find_by_set_cn
+from core.domains.decks.services import deck_analytics
 
 CARD_TYPE_GROUPS = [
     ("Creatures", "Creature"),
@@ -24,7 +25,6 @@ CARD_TYPE_GROUPS = [
     ("Battles", "Battle"),
 ]
 
-_MANA_SYMBOL_RE = re.compile(r"\{([^}]+)\}")
 WUBRG = ("W", "U", "B", "R", "G")
 _COMMON_TOKEN_KINDS = [
     ("treasure", "Treasure"),
@@ -89,22 +89,7 @@ def type_line_from_print_payload(print_payload: dict[str, Any] | None) -> str:
 
 
 def artifact_production_colors(oracle_text: str | None) -> set[str]:
-    if not oracle_text:
-        return set()
-    upper = oracle_text.upper()
-    if "ADD" not in upper:
-        return set()
-
-    out: set[str] = set()
-    for sym in _MANA_SYMBOL_RE.findall(oracle_text):
-        symbol = sym.upper()
-        for ch in WUBRG:
-            if ch in symbol:
-                out.add(ch)
-
-    if "ANY COLOR" in upper:
-        out.update(WUBRG)
-    return out
+    return set(deck_analytics.produced_colors(oracle_text)) & set(WUBRG)
 
 
 def _faces_list(faces_json: Any) -> list[dict[str, Any]]:
@@ -117,13 +102,8 @@ def _faces_list(faces_json: Any) -> list[dict[str, Any]]:
     return [face for face in faces if isinstance(face, dict)]
 
 
-def _mana_costs_from_faces(faces_json: Any) -> list[str]:
-    costs = [face.get("mana_cost") for face in _faces_list(faces_json) if face.get("mana_cost")]
-    return [cost for cost in costs if cost]
-
-
 def _mana_cost_from_faces(faces_json: Any) -> str | None:
-    costs = _mana_costs_from_faces(faces_json)
+    costs = deck_analytics.mana_costs_from_faces(faces_json)
     if not costs:
         return None
     return " // ".join(costs) if len(costs) > 1 else costs[0]
@@ -8,16 +8,23 @@ Scryfall does not encode.
 The service is intentionally read-only and deterministic: given the same deck
 contents and cache epoch, it always produces the same verdict. This makes it
 safe to memoize or render client-side.
+
+Per-oracle legality is precomputed once per cache epoch as a bitmask over
+``SUPPORTED_FORMATS`` plus a color-identity mask, so
+``evaluate_folder_legality_all`` enriches a deck once and checks every format
+with integer tests; its reports are memoized by deck content signature.
 """
 
 from __future__ import annotations
 
+import hashlib
 from dataclasses import dataclass, field
-from typing import Any, Iterable
+from functools import lru_cache
+from typing import Any, Iterable, NamedTuple
 
 from sqlalchemy.orm import selectinload
 
-from extensions import db
+from extensions import cache, db
 from models import Card, Folder
 from core.domains.cards.services import scryfall_cache as sc
 from core.domains.decks.services.commander_utils import (
@@ -35,6 +42,7 @@ __all__ = [
     "LegalityReport",
     "available_formats",
     "evaluate_folder_legality",
+    "evaluate_folder_legality_all",
 ]
 
 
@@ -177,6 +185,18 @@ def available_formats() -> list[dict[str, Any]]:
     ]
 
 
+#: Bit position of each supported format in the per-oracle legality masks.
+_FORMAT_BITS: dict[str, int] = {fmt.key: 1 << index for index, fmt in enumerate(SUPPORTED_FORMATS)}
+_FORMAT_INDEX: dict[str, int] = {fmt.key: index for index, fmt in enumerate(SUPPORTED_FORMATS)}
+
+_COLOR_ORDER = "WUBRG"
+_COLOR_BITS: dict[str, int] = {ch: 1 << index for index, ch in enumerate(_COLOR_ORDER)}
+
+#: Reports for the all-formats matrix are memoized for this long (seconds);
+#: the key changes with deck contents and cache epoch, so this only bounds memory.
+_ALL_FORMATS_CACHE_TIMEOUT = 6 * 3600
+
+
 def _format_by_key(key: str) -> FormatDefinition | None:
     normalized = (key or "").strip().lower()
     for fmt in SUPPORTED_FORMATS:
@@ -266,40 +286,102 @@ def _color_identity(print_data: dict | None) -> set[str]:
     return {str(ch).upper() for ch in raw if ch}
 
 
+def _identity_mask(colors: Iterable[str]) -> int:
+    mask = 0
+    for ch in colors:
+        mask |= _COLOR_BITS.get(ch, 0)
+    return mask
+
+
+def _identity_colors(mask: int) -> set[str]:
+    return {ch for ch, bit in _COLOR_BITS.items() if mask & bit}
+
+
+class _OracleLegality(NamedTuple):
+    #: Bit ``_FORMAT_BITS[key]`` is set when the format accepts the card.
+    allowed_mask: int
+    #: Raw legality per ``SUPPORTED_FORMATS`` entry, for issue messages.
+    statuses: tuple[str, ...]
+    identity_mask: int
+
+    def status(self, fmt: FormatDefinition) -> str:
+        return self.statuses[_FORMAT_INDEX[fmt.key]]
+
+    def allows(self, fmt: FormatDefinition) -> bool:
+        return bool(self.allowed_mask & _FORMAT_BITS[fmt.key])
+
+
+def _legality_entry(print_data: dict | None) -> _OracleLegality:
+    statuses = tuple(_legality_for_print(print_data, fmt.legality_key) for fmt in SUPPORTED_FORMATS)
+    allowed = 0
+    for fmt, status in zip(SUPPORTED_FORMATS, statuses):
+        if status in fmt.allow_legality_values:
+            allowed |= _FORMAT_BITS[fmt.key]
+    return _OracleLegality(allowed, statuses, _identity_mask(_color_identity(print_data)))
+
+
+@lru_cache(maxsize=2)
+def _legality_index(_epoch: int) -> dict[str, _OracleLegality]:
+    """Legality and identity masks for every oracle in the loaded cache.
+
+    Most oracles share one of a few dozen legality patterns, so equal entries
+    are collapsed onto a single tuple.
+    """
+    all_prints = sc.get_all_prints() or {}
+    shared: dict[_OracleLegality, _OracleLegality] = {}
+    index: dict[str, _OracleLegality] = {}
+    for print_data in all_prints.values() if isinstance(all_prints, dict) else all_prints:
+        oracle_id = print_data.get("oracle_id")
+        if not oracle_id or oracle_id in index:
+            continue
+        entry = _legality_entry(print_data)
+        index[oracle_id] = shared.setdefault(entry, entry)
+    return index
+
+
 @dataclass
 class _EnrichedCard:
     card: Card
-    print_data: dict | None
     type_line: str
     name: str
     oracle_id: str | None
     color_identity: set[str]
     is_basic: bool
+    legality: _OracleLegality
 
 
 def _enrich(cards: Iterable[Card]) -> list[_EnrichedCard]:
-    """Hydrate cards with Scryfall cache metadata for legality checks."""
+    """Hydrate cards with Scryfall cache metadata for legality checks.
+
+    Cards whose oracle is in the legality index (and that carry a type line)
+    skip the per-print lookup entirely.
+    """
+    index = _legality_index(sc.cache_epoch())
     enriched: list[_EnrichedCard] = []
     for card in cards:
         name = (card.name or "").strip()
         type_line = (card.type_line or "").strip()
-        print_data = _lookup_print_data(
-            getattr(card, "set_code", None),
-            getattr(card, "collector_number", None),
-            name,
-            getattr(card, "oracle_id", None),
-        )
-        if not type_line:
-            type_line = str((print_data or {}).get("type_line") or "")
+        legality = index.get(card.oracle_id) if card.oracle_id else None
+        if legality is None or not type_line:
+            print_data = _lookup_print_data(
+                getattr(card, "set_code", None),
+                getattr(card, "collector_number", None),
+                name,
+                getattr(card, "oracle_id", None),
+            )
+            if legality is None:
+                legality = _legality_entry(print_data)
+            if not type_line:
+                type_line = str((print_data or {}).get("type_line") or "")
         enriched.append(
             _EnrichedCard(
                 card=card,
-                print_data=print_data,
                 type_line=type_line,
                 name=name,
                 oracle_id=card.oracle_id,
-                color_identity=_color_identity(print_data),
+                color_identity=_identity_colors(legality.identity_mask),
                 is_basic=_is_basic_land_name(name),
+                legality=legality,
             )
         )
     return enriched
@@ -310,6 +392,17 @@ def _enrich(cards: Iterable[Card]) -> list[_EnrichedCard]:
 # ---------------------------------------------------------------------------
 
 
+def _folder_cards(folder: Folder) -> list[Card]:
+    if not sc.cache_ready():
+        sc.ensure_cache_loaded()
+    return (
+        db.session.query(Card)
+        .options(selectinload(Card.folder))
+        .filter(Card.folder_id == folder.id)
+        .all()
+    )
+
+
 def evaluate_folder_legality(folder: Folder, format_key: str) -> LegalityReport:
     """Evaluate an entire folder (deck) against a specific format.
 
@@ -320,17 +413,57 @@ def evaluate_folder_legality(folder: Folder, format_key: str) -> LegalityReport:
     if fmt is None:
         raise ValueError(f"Unsupported format: {format_key!r}")
 
-    if not sc.cache_ready():
-        sc.ensure_cache_loaded()
+    enriched = _enrich(_folder_cards(folder))
+    return _evaluate(fmt, folder, enriched)
+
+
+def _deck_content_signature(folder: Folder, cards: list[Card]) -> str:
+    """SHA1 over everything a verdict depends on: rows, commander and cache epoch."""
+    parts = [
+        str(sc.cache_epoch()),
+        folder.commander_name or "",
+        folder.commander_oracle_id or "",
+    ]
+    for card in sorted(cards, key=lambda c: c.id or 0):
+        parts.append(
+            "|".join(
+                (
+                    str(card.id),
+                    card.name or "",
+                    card.oracle_id or "",
+                    card.type_line or "",
+                    (card.set_code or "").lower(),
+                    (card.collector_number or "").lower(),
+                    str(card.quantity or 0),
+                )
+            )
+        )
+    return hashlib.sha1("\n".join(parts).encode("utf-8")).hexdigest()
+
+
+def evaluate_folder_legality_all(folder: Folder) -> list[LegalityReport]:
+    """Evaluate a folder against every supported format, in ``SUPPORTED_FORMATS`` order.
+
+    Cards are fetched and enriched once for all formats. Reports are cached
+    under the deck's content signature, so any edit (or a cache reload)
+    naturally misses.
+    """
+    cards = _folder_cards(folder)
+    cache_key = f"legality:all:{folder.id}:{_deck_content_signature(folder, cards)}"
+    try:
+        cached = cache.get(cache_key)
+    except Exception:
+        cached = None
+    if cached is not None:
+        return cached
 
-    cards = (
-        db.session.query(Card)
-        .options(selectinload(Card.folder))
-        .filter(Card.folder_id == folder.id)
-        .all()
-    )
     enriched = _enrich(cards)
-    return _evaluate(fmt, folder, enriched)
+    reports = [_evaluate(fmt, folder, enriched) for fmt in SUPPORTED_FORMATS]
+    try:
+        cache.set(cache_key, reports, timeout=_ALL_FORMATS_CACHE_TIMEOUT)
+    except Exception:
+        pass
+    return reports
 
 
 # ---------------------------------------------------------------------------
@@ -471,9 +604,9 @@ def _check_card_legality(
 ) -> None:
     seen_bad: set[str] = set()
     for enriched in cards:
-        status = _legality_for_print(enriched.print_data, fmt.legality_key)
-        if status in fmt.allow_legality_values:
+        if enriched.legality.allows(fmt):
             continue
+        status = enriched.legality.status(fmt)
         key = f"{fmt.key}:{enriched.oracle_id or enriched.name.lower()}"
         if key in seen_bad:
             continue
@@ -561,15 +694,16 @@ def _check_color_identity(
         return
 
     lowered_commander_names = {n.lower() for n in commander_names}
+    commander_mask = _identity_mask(commander_identity)
     for enriched in cards:
         if enriched.is_basic:
             continue
+        if not enriched.legality.identity_mask & ~commander_mask:
+            continue
         if enriched.name.lower() in lowered_commander_names:
             continue
         card_identity = enriched.color_identity
         extra = card_identity - commander_identity
-        if not extra:
-            continue
         issues.append(
             LegalityIssue(
                 severity="error",
@@ -9,13 +9,13 @@ owner decide if more sources of a color are needed, not to block anything.
 
 from __future__ import annotations
 
-import re
 from dataclasses import dataclass, field
 from typing import Any, Iterable
 
 from extensions import db
 from models import Card, Folder
 from core.domains.cards.services import scryfall_cache as sc
+from core.domains.decks.services import deck_analytics
 from core.domains.decks.services.deck_utils import BASIC_LANDS
 from shared.mtg import _lookup_print_data
 
@@ -79,30 +79,6 @@ def _is_basic(name: str) -> bool:
     return name.strip() in BASIC_LANDS
 
 
-def _produces_colors(oracle_text: str, type_line: str) -> set[str]:
-    """Heuristic: return {W,U,B,R,G,C} mana symbols the land can produce."""
-    text = (oracle_text or "").upper()
-    colors: set[str] = set()
-    for match in re.findall(r"\{([^}]+)\}", text):
-        if match in {"W", "U", "B", "R", "G", "C"}:
-            colors.add(match)
-    if "ANY COLOR" in text:
-        colors.update({"W", "U", "B", "R", "G"})
-
-    # Basic types on the type line always yield their color.
-    lowered_type = type_line.lower()
-    for color_name, letter in (
-        ("plains", "W"),
-        ("island", "U"),
-        ("swamp", "B"),
-        ("mountain", "R"),
-        ("forest", "G"),
-    ):
-        if color_name in lowered_type:
-            colors.add(letter)
-    return colors
-
-
 def _classify_land(name: str, oracle_text: str, type_line: str, colors: set[str]) -> str:
     if _snow_basic(name):
         return "snow_basic"
@@ -265,7 +241,7 @@ def analyze_mana_base(folder: Folder) -> ManaBaseReport:
             )
             oracle_text = str((pr or {}).get("oracle_text") or "")
 
-        colors = _produces_colors(oracle_text, type_line)
+        colors = set(deck_analytics.produced_colors(oracle_text, type_line))
         category = _classify_land(card.name or "", oracle_text, type_line, colors)
         untapped = _enters_untapped(oracle_text)
 
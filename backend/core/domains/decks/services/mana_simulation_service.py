@@ -0,0 +1,254 @@
+"""Monte Carlo opening-hand and mana-consistency simulation.
+
+``opening_hand_gameplay_service`` shuffles one deck at a time for the
+interactive playtester and ``mana_base_analysis_service`` compares source
+counts against fixed targets. This module answers the statistical question
+instead: over many shuffles, how often is the opening seven keepable, how
+often are land drops made on curve, and how often is each color available
+by a given turn.
+
+The library is integer-encoded once: cards collapse into categories (a land
+flag plus the bitmask of colors it produces, from the :mod:`deck_analytics`
+feature table), so a deck is just a short vector of category counts. Every
+simulated game is a column of a NumPy matrix and draws happen card by card
+without replacement for all games at once, which keeps the cost
+proportional to the cards actually seen rather than the library size. Only
+lands count as color sources. Mulligans follow the London rule (draw seven,
+then bottom one card per mulligan taken); the optional free first mulligan
+models multiplayer Commander.
+
+Results are cached per deck version (the same card-update stamp deck stats
+use) and simulation parameters, so repeated views are free.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from dataclasses import asdict, dataclass
+from typing import Any
+
+import numpy as np
+
+from extensions import db
+from models import Card, Folder
+from core.domains.cards.services import scryfall_cache as sc
+from core.domains.decks.services import deck_analytics
+from core.domains.decks.services.commander_utils import split_commander_oracle_ids
+from core.domains.decks.services.deck_service import _deck_stats_source_version
+from shared.cache.runtime_cache import cache_fetch
+
+__all__ = [
+    "DEFAULT_ITERATIONS",
+    "MAX_ITERATIONS",
+    "SimulationParams",
+    "simulate_deck",
+    "simulate_folder",
+]
+
+HAND_SIZE = 7
+DEFAULT_ITERATIONS = 10_000
+MIN_ITERATIONS = 1_000
+MAX_ITERATIONS = 100_000
+MAX_TURNS = 10
+SIMULATION_CACHE_TTL = 6 * 60 * 60
+
+_SOURCE_BITS = {color: 1 << idx for idx, color in enumerate(deck_analytics.SOURCE_COLORS)}
+
+
+@dataclass(frozen=True, slots=True)
+class SimulationParams:
+    iterations: int = DEFAULT_ITERATIONS
+    turns: int = 7
+    on_play: bool = True
+    min_lands: int = 2
+    max_lands: int = 5
+    max_mulligans: int = 3
+    free_mulligan: bool = False
+
+    def normalized(self) -> "SimulationParams":
+        min_lands = max(0, min(int(self.min_lands), HAND_SIZE))
+        return SimulationParams(
+            iterations=max(MIN_ITERATIONS, min(int(self.iterations), MAX_ITERATIONS)),
+            turns=max(1, min(int(self.turns), MAX_TURNS)),
+            on_play=bool(self.on_play),
+            min_lands=min_lands,
+            max_lands=max(min_lands, min(int(self.max_lands), HAND_SIZE)),
+            max_mulligans=max(0, min(int(self.max_mulligans), HAND_SIZE - 1)),
+            free_mulligan=bool(self.free_mulligan),
+        )
+
+
+def _draw_categories(rng: np.random.Generator, games: int, counts: np.ndarray, depth: int) -> np.ndarray:
+    """Categories of the top ``depth`` cards of ``games`` independent shuffles.
+
+    Draws card by card without replacement, so the cost scales with
+    ``depth`` rather than the library size. ``cum[c, g]`` holds how many
+    cards of categories ``<= c`` are still in game ``g``'s library.
+    """
+    cum = np.repeat(np.cumsum(counts).astype(np.int32)[:, None], games, axis=1)
+    levels = np.arange(len(counts), dtype=np.int32)[:, None]
+    total = int(counts.sum())
+    picks = rng.random((depth, games))
+    out = np.empty((depth, games), dtype=np.int32)
+    for step in range(depth):
+        position = (picks[step] * (total - step)).astype(np.int32)
+        drawn = (cum <= position).sum(axis=0, dtype=np.int32)
+        out[step] = drawn
+        cum -= levels >= drawn
+    return out.T
+
+
+def _kept_mask(hand_is_land: np.ndarray, bottom: np.ndarray) -> np.ndarray:
+    """Which of the seven cards stay after bottoming ``bottom`` of them.
+
+    Lands are kept toward half of the remaining hand, extras of whichever
+    kind is over-represented go to the bottom, earliest-drawn cards first.
+    """
+    keep = HAND_SIZE - bottom
+    lands = hand_is_land.sum(axis=1)
+    spells = HAND_SIZE - lands
+    kept_lands = np.maximum(keep - spells, np.minimum(np.minimum(lands, keep), (keep + 1) // 2))
+    land_rank = np.cumsum(hand_is_land, axis=1)
+    spell_rank = np.cumsum(~hand_is_land, axis=1)
+    return np.where(
+        hand_is_land,
+        land_rank <= kept_lands[:, None],
+        spell_rank <= (keep - kept_lands)[:, None],
+    )
+
+
+def simulate_deck(
+    counts: np.ndarray,
+    is_land: np.ndarray,
+    source_mask: np.ndarray,
+    *,
+    params: SimulationParams,
+    colors: list[str],
+    seed: int = 0,
+) -> dict[str, Any]:
+    """Simulate opening hands for an integer-encoded library.
+
+    The library is ``counts[c]`` copies of each card category ``c``; a
+    category is a land flag plus a bitmask of the colors it produces
+    (``SOURCE_COLORS`` order).
+    """
+    params = params.normalized()
+    library_size = int(counts.sum())
+    if library_size < HAND_SIZE:
+        raise ValueError(f"Deck needs at least {HAND_SIZE} drawable cards.")
+    draws = params.turns - 1 if params.on_play else params.turns
+    depth = min(library_size, HAND_SIZE + draws)
+    games = params.iterations
+    rng = np.random.default_rng(seed)
+
+    final = np.empty((games, depth), dtype=np.int64)
+    mulligans = np.zeros(games, dtype=np.int64)
+    pending = np.arange(games)
+    keepable_seven = 0.0
+    for attempt in range(params.max_mulligans + 1):
+        orders = _draw_categories(rng, pending.size, counts, depth)
+        hand_lands = is_land[orders[:, :HAND_SIZE]].sum(axis=1)
+        keepable = (hand_lands >= params.min_lands) & (hand_lands <= params.max_lands)
+        if attempt == 0:
+            keepable_seven = float(keepable.mean())
+        if attempt == params.max_mulligans:
+            keepable[:] = True
+        final[pending[keepable]] = orders[keepable]
+        mulligans[pending[keepable]] = attempt
+        pending = pending[~keepable]
+        if not pending.size:
+            break
+
+    bottom = np.maximum(mulligans - int(params.free_mulligan), 0)
+    hand_is_land = is_land[final[:, :HAND_SIZE]]
+    kept = _kept_mask(hand_is_land, bottom)
+    hand_masks = np.where(kept & hand_is_land, source_mask[final[:, :HAND_SIZE]], 0)
+    hand_land_count = (kept & hand_is_land).sum(axis=1)
+    hand_mask = np.bitwise_or.reduce(hand_masks, axis=1)
+
+    drawn = final[:, HAND_SIZE:]
+    drawn_lands = np.cumsum(is_land[drawn], axis=1)
+    drawn_masks = np.bitwise_or.accumulate(np.where(is_land[drawn], source_mask[drawn], 0), axis=1)
+
+    land_drops = []
+    color_sources: dict[str, list[float]] = {color: [] for color in colors}
+    for turn in range(1, params.turns + 1):
+        seen = min(turn - 1 if params.on_play else turn, drawn.shape[1])
+        lands = hand_land_count + (drawn_lands[:, seen - 1] if seen else 0)
+        mask = hand_mask | (drawn_masks[:, seen - 1] if seen else 0)
+        land_drops.append(
+            {
+                "turn": turn,
+                "probability": round(float((lands >= turn).mean()), 4),
+                "average_lands": round(float(lands.mean()), 3),
+            }
+        )
+        for color in colors:
+            color_sources[color].append(round(float(((mask & _SOURCE_BITS[color]) > 0).mean()), 4))
+
+    mulligan_rates = np.bincount(mulligans, minlength=params.max_mulligans + 1) / games
+    return {
+        "params": asdict(params),
+        "library_size": library_size,
+        "land_count": int(counts[is_land].sum()),
+        "keepable_7_rate": round(keepable_seven, 4),
+        "mulligan_rates": {str(idx): round(float(rate), 4) for idx, rate in enumerate(mulligan_rates)},
+        "average_hand_size": round(float((HAND_SIZE - bottom).mean()), 3),
+        "land_drops": land_drops,
+        "color_sources": color_sources,
+    }
+
+
+def _library_categories(folder: Folder) -> tuple[np.ndarray, np.ndarray, np.ndarray, list[str]]:
+    """Integer-encode the folder minus its commanders: per-category counts, land flags and source masks.
+
+    Also returns the colors the deck's mana costs ask for.
+    """
+    commander_ids = {oid for oid in split_commander_oracle_ids(folder.commander_oracle_id) if oid}
+    rows = (
+        db.session.query(Card.quantity, Card.oracle_id, Card.type_line, Card.mana_value, Card.faces_json, Card.oracle_text)
+        .filter(Card.folder_id == folder.id)
+        .all()
+    )
+    arrays, quantities = deck_analytics.deck_features(
+        (
+            (
+                row.quantity,
+                row.oracle_id,
+                lambda row=row: deck_analytics.features_from_row(
+                    type_line=row.type_line,
+                    mana_value=row.mana_value,
+                    faces_json=row.faces_json,
+                    oracle_text=row.oracle_text,
+                ),
+            )
+            for row in rows
+            if not (row.oracle_id and row.oracle_id in commander_ids)
+        ),
+        load_cache=True,
+    )
+    bits = np.array([_SOURCE_BITS[color] for color in deck_analytics.SOURCE_COLORS], dtype=np.int64)
+    masks = (arrays.produces.astype(np.int64) * bits).sum(axis=1)
+    masks[~arrays.is_land] = 0  # only lands are counted as sources
+    codes, category = np.unique(masks * 2 + arrays.is_land, return_inverse=True)
+    counts = np.bincount(category, weights=quantities, minlength=len(codes)).astype(np.int64)
+    pips = quantities @ arrays.pips
+    colors = [color for color, count in zip(deck_analytics.COLORS, pips) if count > 0]
+    return counts, (codes & 1).astype(bool), codes >> 1, colors
+
+
+def simulate_folder(folder: Folder, params: SimulationParams | None = None) -> dict[str, Any]:
+    """Cached simulation report for ``folder``; the caller is responsible for authorization."""
+    params = (params or SimulationParams()).normalized()
+    version = _deck_stats_source_version(folder.id)
+    key_material = repr((folder.id, folder.commander_oracle_id, version, sc.cache_epoch(), sorted(asdict(params).items())))
+    digest = hashlib.blake2b(key_material.encode("utf-8"), digest_size=12).hexdigest()
+
+    def _run() -> dict[str, Any]:
+        counts, is_land, masks, colors = _library_categories(folder)
+        report = simulate_deck(counts, is_land, masks, params=params, colors=colors, seed=int(digest[:8], 16))
+        report["folder_id"] = folder.id
+        report["deck_version"] = version
+        return report
+
+    return cache_fetch(f"mana_sim:{folder.id}:{digest}", SIMULATION_CACHE_TTL, _run)
@@ -4,21 +4,28 @@ These utilities parse simple decklists (one card per line, with optional leading
 quantities) and resolve lightweight printing metadata via the local Scryfall
 cache so downstream features (deck insights, commander brackets, etc.) continue
 to function.
+
+Lists are resolved in one batch: lines are deduplicated by normalized name and
+looked up in a per-epoch normalized-name → preferred-print map, so each
+distinct card pays for ``unique_oracle_by_name`` at most once per cache load.
+Remote deck fetches go through the shared HTTP cache with conditional
+revalidation.
 """
 
 from __future__ import annotations
 
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 from html import unescape
-from typing import Iterable, List, Optional, Set, Tuple
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 from urllib.parse import SplitResult, urlsplit, urlunsplit
 
-import requests
-
 from flask import current_app
 from core.domains.cards.services import scryfall_cache as sc
 from core.domains.cards.services.scryfall_cache import ensure_cache_loaded, prints_for_oracle, unique_oracle_by_name
+from core.domains.cards.services.scryfall_index_service import name_key
+from shared.cache.http_cache import cached_get
 
 
 _LINE_QUANTITY = re.compile(r"^\s*(\d+)\s*x?\s+(.+?)\s*$", flags=re.IGNORECASE)
@@ -32,6 +39,8 @@ _ALLOWED_GOLDFISH_HOSTS = {"mtggoldfish.com", "www.mtggoldfish.com"}
 _ALLOWED_MOXFIELD_HOSTS = {"moxfield.com", "www.moxfield.com"}
 _ALLOWED_GOLDFISH_PORTS = {None, 80, 443}
 _ALLOWED_SCHEMES = {"http", "https"}
+# Remote decklists rarely change within minutes; revalidate after this long.
+_DECK_FETCH_FRESH_SECONDS = 600
 # ARCHIDEKT REMOVED — replaced by internal role engine
 
 
@@ -87,30 +96,73 @@ def _pick_preferred_print(printings: List[dict]) -> dict | None:
     return printings[0]
 
 
+#: (oracle_id, preferred print) for a resolved name.
+Resolution = Tuple[Optional[str], Optional[dict]]
+
+
+@lru_cache(maxsize=2)
+def _resolution_map(_epoch: int) -> Dict[str, Resolution]:
+    """Normalized name → (oracle_id, preferred print) for one cache epoch.
+
+    Filled as names are first resolved; every later list reuses the entries.
+    Only hits are stored, so the map is bounded by the catalog's names rather
+    than by whatever users paste.
+    """
+    return {}
+
+
+def _resolve_oracle(lookup_name: str, raw_name: str, errors: List[str]) -> Optional[Resolution]:
+    """Resolve one name; ``None`` when a lookup raised (so it isn't memoized)."""
+    try:
+        oracle_id = unique_oracle_by_name(lookup_name)
+    except Exception as exc:  # pragma: no cover - defensive
+        errors.append(f"Could not resolve '{raw_name}': {exc}")
+        return None
+    if not oracle_id:
+        return None, None
+    try:
+        printings = prints_for_oracle(oracle_id) or []
+    except Exception as exc:  # pragma: no cover - defensive
+        errors.append(f"Scryfall lookup failed for '{raw_name}': {exc}")
+        return oracle_id, None
+    return oracle_id, _pick_preferred_print(list(printings))
+
+
+def resolve_card_names(names: Iterable[str]) -> Tuple[Dict[str, Resolution], List[str]]:
+    """Batch-resolve card names to ``(oracle_id, preferred print)``.
+
+    Names are deduplicated first. Plain names (no ``/`` or ``,``, whose
+    variants ``unique_oracle_by_name`` expands) resolve by normalized key
+    through the per-epoch map; the rest are resolved individually.
+    """
+    ensure_cache_loaded()
+    by_key = _resolution_map(sc.cache_epoch())
+    resolved: Dict[str, Resolution] = {}
+    errors: List[str] = []
+    for raw_name in dict.fromkeys(names):
+        plain = "/" not in raw_name and "," not in raw_name
+        key = name_key(raw_name) if plain else None
+        if key is not None and key in by_key:
+            resolved[raw_name] = by_key[key]
+            continue
+        result = _resolve_oracle(key if key is not None else raw_name, raw_name, errors)
+        if result is None:
+            resolved[raw_name] = (None, None)
+            continue
+        if key is not None and result[0] is not None:
+            by_key[key] = result
+        resolved[raw_name] = result
+    return resolved, errors
+
+
 def resolve_proxy_cards(deck_lines: Iterable[str]) -> Tuple[List[ResolvedCard], List[str]]:
     """Resolve decklist rows into ResolvedCard objects, capturing any errors."""
-    ensure_cache_loaded()
+    entries = parse_decklist(deck_lines)
+    lookups, errors = resolve_card_names(raw_name for raw_name, _quantity in entries)
 
     resolved: List[ResolvedCard] = []
-    errors: List[str] = []
-
-    for raw_name, quantity in parse_decklist(deck_lines):
-        oracle_id = None
-        try:
-            oracle_id = unique_oracle_by_name(raw_name)
-        except Exception as exc:  # pragma: no cover - defensive
-            errors.append(f"Could not resolve '{raw_name}': {exc}")
-            oracle_id = None
-
-        printings: List[dict] = []
-        if oracle_id:
-            try:
-                printings = prints_for_oracle(oracle_id) or []
-            except Exception as exc:  # pragma: no cover - defensive
-                errors.append(f"Scryfall lookup failed for '{raw_name}': {exc}")
-                printings = []
-
-        pr = _pick_preferred_print(printings)
+    for raw_name, quantity in entries:
+        oracle_id, pr = lookups.get(raw_name, (None, None))
         if not pr:
             # fall back to a synthetic placeholder: ensure downstream lookups do not crash
             resolved.append(
@@ -254,7 +306,12 @@ def fetch_goldfish_deck(deck_url: str) -> Tuple[str | None, str | None, str | No
 
     deck_text = ""
     try:
-        resp = requests.get(download_url, timeout=10, headers=_REQUEST_HEADERS)
+        resp = cached_get(
+            download_url,
+            timeout=10,
+            headers=_REQUEST_HEADERS,
+            fresh_for=_DECK_FETCH_FRESH_SECONDS,
+        )
         resp.raise_for_status()
         deck_text = resp.text or ""
     except Exception as exc:
@@ -265,7 +322,12 @@ def fetch_goldfish_deck(deck_url: str) -> Tuple[str | None, str | None, str | No
     commander_name = None
 
     try:
-        page_resp = requests.get(cleaned_url, timeout=10, headers=_REQUEST_HEADERS)
+        page_resp = cached_get(
+            cleaned_url,
+            timeout=10,
+            headers=_REQUEST_HEADERS,
+            fresh_for=_DECK_FETCH_FRESH_SECONDS,
+        )
         page_resp.raise_for_status()
         html = page_resp.text or ""
 
@@ -405,7 +467,7 @@ def fetch_moxfield_deck(deck_url: str) -> Tuple[str | None, str | None, str | No
     deck_payload = None
     for api_url in api_candidates:
         try:
-            resp = requests.get(
+            resp = cached_get(
                 api_url,
                 timeout=12,
                 headers={
@@ -413,6 +475,7 @@ def fetch_moxfield_deck(deck_url: str) -> Tuple[str | None, str | None, str | No
                     "Accept": "application/json",
                     "Referer": "https://moxfield.com/",
                 },
+                fresh_for=_DECK_FETCH_FRESH_SECONDS,
             )
             if resp.status_code == 403:
                 errors.append(
@@ -489,6 +552,7 @@ def fetch_proxy_deck(deck_url: str) -> Tuple[str | None, str | None, str | None,
 __all__ = [
     "ResolvedCard",
     "parse_decklist",
+    "resolve_card_names",
     "resolve_proxy_cards",
     "fetch_goldfish_deck",
     "fetch_moxfield_deck",
@@ -9,8 +9,18 @@ Layout
 Letter-sized page (8.5in × 11in). A 3×3 grid of card slots at standard
 Magic dimensions (2.5in × 3.5in) per page. Each card is rendered as a
 bordered rectangle with the card name and optional set/collector-number
-stamp inside. Card art is intentionally omitted — the output is designed
-for home-printing playtest proxies where readability matters most.
+stamp inside, or — when an ``image_for`` callback finds a local JPEG for
+the card — as that image scaled to the card size.
+
+Streaming
+---------
+:func:`iter_proxy_pdf` writes the document as a sequence of byte chunks,
+recording object offsets as it goes and finishing with the xref table, so
+a full deck never sits in memory at once. Every distinct card is drawn
+once as a Form XObject and each copy on the sheet is just a ``Do`` of that
+form; every distinct image file is embedded once as a ``DCTDecode`` Image
+XObject shared by all forms that use it. Image files are streamed from
+disk in chunks.
 
 This service is pure function over the decklist and can be called from a
 route or a CLI.
@@ -18,13 +28,15 @@ route or a CLI.
 
 from __future__ import annotations
 
+import hashlib
 import io
+import os
 import re
 from dataclasses import dataclass
-from typing import Iterable, Sequence
+from typing import BinaryIO, Callable, Iterable, Iterator, Sequence, Union
 
 
-__all__ = ["ProxySlot", "render_proxy_pdf"]
+__all__ = ["ProxySlot", "iter_proxy_pdf", "render_proxy_pdf"]
 
 
 # Page + layout constants (all in PDF points, 72 per inch)
@@ -40,6 +52,16 @@ _CARDS_PER_PAGE = _COLS * _ROWS
 _MARGIN_X = (_PAGE_WIDTH - _COLS * _CARD_WIDTH) // 2
 _MARGIN_Y = (_PAGE_HEIGHT - _ROWS * _CARD_HEIGHT) // 2
 
+# Fixed object numbers; everything else is allocated while streaming.
+_CATALOG_ID = 1
+_PAGES_ID = 2
+_FONT_ID = 3
+_IMAGE_CHUNK = 64 * 1024
+
+# ``image_for`` may return a path to a JPEG on disk, the JPEG bytes, or None.
+ImageSource = Union[str, "os.PathLike[str]", bytes, None]
+ImageLookup = Callable[["ProxySlot"], ImageSource]
+
 
 @dataclass
 class ProxySlot:
@@ -50,6 +72,10 @@ class ProxySlot:
     type_line: str | None = None
 
 
+def _slot_key(slot: ProxySlot) -> tuple:
+    return (slot.name, slot.set_code, slot.collector_number, slot.mana_cost, slot.type_line)
+
+
 def _expand_deck(deck: Iterable[tuple[ProxySlot, int]]) -> list[ProxySlot]:
     expanded: list[ProxySlot] = []
     for slot, qty in deck:
@@ -66,132 +92,281 @@ def _escape(text: str) -> str:
     return re.sub(r"[^\x20-\x7e]", "?", sanitized)
 
 
-def _build_page_stream(slots: Sequence[ProxySlot]) -> bytes:
-    """Return a content-stream body rendering up to 9 cards on one page."""
+def _build_card_stream(slot: ProxySlot, *, image_name: str | None = None) -> bytes:
+    """Return a Form XObject body drawing one card in card-local coordinates."""
+    lines: list[str] = ["0.5 w"]
+    if image_name:
+        lines.append(f"q {_CARD_WIDTH} 0 0 {_CARD_HEIGHT} 0 0 cm /{image_name} Do Q")
+        lines.append(f"0 0 {_CARD_WIDTH} {_CARD_HEIGHT} re S")
+        return ("\n".join(lines) + "\n").encode("latin-1", errors="replace")
+
+    # Thin border around the card.
+    lines.append(f"0 0 {_CARD_WIDTH} {_CARD_HEIGHT} re S")
+    # Title at top of card.
+    title_x = 6
+    title_y = _CARD_HEIGHT - 18
+    lines.append("BT")
+    lines.append("/F1 11 Tf")
+    lines.append(f"{title_x} {title_y} Td")
+    lines.append(f"({_escape(slot.name)}) Tj")
+    lines.append("ET")
+    # Mana cost / type line below the title.
+    detail_parts: list[str] = []
+    if slot.mana_cost:
+        detail_parts.append(slot.mana_cost.replace("{", "").replace("}", ""))
+    if slot.type_line:
+        detail_parts.append(slot.type_line)
+    if detail_parts:
+        lines.append("BT")
+        lines.append("/F1 8 Tf")
+        lines.append(f"{title_x} {title_y - 14} Td")
+        lines.append(f"({_escape(' — '.join(detail_parts))}) Tj")
+        lines.append("ET")
+    # Set + collector number stamp near bottom-left.
+    stamp_parts: list[str] = []
+    if slot.set_code:
+        stamp_parts.append(slot.set_code.upper())
+    if slot.collector_number:
+        stamp_parts.append(f"#{slot.collector_number}")
+    if stamp_parts:
+        lines.append("BT")
+        lines.append("/F1 7 Tf")
+        lines.append(f"{title_x} 10 Td")
+        lines.append(f"({_escape(' '.join(stamp_parts))}) Tj")
+        lines.append("ET")
+    body = "\n".join(lines) + "\n"
+    return body.encode("latin-1", errors="replace")
+
+
+def _build_page_stream(form_names: Sequence[str]) -> bytes:
+    """Return a content stream placing up to 9 card forms on one page."""
     lines: list[str] = []
-    # Thin border around each card.
-    lines.append("0.5 w")
-    for idx, slot in enumerate(slots):
+    for idx, form_name in enumerate(form_names):
         col = idx % _COLS
         row = idx // _COLS
         x = _MARGIN_X + col * _CARD_WIDTH
         y = _MARGIN_Y + (_ROWS - 1 - row) * _CARD_HEIGHT  # top row first
-        lines.append(f"{x} {y} {_CARD_WIDTH} {_CARD_HEIGHT} re S")
-        # Title at top of card.
-        title_x = x + 6
-        title_y = y + _CARD_HEIGHT - 18
-        lines.append("BT")
-        lines.append("/F1 11 Tf")
-        lines.append(f"{title_x} {title_y} Td")
-        lines.append(f"({_escape(slot.name)}) Tj")
-        lines.append("ET")
-        # Mana cost / type line below the title.
-        detail_parts: list[str] = []
-        if slot.mana_cost:
-            detail_parts.append(slot.mana_cost.replace("{", "").replace("}", ""))
-        if slot.type_line:
-            detail_parts.append(slot.type_line)
-        if detail_parts:
-            lines.append("BT")
-            lines.append("/F1 8 Tf")
-            lines.append(f"{title_x} {title_y - 14} Td")
-            lines.append(f"({_escape(' — '.join(detail_parts))}) Tj")
-            lines.append("ET")
-        # Set + collector number stamp near bottom-left.
-        stamp_parts: list[str] = []
-        if slot.set_code:
-            stamp_parts.append(slot.set_code.upper())
-        if slot.collector_number:
-            stamp_parts.append(f"#{slot.collector_number}")
-        if stamp_parts:
-            lines.append("BT")
-            lines.append("/F1 7 Tf")
-            lines.append(f"{title_x} {y + 10} Td")
-            lines.append(f"({_escape(' '.join(stamp_parts))}) Tj")
-            lines.append("ET")
-    body = "\n".join(lines) + "\n"
-    return body.encode("latin-1", errors="replace")
+        lines.append(f"q 1 0 0 1 {x} {y} cm /{form_name} Do Q")
+    return ("\n".join(lines) + "\n").encode("ascii")
 
 
-def render_proxy_pdf(
+_JPEG_SOF_MARKERS = {0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF}
+_JPEG_COLOR_SPACES = {1: b"/DeviceGray", 3: b"/DeviceRGB", 4: b"/DeviceCMYK"}
+
+
+def _jpeg_dimensions(fh: BinaryIO) -> tuple[int, int, int] | None:
+    """Return ``(width, height, components)`` from a JPEG's SOF header, or None."""
+    if fh.read(2) != b"\xff\xd8":
+        return None
+    while True:
+        byte = fh.read(1)
+        while byte and byte != b"\xff":
+            byte = fh.read(1)
+        while byte == b"\xff":
+            byte = fh.read(1)
+        if not byte:
+            return None
+        marker = byte[0]
+        if marker in (0xD8, 0x01) or 0xD0 <= marker <= 0xD7:
+            continue
+        if marker in (0xD9, 0xDA):
+            return None
+        length_bytes = fh.read(2)
+        if len(length_bytes) < 2:
+            return None
+        length = int.from_bytes(length_bytes, "big")
+        if marker in _JPEG_SOF_MARKERS:
+            header = fh.read(6)
+            if len(header) < 6:
+                return None
+            height = int.from_bytes(header[1:3], "big")
+            width = int.from_bytes(header[3:5], "big")
+            return width, height, header[5]
+        fh.seek(length - 2, os.SEEK_CUR)
+
+
+class _JpegImage:
+    """A JPEG to embed: its identity, header info and a chunked reader."""
+
+    def __init__(self, source: ImageSource):
+        self.path: str | None = None
+        self.data: bytes | None = None
+        if isinstance(source, (bytes, bytearray)):
+            self.data = bytes(source)
+            self.key = "sha1:" + hashlib.sha1(self.data).hexdigest()
+            self.length = len(self.data)
+        else:
+            self.path = os.path.abspath(os.fspath(source))
+            self.key = "path:" + self.path
+            self.length = os.path.getsize(self.path)
+        self.info = self._read_info()
+
+    def _open(self) -> BinaryIO:
+        return io.BytesIO(self.data) if self.data is not None else open(self.path, "rb")
+
+    def _read_info(self) -> tuple[int, int, int] | None:
+        with self._open() as fh:
+            info = _jpeg_dimensions(fh)
+        if info is None or info[2] not in _JPEG_COLOR_SPACES or not info[0] or not info[1]:
+            return None
+        return info
+
+    def chunks(self) -> Iterator[bytes]:
+        with self._open() as fh:
+            while True:
+                chunk = fh.read(_IMAGE_CHUNK)
+                if not chunk:
+                    break
+                yield chunk
+
+
+def _load_image(image_for: ImageLookup | None, slot: ProxySlot) -> _JpegImage | None:
+    """Resolve a slot's art through ``image_for``; unusable images are ignored."""
+    if image_for is None:
+        return None
+    try:
+        source = image_for(slot)
+        if not source:
+            return None
+        image = _JpegImage(source)
+    except (OSError, TypeError, ValueError):
+        return None
+    return image if image.info is not None else None
+
+
+class _PdfStream:
+    """Track byte offsets of objects as they are yielded."""
+
+    def __init__(self):
+        self.position = 0
+        self.offsets: dict[int, int] = {}
+        self.next_id = _FONT_ID + 1
+
+    def allocate(self) -> int:
+        object_id = self.next_id
+        self.next_id += 1
+        return object_id
+
+    def emit(self, data: bytes) -> bytes:
+        self.position += len(data)
+        return data
+
+    def begin(self, object_id: int) -> bytes:
+        self.offsets[object_id] = self.position
+        return self.emit(b"%d 0 obj\n" % object_id)
+
+    def obj(self, object_id: int, body: bytes) -> bytes:
+        return self.begin(object_id) + self.emit(body + b"\nendobj\n")
+
+
+def iter_proxy_pdf(
     deck: Sequence[tuple[ProxySlot, int]],
     *,
     title: str | None = None,
-) -> bytes:
-    """Render a deck list into a printable PDF byte string.
+    image_for: ImageLookup | None = None,
+) -> Iterator[bytes]:
+    """Yield a proxy-sheet PDF as byte chunks, one object at a time.
 
     ``deck`` is a sequence of ``(ProxySlot, quantity)`` tuples. Each copy of
     a card becomes its own slot on the sheet so a full deck prints across
-    multiple pages in the expected order.
+    multiple pages in the expected order. ``image_for`` optionally maps a
+    slot to a local JPEG (path or bytes); cards without one get the text
+    layout.
     """
     expanded = _expand_deck(deck)
-    pages: list[bytes] = []
-    for i in range(0, max(1, len(expanded)), _CARDS_PER_PAGE):
-        page_slots = expanded[i : i + _CARDS_PER_PAGE]
-        pages.append(_build_page_stream(page_slots))
-
-    # Build PDF objects
-    objects: list[bytes] = []
+    out = _PdfStream()
 
-    def add_object(body: bytes) -> int:
-        objects.append(body)
-        return len(objects)  # 1-based index
+    yield out.emit(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+    yield out.obj(_CATALOG_ID, b"<< /Type /Catalog /Pages %d 0 R >>" % _PAGES_ID)
+    yield out.obj(_FONT_ID, b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
 
-    # add_object returns 1-based indices; we capture them so the trailer
-    # ``/Root 1 0 R`` matches the assembled object stream.
-    add_object(b"<< /Type /Catalog /Pages 2 0 R >>")  # object 1: catalog
-    pages_placeholder_id = add_object(b"")  # object 2: /Pages, filled in below
-    font_id = add_object(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
-
-    # Build page objects.
+    forms: dict[tuple, tuple[str, int]] = {}
+    images: dict[str, int] = {}
     page_ids: list[int] = []
-    for stream_data in pages:
-        content_id = add_object(
-            b"<< /Length %d >>\nstream\n" % len(stream_data)
-            + stream_data
-            + b"endstream"
+    for start in range(0, max(1, len(expanded)), _CARDS_PER_PAGE):
+        page_forms: dict[str, int] = {}
+        placements: list[str] = []
+        for slot in expanded[start : start + _CARDS_PER_PAGE]:
+            key = _slot_key(slot)
+            if key not in forms:
+                image = _load_image(image_for, slot)
+                resources = b"/Font << /F1 %d 0 R >>" % _FONT_ID
+                image_name = None
+                if image is not None:
+                    if image.key not in images:
+                        image_id = out.allocate()
+                        images[image.key] = image_id
+                        width, height, components = image.info
+                        yield out.begin(image_id)
+                        yield out.emit(
+                            b"<< /Type /XObject /Subtype /Image /Width %d /Height %d "
+                            b"/ColorSpace %s /BitsPerComponent 8 /Filter /DCTDecode "
+                            b"/Length %d >>\nstream\n"
+                            % (width, height, _JPEG_COLOR_SPACES[components], image.length)
+                        )
+                        for chunk in image.chunks():
+                            yield out.emit(chunk)
+                        yield out.emit(b"\nendstream\nendobj\n")
+                    image_name = "Im"
+                    resources = b"/XObject << /Im %d 0 R >>" % images[image.key]
+                body = _build_card_stream(slot, image_name=image_name)
+                form_id = out.allocate()
+                forms[key] = (f"C{len(forms) + 1}", form_id)
+                yield out.obj(
+                    form_id,
+                    b"<< /Type /XObject /Subtype /Form /BBox [0 0 %d %d] "
+                    b"/Resources << %s >> /Length %d >>\nstream\n"
+                    % (_CARD_WIDTH, _CARD_HEIGHT, resources, len(body))
+                    + body
+                    + b"endstream",
+                )
+            form_name, form_id = forms[key]
+            page_forms[form_name] = form_id
+            placements.append(form_name)
+
+        stream_data = _build_page_stream(placements)
+        content_id = out.allocate()
+        yield out.obj(
+            content_id,
+            b"<< /Length %d >>\nstream\n" % len(stream_data) + stream_data + b"endstream",
         )
-        page_body = (
+        xobjects = b" ".join(b"/%s %d 0 R" % (name.encode("ascii"), oid) for name, oid in page_forms.items())
+        page_id = out.allocate()
+        yield out.obj(
+            page_id,
             b"<< /Type /Page /Parent %d 0 R "
             b"/MediaBox [0 0 %d %d] "
-            b"/Resources << /Font << /F1 %d 0 R >> >> "
+            b"/Resources << /XObject << %s >> >> "
             b"/Contents %d 0 R >>"
-            % (pages_placeholder_id, _PAGE_WIDTH, _PAGE_HEIGHT, font_id, content_id)
+            % (_PAGES_ID, _PAGE_WIDTH, _PAGE_HEIGHT, xobjects, content_id),
         )
-        page_ids.append(add_object(page_body))
+        page_ids.append(page_id)
 
-    # Fill in the Pages node once we know the child IDs.
+    # The Pages node goes last, once every child ID is known.
     kids = b" ".join(b"%d 0 R" % pid for pid in page_ids)
-    pages_body = (
-        b"<< /Type /Pages /Count %d /Kids [%s] >>" % (len(page_ids), kids)
-    )
-    objects[pages_placeholder_id - 1] = pages_body
-
-    # Assemble full byte stream, tracking byte offsets for xref.
-    buffer = io.BytesIO()
-    buffer.write(b"%PDF-1.4\n")
-    buffer.write(b"%\xe2\xe3\xcf\xd3\n")
-
-    offsets: list[int] = []
-    for index, body in enumerate(objects, start=1):
-        offsets.append(buffer.tell())
-        buffer.write(b"%d 0 obj\n" % index)
-        buffer.write(body)
-        buffer.write(b"\nendobj\n")
-
-    xref_offset = buffer.tell()
-    buffer.write(b"xref\n")
-    buffer.write(b"0 %d\n" % (len(objects) + 1))
-    buffer.write(b"0000000000 65535 f \n")
-    for offset in offsets:
-        buffer.write(b"%010d 00000 n \n" % offset)
-    trailer = (
-        b"trailer\n<< /Size %d /Root 1 0 R"
-        % (len(objects) + 1)
-    )
+    yield out.obj(_PAGES_ID, b"<< /Type /Pages /Count %d /Kids [%s] >>" % (len(page_ids), kids))
+
+    size = out.next_id
+    xref_offset = out.position
+    xref = [b"xref\n", b"0 %d\n" % size, b"0000000000 65535 f \n"]
+    xref.extend(b"%010d 00000 n \n" % out.offsets[object_id] for object_id in range(1, size))
+    yield out.emit(b"".join(xref))
+    trailer = b"trailer\n<< /Size %d /Root %d 0 R" % (size, _CATALOG_ID)
     if title:
         trailer += b" /Info << /Title (%s) >>" % _escape(title).encode("latin-1", errors="replace")
     trailer += b" >>\nstartxref\n"
-    buffer.write(trailer)
-    buffer.write(b"%d\n%%%%EOF\n" % xref_offset)
-    return buffer.getvalue()
+    yield out.emit(trailer + b"%d\n%%%%EOF\n" % xref_offset)
+
+
+def render_proxy_pdf(
+    deck: Sequence[tuple[ProxySlot, int]],
+    *,
+    title: str | None = None,
+    image_for: ImageLookup | None = None,
+) -> bytes:
+    """Render a deck list into a printable PDF byte string.
+
+    Convenience wrapper over :func:`iter_proxy_pdf` for callers that want the
+    whole document (tests, CLI); routes should stream the iterator instead.
+    """
+    return b"".join(iter_proxy_pdf(deck, title=title, image_for=image_for))
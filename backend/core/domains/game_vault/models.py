@@ -102,6 +102,9 @@ class GVDeck(db.Model):
     last_synced_at = db.Column(db.DateTime, nullable=True)
     sync_status = db.Column(db.String(20), nullable=True)  # "ok" | "error"
     sync_error = db.Column(db.String(255), nullable=True)
+    # HTTP validators of the last source fetch; replayed so unchanged decks 304.
+    sync_etag = db.Column(db.String(255), nullable=True)
+    sync_last_modified = db.Column(db.String(64), nullable=True)
     archived_at = db.Column(db.DateTime, nullable=True)
 
     created_at = db.Column(db.DateTime, nullable=False, default=utcnow)
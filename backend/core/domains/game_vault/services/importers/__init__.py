@@ -6,8 +6,10 @@ Moxfield can additionally list a user's public decks by username.
 """
 
 from .base import (
+    DeckNotModified,
     ImportedDeck,
     ImportError as DeckImportError,
+    Validators,
     detect_source,
     fetch_deck,
     import_from_url,
@@ -18,6 +20,8 @@ from .base import (
 __all__ = [
     "ImportedDeck",
     "DeckImportError",
+    "DeckNotModified",
+    "Validators",
     "detect_source",
     "fetch_deck",
     "import_from_url",
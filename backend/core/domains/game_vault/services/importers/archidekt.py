@@ -15,7 +15,14 @@ from urllib.parse import quote, urlsplit
 
 from shared.http_client import EXTERNAL_SERVICE_TIMEOUT, safe_get
 
-from .base import ImportedDeck, ImportError
+from .base import (
+    DeckNotModified,
+    ImportedDeck,
+    ImportError,
+    Validators,
+    conditional_headers,
+    response_validators,
+)
 
 API_BASE = "https://archidekt.com/api"
 COMMANDER_FORMAT = 3
@@ -67,21 +74,35 @@ def normalize_username(raw: str | None) -> str:
     return text.lstrip("@").strip()
 
 
-def _get_json(url: str) -> dict[str, Any]:
+def _get(url: str, validators: Optional[Validators] = None):
     try:
-        resp = safe_get(url, timeout=EXTERNAL_SERVICE_TIMEOUT, headers=_HEADERS)
+        resp = safe_get(
+            url,
+            timeout=EXTERNAL_SERVICE_TIMEOUT,
+            headers=conditional_headers(_HEADERS, validators),
+        )
     except Exception as exc:
         raise ImportError("Couldn't reach Archidekt. Try again in a moment.") from exc
+    if resp.status_code == 304 and validators:
+        raise DeckNotModified(url)
     if resp.status_code == 404:
         raise ImportError("Not found on Archidekt.")
     if resp.status_code != 200:
         raise ImportError(f"Archidekt returned HTTP {resp.status_code}.")
+    return resp
+
+
+def _json(resp) -> dict[str, Any]:
     try:
         return resp.json()
     except ValueError as exc:
         raise ImportError("Archidekt returned an unexpected response.") from exc
 
 
+def _get_json(url: str) -> dict[str, Any]:
+    return _json(_get(url))
+
+
 def _deck_url(deck_id: Any) -> str:
     return f"https://archidekt.com/decks/{deck_id}"
 
@@ -160,11 +181,12 @@ def _card_name(entry: dict[str, Any]) -> str:
     return (oracle.get("name") or card.get("displayName") or "").strip()
 
 
-def fetch_deck(deck_ref: str) -> ImportedDeck:
+def fetch_deck(deck_ref: str, *, validators: Optional[Validators] = None) -> ImportedDeck:
     deck_id = _extract_id(deck_ref)
     if not deck_id:
         raise ImportError("Couldn't find an Archidekt deck id in that link.")
-    data = _get_json(f"{API_BASE}/decks/{deck_id}/")
+    resp = _get(f"{API_BASE}/decks/{deck_id}/", validators)
+    data = _json(resp)
 
     excluded = {
         (cat.get("name") or "").strip().lower()
@@ -209,6 +231,7 @@ def fetch_deck(deck_ref: str) -> ImportedDeck:
         bracket=bracket,
         bracket_estimated=bracket_estimated,
         cards=cards,
+        validators=response_validators(resp),
     )
 
 
@@ -15,6 +15,47 @@ class ImportError(Exception):
 DeckImportError = ImportError
 
 
+class DeckNotModified(Exception):
+    """Raised when a conditional fetch reports the deck unchanged (HTTP 304)."""
+
+
+@dataclass(frozen=True)
+class Validators:
+    """HTTP cache validators (ETag / Last-Modified) from a previous deck fetch."""
+
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    def __bool__(self) -> bool:
+        return bool(self.etag or self.last_modified)
+
+    def headers(self) -> dict[str, str]:
+        out: dict[str, str] = {}
+        if self.etag:
+            out["If-None-Match"] = self.etag
+        if self.last_modified:
+            out["If-Modified-Since"] = self.last_modified
+        return out
+
+
+def conditional_headers(headers: dict[str, str], validators: Optional[Validators]) -> dict[str, str]:
+    """``headers`` plus If-None-Match / If-Modified-Since for ``validators``."""
+    if not validators:
+        return headers
+    return {**headers, **validators.headers()}
+
+
+def response_validators(resp) -> Validators:
+    """Validators a response advertised, to replay on the next sync."""
+    headers = getattr(resp, "headers", None) or {}
+    etag = (headers.get("ETag") or "").strip() or None
+    last_modified = (headers.get("Last-Modified") or "").strip() or None
+    return Validators(
+        etag=etag[:255] if etag else None,
+        last_modified=last_modified[:64] if last_modified else None,
+    )
+
+
 @dataclass
 class ImportedDeck:
     """A normalized decklist pulled from a public deck site."""
@@ -29,6 +70,7 @@ class ImportedDeck:
     bracket: Optional[int] = None
     bracket_estimated: bool = False  # True when the bracket is a site estimate
     cards: list[dict[str, Any]] = field(default_factory=list)  # {"name","quantity"}
+    validators: Validators = field(default_factory=Validators)  # of the primary fetch
 
     @property
     def commander_name(self) -> Optional[str]:
@@ -89,19 +131,23 @@ def _adapter(source: str):
     raise ImportError(f"Unsupported deck source: {source}")
 
 
-def import_from_url(url: str) -> ImportedDeck:
-    """Detect the site from the URL and import the deck."""
+def import_from_url(url: str, *, validators: Optional[Validators] = None) -> ImportedDeck:
+    """Detect the site from the URL and import the deck.
+
+    With ``validators`` the primary fetch is conditional and raises
+    :class:`DeckNotModified` when the site reports the deck unchanged.
+    """
     source = detect_source(url)
     if not source:
         raise ImportError(
             "Unrecognised deck link. Use an Archidekt, Moxfield, or MTGGoldfish URL."
         )
-    return _adapter(source).fetch_deck(url)
+    return _adapter(source).fetch_deck(url, validators=validators)
 
 
-def fetch_deck(source: str, deck_ref: str) -> ImportedDeck:
+def fetch_deck(source: str, deck_ref: str, *, validators: Optional[Validators] = None) -> ImportedDeck:
     """Import a deck by explicit source + a URL or bare site deck id."""
-    return _adapter(source).fetch_deck(deck_ref)
+    return _adapter(source).fetch_deck(deck_ref, validators=validators)
 
 
 def supports_username_listing(source: str) -> bool:
@@ -121,9 +167,13 @@ __all__ = [
     "ImportedDeck",
     "ImportError",
     "DeckImportError",
+    "DeckNotModified",
+    "Validators",
+    "conditional_headers",
     "detect_source",
     "fetch_deck",
     "import_from_url",
     "list_user_decks",
+    "response_validators",
     "supports_username_listing",
 ]
@@ -15,7 +15,14 @@ from urllib.parse import quote, urlsplit
 
 from shared.http_client import EXTERNAL_SERVICE_TIMEOUT, safe_get
 
-from .base import ImportedDeck, ImportError
+from .base import (
+    DeckNotModified,
+    ImportedDeck,
+    ImportError,
+    Validators,
+    conditional_headers,
+    response_validators,
+)
 
 _API = "https://api2.moxfield.com"
 _HEADERS = {
@@ -50,23 +57,37 @@ def _looks_like_cloudflare(resp) -> bool:
     return "cloudflare" in body or "attention required" in body or "cf-ray" in body
 
 
-def _get_json(url: str) -> Any:
+def _get(url: str, validators: Optional[Validators] = None):
     try:
-        resp = safe_get(url, timeout=EXTERNAL_SERVICE_TIMEOUT, headers=_HEADERS)
+        resp = safe_get(
+            url,
+            timeout=EXTERNAL_SERVICE_TIMEOUT,
+            headers=conditional_headers(_HEADERS, validators),
+        )
     except Exception as exc:
         raise ImportError("Couldn't reach Moxfield. Try again in a moment.") from exc
+    if resp.status_code == 304 and validators:
+        raise DeckNotModified(url)
     if resp.status_code in (401, 403, 429, 503) or _looks_like_cloudflare(resp):
         raise ImportError(_CLOUDFLARE_MSG)
     if resp.status_code == 404:
         raise ImportError("Deck not found on Moxfield (is it public?).")
     if resp.status_code != 200:
         raise ImportError(f"Moxfield returned HTTP {resp.status_code}.")
+    return resp
+
+
+def _json(resp) -> Any:
     try:
         return resp.json()
     except ValueError as exc:
         raise ImportError("Moxfield returned an unexpected response.") from exc
 
 
+def _get_json(url: str) -> Any:
+    return _json(_get(url))
+
+
 def _extract_public_id(deck_ref: str) -> Optional[str]:
     raw = (deck_ref or "").strip()
     if not raw:
@@ -111,12 +132,13 @@ def _iter_board_cards(data: dict[str, Any]):
                 yield board_name.lower(), entry
 
 
-def fetch_deck(deck_ref: str) -> ImportedDeck:
+def fetch_deck(deck_ref: str, *, validators: Optional[Validators] = None) -> ImportedDeck:
     public_id = _extract_public_id(deck_ref)
     if not public_id:
         raise ImportError("Couldn't find a Moxfield deck id in that link.")
 
-    data = _get_json(f"{_API}/v3/decks/all/{quote(public_id)}")
+    resp = _get(f"{_API}/v3/decks/all/{quote(public_id)}", validators)
+    data = _json(resp)
     if not isinstance(data, dict):
         raise ImportError("Moxfield returned an unexpected response.")
 
@@ -158,6 +180,7 @@ def fetch_deck(deck_ref: str) -> ImportedDeck:
         format=fmt,
         bracket=None,
         cards=cards,
+        validators=response_validators(resp),
     )
 
 
@@ -14,7 +14,14 @@ from urllib.parse import urlsplit
 
 from shared.http_client import EXTERNAL_SERVICE_TIMEOUT, safe_get
 
-from .base import ImportedDeck, ImportError
+from .base import (
+    DeckNotModified,
+    ImportedDeck,
+    ImportError,
+    Validators,
+    conditional_headers,
+    response_validators,
+)
 
 _HEADERS = {
     "User-Agent": "Mozilla/5.0 (compatible; DragonsVault-GameVault/1.0; +https://github.com/JBSmith29/DragonsVault.app)",
@@ -40,16 +47,26 @@ def _extract_id(deck_ref: str) -> Optional[str]:
     return match.group(1) if match else None
 
 
-def _fetch_text(url: str) -> str:
+def _get(url: str, validators: Optional[Validators] = None):
     try:
-        resp = safe_get(url, timeout=EXTERNAL_SERVICE_TIMEOUT, headers=_HEADERS)
+        resp = safe_get(
+            url,
+            timeout=EXTERNAL_SERVICE_TIMEOUT,
+            headers=conditional_headers(_HEADERS, validators),
+        )
     except Exception as exc:
         raise ImportError("Couldn't reach MTGGoldfish. Try again in a moment.") from exc
+    if resp.status_code == 304 and validators:
+        raise DeckNotModified(url)
     if resp.status_code == 404:
         raise ImportError("Deck not found on MTGGoldfish.")
     if resp.status_code != 200:
         raise ImportError(f"MTGGoldfish returned HTTP {resp.status_code}.")
-    return resp.text or ""
+    return resp
+
+
+def _fetch_text(url: str) -> str:
+    return _get(url).text or ""
 
 
 def _parse_name_and_commander(html: str) -> tuple[Optional[str], Optional[str]]:
@@ -88,12 +105,15 @@ def _parse_name_and_commander(html: str) -> tuple[Optional[str], Optional[str]]:
     return deck_name, commander
 
 
-def fetch_deck(deck_ref: str) -> ImportedDeck:
+def fetch_deck(deck_ref: str, *, validators: Optional[Validators] = None) -> ImportedDeck:
     deck_id = _extract_id(deck_ref)
     if not deck_id:
         raise ImportError("Couldn't find an MTGGoldfish deck id in that link.")
 
-    deck_text = _fetch_text(f"https://www.mtggoldfish.com/deck/download/{deck_id}")
+    # The downloadable list is the deck's content; the page only adds metadata,
+    # so an unchanged list short-circuits before the page is fetched.
+    download = _get(f"https://www.mtggoldfish.com/deck/download/{deck_id}", validators)
+    deck_text = download.text or ""
     try:
         html = _fetch_text(f"https://www.mtggoldfish.com/deck/{deck_id}")
     except ImportError:
@@ -147,6 +167,7 @@ def fetch_deck(deck_ref: str) -> ImportedDeck:
         format="commander" if commanders else None,
         bracket=None,
         cards=cards,
+        validators=response_validators(download),
     )
 
 
@@ -1,25 +1,35 @@
-"""Tiny, standalone Scryfall lookup used to enrich imported decks.
-
-Deliberately independent of the app's own Scryfall cache: it calls the public
-Scryfall API directly and returns only an image URL (served from
-``cards.scryfall.io``, which the site CSP allows for <img>) and the card's
-color identity. All failures are swallowed — enrichment is best-effort.
+"""Commander art + color identity lookup used to enrich Game Vault decks.
+
+Names resolve against the app's local Scryfall bulk cache first
+(``unique_oracle_by_name`` → ``prints_for_oracle``); only names the bulk cache
+doesn't know fall back to the public Scryfall API, batched through
+``/cards/collection``. API results — including "no such card" misses — are kept
+in the shared app cache so restarts and other workers don't re-fetch them.
+Returns only an image URL (served from ``cards.scryfall.io``, which the site
+CSP allows for <img>) and the card's color identity. All failures are
+swallowed — enrichment is best-effort.
 """
 
 from __future__ import annotations
 
-from functools import lru_cache
-from typing import Optional
-from urllib.parse import quote
+from typing import Iterable, Optional
 
-from shared.http_client import SCRYFALL_TIMEOUT, safe_get
+from extensions import cache
+from shared.http_client import SCRYFALL_TIMEOUT, safe_post
 
-_API = "https://api.scryfall.com/cards/named"
+_COLLECTION_API = "https://api.scryfall.com/cards/collection"
+_COLLECTION_BATCH = 75  # Scryfall's per-request identifier limit
 _HEADERS = {
     "User-Agent": "DragonsVault-GameVault/1.0 (+https://github.com/JBSmith29/DragonsVault.app)",
     "Accept": "application/json",
 }
 _COLOR_ORDER = "WUBRG"
+_CACHE_PREFIX = "gv:commander:"
+_HIT_TTL = 7 * 24 * 3600
+_MISS_TTL = 24 * 3600
+_MISS = "__miss__"
+
+Resolved = tuple[Optional[str], Optional[str]]
 
 
 def _image_from_card(card: dict) -> Optional[str]:
@@ -37,45 +47,140 @@ def _identity(card: dict) -> Optional[str]:
     return ident or ("C" if card.get("color_identity") == [] else None)
 
 
-@lru_cache(maxsize=2048)
-def lookup_commander(name: str | None) -> tuple[Optional[str], Optional[str]]:
-    """Return (image_url, color_identity) for a commander name. Best-effort.
-
-    For partner/background pairs given as "A // B", the first name is used for
-    the image and the identities are merged when a second lookup succeeds.
-    """
+def _split(name: str | None) -> list[str]:
+    """Card names in a commander string; "A // B" partner pairs give two."""
     raw = (name or "").strip()
-    if not raw:
-        return None, None
+    return [p.strip() for p in raw.split("//") if p.strip()]
 
-    parts = [p.strip() for p in raw.split("//") if p.strip()]
-    primary = parts[0] if parts else raw
 
-    image, identity = _fetch(primary)
-    if len(parts) > 1:
-        _, identity2 = _fetch(parts[1])
-        identity = _merge_identity(identity, identity2)
-    return image, identity
+def _local(exact_name: str) -> Optional[Resolved]:
+    """Resolve from the in-memory bulk cache; None when it lacks the name."""
+    try:
+        from core.domains.cards.services import scryfall_cache as sc
+
+        if not sc.ensure_cache_loaded():
+            return None
+        oracle_id = sc.unique_oracle_by_name(exact_name)
+        prints = sc.prints_for_oracle(oracle_id) if oracle_id else ()
+    except Exception:
+        return None
+    if not prints:
+        return None
+    card = next((p for p in prints if not p.get("digital") and _image_from_card(p)), prints[0])
+    return _image_from_card(card), _identity(card)
 
 
-def _fetch(exact_name: str) -> tuple[Optional[str], Optional[str]]:
+def _cache_key(exact_name: str) -> str:
+    return _CACHE_PREFIX + exact_name.lower()
+
+
+def _cached(exact_name: str):
     try:
-        resp = safe_get(
-            f"{_API}?exact={quote(exact_name)}",
-            timeout=SCRYFALL_TIMEOUT,
-            headers=_HEADERS,
-        )
+        return cache.get(_cache_key(exact_name))
     except Exception:
-        return None, None
-    if resp.status_code != 200:
-        return None, None
+        return None
+
+
+def _remember(exact_name: str, value: Optional[Resolved]) -> None:
     try:
-        card = resp.json()
-    except ValueError:
-        return None, None
-    if not isinstance(card, dict):
+        if value is None:
+            cache.set(_cache_key(exact_name), _MISS, timeout=_MISS_TTL)
+        else:
+            cache.set(_cache_key(exact_name), list(value), timeout=_HIT_TTL)
+    except Exception:
+        pass
+
+
+def _fetch_collection(names: list[str]) -> dict[str, Resolved]:
+    """Batch-resolve names over the API; names Scryfall reports missing map to (None, None).
+
+    Names from a batch that failed outright (network, 429, 5xx) are left out,
+    so transient errors are never cached as misses.
+    """
+    found: dict[str, Resolved] = {}
+    for start in range(0, len(names), _COLLECTION_BATCH):
+        chunk = names[start:start + _COLLECTION_BATCH]
+        try:
+            resp = safe_post(
+                _COLLECTION_API,
+                json={"identifiers": [{"name": n} for n in chunk]},
+                timeout=SCRYFALL_TIMEOUT,
+                headers=_HEADERS,
+            )
+            payload = resp.json() if resp.status_code == 200 else None
+        except Exception:
+            payload = None
+        if not isinstance(payload, dict):
+            continue
+        by_name: dict[str, Resolved] = {}
+        for card in payload.get("data") or []:
+            if not isinstance(card, dict):
+                continue
+            value = (_image_from_card(card), _identity(card))
+            card_name = (card.get("name") or "").lower()
+            by_name[card_name] = value
+            # Requests by a face name ("Brisela" of a meld, DFC fronts) match too.
+            for face in _split(card_name):
+                by_name.setdefault(face, value)
+        for name in chunk:
+            value = by_name.get(name.lower())
+            found[name] = value if value is not None else (None, None)
+            _remember(name, value)
+    return found
+
+
+def _resolve_names(names: Iterable[str]) -> dict[str, Resolved]:
+    """Resolve single card names: local bulk cache, shared cache, then the API."""
+    resolved: dict[str, Resolved] = {}
+    remote: list[str] = []
+    for name in dict.fromkeys(names):
+        local = _local(name)
+        if local is not None:
+            resolved[name] = local
+            continue
+        cached = _cached(name)
+        if cached == _MISS:
+            resolved[name] = (None, None)
+        elif cached is not None:
+            resolved[name] = (cached[0], cached[1])
+        else:
+            remote.append(name)
+    if remote:
+        resolved.update(_fetch_collection(remote))
+    return resolved
+
+
+def lookup_commanders(names: Iterable[str | None]) -> dict[str, Resolved]:
+    """Batch form of :func:`lookup_commander`, keyed by the name as given.
+
+    Every distinct card across all commander strings is resolved together, so
+    the API (when needed at all) sees one collection request per 75 names.
+    """
+    wanted = [n for n in dict.fromkeys(names) if n and n.strip()]
+    resolved = _resolve_names(part for n in wanted for part in _split(n))
+    out: dict[str, Resolved] = {}
+    for name in wanted:
+        parts = _split(name)
+        if not parts:
+            # Only separators ("//"): nothing to look up.
+            out[name] = (None, None)
+            continue
+        image, identity = resolved.get(parts[0], (None, None))
+        if len(parts) > 1:
+            identity = _merge_identity(identity, resolved.get(parts[1], (None, None))[1])
+        out[name] = (image, identity)
+    return out
+
+
+def lookup_commander(name: str | None) -> Resolved:
+    """Return (image_url, color_identity) for a commander name. Best-effort.
+
+    For partner/background pairs given as "A // B", the first name is used for
+    the image and the identities are merged when a second lookup succeeds.
+    """
+    if not (name or "").strip():
         return None, None
-    return _image_from_card(card), _identity(card)
+    return lookup_commanders([name]).get(name, (None, None))
 
 
 def _merge_identity(a: Optional[str], b: Optional[str]) -> Optional[str]:
@@ -84,4 +189,4 @@ def _merge_identity(a: Optional[str], b: Optional[str]) -> Optional[str]:
     return ident or None
 
 
-__all__ = ["lookup_commander"]
+__all__ = ["lookup_commander", "lookup_commanders"]
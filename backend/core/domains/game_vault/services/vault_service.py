@@ -7,8 +7,10 @@ All queries are scoped by ``owner_user_id`` and never touch tables outside the
 from __future__ import annotations
 
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime
-from typing import Any, Iterable, Optional
+from typing import Any, Iterable, NamedTuple, Optional
 
 from sqlalchemy import func
 
@@ -21,11 +23,16 @@ from ..models import (
     GVGameParticipant,
     GVPlayer,
     KNOWN_SOURCES,
+    SOURCE_ARCHIDEKT,
+    SOURCE_GOLDFISH,
+    SOURCE_MOXFIELD,
     WIN_CONDITIONS,
 )
 from . import scryfall_lookup
 from .importers import (
     DeckImportError,
+    DeckNotModified,
+    Validators,
     detect_source,
     fetch_deck,
     import_from_url,
@@ -129,21 +136,30 @@ def list_source_decks(source: str, username: str, *, limit: int = 60) -> list[di
         raise VaultError(str(exc)) from exc
 
 
-def _run_import(*, url: str | None, source: str | None, deck_ref: str | None):
+def _run_import(*, url: str | None, source: str | None, deck_ref: str | None,
+                validators: Validators | None = None):
     try:
         if url:
-            return import_from_url(url)
+            return import_from_url(url, validators=validators)
         if source and deck_ref:
             source = source.strip().lower()
             if source not in KNOWN_SOURCES:
                 raise VaultError("Unknown deck source.")
-            return fetch_deck(source, deck_ref)
+            return fetch_deck(source, deck_ref, validators=validators)
     except DeckImportError as exc:
         raise VaultError(str(exc)) from exc
     raise VaultError("Provide a deck link to import.")
 
 
-def _apply_imported(deck: GVDeck, imported) -> None:
+def _needs_commander_lookup(deck: GVDeck, imported) -> bool:
+    return bool(imported.commander_name) and not (
+        deck.commander_image and deck.commander_name == imported.commander_name
+    )
+
+
+def _apply_imported(deck: GVDeck, imported, *, commanders: dict[str, tuple] | None = None) -> None:
+    same_commander = not _needs_commander_lookup(deck, imported)
+    previous_identity = deck.color_identity
     deck.source = imported.source
     deck.source_id = imported.source_id
     deck.url = imported.url
@@ -157,10 +173,19 @@ def _apply_imported(deck: GVDeck, imported) -> None:
         deck.bracket_is_estimated = bool(getattr(imported, "bracket_estimated", False))
     deck.card_count = imported.card_count
     deck.cards = imported.cards
+    deck.sync_etag = imported.validators.etag
+    deck.sync_last_modified = imported.validators.last_modified
 
     # Best-effort enrichment: commander art + color identity from Scryfall.
-    if imported.commander_name:
-        image, identity = scryfall_lookup.lookup_commander(imported.commander_name)
+    # A re-sync with the same, already-resolved commander reuses what we have.
+    if same_commander:
+        if not deck.color_identity:
+            deck.color_identity = previous_identity
+    elif imported.commander_name:
+        if commanders and imported.commander_name in commanders:
+            image, identity = commanders[imported.commander_name]
+        else:
+            image, identity = scryfall_lookup.lookup_commander(imported.commander_name)
         if image:
             deck.commander_image = image
         if identity and not deck.color_identity:
@@ -195,37 +220,121 @@ def import_deck(owner_user_id: int, player_id: int, *, url: str | None = None,
     return deck
 
 
+# Sync-all fetches decks on a small thread pool; each site also gets its own
+# ceiling (shared process-wide) so one library can't hammer a single host.
+SYNC_MAX_WORKERS = 6
+_SOURCE_CONCURRENCY = {SOURCE_ARCHIDEKT: 3, SOURCE_MOXFIELD: 1, SOURCE_GOLDFISH: 2}
+_SOURCE_SLOTS = {
+    source: threading.BoundedSemaphore(limit) for source, limit in _SOURCE_CONCURRENCY.items()
+}
+_FALLBACK_SLOT = threading.BoundedSemaphore(1)
+
+
+class _SyncJob(NamedTuple):
+    deck_id: int
+    url: str | None
+    source: str | None
+    source_id: str | None
+    validators: Validators | None
+
+
+class _SyncOutcome(NamedTuple):
+    deck_id: int
+    imported: Any = None  # ImportedDeck, or None when the site reported 304
+    error: VaultError | None = None
+
+
+def _has_source_link(deck: GVDeck) -> bool:
+    return bool(deck.url or (deck.source and deck.source_id))
+
+
+def _stored_validators(deck: GVDeck) -> Validators | None:
+    """Validators from the last good sync; only replayed while its data is intact."""
+    if deck.sync_status != "ok" or deck.cards is None:
+        return None
+    return Validators(etag=deck.sync_etag, last_modified=deck.sync_last_modified) or None
+
+
+def _sync_job(deck: GVDeck) -> _SyncJob:
+    return _SyncJob(deck.id, deck.url, deck.source, deck.source_id, _stored_validators(deck))
+
+
+def _fetch_for_sync(job: _SyncJob) -> _SyncOutcome:
+    """Network half of a sync: no DB access, safe to run off the request thread."""
+    source = (job.source or "").strip().lower() or detect_source(job.url)
+    with _SOURCE_SLOTS.get(source, _FALLBACK_SLOT):
+        try:
+            imported = _run_import(
+                url=job.url, source=job.source, deck_ref=job.source_id, validators=job.validators
+            )
+        except DeckNotModified:
+            return _SyncOutcome(job.deck_id)
+        except VaultError as exc:
+            return _SyncOutcome(job.deck_id, error=exc)
+    return _SyncOutcome(job.deck_id, imported=imported)
+
+
+def _apply_outcome(deck: GVDeck, outcome: _SyncOutcome, *, commanders: dict[str, tuple] | None = None) -> None:
+    if outcome.error is not None:
+        deck.sync_status = "error"
+        deck.sync_error = str(outcome.error)[:255]
+        deck.sync_etag = None
+        deck.sync_last_modified = None
+        deck.last_synced_at = utcnow()
+    elif outcome.imported is None:
+        # Unchanged at the source: keep the stored list, just record the check.
+        deck.last_synced_at = utcnow()
+        deck.sync_status = "ok"
+        deck.sync_error = None
+    else:
+        _apply_imported(deck, outcome.imported, commanders=commanders)
+
+
 def sync_deck(owner_user_id: int, deck_id: int) -> GVDeck:
     deck = GVDeck.query.filter_by(id=deck_id, owner_user_id=owner_user_id).first()
     if not deck:
         raise VaultError("Deck not found.")
-    if not deck.url and not (deck.source and deck.source_id):
+    if not _has_source_link(deck):
         raise VaultError("This deck has no source link to sync from.")
-    try:
-        imported = _run_import(url=deck.url, source=deck.source, deck_ref=deck.source_id)
-    except VaultError as exc:
-        deck.sync_status = "error"
-        deck.sync_error = str(exc)[:255]
-        deck.last_synced_at = utcnow()
-        db.session.commit()
-        raise
-    _apply_imported(deck, imported)
+    outcome = _fetch_for_sync(_sync_job(deck))
+    _apply_outcome(deck, outcome)
     db.session.commit()
+    if outcome.error is not None:
+        raise outcome.error
     return deck
 
 
 def sync_all_decks(owner_user_id: int) -> dict[str, int]:
+    """Re-sync every active deck, fetching sources concurrently.
+
+    Fetches run on a bounded pool with per-site limits and conditional requests;
+    results are applied on the calling thread, which owns the DB session, with
+    new commanders resolved in one batch, then committed once.
+    """
     decks = GVDeck.query.filter(
         GVDeck.owner_user_id == owner_user_id,
         GVDeck.archived_at.is_(None),
     ).all()
-    ok = errors = 0
-    for deck in decks:
-        try:
-            sync_deck(owner_user_id, deck.id)
-            ok += 1
-        except VaultError:
-            errors += 1
+    by_id = {deck.id: deck for deck in decks}
+    jobs = [_sync_job(deck) for deck in decks if _has_source_link(deck)]
+    ok = 0
+    errors = len(decks) - len(jobs)  # no source link to sync from
+    if jobs:
+        with ThreadPoolExecutor(max_workers=min(SYNC_MAX_WORKERS, len(jobs))) as executor:
+            outcomes = list(executor.map(_fetch_for_sync, jobs))
+        # Resolve every new commander in one batch rather than deck by deck.
+        commanders = scryfall_lookup.lookup_commanders(
+            outcome.imported.commander_name
+            for outcome in outcomes
+            if outcome.imported is not None and _needs_commander_lookup(by_id[outcome.deck_id], outcome.imported)
+        )
+        for outcome in outcomes:
+            _apply_outcome(by_id[outcome.deck_id], outcome, commanders=commanders)
+            if outcome.error is None:
+                ok += 1
+            else:
+                errors += 1
+        db.session.commit()
     return {"synced": ok, "errors": errors, "total": len(decks)}
 
 
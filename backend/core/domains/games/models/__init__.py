@@ -2,6 +2,9 @@
 
 from .game import (
     GameDeck,
+    GameMetricDay,
+    GameMetricRollupState,
+    GameMetricSeatDay,
     GamePlayer,
     GamePod,
     GamePodMember,
@@ -14,6 +17,9 @@ from .game import (
 
 __all__ = [
     "GameDeck",
+    "GameMetricDay",
+    "GameMetricRollupState",
+    "GameMetricSeatDay",
     "GamePlayer",
     "GamePod",
     "GamePodMember",
@@ -11,6 +11,7 @@ class GameSession(db.Model):
     __table_args__ = (
         db.Index("ix_game_sessions_owner_played_at", "owner_user_id", "played_at"),
         db.Index("ix_game_sessions_owner_created_at", "owner_user_id", "created_at"),
+        db.Index("ix_game_sessions_owner_keyset", "owner_user_id", "played_at", "created_at", "id"),
     )
 
     id = db.Column(db.Integer, primary_key=True)
@@ -274,3 +275,78 @@ class GameRosterDeck(db.Model):
 
     player = db.relationship("GameRosterPlayer", back_populates="decks")
     owner_user = db.relationship("User", foreign_keys=[owner_user_id])
+
+
+class GameMetricDay(db.Model):
+    """Per-user, per-day game counts bucketed by pod size.
+
+    ``user_id`` is the user whose metrics include the game: the session owner
+    and every registered participant each get their own buckets. Rows are
+    rebuilt by ``game_metrics_rollup_service`` whenever a session changes.
+    """
+
+    __tablename__ = "game_metric_days"
+    __table_args__ = (
+        db.Index("ix_game_metric_days_user_day", "user_id", "day"),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(
+        db.Integer,
+        db.ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    day = db.Column(db.Date, nullable=False)
+    seat_count = db.Column(db.Integer, nullable=False, default=0)
+    games = db.Column(db.Integer, nullable=False, default=0)
+    combo_wins = db.Column(db.Integer, nullable=False, default=0)
+
+
+class GameMetricSeatDay(db.Model):
+    """Per-user, per-day seat outcomes keyed by player, deck and commander.
+
+    One row aggregates every seat in the user's visible games on ``day`` that
+    shares the same player, deck, commander, bracket, pod size and turn order.
+    Player and deck columns are null for seats without an assignment.
+    """
+
+    __tablename__ = "game_metric_seat_days"
+    __table_args__ = (
+        db.Index("ix_game_metric_seat_days_user_day", "user_id", "day"),
+        db.Index("ix_game_metric_seat_days_user_player", "user_id", "player_user_id", "player_name"),
+        db.Index("ix_game_metric_seat_days_user_deck", "user_id", "deck_name"),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(
+        db.Integer,
+        db.ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    day = db.Column(db.Date, nullable=False)
+    seat_count = db.Column(db.Integer, nullable=False, default=0)
+    turn_order = db.Column(db.Integer, nullable=True)
+    player_user_id = db.Column(db.Integer, nullable=True)
+    player_name = db.Column(db.String(120), nullable=True)
+    deck_folder_id = db.Column(db.Integer, nullable=True)
+    deck_name = db.Column(db.String(200), nullable=True)
+    commander_name = db.Column(db.String(200), nullable=True)
+    bracket_label = db.Column(db.String(120), nullable=True)
+    bracket_score_total = db.Column(db.Float, nullable=False, default=0.0)
+    bracket_score_count = db.Column(db.Integer, nullable=False, default=0)
+    plays = db.Column(db.Integer, nullable=False, default=0)
+    wins = db.Column(db.Integer, nullable=False, default=0)
+    combo_wins = db.Column(db.Integer, nullable=False, default=0)
+
+
+class GameMetricRollupState(db.Model):
+    """Marks users whose metric rollups have been fully built."""
+
+    __tablename__ = "game_metric_rollup_state"
+
+    user_id = db.Column(
+        db.Integer,
+        db.ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    built_at = db.Column(db.DateTime, nullable=False, default=utcnow)
@@ -0,0 +1,278 @@
+"""Single-pass metrics over a scoped, in-memory session/seat frame.
+
+Scopes the daily rollups cannot answer (pods, player or deck filters, date
+bounds inside a day) used to run one multi-join aggregate per widget. Instead
+the scoped sessions and their seats are fetched once per request as a slim
+row set (``game_metrics_query_service`` caches the frame per request), and
+every breakdown (winners, decks, commanders, brackets, turn order, player and
+deck options) is computed from it in a single pass.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, NamedTuple
+
+from sqlalchemy import func
+
+from extensions import db
+from models import GameDeck, GamePlayer, GameSeat, GameSeatAssignment, GameSession
+
+from . import game_metrics_support_service as support
+
+__all__ = ["MetricsFrame", "build_frame"]
+
+
+class PlayerRow(NamedTuple):
+    user_id: int | None
+    display_name: str | None
+    plays: int
+    wins: int
+    combo_wins: int
+
+
+class PlayerTotalRow(NamedTuple):
+    user_id: int | None
+    display_name: str | None
+    total: int
+
+
+class LabelRow(NamedTuple):
+    label: str | None
+    plays: int
+    wins: int
+
+
+class DeckRow(NamedTuple):
+    deck_name: str | None
+    plays: int
+    wins: int
+
+
+class PlayerDeckRow(NamedTuple):
+    deck_name: str | None
+    commander_name: str | None
+    plays: int
+    wins: int
+
+
+class DeckOptionRow(NamedTuple):
+    folder_id: int | None
+    deck_name: str | None
+    commander_name: str | None
+
+
+class TurnOrderRow(NamedTuple):
+    seat_count: int
+    turn_order: int
+    plays: int
+    wins: int
+
+
+def _ranked(counts: dict, limit: int | None, make_row: Callable[[Any, list], Any]) -> list:
+    ordered = sorted(counts.items(), key=lambda item: (-item[1][0], item[0] or ""))
+    if limit is not None and limit > 0:
+        ordered = ordered[:limit]
+    return [make_row(key, value) for key, value in ordered]
+
+
+@dataclass
+class _Breakdown:
+    """Aggregates for the frame's seats, optionally narrowed to one player."""
+
+    players: dict[tuple, list[set]] = field(default_factory=lambda: defaultdict(lambda: [set(), set(), set()]))
+    decks: dict[str | None, list[int]] = field(default_factory=lambda: defaultdict(lambda: [0, 0]))
+    deck_sessions: dict[str | None, list[set]] = field(default_factory=lambda: defaultdict(lambda: [set(), set()]))
+    player_decks: dict[tuple, list[set]] = field(default_factory=lambda: defaultdict(lambda: [set(), set()]))
+    commanders: dict[str, list[int]] = field(default_factory=lambda: defaultdict(lambda: [0, 0]))
+    brackets: dict[str, list[int]] = field(default_factory=lambda: defaultdict(lambda: [0, 0]))
+    deck_options: set[tuple] = field(default_factory=set)
+    bracket_score_total: float = 0.0
+    bracket_score_count: int = 0
+    session_ids: set[int] = field(default_factory=set)
+    win_session_ids: set[int] = field(default_factory=set)
+    combo_session_ids: set[int] = field(default_factory=set)
+
+
+class MetricsFrame:
+    """Scoped sessions and seats for one metrics request."""
+
+    def __init__(self, sessions: list[Any], seats: list[Any]):
+        self.sessions = {row.id: row for row in sessions}
+        self.seats = seats
+        self.seat_counts: dict[int, int] = defaultdict(int)
+        for seat in seats:
+            self.seat_counts[seat.session_id] += 1
+        self._breakdowns: dict[Any, _Breakdown] = {}
+
+    @property
+    def total_games(self) -> int:
+        return len(self.sessions)
+
+    @property
+    def combo_wins(self) -> int:
+        return sum(1 for row in self.sessions.values() if row.win_via_combo)
+
+    @property
+    def avg_players(self) -> float | None:
+        counts = list(self.seat_counts.values())
+        return (sum(counts) / len(counts)) if counts else None
+
+    def breakdown(self, player_key: str | None = None, scope: dict[str, Any] | None = None) -> _Breakdown:
+        """Aggregate every seat in one pass, narrowed to ``player_key`` when given."""
+        matcher = support._player_key_matcher(player_key, scope=scope)
+        cache_key = player_key if matcher is not None else None
+        cached = self._breakdowns.get(cache_key)
+        if cached is not None:
+            return cached
+        result = _Breakdown()
+        for seat in self.seats:
+            has_player = seat.player_id is not None
+            if matcher is not None and not (has_player and matcher(seat.player_user_id, seat.player_name)):
+                continue
+            session = self.sessions.get(seat.session_id)
+            if session is None:
+                continue
+            won = session.winner_seat_id == seat.seat_id
+            combo = won and bool(session.win_via_combo)
+            if has_player:
+                entry = result.players[(seat.player_user_id, seat.player_name)]
+                entry[0].add(seat.session_id)
+                if won:
+                    entry[1].add(seat.session_id)
+                if combo:
+                    entry[2].add(seat.session_id)
+                result.session_ids.add(seat.session_id)
+                if won:
+                    result.win_session_ids.add(seat.session_id)
+                if combo:
+                    result.combo_session_ids.add(seat.session_id)
+            if seat.deck_id is None:
+                continue
+            deck_entry = result.decks[seat.deck_name]
+            deck_entry[0] += 1
+            deck_entry[1] += int(won)
+            if has_player:
+                sessions_entry = result.deck_sessions[seat.deck_name]
+                sessions_entry[0].add(seat.session_id)
+                pair_entry = result.player_decks[(seat.deck_name, seat.commander_name)]
+                pair_entry[0].add(seat.session_id)
+                if won:
+                    sessions_entry[1].add(seat.session_id)
+                    pair_entry[1].add(seat.session_id)
+            result.deck_options.add((seat.folder_id, seat.deck_name, seat.commander_name))
+            if seat.commander_name is not None:
+                commander_entry = result.commanders[seat.commander_name]
+                commander_entry[0] += 1
+                commander_entry[1] += int(won)
+            if seat.bracket_label is not None:
+                bracket_entry = result.brackets[seat.bracket_label]
+                bracket_entry[0] += 1
+                bracket_entry[1] += int(won)
+            if seat.bracket_score is not None:
+                result.bracket_score_total += float(seat.bracket_score)
+                result.bracket_score_count += 1
+        self._breakdowns[cache_key] = result
+        return result
+
+    def player_rows(self) -> list[PlayerRow]:
+        return [
+            PlayerRow(user_id, display_name, len(entry[0]), len(entry[1]), len(entry[2]))
+            for (user_id, display_name), entry in self.breakdown().players.items()
+        ]
+
+    def player_totals(self, measure: str) -> list[PlayerTotalRow]:
+        """Per-player ``plays``, ``wins`` or ``combo_wins``, skipping zero totals."""
+        rows = []
+        for row in self.player_rows():
+            total = getattr(row, measure)
+            if total:
+                rows.append(PlayerTotalRow(row.user_id, row.display_name, total))
+        return rows
+
+    def deck_rows(self, limit: int | None, breakdown: _Breakdown | None = None) -> list[DeckRow]:
+        counts = (breakdown or self.breakdown()).decks
+        return _ranked(counts, limit, lambda key, value: DeckRow(key, value[0], value[1]))
+
+    def deck_option_rows(self, breakdown: _Breakdown | None = None) -> list[DeckOptionRow]:
+        return [DeckOptionRow(*values) for values in (breakdown or self.breakdown()).deck_options]
+
+    def distinct_deck_rows(self, limit: int | None, breakdown: _Breakdown) -> list[DeckRow]:
+        counts = {key: [len(value[0]), len(value[1])] for key, value in breakdown.deck_sessions.items()}
+        return _ranked(counts, limit, lambda key, value: DeckRow(key, value[0], value[1]))
+
+    def player_deck_rows(self, breakdown: _Breakdown) -> list[PlayerDeckRow]:
+        counts = {key: [len(value[0]), len(value[1])] for key, value in breakdown.player_decks.items()}
+        ordered = sorted(counts.items(), key=lambda item: (-item[1][0], item[0][0] or ""))
+        return [PlayerDeckRow(key[0], key[1], value[0], value[1]) for key, value in ordered]
+
+    def label_rows(self, attr: str, limit: int | None, breakdown: _Breakdown | None = None) -> list[LabelRow]:
+        counts = getattr(breakdown or self.breakdown(), attr)
+        return _ranked(counts, limit, lambda key, value: LabelRow(key, value[0], value[1]))
+
+    def avg_bracket_score(self) -> float | None:
+        result = self.breakdown()
+        if not result.bracket_score_count:
+            return None
+        return result.bracket_score_total / result.bracket_score_count
+
+    def turn_order_rows(self) -> list[TurnOrderRow]:
+        counts: dict[tuple[int, int], list[int]] = defaultdict(lambda: [0, 0])
+        for seat in self.seats:
+            seat_count = self.seat_counts.get(seat.session_id, 0)
+            if seat_count not in (3, 4) or seat.turn_order is None:
+                continue
+            session = self.sessions.get(seat.session_id)
+            if session is None:
+                continue
+            entry = counts[(seat_count, seat.turn_order)]
+            entry[0] += 1
+            entry[1] += int(session.winner_seat_id == seat.seat_id)
+        return [
+            TurnOrderRow(seat_count, turn_order, value[0], value[1])
+            for (seat_count, turn_order), value in sorted(counts.items())
+        ]
+
+
+def build_frame(
+    user_id: int,
+    start_at: datetime | None,
+    end_at: datetime | None,
+    scope: dict[str, Any] | None,
+) -> MetricsFrame:
+    """Fetch the scoped sessions and their seats in two slim queries."""
+    filters = support._session_filters(user_id, start_at, end_at, scope=scope)
+    sessions = (
+        db.session.query(
+            GameSession.id,
+            GameSession.winner_seat_id,
+            GameSession.win_via_combo,
+        )
+        .filter(*filters)
+        .all()
+    )
+    seats = (
+        db.session.query(
+            GameSeat.session_id.label("session_id"),
+            GameSeat.id.label("seat_id"),
+            func.coalesce(GameSeat.turn_order, GameSeat.seat_number).label("turn_order"),
+            GamePlayer.id.label("player_id"),
+            GamePlayer.user_id.label("player_user_id"),
+            GamePlayer.display_name.label("player_name"),
+            GameDeck.id.label("deck_id"),
+            GameDeck.folder_id.label("folder_id"),
+            GameDeck.deck_name.label("deck_name"),
+            GameDeck.commander_name.label("commander_name"),
+            func.coalesce(GameDeck.bracket_label, GameDeck.bracket_level).label("bracket_label"),
+            GameDeck.bracket_score.label("bracket_score"),
+        )
+        .join(GameSession, GameSession.id == GameSeat.session_id)
+        .outerjoin(GameSeatAssignment, GameSeatAssignment.seat_id == GameSeat.id)
+        .outerjoin(GamePlayer, GamePlayer.id == GameSeatAssignment.player_id)
+        .outerjoin(GameDeck, GameDeck.id == GameSeatAssignment.deck_id)
+        .filter(*filters)
+        .all()
+    )
+    return MetricsFrame(sessions, seats)
@@ -1,17 +1,24 @@
-"""Games metrics query and aggregation helpers."""
+"""Games metrics query and aggregation helpers.
+
+Each widget reads from one of two sources: the per-user daily rollups when the
+scope can be answered from day buckets, otherwise a scoped session/seat frame
+fetched once per request and aggregated in memory.
+"""
 
 from __future__ import annotations
 
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import and_, case, func
+from sqlalchemy import case, func
 from sqlalchemy.orm import selectinload
+from sqlalchemy.sql import ClauseElement
 
-from extensions import db
-from models import GameDeck, GamePlayer, GameSeat, GameSeatAssignment, GameSession
+from models import GameMetricDay, GameMetricSeatDay, GameSeat, GameSeatAssignment, GameSession
 from shared.cache.request_cache import request_cached
 
+from . import game_metrics_frame_service as metrics_frame
+from . import game_metrics_rollup_service as rollup
 from . import game_metrics_support_service as support
 from . import game_session_shared_service as session_shared
 
@@ -20,8 +27,16 @@ def _scope_signature(scope: dict[str, Any] | None) -> str:
     """Stable string signature of a metrics scope for request-cache keys."""
     if not scope:
         return "none"
+
+    def _value(value: Any) -> str:
+        # SQL expressions render with placeholders; fold in the bound values so
+        # filters that differ only by parameter do not share a cache entry.
+        if isinstance(value, ClauseElement):
+            return f"{value} {sorted(value.compile().params.items(), key=repr)!r}"
+        return str(value)
+
     try:
-        return repr(sorted((str(k), str(v)) for k, v in scope.items()))
+        return repr(sorted((str(k), _value(v)) for k, v in scope.items()))
     except Exception:  # pragma: no cover - defensive
         return repr(scope)
 
@@ -30,6 +45,21 @@ def _iso(value: datetime | None) -> str:
     return value.isoformat() if value else "none"
 
 
+def _scoped_frame(
+    user_id: int,
+    start_at: datetime | None,
+    end_at: datetime | None,
+    scope: dict[str, Any] | None,
+) -> metrics_frame.MetricsFrame:
+    """Scoped session/seat frame, fetched once per request and scope.
+
+    Every widget on a filtered metrics page shares the same two queries; the
+    breakdowns are then computed from the frame in memory.
+    """
+    key = ("gm:frame", user_id, _iso(start_at), _iso(end_at), _scope_signature(scope))
+    return request_cached(key, lambda: metrics_frame.build_frame(user_id, start_at, end_at, scope))
+
+
 def _distinct_player_rows(
     user_id: int,
     start_at: datetime | None,
@@ -45,19 +75,20 @@ def _distinct_player_rows(
     key = ("gm:distinct_players", user_id, _iso(start_at), _iso(end_at), _scope_signature(scope))
 
     def _compute():
-        filters = support._session_filters(user_id, start_at, end_at, scope=scope)
-        return (
-            db.session.query(
-                GamePlayer.user_id.label("user_id"),
-                GamePlayer.display_name.label("display_name"),
+        if rollup.rollups_cover(user_id, start_at, end_at, scope):
+            return (
+                rollup.seat_query(
+                    user_id,
+                    start_at,
+                    end_at,
+                    GameMetricSeatDay.player_user_id.label("user_id"),
+                    GameMetricSeatDay.player_name.label("display_name"),
+                )
+                .filter(rollup.seat_has_player())
+                .distinct()
+                .all()
             )
-            .join(GameSeatAssignment, GameSeatAssignment.player_id == GamePlayer.id)
-            .join(GameSeat, GameSeat.id == GameSeatAssignment.seat_id)
-            .join(GameSession, GameSession.id == GameSeat.session_id)
-            .filter(*filters)
-            .distinct()
-            .all()
-        )
+        return _scoped_frame(user_id, start_at, end_at, scope).player_rows()
 
     return request_cached(key, _compute)
 
@@ -77,24 +108,130 @@ def _top_deck_rows(
     key = ("gm:top_decks", user_id, _iso(start_at), _iso(end_at), int(limit or 0), _scope_signature(scope))
 
     def _compute():
-        filters = support._session_filters(user_id, start_at, end_at, scope=scope)
-        return (
-            db.session.query(
-                GameDeck.deck_name,
-                func.count(GameSeatAssignment.id).label("plays"),
-            )
-            .join(GameSeatAssignment, GameSeatAssignment.deck_id == GameDeck.id)
-            .join(GameSeat, GameSeat.id == GameSeatAssignment.seat_id)
-            .join(GameSession, GameSession.id == GameSeat.session_id)
-            .filter(*filters)
-            .group_by(GameDeck.deck_name)
-            .order_by(func.count(GameSeatAssignment.id).desc(), GameDeck.deck_name.asc())
-            .limit(limit)
-            .all()
-        )
+        if rollup.rollups_cover(user_id, start_at, end_at, scope):
+            return _rollup_deck_rows(user_id, start_at, end_at, limit=limit)
+        return _scoped_frame(user_id, start_at, end_at, scope).deck_rows(limit)
 
     return request_cached(key, _compute)
 
+
+def _rollup_deck_rows(
+    user_id: int,
+    start_at: datetime | None,
+    end_at: datetime | None,
+    *,
+    limit: int | None,
+    player_filter=None,
+):
+    plays_expr = func.sum(GameMetricSeatDay.plays)
+    query = rollup.seat_query(
+        user_id,
+        start_at,
+        end_at,
+        GameMetricSeatDay.deck_name.label("deck_name"),
+        plays_expr.label("plays"),
+        func.sum(GameMetricSeatDay.wins).label("wins"),
+    ).filter(GameMetricSeatDay.deck_name.isnot(None))
+    if player_filter is not None:
+        query = query.filter(player_filter)
+    query = query.group_by(GameMetricSeatDay.deck_name).order_by(plays_expr.desc(), GameMetricSeatDay.deck_name.asc())
+    if limit is not None and limit > 0:
+        query = query.limit(limit)
+    return query.all()
+
+
+def _rollup_rows_by(
+    label_column,
+    user_id: int,
+    start_at: datetime | None,
+    end_at: datetime | None,
+    *,
+    limit: int | None,
+    player_filter=None,
+):
+    """Plays and wins per ``label_column`` value summed over seat-day buckets."""
+    plays_expr = func.sum(GameMetricSeatDay.plays)
+    query = rollup.seat_query(
+        user_id,
+        start_at,
+        end_at,
+        label_column.label("label"),
+        plays_expr.label("plays"),
+        func.sum(GameMetricSeatDay.wins).label("wins"),
+    ).filter(label_column.isnot(None))
+    if player_filter is not None:
+        query = query.filter(player_filter)
+    query = query.group_by(label_column).order_by(plays_expr.desc(), label_column.asc())
+    if limit is not None and limit > 0:
+        query = query.limit(limit)
+    return query.all()
+
+
+def _rollup_player_rows(
+    user_id: int,
+    start_at: datetime | None,
+    end_at: datetime | None,
+    measure_column,
+):
+    """Sum of ``measure_column`` per player identity, skipping zero totals."""
+    total_expr = func.sum(measure_column)
+    return (
+        rollup.seat_query(
+            user_id,
+            start_at,
+            end_at,
+            GameMetricSeatDay.player_user_id.label("user_id"),
+            GameMetricSeatDay.player_name.label("display_name"),
+            total_expr.label("total"),
+        )
+        .filter(rollup.seat_has_player())
+        .group_by(GameMetricSeatDay.player_user_id, GameMetricSeatDay.player_name)
+        .having(total_expr > 0)
+        .all()
+    )
+
+
+def _label_rows(
+    label_column,
+    frame_attr: str,
+    user_id: int,
+    start_at: datetime | None,
+    end_at: datetime | None,
+    *,
+    limit: int | None,
+    player_key: str | None,
+    scope: dict[str, Any] | None,
+):
+    """Plays and wins per label from the rollups or the scoped frame."""
+    if rollup.rollups_cover(user_id, start_at, end_at, scope):
+        return _rollup_rows_by(
+            label_column,
+            user_id,
+            start_at,
+            end_at,
+            limit=limit,
+            player_filter=rollup.seat_player_filter(player_key, scope=scope),
+        )
+    frame = _scoped_frame(user_id, start_at, end_at, scope)
+    return frame.label_rows(frame_attr, limit, frame.breakdown(player_key, scope=scope))
+
+
+def _win_rate_rows(rows, unknown_label: str) -> list[dict[str, Any]]:
+    results = []
+    for row in rows:
+        plays = int(row.plays or 0)
+        wins = int(row.wins or 0)
+        win_rate = round((wins / plays) * 100, 1) if plays else 0
+        results.append(
+            {
+                "label": row.label or unknown_label,
+                "plays": plays,
+                "wins": wins,
+                "win_rate": win_rate,
+            }
+        )
+    return results
+
 __all__ = [
     "METRICS_GAMES_LIMIT",
     "POD_METRICS_GAMES_LIMIT",
@@ -122,20 +259,48 @@ def _metrics_payload(
     end_at: datetime | None = None,
     scope: dict[str, Any] | None = None,
 ) -> dict[str, Any]:
-    filters = support._session_filters(user_id, start_at, end_at, scope=scope)
+    if rollup.rollups_cover(user_id, start_at, end_at, scope):
+        totals = rollup.day_query(
+            user_id,
+            start_at,
+            end_at,
+            func.coalesce(func.sum(GameMetricDay.games), 0),
+            func.coalesce(func.sum(GameMetricDay.combo_wins), 0),
+            func.coalesce(func.sum(GameMetricDay.seat_count * GameMetricDay.games), 0),
+            func.coalesce(
+                func.sum(case((GameMetricDay.seat_count > 0, GameMetricDay.games), else_=0)),
+                0,
+            ),
+        ).one()
+        total_games, combo_wins, seat_total, seated_games = (int(value or 0) for value in totals)
+        avg_players = (seat_total / seated_games) if seated_games else None
+        winners = _rollup_player_rows(user_id, start_at, end_at, GameMetricSeatDay.wins)
+        top_commanders = _rollup_rows_by(
+            GameMetricSeatDay.commander_name,
+            user_id,
+            start_at,
+            end_at,
+            limit=5,
+        )
+        score_total, score_count = rollup.seat_query(
+            user_id,
+            start_at,
+            end_at,
+            func.sum(GameMetricSeatDay.bracket_score_total),
+            func.sum(GameMetricSeatDay.bracket_score_count),
+        ).one()
+        avg_bracket_score = (float(score_total) / int(score_count)) if score_count else None
+    else:
+        frame = _scoped_frame(user_id, start_at, end_at, scope)
+        total_games = frame.total_games
+        combo_wins = frame.combo_wins
+        avg_players = frame.avg_players
+        winners = frame.player_totals("wins")
+        top_commanders = frame.label_rows("commanders", 5)
+        avg_bracket_score = frame.avg_bracket_score()
 
-    total_games = db.session.query(func.count(GameSession.id)).filter(*filters).scalar() or 0
-    combo_wins = (
-        db.session.query(func.count(GameSession.id))
-        .filter(*filters, GameSession.win_via_combo.is_(True))
-        .scalar()
-        or 0
-    )
     combo_rate = round((combo_wins / total_games) * 100, 1) if total_games else 0
 
-    seat_counts = support._seat_counts_subquery(filters)
-    avg_players = db.session.query(func.avg(seat_counts.c.seat_count)).scalar()
-
     player_rows = _distinct_player_rows(user_id, start_at, end_at, scope)
     unique_keys = {
         support._canonical_player_identity(row.user_id, row.display_name, scope)[0]
@@ -143,26 +308,13 @@ def _metrics_payload(
     }
     unique_players = len(unique_keys)
 
-    winners = (
-        db.session.query(
-            GamePlayer.user_id.label("user_id"),
-            GamePlayer.display_name.label("display_name"),
-            func.count(func.distinct(GameSession.id)).label("wins"),
-        )
-        .join(GameSeatAssignment, GameSeatAssignment.player_id == GamePlayer.id)
-        .join(GameSeat, GameSeat.id == GameSeatAssignment.seat_id)
-        .join(GameSession, GameSession.winner_seat_id == GameSeat.id)
-        .filter(*filters)
-        .group_by(GamePlayer.user_id, GamePlayer.display_name)
-        .all()
-    )
     top_winners: list[dict[str, Any]] = []
     if winners:
         merged: dict[str, dict[str, Any]] = {}
         for row in winners:
             key, label = support._canonical_player_identity(row.user_id, row.display_name, scope)
             entry = merged.setdefault(key, {"label": label, "count": 0})
-            entry["count"] += int(row.wins or 0)
+            entry["count"] += int(row.total or 0)
         top_winners = sorted(
             merged.values(),
             key=lambda item: (-item["count"], (item["label"] or "").lower()),
@@ -170,30 +322,6 @@ def _metrics_payload(
 
     top_decks = _top_deck_rows(user_id, start_at, end_at, 5, scope)
 
-    top_commanders = (
-        db.session.query(
-            GameDeck.commander_name,
-            func.count(GameSeatAssignment.id).label("plays"),
-        )
-        .join(GameSeatAssignment, GameSeatAssignment.deck_id == GameDeck.id)
-        .join(GameSeat, GameSeat.id == GameSeatAssignment.seat_id)
-        .join(GameSession, GameSession.id == GameSeat.session_id)
-        .filter(*filters, GameDeck.commander_name.isnot(None))
-        .group_by(GameDeck.commander_name)
-        .order_by(func.count(GameSeatAssignment.id).desc(), GameDeck.commander_name.asc())
-        .limit(5)
-        .all()
-    )
-
-    avg_bracket_score = (
-        db.session.query(func.avg(GameDeck.bracket_score))
-        .join(GameSeatAssignment, GameSeatAssignment.deck_id == GameDeck.id)
-        .join(GameSeat, GameSeat.id == GameSeatAssignment.seat_id)
-        .join(GameSession, GameSession.id == GameSeat.session_id)
-        .filter(*filters, GameDeck.bracket_score.isnot(None))
-        .scalar()
-    )
-
     return {
         "total_games": int(total_games or 0),
         "combo_wins": int(combo_wins or 0),
@@ -244,26 +372,15 @@ def _top_players_by_plays(
     limit: int = 5,
     scope: dict[str, Any] | None = None,
 ) -> list[dict[str, Any]]:
-    filters = support._session_filters(user_id, start_at, end_at, scope=scope)
-    plays_expr = func.count(func.distinct(GameSession.id))
-    rows = (
-        db.session.query(
-            GamePlayer.user_id.label("user_id"),
-            GamePlayer.display_name.label("display_name"),
-            plays_expr.label("plays"),
-        )
-        .join(GameSeatAssignment, GameSeatAssignment.player_id == GamePlayer.id)
-        .join(GameSeat, GameSeat.id == GameSeatAssignment.seat_id)
-        .join(GameSession, GameSession.id == GameSeat.session_id)
-        .filter(*filters)
-        .group_by(GamePlayer.user_id, GamePlayer.display_name)
-        .all()
-    )
+    if rollup.rollups_cover(user_id, start_at, end_at, scope):
+        rows = _rollup_player_rows(user_id, start_at, end_at, GameMetricSeatDay.plays)
+    else:
+        rows = _scoped_frame(user_id, start_at, end_at, scope).player_totals("plays")
     merged: dict[str, dict[str, Any]] = {}
     for row in rows:
         key, label = support._canonical_player_identity(row.user_id, row.display_name, scope)
         entry = merged.setdefault(key, {"key": key, "label": label, "count": 0})
-        entry["count"] += int(row.plays or 0)
+        entry["count"] += int(row.total or 0)
     results = sorted(
         merged.values(),
         key=lambda item: (-item["count"], (item["label"] or "").lower()),
@@ -278,26 +395,15 @@ def _combo_winners(
     limit: int = 5,
     scope: dict[str, Any] | None = None,
 ) -> list[dict[str, Any]]:
-    filters = support._session_filters(user_id, start_at, end_at, scope=scope)
-    wins_expr = func.count(func.distinct(GameSession.id))
-    rows = (
-        db.session.query(
-            GamePlayer.user_id.label("user_id"),
-            GamePlayer.display_name.label("display_name"),
-            wins_expr.label("wins"),
-        )
-        .join(GameSeat, GameSeat.id == GameSession.winner_seat_id)
-        .join(GameSeatAssignment, GameSeatAssignment.seat_id == GameSeat.id)
-        .join(GamePlayer, GamePlayer.id == GameSeatAssignment.player_id)
-        .filter(*filters, GameSession.win_via_combo.is_(True))
-        .group_by(GamePlayer.user_id, GamePlayer.display_name)
-        .all()
-    )
+    if rollup.rollups_cover(user_id, start_at, end_at, scope):
+        rows = _rollup_player_rows(user_id, start_at, end_at, GameMetricSeatDay.combo_wins)
+    else:
+        rows = _scoped_frame(user_id, start_at, end_at, scope).player_totals("combo_wins")
     merged: dict[str, dict[str, Any]] = {}
     for row in rows:
         key, label = support._canonical_player_identity(row.user_id, row.display_name, scope)
         entry = merged.setdefault(key, {"label": label, "count": 0})
-        entry["count"] += int(row.wins or 0)
+        entry["count"] += int(row.total or 0)
     results = sorted(
         merged.values(),
         key=lambda item: (-item["count"], (item["label"] or "").lower()),
@@ -317,24 +423,17 @@ def _deck_usage(
     if player_filter is None:
         # Identical to the metrics-payload top decks query; share the request cache.
         rows = _top_deck_rows(user_id, start_at, end_at, limit, scope)
-    else:
-        filters = support._session_filters(user_id, start_at, end_at, scope=scope)
-        rows = (
-            db.session.query(
-                GameDeck.deck_name,
-                func.count(GameSeatAssignment.id).label("plays"),
-            )
-            .join(GameSeatAssignment, GameSeatAssignment.deck_id == GameDeck.id)
-            .join(GameSeat, GameSeat.id == GameSeatAssignment.seat_id)
-            .join(GameSession, GameSession.id == GameSeat.session_id)
-            .join(GamePlayer, GamePlayer.id == GameSeatAssignment.player_id)
-            .filter(player_filter)
-            .filter(*filters)
-            .group_by(GameDeck.deck_name)
-            .order_by(func.count(GameSeatAssignment.id).desc(), GameDeck.deck_name.asc())
-            .limit(limit)
-            .all()
+    elif rollup.rollups_cover(user_id, start_at, end_at, scope):
+        rows = _rollup_deck_rows(
+            user_id,
+            start_at,
+            end_at,
+            limit=limit,
+            player_filter=rollup.seat_player_filter(player_key, scope=scope),
         )
+    else:
+        frame = _scoped_frame(user_id, start_at, end_at, scope)
+        rows = frame.deck_rows(limit, frame.breakdown(player_key, scope=scope))
     return [{"label": row.deck_name or "Unknown deck", "count": int(row.plays or 0)} for row in rows]
 
 
@@ -346,27 +445,17 @@ def _commander_usage(
     player_key: str | None = None,
     scope: dict[str, Any] | None = None,
 ) -> list[dict[str, Any]]:
-    filters = support._session_filters(user_id, start_at, end_at, scope=scope)
-    query = (
-        db.session.query(
-            GameDeck.commander_name,
-            func.count(GameSeatAssignment.id).label("plays"),
-        )
-        .join(GameSeatAssignment, GameSeatAssignment.deck_id == GameDeck.id)
-        .join(GameSeat, GameSeat.id == GameSeatAssignment.seat_id)
-        .join(GameSession, GameSession.id == GameSeat.session_id)
+    rows = _label_rows(
+        GameMetricSeatDay.commander_name,
+        "commanders",
+        user_id,
+        start_at,
+        end_at,
+        limit=limit,
+        player_key=player_key,
+        scope=scope,
     )
-    player_filter = support._player_key_filter(player_key, scope=scope)
-    if player_filter is not None:
-        query = query.join(GamePlayer, GamePlayer.id == GameSeatAssignment.player_id).filter(player_filter)
-    rows = (
-        query.filter(*filters, GameDeck.commander_name.isnot(None))
-        .group_by(GameDeck.commander_name)
-        .order_by(func.count(GameSeatAssignment.id).desc(), GameDeck.commander_name.asc())
-        .limit(limit)
-        .all()
-    )
-    return [{"label": row.commander_name or "Unknown", "count": int(row.plays or 0)} for row in rows]
+    return [{"label": row.label or "Unknown", "count": int(row.plays or 0)} for row in rows]
 
 
 def _commander_win_rates(
@@ -377,43 +466,17 @@ def _commander_win_rates(
     player_key: str | None = None,
     scope: dict[str, Any] | None = None,
 ) -> list[dict[str, Any]]:
-    filters = support._session_filters(user_id, start_at, end_at, scope=scope)
-    plays_expr = func.count(GameSeatAssignment.id)
-    wins_expr = func.coalesce(func.sum(case((GameSession.winner_seat_id == GameSeat.id, 1), else_=0)), 0)
-    query = (
-        db.session.query(
-            GameDeck.commander_name,
-            plays_expr.label("plays"),
-            wins_expr.label("wins"),
-        )
-        .join(GameSeatAssignment, GameSeatAssignment.deck_id == GameDeck.id)
-        .join(GameSeat, GameSeat.id == GameSeatAssignment.seat_id)
-        .join(GameSession, GameSession.id == GameSeat.session_id)
-    )
-    player_filter = support._player_key_filter(player_key, scope=scope)
-    if player_filter is not None:
-        query = query.join(GamePlayer, GamePlayer.id == GameSeatAssignment.player_id).filter(player_filter)
-    rows = (
-        query.filter(*filters, GameDeck.commander_name.isnot(None))
-        .group_by(GameDeck.commander_name)
-        .order_by(plays_expr.desc(), GameDeck.commander_name.asc())
-        .limit(limit)
-        .all()
+    rows = _label_rows(
+        GameMetricSeatDay.commander_name,
+        "commanders",
+        user_id,
+        start_at,
+        end_at,
+        limit=limit,
+        player_key=player_key,
+        scope=scope,
     )
-    results = []
-    for row in rows:
-        plays = int(row.plays or 0)
-        wins = int(row.wins or 0)
-        win_rate = round((wins / plays) * 100, 1) if plays else 0
-        results.append(
-            {
-                "label": row.commander_name or "Unknown",
-                "plays": plays,
-                "wins": wins,
-                "win_rate": win_rate,
-            }
-        )
-    return results
+    return _win_rate_rows(rows, "Unknown")
 
 
 def _bracket_stats(
@@ -424,44 +487,17 @@ def _bracket_stats(
     player_key: str | None = None,
     scope: dict[str, Any] | None = None,
 ) -> list[dict[str, Any]]:
-    filters = support._session_filters(user_id, start_at, end_at, scope=scope)
-    label_expr = func.coalesce(GameDeck.bracket_label, GameDeck.bracket_level)
-    plays_expr = func.count(GameSeatAssignment.id)
-    wins_expr = func.coalesce(func.sum(case((GameSession.winner_seat_id == GameSeat.id, 1), else_=0)), 0)
-    query = (
-        db.session.query(
-            label_expr.label("label"),
-            plays_expr.label("plays"),
-            wins_expr.label("wins"),
-        )
-        .join(GameSeatAssignment, GameSeatAssignment.deck_id == GameDeck.id)
-        .join(GameSeat, GameSeat.id == GameSeatAssignment.seat_id)
-        .join(GameSession, GameSession.id == GameSeat.session_id)
-    )
-    player_filter = support._player_key_filter(player_key, scope=scope)
-    if player_filter is not None:
-        query = query.join(GamePlayer, GamePlayer.id == GameSeatAssignment.player_id).filter(player_filter)
-    rows = (
-        query.filter(*filters, label_expr.isnot(None))
-        .group_by(label_expr)
-        .order_by(plays_expr.desc(), label_expr.asc())
-        .limit(limit)
-        .all()
+    rows = _label_rows(
+        GameMetricSeatDay.bracket_label,
+        "brackets",
+        user_id,
+        start_at,
+        end_at,
+        limit=limit,
+        player_key=player_key,
+        scope=scope,
     )
-    results = []
-    for row in rows:
-        plays = int(row.plays or 0)
-        wins = int(row.wins or 0)
-        win_rate = round((wins / plays) * 100, 1) if plays else 0
-        results.append(
-            {
-                "label": row.label or "Unknown",
-                "plays": plays,
-                "wins": wins,
-                "win_rate": win_rate,
-            }
-        )
-    return results
+    return _win_rate_rows(rows, "Unknown")
 
 
 def _turn_order_metrics(
@@ -470,26 +506,27 @@ def _turn_order_metrics(
     end_at: datetime | None = None,
     scope: dict[str, Any] | None = None,
 ) -> dict[str, list[dict[str, Any]]]:
-    filters = support._session_filters(user_id, start_at, end_at, scope=scope)
-    seat_counts = support._seat_counts_subquery(filters)
-    turn_order_expr = func.coalesce(GameSeat.turn_order, GameSeat.seat_number)
-    rows = (
-        db.session.query(
-            seat_counts.c.seat_count.label("seat_count"),
-            turn_order_expr.label("turn_order"),
-            func.count(GameSeat.id).label("plays"),
-            func.coalesce(func.sum(case((GameSession.winner_seat_id == GameSeat.id, 1), else_=0)), 0).label("wins"),
-        )
-        .join(GameSeat, GameSeat.session_id == seat_counts.c.session_id)
-        .join(GameSession, GameSession.id == GameSeat.session_id)
-        .filter(
-            seat_counts.c.seat_count.in_([3, 4]),
-            turn_order_expr.isnot(None),
+    if rollup.rollups_cover(user_id, start_at, end_at, scope):
+        rows = (
+            rollup.seat_query(
+                user_id,
+                start_at,
+                end_at,
+                GameMetricSeatDay.seat_count.label("seat_count"),
+                GameMetricSeatDay.turn_order.label("turn_order"),
+                func.sum(GameMetricSeatDay.plays).label("plays"),
+                func.sum(GameMetricSeatDay.wins).label("wins"),
+            )
+            .filter(
+                GameMetricSeatDay.seat_count.in_([3, 4]),
+                GameMetricSeatDay.turn_order.isnot(None),
+            )
+            .group_by(GameMetricSeatDay.seat_count, GameMetricSeatDay.turn_order)
+            .order_by(GameMetricSeatDay.seat_count.asc(), GameMetricSeatDay.turn_order.asc())
+            .all()
         )
-        .group_by(seat_counts.c.seat_count, turn_order_expr)
-        .order_by(seat_counts.c.seat_count.asc(), turn_order_expr.asc())
-        .all()
-    )
+    else:
+        rows = _scoped_frame(user_id, start_at, end_at, scope).turn_order_rows()
     buckets: dict[int, list[dict[str, Any]]] = {3: [], 4: []}
     for row in rows:
         seat_count = int(row.seat_count or 0)
@@ -539,21 +576,22 @@ def _deck_options(
     player_key: str | None = None,
     scope: dict[str, Any] | None = None,
 ) -> list[dict[str, Any]]:
-    filters = support._session_filters(user_id, start_at, end_at, scope=scope)
-    query = (
-        db.session.query(
-            GameDeck.folder_id,
-            GameDeck.deck_name,
-            GameDeck.commander_name,
-        )
-        .join(GameSeatAssignment, GameSeatAssignment.deck_id == GameDeck.id)
-        .join(GameSeat, GameSeat.id == GameSeatAssignment.seat_id)
-        .join(GameSession, GameSession.id == GameSeat.session_id)
-    )
-    player_filter = support._player_key_filter(player_key, scope=scope)
-    if player_filter is not None:
-        query = query.join(GamePlayer, GamePlayer.id == GameSeatAssignment.player_id).filter(player_filter)
-    rows = query.filter(*filters).distinct().all()
+    if rollup.rollups_cover(user_id, start_at, end_at, scope):
+        query = rollup.seat_query(
+            user_id,
+            start_at,
+            end_at,
+            GameMetricSeatDay.deck_folder_id.label("folder_id"),
+            GameMetricSeatDay.deck_name.label("deck_name"),
+            GameMetricSeatDay.commander_name.label("commander_name"),
+        ).filter(GameMetricSeatDay.deck_name.isnot(None))
+        player_filter = rollup.seat_player_filter(player_key, scope=scope)
+        if player_filter is not None:
+            query = query.filter(player_filter)
+        rows = query.distinct().all()
+    else:
+        frame = _scoped_frame(user_id, start_at, end_at, scope)
+        rows = frame.deck_option_rows(frame.breakdown(player_key, scope=scope))
     options_map: dict[str, dict[str, Any]] = {}
     for row in rows:
         deck_name = (row.deck_name or "").strip() or "Unknown deck"
@@ -577,66 +615,35 @@ def _player_stats(
     end_at: datetime | None = None,
     scope: dict[str, Any] | None = None,
 ) -> dict[str, Any] | None:
-    player_filter = support._player_key_filter(player_key, scope=scope)
-    if player_filter is None:
+    if support._player_key_matcher(player_key, scope=scope) is None:
         return None
-    filters = support._session_filters(user_id, start_at, end_at, scope=scope)
-    wins_expr = func.count(
-        func.distinct(
-            case((GameSession.winner_seat_id == GameSeat.id, GameSession.id), else_=None)
-        )
-    )
-    combo_expr = func.count(
-        func.distinct(
-            case(
-                (
-                    and_(
-                        GameSession.winner_seat_id == GameSeat.id,
-                        GameSession.win_via_combo.is_(True),
-                    ),
-                    GameSession.id,
-                ),
-                else_=None,
+    if rollup.rollups_cover(user_id, start_at, end_at, scope):
+        seat_player_filter = rollup.seat_player_filter(player_key, scope=scope)
+        games_played, wins, combo_wins = (
+            rollup.seat_query(
+                user_id,
+                start_at,
+                end_at,
+                func.sum(GameMetricSeatDay.plays),
+                func.sum(GameMetricSeatDay.wins),
+                func.sum(GameMetricSeatDay.combo_wins),
             )
+            .filter(seat_player_filter)
+            .one()
         )
-    )
-    games_played, wins, combo_wins = (
-        db.session.query(
-            func.count(func.distinct(GameSession.id)),
-            wins_expr,
-            combo_expr,
-        )
-        .join(GameSeatAssignment, GameSeatAssignment.session_id == GameSession.id)
-        .join(GameSeat, GameSeat.id == GameSeatAssignment.seat_id)
-        .join(GamePlayer, GamePlayer.id == GameSeatAssignment.player_id)
-        .filter(*filters, player_filter)
-        .one()
-    )
+        deck_rows = _rollup_deck_rows(user_id, start_at, end_at, limit=6, player_filter=seat_player_filter)
+    else:
+        frame = _scoped_frame(user_id, start_at, end_at, scope)
+        breakdown = frame.breakdown(player_key, scope=scope)
+        games_played = len(breakdown.session_ids)
+        wins = len(breakdown.win_session_ids)
+        combo_wins = len(breakdown.combo_session_ids)
+        deck_rows = frame.distinct_deck_rows(6, breakdown)
     games_played = int(games_played or 0)
     wins = int(wins or 0)
     combo_wins = int(combo_wins or 0)
     win_rate = round((wins / games_played) * 100, 1) if games_played else 0
 
-    deck_rows = (
-        db.session.query(
-            GameDeck.deck_name,
-            func.count(func.distinct(GameSession.id)).label("plays"),
-            func.count(
-                func.distinct(
-                    case((GameSession.winner_seat_id == GameSeat.id, GameSession.id), else_=None)
-                )
-            ).label("wins"),
-        )
-        .join(GameSeatAssignment, GameSeatAssignment.deck_id == GameDeck.id)
-        .join(GameSeat, GameSeat.id == GameSeatAssignment.seat_id)
-        .join(GameSession, GameSession.id == GameSeat.session_id)
-        .join(GamePlayer, GamePlayer.id == GameSeatAssignment.player_id)
-        .filter(*filters, player_filter)
-        .group_by(GameDeck.deck_name)
-        .order_by(func.count(func.distinct(GameSession.id)).desc(), GameDeck.deck_name.asc())
-        .limit(6)
-        .all()
-    )
     deck_stats = []
     for row in deck_rows:
         plays = int(row.plays or 0)
@@ -665,30 +672,31 @@ def _player_deck_stats(
     end_at: datetime | None = None,
     scope: dict[str, Any] | None = None,
 ) -> list[dict[str, Any]]:
-    player_filter = support._player_key_filter(player_key, scope=scope)
-    if player_filter is None:
+    if support._player_key_matcher(player_key, scope=scope) is None:
         return []
-    filters = support._session_filters(user_id, start_at, end_at, scope=scope)
-    rows = (
-        db.session.query(
-            GameDeck.deck_name,
-            GameDeck.commander_name,
-            func.count(func.distinct(GameSession.id)).label("plays"),
-            func.count(
-                func.distinct(
-                    case((GameSession.winner_seat_id == GameSeat.id, GameSession.id), else_=None)
-                )
-            ).label("wins"),
+    if rollup.rollups_cover(user_id, start_at, end_at, scope):
+        plays_expr = func.sum(GameMetricSeatDay.plays)
+        rows = (
+            rollup.seat_query(
+                user_id,
+                start_at,
+                end_at,
+                GameMetricSeatDay.deck_name.label("deck_name"),
+                GameMetricSeatDay.commander_name.label("commander_name"),
+                plays_expr.label("plays"),
+                func.sum(GameMetricSeatDay.wins).label("wins"),
+            )
+            .filter(
+                GameMetricSeatDay.deck_name.isnot(None),
+                rollup.seat_player_filter(player_key, scope=scope),
+            )
+            .group_by(GameMetricSeatDay.deck_name, GameMetricSeatDay.commander_name)
+            .order_by(plays_expr.desc(), GameMetricSeatDay.deck_name.asc())
+            .all()
         )
-        .join(GameSeatAssignment, GameSeatAssignment.deck_id == GameDeck.id)
-        .join(GameSeat, GameSeat.id == GameSeatAssignment.seat_id)
-        .join(GameSession, GameSession.id == GameSeat.session_id)
-        .join(GamePlayer, GamePlayer.id == GameSeatAssignment.player_id)
-        .filter(*filters, player_filter)
-        .group_by(GameDeck.deck_name, GameDeck.commander_name)
-        .order_by(func.count(func.distinct(GameSession.id)).desc(), GameDeck.deck_name.asc())
-        .all()
-    )
+    else:
+        frame = _scoped_frame(user_id, start_at, end_at, scope)
+        rows = frame.player_deck_rows(frame.breakdown(player_key, scope=scope))
     stats: list[dict[str, Any]] = []
     for row in rows:
         plays = int(row.plays or 0)
@@ -712,25 +720,23 @@ def _player_win_rates(
     limit: int = 6,
     scope: dict[str, Any] | None = None,
 ) -> list[dict[str, Any]]:
-    filters = support._session_filters(user_id, start_at, end_at, scope=scope)
-    rows = (
-        db.session.query(
-            GamePlayer.user_id.label("user_id"),
-            GamePlayer.display_name.label("display_name"),
-            func.count(func.distinct(GameSession.id)).label("plays"),
-            func.count(
-                func.distinct(
-                    case((GameSession.winner_seat_id == GameSeat.id, GameSession.id), else_=None)
-                )
-            ).label("wins"),
+    if rollup.rollups_cover(user_id, start_at, end_at, scope):
+        rows = (
+            rollup.seat_query(
+                user_id,
+                start_at,
+                end_at,
+                GameMetricSeatDay.player_user_id.label("user_id"),
+                GameMetricSeatDay.player_name.label("display_name"),
+                func.sum(GameMetricSeatDay.plays).label("plays"),
+                func.sum(GameMetricSeatDay.wins).label("wins"),
+            )
+            .filter(rollup.seat_has_player())
+            .group_by(GameMetricSeatDay.player_user_id, GameMetricSeatDay.player_name)
+            .all()
         )
-        .join(GameSeatAssignment, GameSeatAssignment.player_id == GamePlayer.id)
-        .join(GameSeat, GameSeat.id == GameSeatAssignment.seat_id)
-        .join(GameSession, GameSession.id == GameSeat.session_id)
-        .filter(*filters)
-        .group_by(GamePlayer.user_id, GamePlayer.display_name)
-        .all()
-    )
+    else:
+        rows = _scoped_frame(user_id, start_at, end_at, scope).player_rows()
 
     merged: dict[str, dict[str, Any]] = {}
     for row in rows:
@@ -765,43 +771,14 @@ def _deck_win_rates(
     player_key: str | None = None,
     scope: dict[str, Any] | None = None,
 ) -> list[dict[str, Any]]:
-    filters = support._session_filters(user_id, start_at, end_at, scope=scope)
-    plays_expr = func.count(GameSeatAssignment.id)
-    wins_expr = func.coalesce(func.sum(case((GameSession.winner_seat_id == GameSeat.id, 1), else_=0)), 0)
-    query = (
-        db.session.query(
-            GameDeck.deck_name,
-            plays_expr.label("plays"),
-            wins_expr.label("wins"),
-        )
-        .join(GameSeatAssignment, GameSeatAssignment.deck_id == GameDeck.id)
-        .join(GameSeat, GameSeat.id == GameSeatAssignment.seat_id)
-        .join(GameSession, GameSession.id == GameSeat.session_id)
-    )
-    player_filter = support._player_key_filter(player_key, scope=scope)
-    if player_filter is not None:
-        query = query.join(GamePlayer, GamePlayer.id == GameSeatAssignment.player_id).filter(player_filter)
-
-    query = (
-        query.filter(*filters)
-        .group_by(GameDeck.deck_name)
-        .order_by(plays_expr.desc(), GameDeck.deck_name.asc())
+    rows = _label_rows(
+        GameMetricSeatDay.deck_name,
+        "decks",
+        user_id,
+        start_at,
+        end_at,
+        limit=limit,
+        player_key=player_key,
+        scope=scope,
     )
-    if limit is not None and limit > 0:
-        query = query.limit(limit)
-    rows = query.all()
-
-    results = []
-    for row in rows:
-        plays = int(row.plays or 0)
-        wins = int(row.wins or 0)
-        win_rate = round((wins / plays) * 100, 1) if plays else 0
-        results.append(
-            {
-                "label": row.deck_name or "Unknown deck",
-                "plays": plays,
-                "wins": wins,
-                "win_rate": win_rate,
-            }
-        )
-    return results
+    return _win_rate_rows(rows, "Unknown deck")
@@ -0,0 +1,430 @@
+"""Per-user daily rollups backing the games metrics pages.
+
+``game_metric_days`` and ``game_metric_seat_days`` hold one bucket per
+(user, day), where the user is anyone who can see the game: its owner and every
+registered participant. Metrics widgets sum those buckets instead of joining
+sessions, seats, assignments, players and decks for every widget and filter.
+
+Buckets are rebuilt after commit for every (user, day) a write touched, both
+before and after the change, so edits that move a game to another day or swap
+its players stay consistent. Users are built in full on their first metrics
+read. Scopes carrying a session-level filter (pods, player or deck filters)
+and date bounds that do not fall on day boundaries keep using the live
+queries.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from datetime import date, datetime, time, timedelta
+from typing import Any, Iterable
+
+from flask import current_app, has_app_context
+from sqlalchemy import and_, delete, event, func, or_, select
+from sqlalchemy.orm import Session
+
+from core.shared.utils.time import utcnow
+from extensions import db
+from models import (
+    GameDeck,
+    GameMetricDay,
+    GameMetricRollupState,
+    GameMetricSeatDay,
+    GamePlayer,
+    GameSeat,
+    GameSeatAssignment,
+    GameSession,
+)
+from shared.cache.request_cache import request_cached
+
+from . import game_metrics_support_service as support
+
+_DIRTY_SESSIONS_KEY = "game_metric_dirty_sessions"
+_STALE_BUCKETS_KEY = "game_metric_stale_buckets"
+_LISTENERS_REGISTERED = False
+
+__all__ = [
+    "day_query",
+    "rebuild_all_rollups",
+    "rebuild_buckets",
+    "rebuild_user_rollups",
+    "register_game_metrics_listeners",
+    "rollups_cover",
+    "rollups_ready",
+    "seat_has_player",
+    "seat_player_filter",
+    "seat_query",
+]
+
+
+def _day_of(value: datetime | date | None) -> date | None:
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value.date()
+    return value
+
+
+def _day_bounds(day: date):
+    start = datetime.combine(day, time.min)
+    return and_(GameSession.played_at >= start, GameSession.played_at < start + timedelta(days=1))
+
+
+def _session_buckets(session: Session, session_ids: Iterable[int]) -> set[tuple[int, date]]:
+    """Return the (user_id, day) buckets the given sessions currently fall in."""
+    ids = sorted({int(sid) for sid in session_ids if sid})
+    if not ids:
+        return set()
+    days: dict[int, date] = {}
+    buckets: set[tuple[int, date]] = set()
+    for session_id, owner_user_id, played_at in session.execute(
+        select(GameSession.id, GameSession.owner_user_id, GameSession.played_at).where(GameSession.id.in_(ids))
+    ):
+        day = _day_of(played_at)
+        if day is None:
+            continue
+        days[session_id] = day
+        buckets.add((int(owner_user_id), day))
+    if not days:
+        return buckets
+    for session_id, user_id in session.execute(
+        select(GameSeat.session_id, GamePlayer.user_id)
+        .join(GameSeatAssignment, GameSeatAssignment.seat_id == GameSeat.id)
+        .join(GamePlayer, GamePlayer.id == GameSeatAssignment.player_id)
+        .where(GameSeat.session_id.in_(list(days)), GamePlayer.user_id.isnot(None))
+    ):
+        buckets.add((int(user_id), days[session_id]))
+    return buckets
+
+
+def _aggregate_rows(
+    session: Session,
+    user_id: int,
+    days: set[date] | None = None,
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """Aggregate the user's visible games into day and seat-day rows."""
+    session_filters = [support._session_visibility_filter(user_id)]
+    if days is not None:
+        if not days:
+            return [], []
+        session_filters.append(or_(*[_day_bounds(day) for day in sorted(days)]))
+
+    games: dict[int, dict[str, Any]] = {}
+    for session_id, played_at, winner_seat_id, win_via_combo in session.execute(
+        select(
+            GameSession.id,
+            GameSession.played_at,
+            GameSession.winner_seat_id,
+            GameSession.win_via_combo,
+        ).where(*session_filters)
+    ):
+        day = _day_of(played_at)
+        if day is None:
+            continue
+        games[session_id] = {
+            "day": day,
+            "winner_seat_id": winner_seat_id,
+            "combo": bool(win_via_combo),
+            "seats": [],
+        }
+    if not games:
+        return [], []
+
+    session_ids = select(GameSession.id).where(*session_filters).scalar_subquery()
+    for row in session.execute(
+        select(
+            GameSeat.id.label("seat_id"),
+            GameSeat.session_id,
+            func.coalesce(GameSeat.turn_order, GameSeat.seat_number).label("turn_order"),
+            GamePlayer.user_id.label("player_user_id"),
+            GamePlayer.display_name.label("player_name"),
+            GameDeck.id.label("deck_id"),
+            GameDeck.folder_id,
+            GameDeck.deck_name,
+            GameDeck.commander_name,
+            func.coalesce(GameDeck.bracket_label, GameDeck.bracket_level).label("bracket_label"),
+            GameDeck.bracket_score,
+        )
+        .select_from(GameSeat)
+        .outerjoin(GameSeatAssignment, GameSeatAssignment.seat_id == GameSeat.id)
+        .outerjoin(GamePlayer, GamePlayer.id == GameSeatAssignment.player_id)
+        .outerjoin(GameDeck, GameDeck.id == GameSeatAssignment.deck_id)
+        .where(GameSeat.session_id.in_(session_ids))
+    ):
+        game = games.get(row.session_id)
+        if game is not None:
+            game["seats"].append(row)
+
+    day_totals: dict[tuple, dict[str, int]] = defaultdict(lambda: {"games": 0, "combo_wins": 0})
+    seat_totals: dict[tuple, dict[str, Any]] = defaultdict(
+        lambda: {
+            "plays": 0,
+            "wins": 0,
+            "combo_wins": 0,
+            "bracket_score_total": 0.0,
+            "bracket_score_count": 0,
+        }
+    )
+    for game in games.values():
+        seat_count = len(game["seats"])
+        day_entry = day_totals[(game["day"], seat_count)]
+        day_entry["games"] += 1
+        if game["combo"]:
+            day_entry["combo_wins"] += 1
+        for seat in game["seats"]:
+            has_deck = seat.deck_id is not None
+            key = (
+                game["day"],
+                seat_count,
+                seat.turn_order,
+                seat.player_user_id,
+                seat.player_name,
+                seat.folder_id if has_deck else None,
+                seat.deck_name if has_deck else None,
+                seat.commander_name if has_deck else None,
+                seat.bracket_label if has_deck else None,
+            )
+            entry = seat_totals[key]
+            entry["plays"] += 1
+            if game["winner_seat_id"] == seat.seat_id:
+                entry["wins"] += 1
+                if game["combo"]:
+                    entry["combo_wins"] += 1
+            if has_deck and seat.bracket_score is not None:
+                entry["bracket_score_total"] += float(seat.bracket_score)
+                entry["bracket_score_count"] += 1
+
+    day_rows = [
+        {"user_id": user_id, "day": day, "seat_count": seat_count, **totals}
+        for (day, seat_count), totals in day_totals.items()
+    ]
+    seat_rows = [
+        {
+            "user_id": user_id,
+            "day": key[0],
+            "seat_count": key[1],
+            "turn_order": key[2],
+            "player_user_id": key[3],
+            "player_name": key[4],
+            "deck_folder_id": key[5],
+            "deck_name": key[6],
+            "commander_name": key[7],
+            "bracket_label": key[8],
+            **totals,
+        }
+        for key, totals in seat_totals.items()
+    ]
+    return day_rows, seat_rows
+
+
+def _write_rows(session: Session, day_rows: list[dict[str, Any]], seat_rows: list[dict[str, Any]]) -> None:
+    if day_rows:
+        session.execute(GameMetricDay.__table__.insert(), day_rows)
+    if seat_rows:
+        session.execute(GameMetricSeatDay.__table__.insert(), seat_rows)
+
+
+def rebuild_user_rollups(user_id: int, *, session: Session | None = None) -> None:
+    """Rebuild every bucket for ``user_id`` and mark the user as built."""
+    session = session or db.session
+    session.execute(delete(GameMetricDay).where(GameMetricDay.user_id == user_id))
+    session.execute(delete(GameMetricSeatDay).where(GameMetricSeatDay.user_id == user_id))
+    _write_rows(session, *_aggregate_rows(session, user_id))
+    state = session.get(GameMetricRollupState, user_id)
+    if state is None:
+        session.add(GameMetricRollupState(user_id=user_id, built_at=utcnow()))
+    else:
+        state.built_at = utcnow()
+    session.flush()
+
+
+def rebuild_buckets(buckets: Iterable[tuple[int, date]], *, session: Session | None = None) -> int:
+    """Rebuild the given (user_id, day) buckets for users that are already built.
+
+    Users without a rollup state are skipped; they are built in full on their
+    first metrics read. Returns the number of buckets rebuilt.
+    """
+    session = session or db.session
+    days_by_user: dict[int, set[date]] = defaultdict(set)
+    for user_id, day in buckets:
+        if user_id and day is not None:
+            days_by_user[int(user_id)].add(day)
+    if not days_by_user:
+        return 0
+    built_users = set(
+        session.execute(
+            select(GameMetricRollupState.user_id).where(GameMetricRollupState.user_id.in_(list(days_by_user)))
+        ).scalars()
+    )
+    rebuilt = 0
+    for user_id in sorted(built_users):
+        days = days_by_user[user_id]
+        session.execute(
+            delete(GameMetricDay).where(GameMetricDay.user_id == user_id, GameMetricDay.day.in_(days))
+        )
+        session.execute(
+            delete(GameMetricSeatDay).where(GameMetricSeatDay.user_id == user_id, GameMetricSeatDay.day.in_(days))
+        )
+        _write_rows(session, *_aggregate_rows(session, user_id, days))
+        rebuilt += len(days)
+    session.flush()
+    return rebuilt
+
+
+def rebuild_all_rollups(*, session: Session | None = None) -> int:
+    """Rebuild rollups for every user with visible games; returns the user count."""
+    session = session or db.session
+    user_ids: set[int] = set(session.execute(select(GameSession.owner_user_id).distinct()).scalars())
+    user_ids.update(
+        session.execute(
+            select(GamePlayer.user_id)
+            .join(GameSeatAssignment, GameSeatAssignment.player_id == GamePlayer.id)
+            .where(GamePlayer.user_id.isnot(None))
+            .distinct()
+        ).scalars()
+    )
+    session.execute(delete(GameMetricRollupState))
+    for user_id in sorted(uid for uid in user_ids if uid):
+        rebuild_user_rollups(user_id, session=session)
+    return len(user_ids)
+
+
+def rollups_ready(user_id: int) -> bool:
+    """Return True once ``user_id`` has built rollups, building them on first use."""
+
+    def _compute() -> bool:
+        try:
+            if db.session.get(GameMetricRollupState, user_id) is not None:
+                return True
+        except Exception:
+            db.session.rollback()
+            return False
+        try:
+            with Session(db.engine) as isolated_session:
+                rebuild_user_rollups(user_id, session=isolated_session)
+                isolated_session.commit()
+        except Exception:
+            if has_app_context():
+                current_app.logger.exception("Failed to build game metric rollups for user %s", user_id)
+            return False
+        return True
+
+    return request_cached(("gm:rollups_ready", user_id), _compute)
+
+
+def rollups_cover(
+    user_id: int,
+    start_at: datetime | None,
+    end_at: datetime | None,
+    scope: dict[str, Any] | None,
+) -> bool:
+    """Return True when the query can be answered by summing day buckets."""
+    if scope and scope.get("session_filter") is not None:
+        return False
+    if start_at is not None and start_at.time() != time.min:
+        return False
+    if end_at is not None and end_at.time() != time.max:
+        return False
+    return rollups_ready(user_id)
+
+
+def _bucket_filters(model, user_id: int, start_at: datetime | None, end_at: datetime | None) -> list:
+    filters = [model.user_id == user_id]
+    if start_at:
+        filters.append(model.day >= start_at.date())
+    if end_at:
+        filters.append(model.day <= end_at.date())
+    return filters
+
+
+def day_query(user_id: int, start_at: datetime | None, end_at: datetime | None, *columns):
+    return db.session.query(*columns).filter(*_bucket_filters(GameMetricDay, user_id, start_at, end_at))
+
+
+def seat_query(user_id: int, start_at: datetime | None, end_at: datetime | None, *columns):
+    return db.session.query(*columns).filter(*_bucket_filters(GameMetricSeatDay, user_id, start_at, end_at))
+
+
+def seat_has_player():
+    return or_(GameMetricSeatDay.player_user_id.isnot(None), GameMetricSeatDay.player_name.isnot(None))
+
+
+def seat_player_filter(player_key: str | None, scope: dict[str, Any] | None = None):
+    return support._player_key_filter(
+        player_key,
+        scope=scope,
+        user_column=GameMetricSeatDay.player_user_id,
+        name_column=GameMetricSeatDay.player_name,
+    )
+
+
+def _touched_session_ids(session, objects: Iterable[Any]) -> set[int]:
+    session_ids: set[int] = set()
+    player_ids: set[int] = set()
+    for obj in objects:
+        if isinstance(obj, GameSession):
+            if obj.id:
+                session_ids.add(obj.id)
+        elif isinstance(obj, (GameSeat, GameSeatAssignment, GameDeck)):
+            if obj.session_id:
+                session_ids.add(obj.session_id)
+        elif isinstance(obj, GamePlayer):
+            if obj.id:
+                player_ids.add(obj.id)
+    if player_ids:
+        session_ids.update(
+            session.execute(
+                select(GameSeatAssignment.session_id).where(GameSeatAssignment.player_id.in_(player_ids))
+            ).scalars()
+        )
+    return session_ids
+
+
+def register_game_metrics_listeners() -> None:
+    """Keep metric rollups in step with game session writes."""
+    global _LISTENERS_REGISTERED
+    if _LISTENERS_REGISTERED:
+        return
+    _LISTENERS_REGISTERED = True
+
+    @event.listens_for(db.session, "before_flush")
+    def _capture_stale_buckets(session, _flush_context, _instances):
+        try:
+            with session.no_autoflush:
+                session_ids = _touched_session_ids(session, session.new.union(session.dirty).union(session.deleted))
+                if not session_ids:
+                    return
+                buckets = _session_buckets(session, session_ids)
+        except Exception:
+            return
+        if buckets:
+            session.info.setdefault(_STALE_BUCKETS_KEY, set()).update(buckets)
+
+    @event.listens_for(db.session, "after_flush")
+    def _track_game_metric_changes(session, _flush_context):
+        try:
+            session_ids = _touched_session_ids(session, session.new.union(session.dirty).union(session.deleted))
+        except Exception:
+            return
+        if session_ids:
+            session.info.setdefault(_DIRTY_SESSIONS_KEY, set()).update(session_ids)
+
+    @event.listens_for(db.session, "after_rollback")
+    def _discard_game_metric_changes(session):
+        session.info.pop(_DIRTY_SESSIONS_KEY, None)
+        session.info.pop(_STALE_BUCKETS_KEY, None)
+
+    @event.listens_for(db.session, "after_commit")
+    def _rebuild_game_metric_buckets(session):
+        session_ids = session.info.pop(_DIRTY_SESSIONS_KEY, set())
+        buckets = session.info.pop(_STALE_BUCKETS_KEY, set())
+        if not session_ids and not buckets:
+            return
+        try:
+            with Session(db.engine) as isolated_session:
+                buckets = set(buckets) | _session_buckets(isolated_session, session_ids)
+                rebuild_buckets(buckets, session=isolated_session)
+                isolated_session.commit()
+        except Exception:
+            if has_app_context():
+                current_app.logger.exception("Failed to rebuild game metric rollups")
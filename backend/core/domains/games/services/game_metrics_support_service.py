@@ -19,6 +19,7 @@ from models import (
     GameSession,
     User,
 )
+from shared.database.search import notes_match
 from shared.validation import ValidationError, log_validation_error, parse_positive_int
 
 __all__ = [
@@ -30,6 +31,7 @@ __all__ = [
     "_metrics_cache_key",
     "_parse_date_value",
     "_player_key_filter",
+    "_player_key_matcher",
     "_player_label_expr",
     "_pod_metrics_scope",
     "_pod_options_for_user",
@@ -83,6 +85,10 @@ def _apply_notes_search(query, q: str):
             return query.filter(GameSession.id.in_(ids))
         except Exception:
             db.session.rollback()
+    else:
+        match = notes_match(q)
+        if match is not None:
+            return query.filter(match)
     return query.filter(GameSession.notes.ilike(f"%{q}%"))
 
 
@@ -398,9 +404,17 @@ def _metrics_cache_key(
     )
 
 
-def _player_key_filter(player_key: str | None, scope: dict[str, Any] | None = None):
+def _player_key_filter(
+    player_key: str | None,
+    scope: dict[str, Any] | None = None,
+    *,
+    user_column=None,
+    name_column=None,
+):
     if not player_key:
         return None
+    user_column = GamePlayer.user_id if user_column is None else user_column
+    name_column = GamePlayer.display_name if name_column is None else name_column
     key = player_key.strip()
     if key.startswith("user:"):
         try:
@@ -412,13 +426,13 @@ def _player_key_filter(player_key: str | None, scope: dict[str, Any] | None = No
             alias_names = scope.get("alias_names_by_user", {}).get(user_id)
             if alias_names:
                 return or_(
-                    GamePlayer.user_id == user_id,
+                    user_column == user_id,
                     and_(
-                        GamePlayer.user_id.is_(None),
-                        func.lower(GamePlayer.display_name).in_(alias_names),
+                        user_column.is_(None),
+                        func.lower(name_column).in_(alias_names),
                     ),
                 )
-        return GamePlayer.user_id == user_id
+        return user_column == user_id
     if key.startswith("name:"):
         name = key.split(":", 1)[1].strip().lower()
         if not name:
@@ -428,17 +442,52 @@ def _player_key_filter(player_key: str | None, scope: dict[str, Any] | None = No
             alias_names = scope.get("alias_names_by_user", {}).get(user_id)
             if alias_names:
                 return or_(
-                    GamePlayer.user_id == user_id,
+                    user_column == user_id,
                     and_(
-                        GamePlayer.user_id.is_(None),
-                        func.lower(GamePlayer.display_name).in_(alias_names),
+                        user_column.is_(None),
+                        func.lower(name_column).in_(alias_names),
                     ),
                 )
-            return GamePlayer.user_id == user_id
-        return func.lower(GamePlayer.display_name) == name
+            return user_column == user_id
+        return func.lower(name_column) == name
     return None
 
 
+def _player_key_matcher(player_key: str | None, scope: dict[str, Any] | None = None):
+    """Python counterpart of ``_player_key_filter`` for in-memory seat rows.
+
+    Returns a ``(user_id, display_name) -> bool`` callable, or None when the key
+    does not select a player.
+    """
+    if not player_key:
+        return None
+    key = player_key.strip()
+    target_user_id = None
+    if key.startswith("user:"):
+        try:
+            target_user_id = parse_positive_int(key.split(":", 1)[1], field="player")
+        except ValidationError as exc:
+            log_validation_error(exc, context="metrics_player")
+            return None
+    elif key.startswith("name:"):
+        name = key.split(":", 1)[1].strip().lower()
+        if not name:
+            return None
+        if not (scope and name in scope.get("alias_map", {})):
+            return lambda _user_id, display_name: display_name is not None and display_name.lower() == name
+        target_user_id = scope["alias_map"][name]
+    else:
+        return None
+    alias_names = (scope.get("alias_names_by_user", {}).get(target_user_id) if scope else None) or set()
+
+    def _matches(user_id: int | None, display_name: str | None) -> bool:
+        if user_id is not None:
+            return user_id == target_user_id
+        return display_name is not None and display_name.lower() in alias_names
+
+    return _matches
+
+
 def _deck_key_filter(deck_key: str | None):
     if not deck_key:
         return None
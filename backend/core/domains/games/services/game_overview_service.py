@@ -6,9 +6,9 @@ import csv
 import io
 from datetime import date
 
-from flask import Response, flash, redirect, render_template, request, url_for
+from flask import Response, current_app, flash, make_response, redirect, render_template, request, url_for
 from flask_login import current_user
-from sqlalchemy import case, func
+from sqlalchemy import case, func, tuple_
 from sqlalchemy.orm import selectinload
 
 from extensions import db
@@ -185,12 +185,54 @@ def games_overview():
     )
 
 
+def _public_page_size() -> int:
+    try:
+        size = int(current_app.config.get("PUBLIC_GAMES_PAGE_SIZE") or 50)
+    except (TypeError, ValueError):
+        size = 50
+    return max(1, min(size, 500))
+
+
 def games_overview_public():
     owner_user_id = game_public_dashboard_service.resolve_public_dashboard_owner_user_id()
     q = (request.args.get("q") or "").strip()
+    cursor_raw = (request.args.get("cursor") or "").strip()
+    cursor = game_public_dashboard_service.decode_cursor(cursor_raw)
+    page_size = _public_page_size()
     sessions: list[GameSession] = []
     summary = {"total_games": 0, "combo_wins": 0}
+    validator: tuple = (0, 0, None)
+
+    if owner_user_id is not None:
+        total, combo_wins, last_updated = (
+            db.session.query(
+                func.count(GameSession.id),
+                func.coalesce(func.sum(case((GameSession.win_via_combo.is_(True), 1), else_=0)), 0),
+                func.max(GameSession.updated_at),
+            )
+            .filter(GameSession.owner_user_id == owner_user_id)
+            .one()
+        )
+        summary = {
+            "total_games": int(total or 0),
+            "combo_wins": int(combo_wins or 0),
+        }
+        validator = (summary["total_games"], summary["combo_wins"], str(last_updated))
+
+    etag = None
+    if game_public_dashboard_service.page_is_cacheable():
+        etag = game_public_dashboard_service.page_etag(
+            owner_user_id,
+            validator,
+            q=q,
+            cursor=cursor_raw if cursor else "",
+            page_size=page_size,
+        )
+        game_public_dashboard_service.pin_csp_nonce(etag)
+        if request.if_none_match.contains_weak(etag):
+            return game_public_dashboard_service.not_modified(etag)
 
+    next_cursor = None
     if owner_user_id is not None:
         query = (
             GameSession.query.options(
@@ -204,33 +246,41 @@ def games_overview_public():
             .filter(GameSession.owner_user_id == owner_user_id)
         )
         query = metrics_support._apply_notes_search(query, q)
-        sessions = query.order_by(GameSession.played_at.desc().nullslast(), GameSession.created_at.desc()).all()
-        total, combo_wins = (
-            db.session.query(
-                func.count(GameSession.id),
-                func.coalesce(func.sum(case((GameSession.win_via_combo.is_(True), 1), else_=0)), 0),
+        # Keyset pagination on (played_at, created_at, id), served by
+        # ix_game_sessions_owner_keyset; played_at/created_at are NOT NULL.
+        if cursor:
+            query = query.filter(
+                tuple_(GameSession.played_at, GameSession.created_at, GameSession.id) < tuple_(*cursor)
             )
-            .filter(GameSession.owner_user_id == owner_user_id)
-            .one()
+        sessions = (
+            query.order_by(GameSession.played_at.desc(), GameSession.created_at.desc(), GameSession.id.desc())
+            .limit(page_size + 1)
+            .all()
         )
-        summary = {
-            "total_games": int(total or 0),
-            "combo_wins": int(combo_wins or 0),
-        }
+        if len(sessions) > page_size:
+            sessions = sessions[:page_size]
+            next_cursor = game_public_dashboard_service.encode_cursor(sessions[-1])
 
     games = [session_shared._game_session_payload(session, None) for session in sessions]
-    return render_template(
-        "games/logs.html",
-        games=games,
-        summary=summary,
-        search_query=q,
-        has_owned_games=False,
-        manual_decks=[],
-        registered_deck_options=[],
-        is_public_dashboard=True,
-        logs_action_endpoint="views.gamedashboard",
-        logs_metric_value="logs",
+    response = make_response(
+        render_template(
+            "games/logs.html",
+            games=games,
+            summary=summary,
+            search_query=q,
+            has_owned_games=False,
+            manual_decks=[],
+            registered_deck_options=[],
+            is_public_dashboard=True,
+            logs_action_endpoint="views.gamedashboard",
+            logs_metric_value="logs",
+            next_cursor=next_cursor,
+            is_paged=bool(cursor),
+        )
     )
+    if etag:
+        game_public_dashboard_service.apply_cache_headers(response, etag)
+    return response
 
 
 def games_manual_deck_update():
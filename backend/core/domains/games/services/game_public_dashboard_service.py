@@ -2,15 +2,33 @@
 
 from __future__ import annotations
 
-from flask import current_app
-from sqlalchemy import func
+import base64
+import hashlib
+import hmac
+import json
+import time
+from datetime import datetime
+from typing import Any, Optional
+
+from flask import Response, current_app, request, session as flask_session
+from flask_login import current_user
+from sqlalchemy import event, func, update
 
 from extensions import db
 from models import GameSession, User
+from core.shared.utils.time import utcnow
+from shared.cache.runtime_cache import cache_fetch
 from shared.validation import ValidationError, log_validation_error, parse_positive_int
 
+from .game_metrics_rollup_service import _touched_session_ids
 
-def resolve_public_dashboard_owner_user_id() -> int | None:
+# The fallback owner is picked by a group-by over every session; it only moves
+# when another user out-logs the current one, so a few minutes of staleness is fine.
+OWNER_CACHE_TTL = 300
+_LISTENERS_REGISTERED = False
+
+
+def _resolve_owner_user_id() -> int | None:
     configured_raw = str(current_app.config.get("PUBLIC_GAME_DASHBOARD_OWNER_ID") or "").strip()
     if configured_raw:
         try:
@@ -34,4 +52,130 @@ def resolve_public_dashboard_owner_user_id() -> int | None:
     return int(row[0])
 
 
-__all__ = ["resolve_public_dashboard_owner_user_id"]
+def resolve_public_dashboard_owner_user_id() -> int | None:
+    configured_raw = str(current_app.config.get("PUBLIC_GAME_DASHBOARD_OWNER_ID") or "").strip()
+    # 0 stands in for "no owner" because cache_fetch treats None as a miss.
+    owner_id = cache_fetch(
+        f"public_game_dashboard_owner:{configured_raw}",
+        OWNER_CACHE_TTL,
+        lambda: _resolve_owner_user_id() or 0,
+    )
+    return int(owner_id) if owner_id else None
+
+
+def encode_cursor(game: GameSession) -> str:
+    """Opaque keyset cursor pointing just after ``game`` in newest-first order."""
+    payload = [game.played_at.isoformat(), game.created_at.isoformat(), int(game.id)]
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str | None) -> Optional[tuple[datetime, datetime, int]]:
+    """Parse a cursor from :func:`encode_cursor`; None when missing or malformed."""
+    token = (token or "").strip()
+    if not token or len(token) > 200:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        played_at, created_at, game_id = json.loads(raw)
+        return datetime.fromisoformat(played_at), datetime.fromisoformat(created_at), int(game_id)
+    except (ValueError, TypeError):
+        return None
+
+
+def page_is_cacheable() -> bool:
+    """Only anonymous full-page views without pending flashes get an ETag."""
+    if getattr(current_user, "is_authenticated", False):
+        return False
+    if request.headers.get("HX-Request") == "true":
+        return False
+    return not flask_session.get("_flashes")
+
+
+def page_etag(owner_user_id: int | None, validator: tuple, **params: Any) -> str:
+    """Weak validator for a public dashboard page.
+
+    ``validator`` is the owner's (session count, combo wins, latest
+    ``updated_at``). The page also embeds the visitor's CSRF token, so the raw
+    session token and a time window shorter than ``WTF_CSRF_TIME_LIMIT`` are
+    mixed in to keep a revalidated copy from carrying an expired token.
+    """
+    csrf_field = current_app.config.get("WTF_CSRF_FIELD_NAME", "csrf_token")
+    csrf_limit = current_app.config.get("WTF_CSRF_TIME_LIMIT") or 0
+    window = int(time.time() // max(60, int(csrf_limit) // 2)) if csrf_limit else 0
+    material = repr((owner_user_id, validator, sorted(params.items()), flask_session.get(csrf_field), window))
+    return hashlib.blake2b(material.encode("utf-8"), digest_size=12).hexdigest()
+
+
+def pin_csp_nonce(etag: str) -> None:
+    """Derive this response's CSP nonce from ``etag``.
+
+    A 304 keeps the browser's cached body, whose inline tags carry the nonce of
+    the original response, while the 304 itself brings a fresh CSP header.
+    Talisman reads ``request.csp_nonce`` for both, so pinning it to the
+    validator keeps the two in step. It stays unguessable because it is keyed
+    on ``SECRET_KEY``.
+    """
+    secret = str(current_app.config.get("SECRET_KEY") or "").encode("utf-8")
+    digest = hmac.new(secret, f"csp-nonce:{etag}".encode("utf-8"), hashlib.sha256).digest()
+    request.csp_nonce = base64.urlsafe_b64encode(digest[:24]).decode("ascii")
+
+
+def apply_cache_headers(response: Response, etag: str) -> Response:
+    response.set_etag(etag, weak=True)
+    # Private: the body embeds the visitor's CSRF token.
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    response.vary.add("Cookie")
+    return response
+
+
+def not_modified(etag: str) -> Response:
+    return apply_cache_headers(Response(status=304), etag)
+
+
+def _touched_child_session_ids(session) -> set[int]:
+    children = [
+        obj
+        for obj in session.new.union(session.dirty).union(session.deleted)
+        if not isinstance(obj, GameSession)
+    ]
+    return _touched_session_ids(session, children) if children else set()
+
+
+def register_public_dashboard_listeners() -> None:
+    """Bump ``game_sessions.updated_at`` when a session's seats, decks or players change.
+
+    The public dashboard ETag is keyed on the owner's latest session update;
+    ``updated_at`` only moves on writes to the session row itself otherwise.
+    """
+    global _LISTENERS_REGISTERED
+    if _LISTENERS_REGISTERED:
+        return
+    _LISTENERS_REGISTERED = True
+
+    @event.listens_for(db.session, "after_flush")
+    def _touch_parent_sessions(session, _flush_context):
+        try:
+            session_ids = _touched_child_session_ids(session)
+        except Exception:
+            return
+        if not session_ids:
+            return
+        table = GameSession.__table__
+        session.connection().execute(
+            update(table).where(table.c.id.in_(sorted(session_ids))).values(updated_at=utcnow())
+        )
+
+
+__all__ = [
+    "apply_cache_headers",
+    "decode_cursor",
+    "encode_cursor",
+    "not_modified",
+    "page_etag",
+    "page_is_cacheable",
+    "pin_csp_nonce",
+    "register_public_dashboard_listeners",
+    "resolve_public_dashboard_owner_user_id",
+]
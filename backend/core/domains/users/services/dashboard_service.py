@@ -9,7 +9,11 @@ from sqlalchemy.orm import load_only, selectinload
 
 from extensions import db
 from models import Card, Folder, FolderRole, UserSetting
-from core.domains.cards.services import scryfall_cache as sc
+from core.domains.cards.services.card_valuation_service import (
+    collection_values,
+    ensure_card_valuations,
+    format_valuation,
+)
 from core.domains.cards.services.scryfall_cache import (
     cache_epoch,
     ensure_cache_loaded,
@@ -36,7 +40,7 @@ from core.domains.users.viewmodels.dashboard_vm import (
 )
 from core.shared.utils.assets import static_url
 from shared.cache.request_cache import request_cached
-from shared.cache.runtime_cache import cache_fetch
+from shared.cache.runtime_cache import COLLECTION_CACHE_TTL, cache_fetch, collection_generation
 from shared.mtg import (
     _bulk_print_lookup,
     _img_url_for_print,
@@ -193,70 +197,13 @@ def _dashboard_card_stats(
     return request_cached(cache_key, _load)
 
 
-def _dashboard_price_to_float(value: object | None) -> float | None:
-    if value in (None, "", 0, "0", "0.0", "0.00"):
-        return None
-    try:
-        num = float(value)
-    except (TypeError, ValueError):
-        return None
-    return num if num > 0 else None
-
-
-def _dashboard_price_value(prices: dict | None, is_foil: bool) -> float | None:
-    if not prices:
-        return None
-    keys = ("usd_foil", "usd", "usd_etched") if is_foil else ("usd", "usd_foil", "usd_etched")
-    for key in keys:
-        value = _dashboard_price_to_float(prices.get(key))
-        if value is not None:
-            return value
-    for key in ("eur", "eur_foil", "tix"):
-        value = _dashboard_price_to_float(prices.get(key))
-        if value is not None:
-            return value
-    return None
-
-
-def _dashboard_price_text(prices: dict | None, is_foil: bool) -> str | None:
-    if not prices:
-        return None
-
-    def _fmt(value: object | None, prefix: str) -> str | None:
-        if value in (None, "", 0, "0", "0.0", "0.00"):
-            return None
-        try:
-            num = float(value)
-        except (TypeError, ValueError):
-            return None
-        if num <= 0:
-            return None
-        return f"{prefix}{num:,.2f}".replace(",", "")
-
-    if is_foil:
-        value = _fmt(prices.get("usd_foil"), "$") or _fmt(prices.get("usd"), "$") or _fmt(prices.get("usd_etched"), "$")
-        if value:
-            return value
-        value = _fmt(prices.get("eur_foil"), "EUR ") or _fmt(prices.get("eur"), "EUR ")
-        if value:
-            return value
-    else:
-        value = _fmt(prices.get("usd"), "$") or _fmt(prices.get("usd_foil"), "$") or _fmt(prices.get("usd_etched"), "$")
-        if value:
-            return value
-        value = _fmt(prices.get("eur"), "EUR ") or _fmt(prices.get("eur_foil"), "EUR ")
-        if value:
-            return value
-
-    return _fmt(prices.get("tix"), "TIX ")
-
-
 def _dashboard_top_cards(user_id: int | None, folder_ids: list[int]) -> list[DashboardTopCardVM]:
     if not user_id or not folder_ids:
         return []
-    cache_key = f"dashboard_top_cards:{user_id}:{cache_epoch()}"
+    cache_key = f"dashboard_top_cards:{user_id}:{collection_generation(user_id)}:{cache_epoch()}"
 
     def _load() -> list[DashboardTopCardVM]:
+        ensure_card_valuations(folder_ids)
         cards = (
             Card.query.options(
                 load_only(
@@ -268,6 +215,8 @@ def _dashboard_top_cards(user_id: int | None, folder_ids: list[int]) -> list[Das
                     Card.lang,
                     Card.is_foil,
                     Card.folder_id,
+                    Card.unit_price,
+                    Card.price_currency,
                 ),
                 selectinload(Card.folder).load_only(Folder.id, Folder.name),
             )
@@ -275,22 +224,18 @@ def _dashboard_top_cards(user_id: int | None, folder_ids: list[int]) -> list[Das
             .filter(
                 Card.folder_id.in_(folder_ids),
                 Folder.is_proxy.is_(False),
+                Card.unit_price.isnot(None),
             )
+            .order_by(Card.unit_price.desc(), func.lower(Card.name).desc())
+            .limit(10)
             .all()
         )
         if not cards:
             return []
-        if not sc.cache_ready():
-            sc.ensure_cache_loaded()
         print_map = _bulk_print_lookup(cards)
-        ranked: list[tuple[float, str, DashboardTopCardVM]] = []
+        top_cards: list[DashboardTopCardVM] = []
         for card in cards:
             print_data = print_map.get(card.id, {}) or {}
-            prices = print_data.get("prices") or {}
-            value = _dashboard_price_value(prices, bool(card.is_foil))
-            if value is None:
-                continue
-            price_text = _dashboard_price_text(prices, bool(card.is_foil))
             image = _img_url_for_print(print_data, "normal") or _img_url_for_print(print_data, "small")
             folder = getattr(card, "folder", None)
             folder_name = folder.name if folder and folder.name else "Unknown folder"
@@ -301,25 +246,20 @@ def _dashboard_top_cards(user_id: int | None, folder_ids: list[int]) -> list[Das
                 printing_label = f"{set_code} #{collector_number}"
             elif set_code:
                 printing_label = set_code
-            ranked.append(
-                (
-                    float(value),
-                    (card.name or "").lower(),
-                    DashboardTopCardVM(
-                        id=card.id,
-                        name=card.name or "",
-                        image=image,
-                        price_text=price_text,
-                        folder_name=folder_name,
-                        card_href=url_for("views.card_detail", card_id=card.id),
-                        printing_label=printing_label,
-                    ),
+            top_cards.append(
+                DashboardTopCardVM(
+                    id=card.id,
+                    name=card.name or "",
+                    image=image,
+                    price_text=format_valuation(card.unit_price, card.price_currency),
+                    folder_name=folder_name,
+                    card_href=url_for("views.card_detail", card_id=card.id),
+                    printing_label=printing_label,
                 )
             )
-        ranked.sort(key=lambda item: (item[0], item[1]), reverse=True)
-        return [vm for _, __, vm in ranked[:10]]
+        return top_cards
 
-    return cache_fetch(cache_key, 300, _load)
+    return cache_fetch(cache_key, COLLECTION_CACHE_TTL, _load)
 
 
 def _color_identity_html(letters: str) -> str:
@@ -587,12 +527,20 @@ def dashboard():
             icon="bi bi-grid-3x3-gap",
         ),
     ]
+    collection_top_cards: list[DashboardTopCardVM] = []
+    collection_value_text = None
+    if mode == "collection":
+        collection_top_cards = _dashboard_top_cards(owner_id, user_folder_ids)
+        collection_value_text = " + ".join(
+            format_valuation(value, currency) for currency, value in collection_values(collection_ids).items()
+        ) or None
     collection_stats = DashboardCollectionStatsVM(
         total_qty=int(total_qty or 0),
         collection_qty=int(collection_qty or 0),
         unique_names=int(unique_names or 0),
         set_count=int(set_count or 0),
         collection_bucket_count=int(collection_bucket_count or 0),
+        total_value_text=collection_value_text,
     )
     collection_actions = [
         DashboardActionVM(
@@ -632,9 +580,6 @@ def dashboard():
             icon="bi bi-list-check",
         ),
     ]
-    collection_top_cards: list[DashboardTopCardVM] = []
-    if mode == "collection":
-        collection_top_cards = _dashboard_top_cards(owner_id, user_folder_ids)
     deck_actions = [
         DashboardActionVM(
             label="Opening Hand",
@@ -37,6 +37,7 @@ class DashboardCollectionStatsVM:
     unique_names: int
     set_count: int
     collection_bucket_count: int
+    total_value_text: str | None = None
 
 
 @dataclass(slots=True)
@@ -19,6 +19,7 @@ from models import Card, Folder, WishlistItem
 from core.domains.cards.services import scryfall_cache as sc
 from core.domains.decks.services.edhrec_cache_service import edhrec_cache_snapshot
 from core.domains.decks.services.edhrec_client import edhrec_service_enabled
+from shared import warmup
 from shared.events.live_updates import latest_job_events
 from .api import api_bp
 from .base import views
@@ -94,7 +95,11 @@ def healthz():
 
 @views.route("/readyz", methods=["GET"])
 def readyz():
-    """Readiness probe that verifies database connectivity."""
+    """Readiness probe: database connectivity plus the startup warmup components.
+
+    Answers 503 while the warmup thread is still loading; components that
+    finished without data (or failed) are listed under ``degraded``.
+    """
     if not _ops_authorized():
         return _ops_forbidden()
     try:
@@ -104,7 +109,11 @@ def readyz():
         current_app.logger.warning("Readiness check failed: %s", exc, exc_info=True)
         db.session.rollback()
         return jsonify(status="error", reason="database"), 503
-    return jsonify(status="ok"), 200
+    components = warmup.readiness()
+    if any(item["state"] == warmup.LOADING for item in components.values()):
+        return jsonify(status="warming", components=components), 503
+    degraded = sorted(name for name, item in components.items() if item["state"] != warmup.READY)
+    return jsonify(status="ok", components=components, degraded=degraded), 200
 
 
 @api_bp.route("/healthz", methods=["GET"])
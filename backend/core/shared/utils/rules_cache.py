@@ -7,6 +7,8 @@ import urllib.request
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from shared import warmup
+
 
 _RULES_TEXT: Optional[str] = None
 _RULES_LINES: Optional[List[str]] = None
@@ -22,6 +24,8 @@ _EFFECTIVE_RE = re.compile(r"effective as of ([A-Za-z]+\\s+\\d{1,2},\\s+\\d{4})"
 
 def _load_rules_text() -> str:
     global _RULES_TEXT, _RULES_LINES
+    if _RULES_TEXT is None and not warmup.wait_for("rules"):
+        return ""
     if _RULES_TEXT is None:
         if not _RULES_PATH.exists() or _RULES_PATH.stat().st_size < _RULES_MIN_BYTES:
             downloaded = _download_rules_text()
@@ -58,6 +62,10 @@ def _download_rules_text() -> str:
         return ""
 
 
+def rules_loaded() -> bool:
+    return _RULES_TEXT is not None
+
+
 def _load_rules_lines() -> List[str]:
     if _RULES_LINES is None:
         _load_rules_text()
@@ -68,6 +76,9 @@ def magic_rules_metadata() -> Dict[str, Any]:
     global _RULES_META
     if _RULES_META is None:
         text = _load_rules_text()
+        if _RULES_TEXT is None:
+            # Not loaded yet (startup warmup still running); do not memoize.
+            return {"filename": _RULES_FILENAME, "effective_date": None, "line_count": 0, "source_url": _RULES_SOURCE_URL}
         effective = None
         match = _EFFECTIVE_RE.search(text[:4000]) if text else None
         if match:
@@ -98,7 +109,8 @@ def magic_rules_workbook() -> List[Dict[str, Any]]:
 
     text = _load_rules_text()
     if not text:
-        _RULES_WORKBOOK = []
+        if _RULES_TEXT is not None:
+            _RULES_WORKBOOK = []
         return []
 
     lines = re.split(r"\r\n|\n|\r", text.lstrip("\ufeff"))
@@ -3,13 +3,16 @@ import json
 import logging
 import os
 import re
+import time
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 
 import requests
 from markupsafe import Markup, escape
 from core.shared.utils.assets import static_url
+from shared import warmup
 
 # Where we store JSON + SVGs (always under backend/static/symbols)
 STATIC_DIR = Path(__file__).resolve().parents[3] / "static"
@@ -23,10 +26,17 @@ _LOG = logging.getLogger(__name__)
 _SYMBOL_MAP: Optional[Dict[str, dict]] = None
 _SRC_MAP_LOCAL: Optional[Dict[str, str]] = None
 _SRC_MAP_REMOTE: Optional[Dict[str, str]] = None
+# Symbol -> finished <img> tag keyed by (use_local, oracle); oracle tables also
+# map "\n" to "<br>". Unknown symbols fall back to their escaped text.
+_HTML_TABLES: Dict[Tuple[bool, bool], Dict[str, str]] = {}
 _LAST_REFRESH_FAILURE_AT: Optional[datetime] = None
 
 # Matches "{X}", "{2/W}", "{W/U}", "{B/P}", "{T}", "{C}", "{∞}", etc.
 MANA_RE = re.compile(r"\{[^}]+\}")
+# Oracle text also turns newlines into <br> in the same pass.
+_ORACLE_TOKEN_RE = re.compile(r"\{[^}]+\}|\n")
+# Rendered strings kept per process; oracle text of a full catalog is ~30k entries.
+RENDER_CACHE_SIZE = int(os.getenv("MANA_RENDER_CACHE_SIZE", "32768"))
 
 
 def _now() -> datetime:
@@ -74,8 +84,6 @@ def ensure_symbols_cache(
     Returns a map: symbol string -> symbol record (from Scryfall).
     When return_status is True, also returns whether the fetch hit the remote API.
     """
-    global _SYMBOL_MAP, _SRC_MAP_LOCAL, _SRC_MAP_REMOTE
-
     # Load JSON if present (migrate legacy location if needed).
     if not force and not SYMBOLS_JSON.exists() and _LEGACY_SYMBOLS_JSON.exists():
         try:
@@ -133,63 +141,113 @@ def ensure_symbols_cache(
                     # Failing to download a single SVG shouldn't break the entire flow
                     pass
 
-    _SYMBOL_MAP = sym_map
-    # Build src maps
-    _SRC_MAP_LOCAL = {}
-    _SRC_MAP_REMOTE = {}
-    for sym, rec in sym_map.items():
-        fn = _normalize_filename(sym)
-        local = static_url(f"symbols/{fn}")
-        _SRC_MAP_LOCAL[sym] = local
-        _SRC_MAP_REMOTE[sym] = rec.get("svg_uri") or rec.get("png_uri") or ""
+    _install_symbol_map(sym_map)
 
     if return_status:
         return sym_map, fetched_remote
     return sym_map
 
+
+def _install_symbol_map(sym_map: Dict[str, dict]) -> None:
+    """Build src maps and the symbol -> <img> tables; drop memoized renders."""
+    global _SYMBOL_MAP, _SRC_MAP_LOCAL, _SRC_MAP_REMOTE, _HTML_TABLES
+    src_local: Dict[str, str] = {}
+    src_remote: Dict[str, str] = {}
+    tables: Dict[Tuple[bool, bool], Dict[str, str]] = {(True, False): {}, (False, False): {}}
+    for sym, rec in sym_map.items():
+        src_local[sym] = static_url(f"symbols/{_normalize_filename(sym)}")
+        src_remote[sym] = rec.get("svg_uri") or rec.get("png_uri") or ""
+        alt = escape(sym)
+        for use_local, src in ((True, src_local[sym]), (False, src_remote[sym])):
+            if src:
+                # Keys are matched against escaped text, which leaves symbols intact.
+                tables[(use_local, False)][str(alt)] = f'<img class="mana" src="{escape(src)}" alt="{alt}" title="{alt}">'
+    for use_local in (True, False):
+        tables[(use_local, True)] = {**tables[(use_local, False)], "\n": "<br>"}
+    _SYMBOL_MAP = sym_map
+    _SRC_MAP_LOCAL = src_local
+    _SRC_MAP_REMOTE = src_remote
+    _HTML_TABLES = tables
+    _render_cached.cache_clear()
+
+
 def get_symbol_src_map(use_local: bool = True) -> Dict[str, str]:
     """
     Returns a map: symbol string -> src (local / remote).
     """
-    global _SYMBOL_MAP, _SRC_MAP_LOCAL, _SRC_MAP_REMOTE
     if _SYMBOL_MAP is None or _SRC_MAP_LOCAL is None or _SRC_MAP_REMOTE is None:
-        ensure_symbols_cache(force=False)
+        if not warmup.wait_for("symbols"):
+            return {}
+        if _SYMBOL_MAP is None:
+            ensure_symbols_cache(force=False)
     return _SRC_MAP_LOCAL if use_local else _SRC_MAP_REMOTE
 
+
+def symbols_loaded() -> bool:
+    return _SYMBOL_MAP is not None
+
+
+@lru_cache(maxsize=RENDER_CACHE_SIZE)
+def _render_cached(text: str, use_local: bool, oracle: bool) -> Markup:
+    escaped = str(escape(text))
+    if "{" not in escaped and (not oracle or "\n" not in escaped):
+        return Markup(escaped)
+    table = _HTML_TABLES[(use_local, oracle)]
+    pattern = _ORACLE_TOKEN_RE if oracle else MANA_RE
+    return Markup(pattern.sub(lambda match: table.get(match.group(0), match.group(0)), escaped))
+
+
+def _render(text: Optional[str], use_local: bool, oracle: bool) -> Markup:
+    if not text:
+        return Markup("—")
+    if _SYMBOL_MAP is None:
+        get_symbol_src_map(use_local=use_local)
+        if _SYMBOL_MAP is None:
+            # Symbols are still warming up: plain text, and nothing memoized.
+            escaped = str(escape(text))
+            return Markup(escaped.replace("\n", "<br>") if oracle else escaped)
+    return _render_cached(str(text), bool(use_local), oracle)
+
+
 def render_mana_html(text: Optional[str], use_local: bool = True) -> str:
     """
     Replace all {...} tokens in a mana-cost-like string with <img class="mana"> icons.
     """
-    if not text:
-        return "—"
-    src_map = get_symbol_src_map(use_local=use_local)
-    out = Markup("")
-    last = 0
-    for match in MANA_RE.finditer(text):
-        if match.start() > last:
-            out += escape(text[last:match.start()])
-        sym = match.group(0)
-        src = src_map.get(sym)
-        alt = escape(sym)
-        if not src:
-            out += alt  # fallback to plain text
-        else:
-            out += Markup(
-                f'<img class="mana" src="{escape(src)}" alt="{alt}" title="{alt}">'
-            )
-        last = match.end()
-    if last < len(text):
-        out += escape(text[last:])
-    return out
+    return _render(text, use_local, False)
+
 
 def render_oracle_html(text: Optional[str], use_local: bool = True) -> str:
     """
     Replace mana symbols inside oracle text and convert newlines to <br>.
     """
-    if not text:
-        return "—"
-    html = render_mana_html(text, use_local=use_local)
-    return Markup(str(html).replace("\n", "<br>"))
+    return _render(text, use_local, True)
+
+
+def benchmark_render(texts: Iterable[str], *, use_local: bool = True, rounds: int = 3) -> Dict[str, float]:
+    """Time oracle rendering over ``texts``: one cold pass, then memoized passes."""
+    items = [text for text in texts if text]
+    get_symbol_src_map(use_local=use_local)
+    _render_cached.cache_clear()
+    started = time.perf_counter()
+    for text in items:
+        render_oracle_html(text, use_local=use_local)
+    cold = time.perf_counter() - started
+    started = time.perf_counter()
+    for _ in range(max(1, rounds)):
+        for text in items:
+            render_oracle_html(text, use_local=use_local)
+    warm = (time.perf_counter() - started) / max(1, rounds)
+    info = _render_cached.cache_info()
+    return {
+        "texts": len(items),
+        "cold_seconds": round(cold, 4),
+        "warm_seconds": round(warm, 4),
+        "cold_us_per_text": round(cold * 1e6 / len(items), 2) if items else 0.0,
+        "warm_us_per_text": round(warm * 1e6 / len(items), 2) if items else 0.0,
+        "cache_entries": info.currsize,
+        "cache_size": RENDER_CACHE_SIZE,
+    }
+
 
 def colors_to_icons(colors: Optional[List[str]], use_local: bool = True) -> List[str]:
     """
@@ -0,0 +1,70 @@
+"""Gunicorn settings for the web container.
+
+Command-line flags in docker-compose.yml / infra/Dockerfile still set bind,
+workers, threads and timeouts; this file adds the warmup and preload modes.
+
+By default (``GUNICORN_PRELOAD=0``) workers fork straight away and each one
+warms up (``shared.warmup``) in a background thread, so the port accepts
+traffic within a second and ``/readyz`` answers "warming" until the caches
+are in.
+
+``GUNICORN_PRELOAD=1`` trades that for memory: the master imports the app
+once, runs the warmup in the foreground, then ``gc.freeze()``s everything so
+workers share those pages copy-on-write instead of each building a private
+copy (and refcount/GC writes do not un-share them). Each worker re-opens its
+database and Redis connections in ``post_fork``. No worker exists, and so no
+connection is accepted, until that warmup finishes; compare both modes with
+``backend/scripts/bench_worker_memory.py``.
+
+This is the only place that turns on background warmup: other processes that
+build the app (``flask`` CLI commands, RQ jobs) default to ``manual``.
+"""
+
+from __future__ import annotations
+
+import gc
+import os
+
+preload_app = os.getenv("GUNICORN_PRELOAD", "0").lower() in {"1", "true", "yes", "on"}
+if preload_app:
+    # The master runs the startup warmup itself in when_ready (no threads before fork).
+    os.environ.setdefault("STARTUP_WARMUP", "manual")
+else:
+    os.environ.setdefault("STARTUP_WARMUP", "background")
+
+
+def _flask_app(server):
+    try:
+        return server.app.wsgi()
+    except Exception:  # pragma: no cover - gunicorn reports load errors itself
+        return None
+
+
+def when_ready(server):
+    if not preload_app:
+        return
+    app = _flask_app(server)
+    if app is None:
+        return
+    from shared.app_runtime import freeze_for_fork, warm_shared_indexes
+
+    timings = warm_shared_indexes(app)
+    frozen = freeze_for_fork()
+    server.log.info("Preloaded shared indexes %s; froze %s objects before fork", timings, frozen)
+
+
+def pre_fork(server, worker):
+    if preload_app:
+        # Objects created by the master since when_ready (e.g. after a reload).
+        gc.freeze()
+
+
+def post_fork(server, worker):
+    if not preload_app:
+        return
+    app = _flask_app(server)
+    if app is None:
+        return
+    from shared.app_runtime import reinitialize_after_fork
+
+    reinitialize_after_fork(app)
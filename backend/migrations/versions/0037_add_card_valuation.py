@@ -0,0 +1,71 @@
+"""Add materialized per-card valuation columns to cards.
+
+Stores the unit price for each row's exact print and finish (plus the currency
+it was resolved in and when) so top-N and price-sorted collection queries can
+be answered with an indexed ORDER BY instead of resolving every print in
+Python. Values are filled by ``card_valuation_service.refresh_card_valuations``.
+
+Revision ID: 0037_add_card_valuation
+Revises: 0036_gv_bracket_manual
+Create Date: 2026-10-18
+"""
+
+from __future__ import annotations
+
+import logging
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy import inspect
+
+_LOG = logging.getLogger(__name__)
+
+revision = "0037_add_card_valuation"
+down_revision = "0036_gv_bracket_manual"
+branch_labels = None
+depends_on = None
+
+
+_TABLE = "cards"
+_COLUMNS = (
+    ("unit_price", sa.Float()),
+    ("price_currency", sa.String(length=4)),
+    ("price_updated_at", sa.DateTime()),
+)
+_INDEX = "ix_cards_folder_unit_price"
+
+
+def _has_column(inspector, table: str, column: str) -> bool:
+    return any(col["name"] == column for col in inspector.get_columns(table))
+
+
+def _has_index(inspector, table: str, name: str) -> bool:
+    return any(idx["name"] == name for idx in inspector.get_indexes(table))
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = inspect(bind)
+
+    for name, column_type in _COLUMNS:
+        if _has_column(inspector, _TABLE, name):
+            _LOG.info("Column %s.%s already present, skipping add", _TABLE, name)
+            continue
+        op.add_column(_TABLE, sa.Column(name, column_type, nullable=True))
+
+    inspector = inspect(bind)
+    if not _has_index(inspector, _TABLE, _INDEX):
+        op.create_index(_INDEX, _TABLE, ["folder_id", "unit_price"], unique=False)
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = inspect(bind)
+
+    if _has_index(inspector, _TABLE, _INDEX):
+        op.drop_index(_INDEX, table_name=_TABLE)
+
+    with op.batch_alter_table(_TABLE) as batch:
+        for name, _column_type in reversed(_COLUMNS):
+            if _has_column(inspector, _TABLE, name):
+                batch.drop_column(name)
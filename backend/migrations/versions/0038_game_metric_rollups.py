@@ -0,0 +1,111 @@
+"""Add per-user daily game metric rollup tables.
+
+``game_metric_days`` holds per-day game counts by pod size and
+``game_metric_seat_days`` holds per-day seat outcomes keyed by player, deck and
+commander, both scoped to the user whose metrics include the game.
+``game_metric_rollup_state`` records which users have been fully built; users
+without a row are built lazily on their first metrics read, so no data
+backfill is needed here.
+
+Revision ID: 0038_game_metric_rollups
+Revises: 0037_add_card_valuation
+Create Date: 2026-10-18
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy import inspect
+
+revision = "0038_game_metric_rollups"
+down_revision = "0037_add_card_valuation"
+branch_labels = None
+depends_on = None
+
+
+def _has_table(inspector, table: str) -> bool:
+    return table in set(inspector.get_table_names())
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = inspect(bind)
+
+    if not _has_table(inspector, "game_metric_days"):
+        op.create_table(
+            "game_metric_days",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("user_id", sa.Integer(), nullable=False),
+            sa.Column("day", sa.Date(), nullable=False),
+            sa.Column("seat_count", sa.Integer(), nullable=False),
+            sa.Column("games", sa.Integer(), nullable=False),
+            sa.Column("combo_wins", sa.Integer(), nullable=False),
+            sa.PrimaryKeyConstraint("id", name="pk_game_metric_days"),
+            sa.ForeignKeyConstraint(
+                ["user_id"], ["users.id"],
+                name="fk_game_metric_days_user_id_users", ondelete="CASCADE",
+            ),
+        )
+        op.create_index("ix_game_metric_days_user_day", "game_metric_days", ["user_id", "day"])
+
+    if not _has_table(inspector, "game_metric_seat_days"):
+        op.create_table(
+            "game_metric_seat_days",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("user_id", sa.Integer(), nullable=False),
+            sa.Column("day", sa.Date(), nullable=False),
+            sa.Column("seat_count", sa.Integer(), nullable=False),
+            sa.Column("turn_order", sa.Integer(), nullable=True),
+            sa.Column("player_user_id", sa.Integer(), nullable=True),
+            sa.Column("player_name", sa.String(length=120), nullable=True),
+            sa.Column("deck_folder_id", sa.Integer(), nullable=True),
+            sa.Column("deck_name", sa.String(length=200), nullable=True),
+            sa.Column("commander_name", sa.String(length=200), nullable=True),
+            sa.Column("bracket_label", sa.String(length=120), nullable=True),
+            sa.Column("bracket_score_total", sa.Float(), nullable=False),
+            sa.Column("bracket_score_count", sa.Integer(), nullable=False),
+            sa.Column("plays", sa.Integer(), nullable=False),
+            sa.Column("wins", sa.Integer(), nullable=False),
+            sa.Column("combo_wins", sa.Integer(), nullable=False),
+            sa.PrimaryKeyConstraint("id", name="pk_game_metric_seat_days"),
+            sa.ForeignKeyConstraint(
+                ["user_id"], ["users.id"],
+                name="fk_game_metric_seat_days_user_id_users", ondelete="CASCADE",
+            ),
+        )
+        op.create_index("ix_game_metric_seat_days_user_day", "game_metric_seat_days", ["user_id", "day"])
+        op.create_index(
+            "ix_game_metric_seat_days_user_player",
+            "game_metric_seat_days",
+            ["user_id", "player_user_id", "player_name"],
+        )
+        op.create_index("ix_game_metric_seat_days_user_deck", "game_metric_seat_days", ["user_id", "deck_name"])
+
+    if not _has_table(inspector, "game_metric_rollup_state"):
+        op.create_table(
+            "game_metric_rollup_state",
+            sa.Column("user_id", sa.Integer(), nullable=False),
+            sa.Column("built_at", sa.DateTime(), nullable=False),
+            sa.PrimaryKeyConstraint("user_id", name="pk_game_metric_rollup_state"),
+            sa.ForeignKeyConstraint(
+                ["user_id"], ["users.id"],
+                name="fk_game_metric_rollup_state_user_id_users", ondelete="CASCADE",
+            ),
+        )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = inspect(bind)
+
+    if _has_table(inspector, "game_metric_rollup_state"):
+        op.drop_table("game_metric_rollup_state")
+    if _has_table(inspector, "game_metric_seat_days"):
+        op.drop_index("ix_game_metric_seat_days_user_deck", table_name="game_metric_seat_days")
+        op.drop_index("ix_game_metric_seat_days_user_player", table_name="game_metric_seat_days")
+        op.drop_index("ix_game_metric_seat_days_user_day", table_name="game_metric_seat_days")
+        op.drop_table("game_metric_seat_days")
+    if _has_table(inspector, "game_metric_days"):
+        op.drop_index("ix_game_metric_days_user_day", table_name="game_metric_days")
+        op.drop_table("game_metric_days")
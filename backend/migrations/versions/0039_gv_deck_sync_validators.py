@@ -0,0 +1,27 @@
+"""Game Vault — add gv_decks sync validator columns.
+
+Stores the ETag / Last-Modified of the last source fetch so re-syncs can send
+conditional requests and skip re-parsing decks the site reports unchanged.
+
+Revision ID: 0039_gv_deck_sync_validators
+Revises: 0038_game_metric_rollups
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0039_gv_deck_sync_validators"
+down_revision = "0038_game_metric_rollups"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("gv_decks", sa.Column("sync_etag", sa.String(length=255), nullable=True))
+    op.add_column("gv_decks", sa.Column("sync_last_modified", sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("gv_decks", "sync_last_modified")
+    op.drop_column("gv_decks", "sync_etag")
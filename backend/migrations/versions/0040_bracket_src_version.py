@@ -0,0 +1,25 @@
+"""Add commander_bracket_cache.source_version.
+
+Stores a cheap deck-content version next to each cached bracket so the decks
+overview can reuse stored results without loading every card row.
+
+Revision ID: 0040_bracket_src_version
+Revises: 0039_gv_deck_sync_validators
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0040_bracket_src_version"
+down_revision = "0039_gv_deck_sync_validators"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("commander_bracket_cache", sa.Column("source_version", sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("commander_bracket_cache", "source_version")
@@ -0,0 +1,55 @@
+"""Postgres search indexes: pg_trgm on card/tag text, tsvector on game notes.
+
+Postgres counterpart of the SQLite FTS5 tables from shared.database.fts:
+- GIN trigram indexes serving ILIKE substring/word-start searches on
+  cards.name, cards.type_line, oracle_core_role_tags.role and
+  oracle_evergreen_tags.keyword
+- game_sessions.notes_tsv, a generated tsvector over notes, with a GIN index
+
+No-op on other dialects.
+
+Revision ID: 0041_pg_search_indexes
+Revises: 0040_bracket_src_version
+"""
+
+from alembic import op
+
+
+revision = "0041_pg_search_indexes"
+down_revision = "0040_bracket_src_version"
+branch_labels = None
+depends_on = None
+
+_TRGM_INDEXES = (
+    ("ix_cards_name_trgm", "cards", "name"),
+    ("ix_cards_type_line_trgm", "cards", "type_line"),
+    ("ix_oracle_core_role_tags_role_trgm", "oracle_core_role_tags", "role"),
+    ("ix_oracle_evergreen_tags_keyword_trgm", "oracle_evergreen_tags", "keyword"),
+)
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        "ALTER TABLE game_sessions ADD COLUMN IF NOT EXISTS notes_tsv tsvector "
+        "GENERATED ALWAYS AS (to_tsvector('simple', coalesce(notes, ''))) STORED"
+    )
+    # cards can be large; build without blocking writes.
+    with op.get_context().autocommit_block():
+        for name, table, column in _TRGM_INDEXES:
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} USING gin ({column} gin_trgm_ops)")
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_game_sessions_notes_tsv ON game_sessions USING gin (notes_tsv)"
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_game_sessions_notes_tsv")
+        for name, _table, _column in _TRGM_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+    op.execute("ALTER TABLE game_sessions DROP COLUMN IF EXISTS notes_tsv")
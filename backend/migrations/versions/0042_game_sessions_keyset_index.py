@@ -0,0 +1,36 @@
+"""Composite index for keyset-paginated game logs.
+
+The public games dashboard pages an owner's sessions newest-first on
+(played_at, created_at, id); this index serves both the ordering and the
+row-value cursor comparison without a sort.
+
+Revision ID: 0042_game_sessions_keyset_index
+Revises: 0041_pg_search_indexes
+"""
+
+from alembic import op
+from sqlalchemy import inspect
+
+
+revision = "0042_game_sessions_keyset_index"
+down_revision = "0041_pg_search_indexes"
+branch_labels = None
+depends_on = None
+
+_TABLE = "game_sessions"
+_INDEX = "ix_game_sessions_owner_keyset"
+_COLUMNS = ["owner_user_id", "played_at", "created_at", "id"]
+
+
+def _has_index(name: str) -> bool:
+    return any(idx["name"] == name for idx in inspect(op.get_bind()).get_indexes(_TABLE))
+
+
+def upgrade() -> None:
+    if not _has_index(_INDEX):
+        op.create_index(_INDEX, _TABLE, _COLUMNS, unique=False)
+
+
+def downgrade() -> None:
+    if _has_index(_INDEX):
+        op.drop_index(_INDEX, table_name=_TABLE)
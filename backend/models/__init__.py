@@ -30,6 +30,9 @@ from .game import (  # type: ignore F401
     GamePodMember,
     GameRosterPlayer,
     GameRosterDeck,
+    GameMetricDay,
+    GameMetricSeatDay,
+    GameMetricRollupState,
 )
 from .site_request import SiteRequest  # type: ignore F401
 from .user_setting import UserSetting  # type: ignore F401
@@ -96,6 +99,9 @@ __all__ = [
     "GamePodMember",
     "GameRosterPlayer",
     "GameRosterDeck",
+    "GameMetricDay",
+    "GameMetricSeatDay",
+    "GameMetricRollupState",
     "SiteRequest",
     "UserSetting",
     "DeckTag",
@@ -0,0 +1,99 @@
+"""Time the hot paths against a deterministic synthetic catalog and collection.
+
+Builds a throwaway instance (its own SQLite database and data directory,
+background jobs off, warmup inline), seeds it with the synthetic
+catalog/collection from ``tests.benchmarks.synthetic`` and prints a JSON
+report of per-path timings. With ``--baseline`` the run is compared against
+an earlier report and exits non-zero when any median regressed past
+``--tolerance``.
+
+Run from the repository root:
+
+    python backend/scripts/bench_hot_paths.py --output bench.json
+    python backend/scripts/bench_hot_paths.py --baseline bench.json --tolerance 0.25
+
+``--scale 0.1`` shrinks every size (100k prints, 50k owned cards, 500 decks,
+10k games at 1.0) for a quick local run.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+REPO_ROOT = BACKEND_DIR.parent
+
+
+def _isolated_app(instance_dir: Path):
+    os.environ["INSTANCE_DIR"] = str(instance_dir)
+    os.environ["DATABASE_URL"] = f"sqlite:///{(instance_dir / 'bench.sqlite').as_posix()}"
+    os.environ["DISABLE_BACKGROUND_JOBS"] = "1"
+    os.environ["STARTUP_WARMUP"] = "inline"
+    os.environ.setdefault("FLASK_ENV", "development")
+    os.environ.setdefault("ENABLE_TALISMAN", "0")
+    # The app imports from backend/; the benchmark harness lives in tests/benchmarks.
+    for path in (REPO_ROOT, BACKEND_DIR):
+        if str(path) not in sys.path:
+            sys.path.insert(0, str(path))
+
+    import app as dv_app
+    from extensions import db
+
+    flask_app = dv_app.create_app()
+    flask_app.config.update(TESTING=True, WTF_CSRF_ENABLED=False)
+    with flask_app.app_context():
+        db.create_all()
+    return flask_app
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiplier for every synthetic size.")
+    parser.add_argument("--seed", type=int, default=None, help="Override the synthetic data seed.")
+    parser.add_argument("--rounds", type=int, default=3, help="Timed rounds per benchmark (median is reported).")
+    parser.add_argument("--output", type=Path, help="Also write the JSON report here.")
+    parser.add_argument("--baseline", type=Path, help="Earlier report to compare against.")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed median slowdown, e.g. 0.25 = 25%%.")
+    parser.add_argument("--keep", action="store_true", help="Keep the throwaway instance directory.")
+    args = parser.parse_args()
+
+    instance_dir = Path(tempfile.mkdtemp(prefix="dv-bench-instance-"))
+    try:
+        flask_app = _isolated_app(instance_dir)
+
+        from tests.benchmarks import SyntheticSpec, compare_reports, run_hot_paths
+
+        spec = SyntheticSpec().scaled(args.scale)
+        if args.seed is not None:
+            spec = SyntheticSpec(**{**spec.as_dict(), "seed": args.seed})
+        report = run_hot_paths(flask_app, spec, rounds=args.rounds, workdir=instance_dir / "bench")
+    finally:
+        if not args.keep:
+            shutil.rmtree(instance_dir, ignore_errors=True)
+
+    status = 0
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        try:
+            regressions = compare_reports(report, baseline, tolerance=args.tolerance)
+        except ValueError as exc:
+            print(f"error: {exc}", file=sys.stderr)
+            return 2
+        report["regressions"] = regressions
+        status = 1 if regressions else 0
+
+    payload = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(payload + "\n", encoding="utf-8")
+    print(payload)
+    return status
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
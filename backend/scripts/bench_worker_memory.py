@@ -0,0 +1,126 @@
+"""Compare gunicorn worker memory and startup time with and without preload.
+
+Starts the web app under ``backend/gunicorn.conf.py`` twice (``GUNICORN_PRELOAD=0``
+and ``=1``), waits for ``/healthz`` to answer, then reads per-worker memory
+from ``/proc/<pid>/smaps_rollup``. RSS counts shared pages in every worker;
+PSS splits them between the processes sharing them and USS is what a worker
+owns privately, so preload should mostly show up as lower PSS/USS.
+
+Linux only. Run from the repository root with the usual app environment:
+
+    python backend/scripts/bench_worker_memory.py --workers 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import signal
+import subprocess
+import sys
+import time
+import urllib.request
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+
+
+def _children(pid: int) -> list[int]:
+    try:
+        raw = Path(f"/proc/{pid}/task/{pid}/children").read_text()
+    except OSError:
+        return []
+    return [int(part) for part in raw.split()]
+
+
+def _memory_kb(pid: int) -> dict[str, int]:
+    fields = {"Rss": 0, "Pss": 0, "Private_Clean": 0, "Private_Dirty": 0}
+    try:
+        lines = Path(f"/proc/{pid}/smaps_rollup").read_text().splitlines()
+    except OSError:
+        return {"rss": 0, "pss": 0, "uss": 0}
+    for line in lines:
+        name, _, rest = line.partition(":")
+        if name in fields:
+            fields[name] = int(rest.split()[0])
+    return {
+        "rss": fields["Rss"],
+        "pss": fields["Pss"],
+        "uss": fields["Private_Clean"] + fields["Private_Dirty"],
+    }
+
+
+def _wait_ready(url: str, timeout: float) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(url, timeout=2) as resp:
+                if resp.status == 200:
+                    return True
+        except Exception:
+            pass
+        time.sleep(0.2)
+    return False
+
+
+def run(preload: bool, *, workers: int, port: int, settle: float, timeout: float) -> dict:
+    env = dict(os.environ, GUNICORN_PRELOAD="1" if preload else "0")
+    env.setdefault("PYTHONPATH", str(BACKEND_DIR))
+    cmd = [
+        sys.executable, "-m", "gunicorn",
+        "--config", str(BACKEND_DIR / "gunicorn.conf.py"),
+        "--bind", f"127.0.0.1:{port}",
+        "--workers", str(workers),
+        "app:create_app()",
+    ]
+    started = time.monotonic()
+    proc = subprocess.Popen(cmd, cwd=BACKEND_DIR, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        ready = _wait_ready(f"http://127.0.0.1:{port}/healthz", timeout)
+        startup = time.monotonic() - started
+        # Let every worker finish booting and touch a few pages.
+        time.sleep(settle)
+        per_worker = [_memory_kb(pid) for pid in _children(proc.pid)]
+        master = _memory_kb(proc.pid)
+    finally:
+        proc.send_signal(signal.SIGTERM)
+        try:
+            proc.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+
+    def _avg(key: str) -> float:
+        return round(sum(w[key] for w in per_worker) / len(per_worker) / 1024, 1) if per_worker else 0.0
+
+    return {
+        "preload": preload,
+        "ready": ready,
+        "startup_seconds": round(startup, 2),
+        "workers": len(per_worker),
+        "master_rss_mb": round(master["rss"] / 1024, 1),
+        "worker_rss_mb": _avg("rss"),
+        "worker_pss_mb": _avg("pss"),
+        "worker_uss_mb": _avg("uss"),
+        "total_pss_mb": round((master["pss"] + sum(w["pss"] for w in per_worker)) / 1024, 1),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--port", type=int, default=5057)
+    parser.add_argument("--settle", type=float, default=5.0, help="Seconds to wait after /healthz before sampling.")
+    parser.add_argument("--timeout", type=float, default=300.0, help="Seconds to wait for /healthz.")
+    args = parser.parse_args()
+
+    results = [
+        run(preload, workers=args.workers, port=args.port, settle=args.settle, timeout=args.timeout)
+        for preload in (False, True)
+    ]
+    print(json.dumps(results, indent=2))
+    return 0 if all(item["ready"] for item in results) else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
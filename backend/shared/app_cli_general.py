@@ -103,6 +103,41 @@ def register_general_cli_commands(app) -> None:
             top = ", ".join(f"{key}:{value}" for key, value in list(per_folder.items())[:10])
             click.echo(f"By folder (first 10): {top}")
 
+    @app.cli.command("bench-visibility")
+    @click.option("--user-id", type=int, required=True, help="User whose visibility filter to time.")
+    @click.option("--rounds", type=int, default=5, show_default=True, help="Queries to average per filter.")
+    @click.option(
+        "--synthetic-cards",
+        type=int,
+        default=0,
+        show_default=True,
+        help="Temporarily add this many cards to the user's account (rolled back), e.g. 100000.",
+    )
+    def bench_visibility_cmd(user_id, rounds, synthetic_cards):
+        """Compare the correlated EXISTS visibility filter with the cached folder-id set."""
+        import json as _json
+
+        from shared.cache.visibility_cache import benchmark_visibility
+
+        result = benchmark_visibility(user_id, rounds=rounds, synthetic_cards=synthetic_cards)
+        click.echo(_json.dumps(result, indent=2))
+
+    @app.cli.command("bench-search")
+    @click.option("--cards", type=int, default=200_000, show_default=True, help="Synthetic card rows to seed.")
+    @click.option("--notes", type=int, default=50_000, show_default=True, help="Synthetic game notes to seed.")
+    @click.option("--rounds", type=int, default=5, show_default=True, help="Queries to average per search.")
+    def bench_search_cmd(cards, notes, rounds):
+        """Time Postgres card/notes search with and without the trigram/tsvector indexes (temp tables)."""
+        import json as _json
+
+        from shared.database.search import benchmark_search
+
+        try:
+            result = benchmark_search(cards=cards, notes=notes, rounds=rounds)
+        except RuntimeError as exc:
+            raise click.ClickException(str(exc)) from exc
+        click.echo(_json.dumps(result, indent=2))
+
     @app.cli.command("rq-worker")
     @click.option("--queue", default="default", show_default=True)
     def rq_worker(queue):
@@ -286,6 +321,15 @@ def register_general_cli_commands(app) -> None:
         session.commit()
         click.echo(f"Merged {total_merged} duplicate rows.")
 
+    @app.cli.command("rebuild-game-metrics")
+    def rebuild_game_metrics_cmd():
+        """Rebuild the per-user daily game metric rollups from logged sessions."""
+        from core.domains.games.services.game_metrics_rollup_service import rebuild_all_rollups
+
+        users = rebuild_all_rollups()
+        db.session.commit()
+        click.echo(f"Rebuilt game metric rollups for {users} user(s).")
+
     @app.cli.command("analyze")
     def analyze_sqlite():
         db.session.execute(text("ANALYZE"))
@@ -82,6 +82,18 @@ def register_scryfall_cli_commands(app) -> None:
         db.session.commit()
         click.echo(f"Backfilled oracle_id for {fixed} card rows.")
 
+    @app.cli.command("refresh-card-valuations")
+    @click.option("--missing-only", is_flag=True, help="Only price rows that have never been valued.")
+    def refresh_card_valuations_cmd(missing_only):
+        """Recompute stored per-card unit prices (price service, then the Scryfall cache)."""
+        if not (cache_exists() and load_cache()):
+            click.echo("No local Scryfall cache found. Run: flask fetch-scryfall-bulk")
+            return
+        from core.domains.cards.services.card_valuation_service import refresh_card_valuations
+
+        updated = refresh_card_valuations(only_missing=missing_only)
+        click.echo(f"Refreshed valuations for {updated} card row(s).")
+
     @app.cli.command("refresh-oracle-tags")
     def refresh_oracle_tags_cmd():
         """Recompute oracle core roles and evergreen tags from the Scryfall cache."""
@@ -115,6 +127,63 @@ def register_scryfall_cli_commands(app) -> None:
         recompute_all_roles(merge_existing=not replace)
         click.echo("Card roles refreshed from oracle text.")
 
+    @app.cli.command("sync-card-images")
+    @click.option("--limit", type=int, default=None, help="Max images to download this run (default: CARD_IMAGE_SYNC_LIMIT).")
+    @click.option("--concurrency", type=int, default=None, help="Parallel downloads.")
+    @click.option("--rate", type=float, default=None, help="Max download starts per second.")
+    def sync_card_images_cmd(limit, concurrency, rate):
+        """Download images referenced by owned cards and decks into the local image cache."""
+        if not (cache_exists() and load_cache()):
+            click.echo("No local Scryfall cache found. Run: flask fetch-scryfall-bulk")
+            return
+        from core.domains.cards.services.card_image_cache import sync_card_images
+
+        info = sync_card_images(limit=limit, concurrency=concurrency, rate_per_second=rate, log=app.logger)
+        click.echo(
+            f"Images referenced: {info['referenced']}  already cached: {info['cached']}  "
+            f"downloaded: {info['downloaded']}  failed: {info['failed']}  remaining: {info['remaining']}"
+        )
+        if not info["thumbnails_enabled"]:
+            click.echo("Pillow is not installed; WebP thumbnails were skipped.")
+
+    @app.cli.command("bench-mana-render")
+    @click.option("--rounds", type=int, default=3, help="Memoized passes to average.")
+    @click.option("--remote", is_flag=True, help="Render remote symbol URLs instead of local SVGs.")
+    def bench_mana_render_cmd(rounds, remote):
+        """Time oracle-text symbol rendering over every distinct oracle text in the catalog."""
+        import json as _json
+
+        if not (cache_exists() and load_cache()):
+            click.echo("No local Scryfall cache found. Run: flask fetch-scryfall-bulk")
+            return
+        from core.shared.utils.symbols_cache import benchmark_render
+
+        texts: dict[str, None] = {}
+        for print_obj in sc.get_all_prints():
+            texts.setdefault(print_obj.get("oracle_text") or "", None)
+            for face in print_obj.get("card_faces") or []:
+                texts.setdefault((face or {}).get("oracle_text") or "", None)
+        click.echo(_json.dumps(benchmark_render(texts, use_local=not remote, rounds=rounds), indent=2))
+
+    @app.cli.command("bench-core-roles")
+    @click.option("--rounds", type=int, default=3, help="Passes to average.")
+    def bench_core_roles_cmd(rounds):
+        """Time core-role rule evaluation (per-rule regexes vs compiled matcher) over every oracle."""
+        import json as _json
+
+        if not (cache_exists() and load_cache()):
+            click.echo("No local Scryfall cache found. Run: flask fetch-scryfall-bulk")
+            return
+        from core.domains.decks.services.core_role_logic import benchmark_core_roles
+        from shared.jobs.background.oracle_profile_service import build_oracle_mock
+
+        oracles: dict[str, dict] = {}
+        for print_obj in sc.get_all_prints():
+            oracle_id = print_obj.get("oracle_id")
+            if oracle_id and oracle_id not in oracles:
+                oracles[oracle_id] = build_oracle_mock(print_obj)
+        click.echo(_json.dumps(benchmark_core_roles(oracles.values(), rounds=rounds), indent=2))
+
     @app.cli.command("cache-stats")
     @click.option("--json", "as_json", is_flag=True, help="Output raw JSON.")
     def cache_stats_cmd(as_json):
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import gc
 import json
 import logging
+import random
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
 from urllib.parse import urlparse
@@ -110,3 +112,40 @@ def extend_csp_for_static_assets(app: Flask) -> None:
     for directive in ("img-src", "script-src", "style-src", "font-src"):
         csp[directive] = append_csp_source(csp.get(directive), origin)
     app.config["CONTENT_SECURITY_POLICY"] = csp
+
+
+def warm_shared_indexes(app: Flask) -> dict[str, float]:
+    """Load the warmup components (Scryfall cache and indexes, symbols, rules) in this process.
+
+    A preloading gunicorn master calls this before forking so every worker
+    starts with them; returns load times in ms.
+    """
+    from shared.warmup import run_warmup
+
+    return run_warmup(app)
+
+
+def freeze_for_fork() -> int:
+    """Move every live object to the permanent GC generation before forking.
+
+    Collections in the workers then never touch (and so never copy) the
+    pages holding the master's caches. Returns the number of frozen objects.
+    """
+    gc.collect()
+    gc.freeze()
+    return gc.get_freeze_count()
+
+
+def reinitialize_after_fork(app: Flask) -> None:
+    """Drop connections and state a worker must not share with its master."""
+    with app.app_context():
+        from extensions import db
+
+        db.engine.dispose(close=False)
+    from shared import histograms
+    from shared.events import live_updates
+
+    live_updates._redis_client = None
+    # Anything the master timed while warming up must not be counted once per worker.
+    histograms.reset()
+    random.seed()
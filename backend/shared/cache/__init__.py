@@ -1,15 +1,19 @@
 """Shared cache backends (legacy implementations)."""
 
 from . import database_cache
+from . import http_cache
 from . import memory_cache
 from . import redis_cache
 from . import request_cache
 from . import runtime_cache
+from . import visibility_cache
 
 __all__ = [
     "database_cache",
+    "http_cache",
     "memory_cache",
     "redis_cache",
     "request_cache",
     "runtime_cache",
+    "visibility_cache",
 ]
@@ -0,0 +1,123 @@
+"""Shared-cache HTTP GETs with conditional revalidation.
+
+Successful responses are kept in the app cache keyed by URL. A cached body
+younger than ``fresh_for`` seconds is served without touching the network;
+older entries are revalidated with ``If-None-Match`` / ``If-Modified-Since``
+and a ``304`` simply refreshes the entry. Anything other than a ``200`` is
+returned to the caller uncached, so transient failures are retried next time.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import time
+from typing import Any, NamedTuple, Optional
+
+import requests
+
+from extensions import cache
+from shared.http_client import DEFAULT_TIMEOUT, safe_get
+
+_KEY_PREFIX = "http:get:"
+DEFAULT_FRESH_SECONDS = 300
+DEFAULT_TTL_SECONDS = 24 * 3600
+
+
+class CachedResponse(NamedTuple):
+    """The parts of a ``requests.Response`` callers read, safe to cache."""
+
+    url: str
+    status_code: int
+    text: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    from_cache: bool = False
+
+    def json(self) -> Any:
+        return json.loads(self.text)
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} Error for url: {self.url}")
+
+
+def _cache_key(url: str) -> str:
+    return _KEY_PREFIX + hashlib.sha1(url.encode("utf-8")).hexdigest()
+
+
+def _load(url: str) -> Optional[dict]:
+    try:
+        entry = cache.get(_cache_key(url))
+    except Exception:
+        return None
+    return entry if isinstance(entry, dict) else None
+
+
+def _store(url: str, entry: dict, ttl: int) -> None:
+    try:
+        cache.set(_cache_key(url), entry, timeout=ttl)
+    except Exception:
+        pass
+
+
+def _from_entry(url: str, entry: dict) -> CachedResponse:
+    return CachedResponse(
+        url=url,
+        status_code=200,
+        text=entry.get("text") or "",
+        etag=entry.get("etag"),
+        last_modified=entry.get("last_modified"),
+        from_cache=True,
+    )
+
+
+def cached_get(
+    url: str,
+    *,
+    headers: Optional[dict] = None,
+    timeout: float | tuple[int, int] | None = None,
+    fresh_for: int = DEFAULT_FRESH_SECONDS,
+    ttl: int = DEFAULT_TTL_SECONDS,
+) -> CachedResponse:
+    """GET ``url`` through the shared cache. Network errors propagate."""
+    entry = _load(url)
+    now = time.time()
+    if entry is not None and now - float(entry.get("fetched_at") or 0) < fresh_for:
+        return _from_entry(url, entry)
+
+    request_headers = dict(headers or {})
+    if entry is not None:
+        if entry.get("etag"):
+            request_headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            request_headers["If-Modified-Since"] = entry["last_modified"]
+
+    resp = safe_get(url, timeout=timeout or DEFAULT_TIMEOUT, headers=request_headers)
+    if resp.status_code == 304 and entry is not None:
+        entry = {**entry, "fetched_at": now}
+        _store(url, entry, ttl)
+        return _from_entry(url, entry)
+
+    result = CachedResponse(
+        url=url,
+        status_code=resp.status_code,
+        text=resp.text or "",
+        etag=resp.headers.get("ETag"),
+        last_modified=resp.headers.get("Last-Modified"),
+    )
+    if resp.status_code == 200:
+        _store(
+            url,
+            {
+                "text": result.text,
+                "etag": result.etag,
+                "last_modified": result.last_modified,
+                "fetched_at": now,
+            },
+            ttl,
+        )
+    return result
+
+
+__all__ = ["CachedResponse", "cached_get", "DEFAULT_FRESH_SECONDS", "DEFAULT_TTL_SECONDS"]
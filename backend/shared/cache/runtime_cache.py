@@ -2,9 +2,37 @@
 
 from __future__ import annotations
 
+import hashlib
+import os
+import sys
+import threading
+import time
+from typing import Iterable, Optional
+
 from flask_login import current_user
+from sqlalchemy import event, inspect, select
+
+from extensions import cache, db
+from shared.cache.request_cache import request_cache_clear, request_cached
+
+# Collection views keyed by collection_generation() can live this long; writes
+# invalidate them through the generation rather than by expiry.
+COLLECTION_CACHE_TTL = int(os.getenv("COLLECTION_CACHE_TTL", str(6 * 60 * 60)))
+COLLECTION_GENERATION_PREFIX = "collection-gen:"
+_GLOBAL_GENERATION_KEY = f"{COLLECTION_GENERATION_PREFIX}*"
+_DIRTY_OWNERS_KEY = "_dv_collection_dirty_owners"
+_DIRTY_GLOBAL_KEY = "_dv_collection_dirty_all"
+# Execution option naming the owners a bulk card/folder statement touches, so
+# it invalidates their collections instead of everyone's.
+COLLECTION_OWNERS_OPTION = "collection_owner_ids"
+_LISTENERS_REGISTERED = False
 
-from extensions import cache
+# Single-flight: concurrent misses on one key in this process wait for the
+# first caller; other processes back off on a short-lived fill marker.
+_FILL_MARKER_TTL = 30
+_FILL_WAIT_SECONDS = 2.0
+_inflight_guard = threading.Lock()
+_inflight: dict[str, list] = {}  # key -> [lock, holders]
 
 
 def user_cache_key() -> str:
@@ -12,27 +40,206 @@ def user_cache_key() -> str:
     return str(getattr(current_user, "id", None) or "anon")
 
 
+def _cache_get(key: str):
+    try:
+        return cache.get(key)
+    except Exception:
+        return None
+
+
+def _cache_set(key: str, value, ttl_seconds: int) -> None:
+    try:
+        if sys.getsizeof(value) < 1024 * 1024:
+            cache.set(key, value, timeout=ttl_seconds)
+    except Exception:
+        pass
+
+
+def _acquire_key_lock(key: str) -> threading.Lock:
+    with _inflight_guard:
+        slot = _inflight.get(key)
+        if slot is None:
+            slot = _inflight[key] = [threading.Lock(), 0]
+        slot[1] += 1
+    slot[0].acquire()
+    return slot[0]
+
+
+def _release_key_lock(key: str) -> None:
+    with _inflight_guard:
+        slot = _inflight[key]
+        slot[1] -= 1
+        if slot[1] <= 0:
+            _inflight.pop(key, None)
+    slot[0].release()
+
+
+def _wait_for_other_process(key: str):
+    deadline = time.monotonic() + _FILL_WAIT_SECONDS
+    while time.monotonic() < deadline:
+        time.sleep(0.05)
+        cached = _cache_get(key)
+        if cached is not None:
+            return cached
+        if _cache_get(f"{key}:filling") is None:
+            break
+    return None
+
+
 def cache_fetch(key: str, ttl_seconds: int, factory):
-    """Fetch from the shared cache with a basic payload size guard."""
+    """Fetch from the shared cache, computing each missing key only once at a time."""
     if not cache:
         return factory()
-    try:
-        cached = cache.get(key)
-    except Exception:
-        cached = None
+    cached = _cache_get(key)
     if cached is not None:
         return cached
 
-    value = factory()
-
+    _acquire_key_lock(key)
     try:
-        import sys
+        cached = _cache_get(key)
+        if cached is not None:
+            return cached
+        marker = f"{key}:filling"
+        try:
+            filling_here = bool(cache.add(marker, os.getpid(), timeout=_FILL_MARKER_TTL))
+        except Exception:
+            filling_here = True
+        if not filling_here:
+            cached = _wait_for_other_process(key)
+            if cached is not None:
+                return cached
+        try:
+            value = factory()
+            _cache_set(key, value, ttl_seconds)
+        finally:
+            if filling_here:
+                try:
+                    cache.delete(marker)
+                except Exception:
+                    pass
+        return value
+    finally:
+        _release_key_lock(key)
 
-        if sys.getsizeof(value) < 1024 * 1024:
-            cache.set(key, value, timeout=ttl_seconds)
+
+def collection_generation(user_id: Optional[int] = None) -> str:
+    """Version token for the collection data ``user_id`` can see.
+
+    Combines the generation of every owner whose folders the user can read
+    (their own, friends', shared and public ones), the visibility generation
+    and a global generation for bulk writes. Any relevant commit changes the
+    token, so keys that include it can use ``COLLECTION_CACHE_TTL``.
+    """
+    if user_id is None:
+        user_id = getattr(current_user, "id", None)
+
+    def _load() -> str:
+        from shared.cache.visibility_cache import GENERATION_KEY, visible_owner_ids
+
+        keys = [_GLOBAL_GENERATION_KEY]
+        if user_id:
+            owners = set(visible_owner_ids(int(user_id))) | {int(user_id)}
+            keys.append(GENERATION_KEY)
+            keys.extend(f"{COLLECTION_GENERATION_PREFIX}{owner}" for owner in sorted(owners))
+        try:
+            values = cache.get_many(*keys)
+        except Exception:
+            return f"nocache-{time.time_ns()}"
+        digest = hashlib.blake2b(repr(list(zip(keys, values))).encode("utf-8"), digest_size=8)
+        return digest.hexdigest()
+
+    return request_cached(("collection_generation", user_id), _load)
+
+
+def bump_collection_generation(owner_ids: Iterable[Optional[int]] = (), *, everyone: bool = False) -> None:
+    """Invalidate collection caches for ``owner_ids`` (``None``/0 = ownerless), or for all users."""
+    stamp = time.time_ns()
+    keys = {f"{COLLECTION_GENERATION_PREFIX}{int(owner or 0)}" for owner in owner_ids}
+    if everyone:
+        keys.add(_GLOBAL_GENERATION_KEY)
+    if not keys:
+        return
+    try:
+        cache.set_many({key: stamp for key in keys}, timeout=0)
     except Exception:
         pass
-    return value
+    request_cache_clear("collection_generation")
+
+
+def _dirty_owner_ids(session) -> set[int]:
+    from models import Card, Folder
+
+    owners: set[int] = set()
+    folder_ids: set[int] = set()
+    for obj in session.new.union(session.dirty).union(session.deleted):
+        if isinstance(obj, Folder):
+            owners.add(obj.owner_user_id or 0)
+            for previous in inspect(obj).attrs.owner_user_id.history.deleted or []:
+                owners.add(previous or 0)
+        elif isinstance(obj, Card):
+            if obj.folder_id:
+                folder_ids.add(obj.folder_id)
+            for previous in inspect(obj).attrs.folder_id.history.deleted or []:
+                if previous:
+                    folder_ids.add(previous)
+    if folder_ids:
+        table = Folder.__table__
+        rows = session.connection().execute(
+            select(table.c.owner_user_id).where(table.c.id.in_(sorted(folder_ids)))
+        )
+        owners.update(owner or 0 for (owner,) in rows)
+    return owners
+
+
+def register_collection_generation_listeners() -> None:
+    global _LISTENERS_REGISTERED
+    if _LISTENERS_REGISTERED:
+        return
+    _LISTENERS_REGISTERED = True
+
+    @event.listens_for(db.session, "after_flush")
+    def _track_collection_writes(session, _flush_context) -> None:
+        if not (session.new or session.dirty or session.deleted):
+            return
+        owners = _dirty_owner_ids(session)
+        if owners:
+            session.info.setdefault(_DIRTY_OWNERS_KEY, set()).update(owners)
+
+    @event.listens_for(db.session, "do_orm_execute")
+    def _track_bulk_collection_writes(execute_state) -> None:
+        if not (execute_state.is_update or execute_state.is_delete or execute_state.is_insert):
+            return
+        from models import Card, Folder
+
+        table = getattr(execute_state.statement, "table", None)
+        if table is not Card.__table__ and table is not Folder.__table__:
+            return
+        owners = execute_state.execution_options.get(COLLECTION_OWNERS_OPTION)
+        if owners is not None:
+            dirty = execute_state.session.info.setdefault(_DIRTY_OWNERS_KEY, set())
+            dirty.update(int(owner or 0) for owner in owners)
+        else:
+            execute_state.session.info[_DIRTY_GLOBAL_KEY] = True
+
+    @event.listens_for(db.session, "after_commit")
+    def _bump_collection_generations(session) -> None:
+        owners = session.info.pop(_DIRTY_OWNERS_KEY, None) or set()
+        everyone = bool(session.info.pop(_DIRTY_GLOBAL_KEY, False))
+        if owners or everyone:
+            bump_collection_generation(owners, everyone=everyone)
+
+    @event.listens_for(db.session, "after_rollback")
+    def _discard_collection_writes(session) -> None:
+        session.info.pop(_DIRTY_OWNERS_KEY, None)
+        session.info.pop(_DIRTY_GLOBAL_KEY, None)
 
 
-__all__ = ["cache_fetch", "user_cache_key"]
+__all__ = [
+    "COLLECTION_CACHE_TTL",
+    "COLLECTION_OWNERS_OPTION",
+    "bump_collection_generation",
+    "cache_fetch",
+    "collection_generation",
+    "register_collection_generation_listeners",
+    "user_cache_key",
+]
@@ -0,0 +1,278 @@
+"""Per-user visible-folder id sets for the request visibility filter.
+
+A user can see folders they own, ownerless and public folders, folders shared
+with them and folders owned by their friends. Rather than re-evaluating that
+rule as a correlated ``EXISTS`` for every folder/card row, the request hook in
+``app._register_visibility_filters`` asks :func:`visible_folder_ids` for the
+precomputed id set and filters on ``folder_id IN (...)``.
+
+Sets live in the shared cache under a global generation that is bumped after
+any commit touching folder ownership/public flags, shares or friendships, so
+a change is visible to every worker on its next request. Deployments on the
+per-process ``SimpleCache`` only get that guarantee for a single worker;
+``FOLDER_VISIBILITY_CACHE_TTL`` bounds staleness elsewhere.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+from flask import g, has_request_context
+from sqlalchemy import event, inspect, or_, select
+
+from extensions import cache, db
+
+GENERATION_KEY = "folder-visibility:generation"
+CACHE_TTL = int(os.getenv("FOLDER_VISIBILITY_CACHE_TTL", "300"))
+_REQUEST_KEY = "_dv_visible_folder_ids"
+_DIRTY_FLAG = "_dv_folder_visibility_dirty"
+_WATCHED_FOLDER_ATTRS = ("owner_user_id", "is_public")
+_LISTENERS_REGISTERED = False
+
+
+VISIBILITY_SKIP_SESSION_FLAG = "_skip_visibility_filters"
+
+
+@contextmanager
+def without_visibility_filters() -> Iterator[None]:
+    """Temporarily disable per-request visibility hooks (auth loaders, id-set queries)."""
+    depth = int(db.session.info.get(VISIBILITY_SKIP_SESSION_FLAG, 0) or 0)
+    db.session.info[VISIBILITY_SKIP_SESSION_FLAG] = depth + 1
+    try:
+        yield
+    finally:
+        if depth > 0:
+            db.session.info[VISIBILITY_SKIP_SESSION_FLAG] = depth
+        else:
+            db.session.info.pop(VISIBILITY_SKIP_SESSION_FLAG, None)
+
+
+def _user_key(user_id: int) -> str:
+    return f"folder-visibility:user:{user_id}"
+
+
+def _compute_visible(user_id: int) -> tuple[frozenset[int], frozenset[int]]:
+    from models import Folder, FolderShare, UserFriend
+
+    shared = select(FolderShare.folder_id).where(FolderShare.shared_user_id == user_id)
+    friends = select(UserFriend.friend_user_id).where(UserFriend.user_id == user_id)
+    rows = db.session.execute(
+        select(Folder.id, Folder.owner_user_id).where(
+            or_(
+                Folder.owner_user_id == user_id,
+                Folder.owner_user_id.is_(None),
+                Folder.is_public.is_(True),
+                Folder.id.in_(shared),
+                Folder.owner_user_id.in_(friends),
+            )
+        )
+    ).all()
+    # Ownerless folders are reported as owner 0.
+    return frozenset(folder_id for folder_id, _ in rows), frozenset(owner or 0 for _, owner in rows)
+
+
+def compute_visible_folder_ids(user_id: int) -> frozenset[int]:
+    """Run the visibility rule once for ``user_id``, bypassing every cache."""
+    with without_visibility_filters():
+        return _compute_visible(user_id)[0]
+
+
+def visible_folder_ids(user_id: int) -> frozenset[int]:
+    """Folder ids ``user_id`` may read; memoized per request and in the shared cache."""
+    return _visible(user_id)[0]
+
+
+def visible_owner_ids(user_id: int) -> frozenset[int]:
+    """Owners (0 for ownerless) of the folders ``user_id`` may read."""
+    return _visible(user_id)[1]
+
+
+def _visible(user_id: int) -> tuple[frozenset[int], frozenset[int]]:
+    memo = getattr(g, _REQUEST_KEY, None) if has_request_context() else None
+    if memo is not None and memo[0] == user_id:
+        return memo[1]
+
+    visible: Optional[tuple[frozenset[int], frozenset[int]]] = None
+    generation = None
+    # With flushed but uncommitted visibility changes the shared entry predates
+    # them, and a set computed now must not outlive a rollback: bypass it.
+    if not db.session.info.get(_DIRTY_FLAG):
+        try:
+            generation, entry = cache.get_many(GENERATION_KEY, _user_key(user_id))
+        except Exception:
+            entry = None
+        if generation is None:
+            # First use or evicted: start a generation so older entries never match.
+            try:
+                cache.add(GENERATION_KEY, time.time_ns(), timeout=0)
+                generation = cache.get(GENERATION_KEY)
+            except Exception:
+                generation = None
+        elif isinstance(entry, tuple) and len(entry) == 3 and entry[0] == generation:
+            visible = (frozenset(entry[1]), frozenset(entry[2]))
+    if visible is None:
+        with without_visibility_filters():
+            visible = _compute_visible(user_id)
+        if generation is not None:
+            try:
+                payload = (generation, tuple(sorted(visible[0])), tuple(sorted(visible[1])))
+                cache.set(_user_key(user_id), payload, timeout=CACHE_TTL)
+            except Exception:
+                pass
+
+    if has_request_context():
+        setattr(g, _REQUEST_KEY, (user_id, visible))
+    return visible
+
+
+def _drop_request_memo() -> None:
+    if has_request_context():
+        g.pop(_REQUEST_KEY, None)
+
+
+def invalidate_visible_folder_ids() -> None:
+    """Retire every cached set (new generation) and the current request's memo."""
+    try:
+        cache.set(GENERATION_KEY, time.time_ns(), timeout=0)
+    except Exception:
+        pass
+    _drop_request_memo()
+
+
+def benchmark_visibility(user_id: int, *, rounds: int = 5, synthetic_cards: int = 0) -> dict:
+    """Time the legacy correlated EXISTS filter against the id-set filter.
+
+    ``synthetic_cards`` adds that many cards to a throwaway folder owned by
+    ``user_id`` inside a savepoint that is rolled back afterwards.
+    """
+    from sqlalchemy import exists, func, insert
+
+    from models import Card, Folder, FolderShare, UserFriend
+
+    rounds = max(1, int(rounds))
+    savepoint = db.session.begin_nested() if synthetic_cards else None
+    try:
+        if synthetic_cards:
+            folder = Folder(name="visibility-benchmark", owner_user_id=user_id)
+            db.session.add(folder)
+            db.session.flush()
+            rows = [
+                {"name": f"Benchmark Card {idx}", "set_code": "bch", "collector_number": str(idx), "folder_id": folder.id}
+                for idx in range(int(synthetic_cards))
+            ]
+            for start in range(0, len(rows), 5000):
+                db.session.execute(insert(Card), rows[start:start + 5000])
+
+        share_exists = (
+            exists()
+            .where((FolderShare.folder_id == Folder.id) & (FolderShare.shared_user_id == user_id))
+            .correlate(Folder)
+        )
+        friend_exists = (
+            exists()
+            .where((UserFriend.user_id == user_id) & (UserFriend.friend_user_id == Folder.owner_user_id))
+            .correlate(Folder)
+        )
+        legacy_scope = or_(
+            Folder.owner_user_id == user_id,
+            Folder.owner_user_id.is_(None),
+            Folder.is_public.is_(True),
+            share_exists,
+            friend_exists,
+        )
+
+        started = time.perf_counter()
+        ids = compute_visible_folder_ids(user_id)
+        compute_ms = (time.perf_counter() - started) * 1000
+
+        def _time(criteria) -> tuple[float, int]:
+            total = 0
+            started = time.perf_counter()
+            for _ in range(rounds):
+                total = db.session.execute(select(func.count(Card.id)).where(criteria)).scalar() or 0
+            return (time.perf_counter() - started) * 1000 / rounds, total
+
+        legacy_ms, legacy_count = _time(Card.folder.has(legacy_scope))
+        id_set_ms, id_set_count = _time(Card.folder_id.in_(tuple(ids)))
+    finally:
+        if savepoint is not None:
+            savepoint.rollback()
+
+    return {
+        "user_id": user_id,
+        "visible_folders": len(ids),
+        "visible_cards": id_set_count,
+        "counts_match": legacy_count == id_set_count,
+        "rounds": rounds,
+        "compute_ids_ms": round(compute_ms, 3),
+        "legacy_exists_ms": round(legacy_ms, 3),
+        "id_set_ms": round(id_set_ms, 3),
+    }
+
+
+def _touches_visibility(session) -> bool:
+    from models import Folder, FolderShare, UserFriend
+
+    for obj in list(session.new) + list(session.deleted):
+        if isinstance(obj, (Folder, FolderShare, UserFriend)):
+            return True
+    for obj in session.dirty:
+        if isinstance(obj, (FolderShare, UserFriend)):
+            return True
+        if isinstance(obj, Folder):
+            state = inspect(obj)
+            if any(state.attrs[name].history.has_changes() for name in _WATCHED_FOLDER_ATTRS):
+                return True
+    return False
+
+
+def register_visibility_cache_listeners() -> None:
+    global _LISTENERS_REGISTERED
+    if _LISTENERS_REGISTERED:
+        return
+    _LISTENERS_REGISTERED = True
+
+    @event.listens_for(db.session, "before_flush")
+    def _flag_visibility_changes(session, _flush_context, _instances) -> None:
+        if _touches_visibility(session):
+            session.info[_DIRTY_FLAG] = True
+            # Later selects in this request must see the flushed folders/shares.
+            _drop_request_memo()
+
+    @event.listens_for(db.session, "do_orm_execute")
+    def _flag_bulk_visibility_changes(execute_state) -> None:
+        if not (execute_state.is_update or execute_state.is_delete):
+            return
+        from models import Folder, FolderShare, UserFriend
+
+        mapper = execute_state.bind_mapper
+        if mapper is not None and mapper.class_ in (Folder, FolderShare, UserFriend):
+            execute_state.session.info[_DIRTY_FLAG] = True
+            _drop_request_memo()
+
+    @event.listens_for(db.session, "after_commit")
+    def _bump_visibility_generation(session) -> None:
+        if session.info.pop(_DIRTY_FLAG, False):
+            invalidate_visible_folder_ids()
+
+    @event.listens_for(db.session, "after_rollback")
+    def _discard_visibility_flag(session) -> None:
+        if session.info.pop(_DIRTY_FLAG, None):
+            _drop_request_memo()
+
+
+__all__ = [
+    "CACHE_TTL",
+    "GENERATION_KEY",
+    "VISIBILITY_SKIP_SESSION_FLAG",
+    "benchmark_visibility",
+    "compute_visible_folder_ids",
+    "invalidate_visible_folder_ids",
+    "register_visibility_cache_listeners",
+    "visible_folder_ids",
+    "visible_owner_ids",
+    "without_visibility_filters",
+]
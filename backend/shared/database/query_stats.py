@@ -0,0 +1,276 @@
+"""Per-request SQL statement accounting and N+1 detection.
+
+Engine-wide ``before_cursor_execute`` / ``after_cursor_execute`` listeners
+feed whichever :class:`QueryStats` is active in the current context: one is
+opened for every request by :func:`register_query_stats`, and
+:func:`collect_queries` opens one around any block (jobs, tests). Each
+statement is reduced to a fingerprint (literals and ``IN`` lists collapsed),
+so the same query issued once per row shows up as one fingerprint with a
+high count — the usual N+1 shape.
+
+At the end of a request the totals are folded into per-endpoint aggregates
+(served by the observability blueprint), written as a ``Server-Timing``
+header, and checked against the endpoint's budget (``QUERY_BUDGETS`` /
+``QUERY_BUDGET_DEFAULT``). Over-budget requests are logged, or raise
+:class:`QueryBudgetExceeded` when ``QUERY_BUDGET_STRICT`` is set (tests).
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator, Optional
+
+from flask import Flask, current_app, g, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+__all__ = [
+    "QueryBudgetExceeded",
+    "QueryStats",
+    "collect_queries",
+    "fingerprint",
+    "get_route_query_stats",
+    "parse_budgets",
+    "register_query_stats",
+    "reset_route_query_stats",
+]
+
+_DEFAULT_NPLUSONE_THRESHOLD = 10
+_current: ContextVar[Optional["QueryStats"]] = ContextVar("dv_query_stats", default=None)
+
+_WS_RE = re.compile(r"\s+")
+_STRING_RE = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_RE = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PARAM_RE = re.compile(r"%\(\w+\)s|:\w+|\?|%s|\$\d+")
+_IN_LIST_RE = re.compile(r"\bIN\s*\((?:\s*\?\s*,?)+\)", re.IGNORECASE)
+_POSTCOMPILE_RE = re.compile(r"\(?__\[POSTCOMPILE_\w+\]\)?")
+
+
+class QueryBudgetExceeded(AssertionError):
+    """A request issued more statements than its configured budget."""
+
+
+def fingerprint(statement: str) -> str:
+    """Normalize a SQL statement so per-row repeats compare equal."""
+    text = _WS_RE.sub(" ", statement or "").strip()
+    text = _STRING_RE.sub("?", text)
+    text = _NUMBER_RE.sub("?", text)
+    text = _PARAM_RE.sub("?", text)
+    text = _POSTCOMPILE_RE.sub("(?)", text)
+    text = _IN_LIST_RE.sub("IN (...)", text)
+    return text
+
+
+class QueryStats:
+    """Statement count, DB time and fingerprint counts for one scope."""
+
+    __slots__ = ("count", "total_seconds", "fingerprints", "slowest_seconds", "slowest_statement")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total_seconds = 0.0
+        self.fingerprints: Counter[str] = Counter()
+        self.slowest_seconds = 0.0
+        self.slowest_statement: Optional[str] = None
+
+    def record(self, statement: str, seconds: float) -> None:
+        self.count += 1
+        self.total_seconds += seconds
+        self.fingerprints[fingerprint(statement)] += 1
+        if seconds > self.slowest_seconds:
+            self.slowest_seconds = seconds
+            self.slowest_statement = statement
+
+    def repeated(self, threshold: int = _DEFAULT_NPLUSONE_THRESHOLD) -> list[tuple[str, int]]:
+        """Fingerprints issued at least ``threshold`` times, most frequent first."""
+        return [(fp, n) for fp, n in self.fingerprints.most_common() if n >= threshold]
+
+    def as_dict(self, threshold: int = _DEFAULT_NPLUSONE_THRESHOLD) -> dict[str, Any]:
+        return {
+            "queries": self.count,
+            "db_ms": round(self.total_seconds * 1000, 2),
+            "distinct": len(self.fingerprints),
+            "slowest_ms": round(self.slowest_seconds * 1000, 2),
+            "suspected_n_plus_one": [{"fingerprint": fp, "count": n} for fp, n in self.repeated(threshold)],
+        }
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current.get() is not None:
+        conn.info.setdefault("dv_query_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current.get()
+    if stats is None:
+        return
+    starts = conn.info.get("dv_query_start")
+    started = starts.pop() if starts else time.perf_counter()
+    stats.record(statement, time.perf_counter() - started)
+
+
+_listeners_lock = threading.Lock()
+_listeners_installed = False
+
+
+def _install_listeners() -> None:
+    global _listeners_installed
+    with _listeners_lock:
+        if _listeners_installed:
+            return
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+        _listeners_installed = True
+
+
+@contextmanager
+def collect_queries(*, max_queries: Optional[int] = None) -> Iterator[QueryStats]:
+    """Count statements issued inside the block; optionally enforce a budget.
+
+    Nested blocks count independently; the outer scope resumes afterwards.
+    """
+    _install_listeners()
+    stats = QueryStats()
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+    if max_queries is not None and stats.count > max_queries:
+        raise QueryBudgetExceeded(
+            f"{stats.count} queries exceeded budget of {max_queries}; "
+            f"top fingerprints: {stats.fingerprints.most_common(3)}"
+        )
+
+
+# Per-endpoint aggregates, per worker process (like shared.observability).
+_route_lock = threading.Lock()
+_route_stats: dict[str, dict[str, Any]] = {}
+
+
+def _fold_route(endpoint: str, stats: QueryStats, repeated: list[tuple[str, int]]) -> None:
+    with _route_lock:
+        entry = _route_stats.setdefault(
+            endpoint,
+            {"requests": 0, "queries": 0, "db_seconds": 0.0, "max_queries": 0, "n_plus_one": Counter()},
+        )
+        entry["requests"] += 1
+        entry["queries"] += stats.count
+        entry["db_seconds"] += stats.total_seconds
+        entry["max_queries"] = max(entry["max_queries"], stats.count)
+        for fp, _count in repeated:
+            entry["n_plus_one"][fp] += 1
+
+
+def get_route_query_stats() -> dict[str, dict[str, Any]]:
+    """Per-endpoint statement totals for this worker."""
+    with _route_lock:
+        snapshot = {name: dict(entry, n_plus_one=Counter(entry["n_plus_one"])) for name, entry in _route_stats.items()}
+    result = {}
+    for name, entry in sorted(snapshot.items()):
+        requests_seen = entry["requests"] or 1
+        result[name] = {
+            "requests": entry["requests"],
+            "avg_queries": round(entry["queries"] / requests_seen, 2),
+            "max_queries": entry["max_queries"],
+            "avg_db_ms": round(entry["db_seconds"] * 1000 / requests_seen, 2),
+            "n_plus_one": [
+                {"fingerprint": fp, "requests": n} for fp, n in entry["n_plus_one"].most_common(5)
+            ],
+        }
+    return result
+
+
+def reset_route_query_stats() -> None:
+    with _route_lock:
+        _route_stats.clear()
+
+
+def parse_budgets(raw: Any) -> dict[str, int]:
+    """Accept ``{"endpoint": n}`` or the env form ``"endpoint=n,endpoint=n"``."""
+    if isinstance(raw, dict):
+        return {str(key): int(value) for key, value in raw.items()}
+    budgets: dict[str, int] = {}
+    for item in str(raw or "").split(","):
+        endpoint, sep, value = item.partition("=")
+        if sep and endpoint.strip() and value.strip().isdigit():
+            budgets[endpoint.strip()] = int(value)
+    return budgets
+
+
+def _budget_for(app: Flask, endpoint: str) -> Optional[int]:
+    budgets = parse_budgets(app.config.get("QUERY_BUDGETS"))
+    if endpoint in budgets:
+        return budgets[endpoint]
+    return int(app.config.get("QUERY_BUDGET_DEFAULT") or 0) or None
+
+
+def register_query_stats(app: Flask) -> None:
+    """Open a :class:`QueryStats` per request and report it on the response."""
+    if not app.config.get("QUERY_STATS_ENABLED", True):
+        return
+    _install_listeners()
+
+    def _start_query_stats():
+        g.query_stats = QueryStats()
+        g.query_stats_token = _current.set(g.query_stats)
+        g.query_stats_started = time.perf_counter()
+
+    # Run ahead of the auth/session hooks so their user lookups are counted too.
+    app.before_request_funcs.setdefault(None, []).insert(0, _start_query_stats)
+
+    @app.after_request
+    def _report_query_stats(response):
+        stats: Optional[QueryStats] = g.pop("query_stats", None)
+        token = g.pop("query_stats_token", None)
+        if token is not None:
+            try:
+                _current.reset(token)
+            except ValueError:
+                _current.set(None)
+        if stats is None:
+            return response
+
+        config = current_app.config
+        endpoint = request.endpoint or "unknown"
+        threshold = int(config.get("QUERY_NPLUSONE_THRESHOLD") or _DEFAULT_NPLUSONE_THRESHOLD)
+        repeated = stats.repeated(threshold)
+        _fold_route(endpoint, stats, repeated)
+        if repeated:
+            fp, count = repeated[0]
+            current_app.logger.warning(
+                "Possible N+1 on %s: %s statements, %sx %s",
+                endpoint,
+                stats.count,
+                count,
+                fp[:200],
+            )
+
+        if config.get("SERVER_TIMING_ENABLED", True):
+            elapsed_ms = (time.perf_counter() - g.pop("query_stats_started", time.perf_counter())) * 1000
+            timing = f'db;dur={stats.total_seconds * 1000:.1f};desc="{stats.count} queries", app;dur={elapsed_ms:.1f}'
+            existing = response.headers.get("Server-Timing")
+            response.headers["Server-Timing"] = f"{existing}, {timing}" if existing else timing
+
+        budget = _budget_for(current_app, endpoint)
+        if budget is not None and stats.count > budget:
+            message = f"{endpoint} issued {stats.count} queries (budget {budget})"
+            if config.get("QUERY_BUDGET_STRICT"):
+                raise QueryBudgetExceeded(message)
+            current_app.logger.warning("Query budget exceeded: %s", message)
+        return response
+
+    @app.teardown_request
+    def _clear_query_stats(exc=None):
+        token = g.pop("query_stats_token", None)
+        g.pop("query_stats", None)
+        if token is not None:
+            try:
+                _current.reset(token)
+            except ValueError:
+                _current.set(None)
@@ -241,6 +241,12 @@ def _ensure_card_metadata_columns() -> None:
         missing.append(("color_identity", "VARCHAR(8)"))
     if "color_identity_mask" not in columns:
         missing.append(("color_identity_mask", "INTEGER"))
+    if "unit_price" not in columns:
+        missing.append(("unit_price", "FLOAT"))
+    if "price_currency" not in columns:
+        missing.append(("price_currency", "VARCHAR(4)"))
+    if "price_updated_at" not in columns:
+        missing.append(("price_updated_at", "TIMESTAMP"))
 
     if not missing:
         return
@@ -0,0 +1,175 @@
+"""Dialect-aware text search predicates (Postgres counterpart of ``fts``).
+
+SQLite searches use the FTS5 tables from :mod:`shared.database.fts`. On
+Postgres, migration ``0041_pg_search_indexes`` adds ``pg_trgm`` GIN indexes
+on card names/type lines and the role/keyword tag columns, plus a generated
+``game_sessions.notes_tsv`` column with a GIN index.
+
+Trigram indexes serve ``column ILIKE '%...%'`` directly, but only when the
+bare column is compared: ``lower(column) ILIKE ...`` never uses them.
+:func:`ilike_any` is the index-friendly form of the substring/word-start
+matches used by the card browsers (SQLAlchemy still renders ``lower() LIKE``
+on SQLite, so results are unchanged there).
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any, Iterable, Optional
+
+from sqlalchemy import inspect, or_, text
+from sqlalchemy.sql.elements import ColumnElement
+
+from extensions import db
+
+NOTES_TSV_COLUMN = "notes_tsv"
+# Must match the expression in migration 0041_pg_search_indexes.
+NOTES_TS_CONFIG = "simple"
+_notes_tsv_available: dict[str, bool] = {}
+
+
+def dialect_name() -> str:
+    return db.engine.dialect.name
+
+
+def ilike_any(column, patterns: Iterable[str]) -> ColumnElement:
+    """``column ILIKE p1 OR column ILIKE p2 ...`` without wrapping the column."""
+    return or_(*[column.ilike(pattern) for pattern in patterns])
+
+
+def notes_tsvector_available() -> bool:
+    """True on Postgres once ``game_sessions.notes_tsv`` exists (memoized per engine)."""
+    if dialect_name() != "postgresql":
+        return False
+    key = str(db.engine.url)
+    if key not in _notes_tsv_available:
+        try:
+            columns = {col["name"] for col in inspect(db.engine).get_columns("game_sessions")}
+        except Exception:
+            return False
+        _notes_tsv_available[key] = NOTES_TSV_COLUMN in columns
+    return _notes_tsv_available[key]
+
+
+def notes_match(q: str) -> Optional[ColumnElement]:
+    """Postgres full-text predicate for game notes, or None when unavailable.
+
+    ``plainto_tsquery`` ANDs the words of ``q`` like an FTS5 ``MATCH`` on plain
+    words does on SQLite.
+    """
+    if not q or not notes_tsvector_available():
+        return None
+    return text(
+        f"game_sessions.{NOTES_TSV_COLUMN} @@ plainto_tsquery('{NOTES_TS_CONFIG}', :notes_query)"
+    ).bindparams(notes_query=q)
+
+
+_BENCH_WORDS = (
+    "Lightning", "Bolt", "Serra", "Angel", "Llanowar", "Elves", "Counterspell", "Dark", "Ritual",
+    "Sol", "Ring", "Wrath", "God", "Shivan", "Dragon", "Birds", "Paradise", "Swords", "Plowshares",
+    "Goblin", "Guide", "Path", "Exile", "Brainstorm", "Ponder", "Tarmogoyf", "Thoughtseize", "Snapcaster",
+    "Mage", "Primeval", "Titan", "Craterhoof", "Behemoth", "Rhystic", "Study", "Smothering", "Tithe",
+)
+_BENCH_TYPES = (
+    "Creature — Human Wizard", "Creature — Elf Druid", "Creature — Dragon", "Instant", "Sorcery",
+    "Artifact", "Enchantment — Aura", "Legendary Creature — Angel", "Land — Forest", "Planeswalker — Jace",
+)
+
+
+def benchmark_search(*, cards: int = 200_000, notes: int = 50_000, rounds: int = 5) -> dict[str, Any]:
+    """Time card/notes search with and without the Postgres search indexes.
+
+    Seeds ``cards`` synthetic card rows and ``notes`` game notes into
+    temporary tables (dropped with the session), times the browser-style
+    ``ILIKE`` queries and the notes search before and after building the same
+    indexes migration 0041 creates, and returns average milliseconds.
+    """
+    if dialect_name() != "postgresql":
+        raise RuntimeError("benchmark_search needs a PostgreSQL database (pg_trgm).")
+    rounds = max(1, int(rounds))
+    words = "ARRAY[" + ",".join(f"'{w}'" for w in _BENCH_WORDS) + "]"
+    types = "ARRAY[" + ",".join(f"'{t}'" for t in _BENCH_TYPES) + "]"
+    conn = db.session.connection()
+    conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    conn.execute(text("DROP TABLE IF EXISTS bench_cards; DROP TABLE IF EXISTS bench_notes"))
+    conn.execute(text("CREATE TEMP TABLE bench_cards (id serial PRIMARY KEY, name text, type_line text)"))
+    conn.execute(text(
+        f"""
+        INSERT INTO bench_cards (name, type_line)
+        SELECT ({words})[1 + (g * 7) % {len(_BENCH_WORDS)}] || ' ' || ({words})[1 + (g * 13) % {len(_BENCH_WORDS)}]
+                   || ' ' || g::text,
+               ({types})[1 + g % {len(_BENCH_TYPES)}]
+        FROM generate_series(1, :n) AS g
+        """
+    ), {"n": int(cards)})
+    conn.execute(text(
+        f"""
+        CREATE TEMP TABLE bench_notes (
+            id serial PRIMARY KEY,
+            notes text,
+            notes_tsv tsvector GENERATED ALWAYS AS (to_tsvector('{NOTES_TS_CONFIG}', coalesce(notes, ''))) STORED
+        )
+        """
+    ))
+    conn.execute(text(
+        f"""
+        INSERT INTO bench_notes (notes)
+        SELECT 'Turn ' || (g % 12) || ': ' || ({words})[1 + (g * 5) % {len(_BENCH_WORDS)}]
+                   || ' into ' || ({words})[1 + (g * 11) % {len(_BENCH_WORDS)}] || ' for the win'
+        FROM generate_series(1, :n) AS g
+        """
+    ), {"n": int(notes)})
+    conn.execute(text("ANALYZE bench_cards; ANALYZE bench_notes"))
+
+    queries = {
+        "name_substring": ("SELECT count(*) FROM bench_cards WHERE name ILIKE :p", {"p": "%goyf%"}),
+        "type_word_start": (
+            "SELECT count(*) FROM bench_cards WHERE type_line ILIKE :a OR type_line ILIKE :b",
+            {"a": "druid%", "b": "% druid%"},
+        ),
+        "notes_ilike": ("SELECT count(*) FROM bench_notes WHERE notes ILIKE :p", {"p": "%craterhoof%"}),
+        "notes_tsvector": (
+            f"SELECT count(*) FROM bench_notes WHERE notes_tsv @@ plainto_tsquery('{NOTES_TS_CONFIG}', :q)",
+            {"q": "craterhoof"},
+        ),
+    }
+
+    def _run() -> dict[str, dict[str, Any]]:
+        out = {}
+        for label, (sql, params) in queries.items():
+            statement = text(sql)
+            rows = 0
+            started = time.perf_counter()
+            for _ in range(rounds):
+                rows = conn.execute(statement, params).scalar() or 0
+            out[label] = {"ms": round((time.perf_counter() - started) * 1000 / rounds, 3), "rows": rows}
+        return out
+
+    try:
+        before = _run()
+        conn.execute(text("CREATE INDEX ON bench_cards USING gin (name gin_trgm_ops)"))
+        conn.execute(text("CREATE INDEX ON bench_cards USING gin (type_line gin_trgm_ops)"))
+        conn.execute(text("CREATE INDEX ON bench_notes USING gin (notes_tsv)"))
+        conn.execute(text("ANALYZE bench_cards; ANALYZE bench_notes"))
+        after = _run()
+    finally:
+        conn.execute(text("DROP TABLE IF EXISTS bench_cards; DROP TABLE IF EXISTS bench_notes"))
+        db.session.commit()
+
+    return {
+        "cards": int(cards),
+        "notes": int(notes),
+        "rounds": rounds,
+        "unindexed": before,
+        "indexed": after,
+    }
+
+
+__all__ = [
+    "NOTES_TSV_COLUMN",
+    "benchmark_search",
+    "dialect_name",
+    "ilike_any",
+    "notes_match",
+    "notes_tsvector_available",
+]
@@ -13,6 +13,7 @@ from flask import current_app, has_app_context
 from blinker import Signal
 
 from core.shared.utils.time import utcnow
+from shared.histograms import observe_job_event
 _import_signal = Signal("import-events")
 _RECENT_EVENT_LIMIT = 50
 _REDIS_EVENT_TTL_SECONDS = int(os.getenv("JOB_EVENT_TTL_SECONDS", "7200"))
@@ -145,6 +146,7 @@ def emit_job_event(scope: str, event_type: str, **payload) -> None:
     """Publish a job-related event (import, scryfall, etc.) to all subscribers."""
     event = {"scope": scope, "type": event_type, **payload}
     event["recorded_at"] = utcnow().isoformat() + "Z"
+    observe_job_event(scope, event_type, payload.get("job_id"))
     _store_recent_event(event)
     _import_signal.send("imports", event=event)
 
@@ -0,0 +1,325 @@
+"""Fixed-bucket latency histograms shared across worker processes.
+
+Each process accumulates bucket counts in memory (one lock, no I/O on the
+request path) and every ``METRICS_FLUSH_INTERVAL`` seconds writes its
+cumulative totals to ``<metrics dir>/<host>-<pid>.json`` with an atomic
+replace. Readers merge every file in the directory, so a scrape served by
+any gunicorn worker — or a ``flask`` command — sees fleet-wide totals,
+including RQ job processes that share the instance volume. This is the same
+layout prometheus_client uses in multiprocess mode, without the dependency.
+
+Files left behind by recycled workers (``--max-requests``) are folded into
+``archive.json`` once they have been idle for ``METRICS_STALE_SECONDS`` so
+counters stay monotonic while the directory stays small. A process whose
+file was archived starts its next file from the unflushed delta only.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import threading
+import time
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+try:  # pragma: no cover - POSIX only
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None  # type: ignore
+
+# Upper bounds in seconds; spans sub-10ms cache hits up to half-hour bulk jobs.
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0, 900.0, 1800.0,
+)
+
+REQUEST_FAMILY = "dragonsvault_http_request_duration_seconds"
+TIMER_FAMILY = "dragonsvault_function_duration_seconds"
+JOB_FAMILY = "dragonsvault_job_duration_seconds"
+
+_FAMILY_HELP = {
+    REQUEST_FAMILY: "HTTP request latency by endpoint.",
+    TIMER_FAMILY: "Duration of functions wrapped with track_time.",
+    JOB_FAMILY: "Background and inline job duration from start to completion.",
+}
+
+FLUSH_INTERVAL = float(os.getenv("METRICS_FLUSH_INTERVAL", "5"))
+STALE_SECONDS = float(os.getenv("METRICS_STALE_SECONDS", "3600"))
+_ARCHIVE_NAME = "archive.json"
+_JOB_START_LIMIT = 1024
+
+SeriesKey = tuple[str, tuple[tuple[str, str], ...]]
+
+_lock = threading.Lock()
+_series: dict[SeriesKey, list] = {}  # key -> [bucket counts..., +Inf count, sum]
+_flushed: dict[SeriesKey, list] = {}
+_dirty = False
+_last_flush = 0.0
+_wrote_file = False
+_store_dir: Optional[Path] = None
+_job_starts: dict[tuple[str, str], float] = {}
+
+
+def configure(app) -> None:
+    """Point the store at ``METRICS_DIR`` (default ``<instance>/metrics``)."""
+    global _store_dir
+    configured = app.config.get("METRICS_DIR") or os.getenv("METRICS_DIR")
+    _store_dir = Path(configured) if configured else Path(app.instance_path) / "metrics"
+
+
+def _directory() -> Path:
+    if _store_dir is not None:
+        return _store_dir
+    from config import INSTANCE_DIR
+
+    return Path(os.getenv("METRICS_DIR") or INSTANCE_DIR / "metrics")
+
+
+def _own_file(directory: Path) -> Path:
+    return directory / f"{socket.gethostname()}-{os.getpid()}.json"
+
+
+def _empty() -> list:
+    return [0] * (len(DEFAULT_BUCKETS) + 1) + [0.0]
+
+
+def observe(family: str, seconds: float, **labels: Any) -> None:
+    """Record one duration in ``family`` under ``labels``."""
+    global _dirty
+    key: SeriesKey = (family, tuple(sorted((name, str(value)) for name, value in labels.items())))
+    index = len(DEFAULT_BUCKETS)
+    for position, bound in enumerate(DEFAULT_BUCKETS):
+        if seconds <= bound:
+            index = position
+            break
+    with _lock:
+        series = _series.get(key)
+        if series is None:
+            series = _series[key] = _empty()
+        series[index] += 1
+        series[-1] += seconds
+        _dirty = True
+    if time.monotonic() - _last_flush >= FLUSH_INTERVAL:
+        flush()
+
+
+def observe_job_event(scope: str, event_type: str, job_id: Optional[str]) -> None:
+    """Turn ``emit_job_event`` lifecycle events into job duration samples."""
+    if not scope or not job_id:
+        return
+    key = (scope, str(job_id))
+    now = time.perf_counter()
+    if event_type == "started" or (event_type == "queued" and key not in _job_starts):
+        if len(_job_starts) >= _JOB_START_LIMIT:
+            _job_starts.pop(next(iter(_job_starts)))
+        _job_starts[key] = now
+    elif event_type in {"completed", "failed"}:
+        started = _job_starts.pop(key, None)
+        if started is not None:
+            observe(JOB_FAMILY, now - started, job=scope, outcome=event_type)
+            # RQ forks a child per job and exits without atexit hooks.
+            flush(force=True)
+
+
+def _encode(series: dict[SeriesKey, list]) -> list[dict[str, Any]]:
+    return [
+        {"family": family, "labels": dict(labels), "counts": values[:-1], "sum": values[-1]}
+        for (family, labels), values in series.items()
+    ]
+
+
+def _merge_into(target: dict[SeriesKey, list], rows: Iterable[dict[str, Any]]) -> None:
+    for row in rows:
+        counts = row.get("counts") or []
+        if len(counts) != len(DEFAULT_BUCKETS) + 1:
+            continue  # written with a different bucket layout
+        key: SeriesKey = (row["family"], tuple(sorted((k, str(v)) for k, v in (row.get("labels") or {}).items())))
+        series = target.get(key)
+        if series is None:
+            series = target[key] = _empty()
+        for position, value in enumerate(counts):
+            series[position] += int(value)
+        series[-1] += float(row.get("sum") or 0.0)
+
+
+def _read(path: Path) -> list[dict[str, Any]]:
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return []
+    return payload.get("series", []) if isinstance(payload, dict) else []
+
+
+def _write(path: Path, series: dict[SeriesKey, list]) -> None:
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_text(json.dumps({"pid": os.getpid(), "series": _encode(series)}), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def flush(*, force: bool = False) -> None:
+    """Write this process's cumulative totals if they changed."""
+    global _dirty, _last_flush, _wrote_file, _series, _flushed
+    if not force and time.monotonic() - _last_flush < FLUSH_INTERVAL:
+        return
+    directory = _directory()
+    with _lock:
+        _last_flush = time.monotonic()
+        if not _dirty:
+            return
+        path = _own_file(directory)
+        if _wrote_file and not path.exists():
+            # Our earlier totals were archived; keep only what was never written.
+            _series = {
+                key: [current - previous for current, previous in zip(values, _flushed.get(key, _empty()))]
+                for key, values in _series.items()
+            }
+        snapshot = {key: list(values) for key, values in _series.items()}
+        try:
+            directory.mkdir(parents=True, exist_ok=True)
+            _write(path, snapshot)
+        except OSError:
+            return
+        _flushed = snapshot
+        _wrote_file = True
+        _dirty = False
+
+
+def _compact(directory: Path) -> None:
+    """Fold files from long-idle (usually recycled) workers into the archive."""
+    cutoff = time.time() - STALE_SECONDS
+    stale = []
+    for path in directory.glob("*.json"):
+        if path.name == _ARCHIVE_NAME or path == _own_file(directory):
+            continue
+        try:
+            if path.stat().st_mtime < cutoff:
+                stale.append(path)
+        except OSError:
+            continue
+    if not stale or fcntl is None:
+        return
+    with open(directory / ".archive.lock", "w", encoding="utf-8") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        archive: dict[SeriesKey, list] = {}
+        _merge_into(archive, _read(directory / _ARCHIVE_NAME))
+        moved = []
+        for path in stale:
+            if path.exists():
+                _merge_into(archive, _read(path))
+                moved.append(path)
+        _write(directory / _ARCHIVE_NAME, archive)
+        for path in moved:
+            path.unlink(missing_ok=True)
+
+
+def collect() -> dict[SeriesKey, list]:
+    """Merged totals from every process that shares the metrics directory."""
+    flush(force=True)
+    directory = _directory()
+    merged: dict[SeriesKey, list] = {}
+    if not directory.is_dir():
+        with _lock:
+            return {key: list(values) for key, values in _series.items()}
+    try:
+        _compact(directory)
+    except OSError:
+        pass
+    for path in sorted(directory.glob("*.json")):
+        _merge_into(merged, _read(path))
+    return merged
+
+
+def quantile(q: float, counts: list[int]) -> float:
+    """Estimate the ``q`` quantile by linear interpolation inside its bucket."""
+    total = sum(counts)
+    if total <= 0:
+        return 0.0
+    rank = q * total
+    seen = 0
+    lower = 0.0
+    for position, bound in enumerate(DEFAULT_BUCKETS):
+        in_bucket = counts[position]
+        if seen + in_bucket >= rank and in_bucket:
+            return lower + (bound - lower) * ((rank - seen) / in_bucket)
+        seen += in_bucket
+        lower = bound
+    return DEFAULT_BUCKETS[-1]
+
+
+def summary() -> list[dict[str, Any]]:
+    """Count, mean and p50/p95/p99 (seconds) for every series."""
+    rows = []
+    for (family, labels), values in sorted(collect().items()):
+        counts = values[:-1]
+        count = sum(counts)
+        rows.append({
+            "family": family,
+            "labels": dict(labels),
+            "count": count,
+            "avg": values[-1] / count if count else 0.0,
+            "p50": quantile(0.50, counts),
+            "p95": quantile(0.95, counts),
+            "p99": quantile(0.99, counts),
+        })
+    return rows
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace("\"", "\\\"")
+
+
+def _label_text(labels: Iterable[tuple[str, str]], extra: Optional[tuple[str, str]] = None) -> str:
+    pairs = list(labels) + ([extra] if extra else [])
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+def render_prometheus() -> str:
+    """Prometheus text exposition (format 0.0.4) of every histogram."""
+    by_family: dict[str, list[tuple[tuple[tuple[str, str], ...], list]]] = {}
+    for (family, labels), values in sorted(collect().items()):
+        by_family.setdefault(family, []).append((labels, values))
+    lines: list[str] = []
+    for family, series in by_family.items():
+        lines.append(f"# HELP {family} {_FAMILY_HELP.get(family, 'Duration in seconds.')}")
+        lines.append(f"# TYPE {family} histogram")
+        for labels, values in series:
+            cumulative = 0
+            for position, bound in enumerate(DEFAULT_BUCKETS):
+                cumulative += values[position]
+                lines.append(f"{family}_bucket{_label_text(labels, ('le', repr(bound)))} {cumulative}")
+            cumulative += values[len(DEFAULT_BUCKETS)]
+            lines.append(f"{family}_bucket{_label_text(labels, ('le', '+Inf'))} {cumulative}")
+            lines.append(f"{family}_sum{_label_text(labels)} {values[-1]}")
+            lines.append(f"{family}_count{_label_text(labels)} {cumulative}")
+    return "\n".join(lines) + "\n"
+
+
+def reset() -> None:
+    """Drop in-memory series (tests); files on disk are left alone."""
+    global _series, _flushed, _dirty, _wrote_file
+    with _lock:
+        _series = {}
+        _flushed = {}
+        _dirty = False
+        _wrote_file = False
+    _job_starts.clear()
+
+
+__all__ = [
+    "DEFAULT_BUCKETS",
+    "JOB_FAMILY",
+    "REQUEST_FAMILY",
+    "TIMER_FAMILY",
+    "collect",
+    "configure",
+    "flush",
+    "observe",
+    "observe_job_event",
+    "quantile",
+    "render_prometheus",
+    "reset",
+    "summary",
+]
@@ -8,6 +8,8 @@ from typing import Optional
 from sqlalchemy.exc import SQLAlchemyError
 
 from extensions import db
+from models import Folder
+from core.domains.cards.services.card_valuation_service import refresh_card_valuations
 from core.domains.cards.services.csv_importer import process_csv
 from core.domains.cards.services.import_helpers import (
     delete_empty_folders,
@@ -18,6 +20,16 @@ from core.domains.cards.services.import_helpers import (
 _LOG = logging.getLogger(__name__)
 
 
+def _price_imported_rows(owner_user_id: int) -> None:
+    """Value the rows an import just added while we are already off the request path."""
+    folder_ids = [fid for (fid,) in db.session.query(Folder.id).filter(Folder.owner_user_id == owner_user_id)]
+    try:
+        refresh_card_valuations(folder_ids=folder_ids, only_missing=True)
+    except Exception:
+        db.session.rollback()
+        _LOG.warning("Pricing imported cards failed; they will be valued on the next refresh.", exc_info=True)
+
+
 def run_csv_import(
     *,
     filepath: str,
@@ -62,6 +74,9 @@ def run_csv_import(
         _LOG.error("CSV import failed unexpectedly.", exc_info=True)
         raise
 
+    if owner_user_id and (stats.added or stats.updated):
+        _price_imported_rows(owner_user_id)
+
     summary = {
         "job_id": stats.job_id,
         "added": stats.added,
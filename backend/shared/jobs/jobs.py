@@ -37,6 +37,7 @@ from shared.jobs.csv_import_jobs_service import (
     run_csv_import_job as _run_csv_import_job_service,
     start_inline_import_thread as _start_inline_import_thread_service,
 )
+from core.domains.cards.services.card_valuation_service import refresh_card_valuations
 from core.domains.cards.services.scryfall_cache import ensure_cache_loaded
 from core.domains.cards.services import scryfall_cache as sc
 from core.domains.decks.services.spellbook_sync import (
@@ -49,6 +50,8 @@ from shared.jobs.background.edhrec_sync import refresh_edhrec_synergy_cache
 from core.domains.decks.services.commander_brackets import reload_spellbook_combos
 from sqlalchemy import func
 
+from extensions import db
+
 
 def _create_app():
     from app import create_app
@@ -202,6 +205,49 @@ def _cleanup_temp_file(filepath: str, logger) -> None:
     _cleanup_temp_file_service(filepath, logger)
 
 
+def _refresh_card_valuations(log) -> None:
+    """Re-price stored card valuations after the Scryfall prints were reloaded."""
+    try:
+        updated = refresh_card_valuations()
+        log.info("Card valuations refreshed: rows=%s", updated)
+    except Exception as exc:
+        db.session.rollback()
+        log.error("Card valuation refresh failed: %s", exc, exc_info=True)
+
+
+def enqueue_card_valuations(folder_ids: list[int]) -> str:
+    """Queue pricing of never-valued card rows in ``folder_ids`` (see ``ensure_card_valuations``)."""
+    if not _jobs_available:
+        raise RuntimeError("RQ is not installed; unable to queue card valuations.")
+    job_id = uuid.uuid4().hex
+    queue = get_queue()
+    try:
+        queue.enqueue(
+            run_card_valuations_job,
+            list(folder_ids),
+            job_id,
+            job_id=f"card-valuations-{job_id}",
+            description="card-valuations",
+        )
+    except Exception as exc:  # pragma: no cover - depends on redis availability
+        raise RuntimeError(f"Unable to queue card valuations: {exc}") from exc
+    return job_id
+
+
+def run_card_valuations_job(folder_ids: list[int], job_id: str) -> int:
+    app = _create_app()
+    with app.app_context():
+        log = _get_logger()
+        try:
+            updated = refresh_card_valuations(folder_ids=folder_ids, only_missing=True)
+        except Exception:
+            db.session.rollback()
+            log.error("Card valuation job failed: job_id=%s", job_id, exc_info=True)
+            raise
+        log.info("Card valuations priced: job_id=%s rows=%s", job_id, updated)
+        return updated
+
+
 def enqueue_scryfall_refresh(kind: str, *, force_download: bool = False) -> str:
     if not _jobs_available:
         raise RuntimeError("RQ is not installed; unable to queue Scryfall refresh jobs.")
@@ -233,6 +279,7 @@ def run_scryfall_refresh_inline(kind: str, force_download: bool = False) -> dict
         info = _download_bulk_to(kind, force=force_download, job_id=job_id)
         if kind == "default_cards":
             ensure_cache_loaded(force=True)
+            _refresh_card_valuations(log)
         emit_job_event(
             "scryfall",
             "completed",
@@ -266,6 +313,7 @@ def run_scryfall_refresh_job(kind: str, job_id: str, force_download: bool = Fals
             info = _download_bulk_to(kind, force=force_download, job_id=job_id)
             if kind == "default_cards":
                 ensure_cache_loaded(force=True)
+                _refresh_card_valuations(log)
             emit_job_event(
                 "scryfall",
                 "completed",
@@ -521,6 +569,68 @@ def run_edhrec_refresh_inline(*, force_refresh: bool = False, scope: str = "all"
     return result
 
 
+def enqueue_card_image_sync(*, limit: int | None = None) -> str:
+    if not _jobs_available:
+        raise RuntimeError("RQ is not installed; unable to queue card image sync.")
+    job_id = uuid.uuid4().hex
+    queue = get_queue()
+    try:
+        queue.enqueue(
+            run_card_image_sync_job,
+            limit,
+            job_id,
+            job_id=f"card-images-{job_id}",
+            description="card-image-sync",
+        )
+    except Exception as exc:  # pragma: no cover - depends on redis availability
+        raise RuntimeError(f"Unable to queue card image sync: {exc}") from exc
+    emit_job_event("images", "queued", job_id=job_id, dataset="card_images")
+    return job_id
+
+
+def _run_card_image_sync(limit: int | None, job_id: str, log) -> dict:
+    from core.domains.cards.services.card_image_cache import sync_card_images
+
+    info = sync_card_images(limit=limit, log=log)
+    emit_job_event(
+        "images",
+        "completed",
+        job_id=job_id,
+        dataset="card_images",
+        downloaded=info.get("downloaded"),
+        failed=info.get("failed"),
+        remaining=info.get("remaining"),
+    )
+    log.info("Card image sync completed: job_id=%s %s", job_id, info)
+    return info
+
+
+def run_card_image_sync_job(limit: int | None, job_id: str) -> dict:
+    app = _create_app()
+    with app.app_context():
+        job = get_current_job()
+        log = _get_logger()
+        emit_job_event("images", "started", job_id=job_id, dataset="card_images", rq_id=getattr(job, "id", None))
+        try:
+            return _run_card_image_sync(limit, job_id, log)
+        except Exception as exc:
+            log.error("Card image sync failed (job): job_id=%s error=%s", job_id, exc, exc_info=True)
+            emit_job_event("images", "failed", job_id=job_id, dataset="card_images", error=str(exc))
+            raise
+
+
+def run_card_image_sync_inline(*, limit: int | None = None) -> dict:
+    """Download referenced card images synchronously (CLI / scheduler fallback)."""
+    job_id = f"inline-{uuid.uuid4().hex[:8]}"
+    log = _get_logger()
+    emit_job_event("images", "started", job_id=job_id, dataset="card_images", rq_id=None)
+    try:
+        return _run_card_image_sync(limit, job_id, log)
+    except Exception as exc:
+        log.error("Card image sync failed (inline): job_id=%s error=%s", job_id, exc, exc_info=True)
+        emit_job_event("images", "failed", job_id=job_id, dataset="card_images", error=str(exc))
+        raise
+
 def _download_bulk_to(kind: str, force: bool = False, *, job_id: str | None = None) -> dict:
     target = sc.get_bulk_metadata(kind)
     if not target:
@@ -1,4 +1,4 @@
-"""Weekly refresh scheduler for Scryfall, Spellbook, and EDHREC datasets."""
+"""Weekly refresh scheduler for Scryfall, Spellbook, EDHREC datasets and card images."""
 
 from __future__ import annotations
 
@@ -137,6 +137,7 @@ def _run_refreshes(
     refresh_rulings: bool,
     refresh_spellbook: bool,
     refresh_edhrec: bool,
+    refresh_images: bool = False,
 ) -> None:
     use_queue = _queue_enabled(mode)
     if use_queue:
@@ -148,6 +149,8 @@ def _run_refreshes(
             _safe_call("Spellbook", job_service.enqueue_spellbook_refresh, force_download=force_refresh)
         if refresh_edhrec:
             _safe_call("EDHREC", job_service.enqueue_edhrec_refresh, force_refresh=force_refresh, scope=edhrec_scope)
+        if refresh_images:
+            _safe_call("Card images", job_service.enqueue_card_image_sync)
         return
 
     if refresh_scryfall:
@@ -158,6 +161,8 @@ def _run_refreshes(
         _safe_call("Spellbook", job_service.run_spellbook_refresh_inline, force_download=force_refresh)
     if refresh_edhrec:
         _safe_call("EDHREC", job_service.run_edhrec_refresh_inline, force_refresh=force_refresh, scope=edhrec_scope)
+    if refresh_images:
+        _safe_call("Card images", job_service.run_card_image_sync_inline)
 
 
 def _create_app():
@@ -197,6 +202,7 @@ def main() -> None:
     refresh_rulings = _parse_bool(os.getenv("SCHEDULE_REFRESH_SCRYFALL_RULINGS", "1"), True)
     refresh_spellbook = _parse_bool(os.getenv("SCHEDULE_REFRESH_SPELLBOOK", "1"), True)
     refresh_edhrec = _parse_bool(os.getenv("SCHEDULE_REFRESH_EDHREC", "1"), True)
+    refresh_images = _parse_bool(os.getenv("SCHEDULE_REFRESH_CARD_IMAGES", "0"), False)
 
     state_path = Path(os.getenv("SCHEDULE_REFRESH_STATE_FILE", "/app/instance/scheduler_state.json"))
 
@@ -226,6 +232,7 @@ def main() -> None:
                     refresh_rulings=refresh_rulings,
                     refresh_spellbook=refresh_spellbook,
                     refresh_edhrec=refresh_edhrec,
+                    refresh_images=refresh_images,
                 )
             state["last_run_at"] = datetime.now(tz).isoformat()
             _save_state(state_path, state)
@@ -9,6 +9,7 @@ from collections import OrderedDict
 from extensions import cache
 from models import Card
 from core.domains.cards.services import scryfall_cache as sc
+from core.domains.cards.services.card_image_cache import localize_image_url
 from core.domains.cards.services.scryfall_cache import (
     find_by_set_cn,
     prints_for_oracle,
@@ -545,12 +546,12 @@ def _small_thumb_for_print(pr: dict | None) -> str | None:
         return None
     iu = (pr or {}).get("image_uris") or {}
     if iu.get("small"):
-        return iu["small"]
+        return localize_image_url(iu["small"])
     faces = (pr or {}).get("card_faces") or []
     for face in faces:
         face_uris = (face or {}).get("image_uris") or {}
         if face_uris.get("small"):
-            return face_uris["small"]
+            return localize_image_url(face_uris["small"])
     return None
 
 
@@ -559,13 +560,13 @@ def _img_url_for_print(pr, size="normal"):
         return None
     iu = pr.get("image_uris")
     if iu:
-        return iu.get(size) or iu.get("large") or iu.get("png")
+        return localize_image_url(iu.get(size) or iu.get("large") or iu.get("png"))
     faces = pr.get("card_faces") or []
     for face in faces:
         face_uris = face.get("image_uris") or {}
         url = face_uris.get(size) or face_uris.get("large") or face_uris.get("png")
         if url:
-            return url
+            return localize_image_url(url)
     return None
 
 
@@ -3,12 +3,13 @@
 This module provides basic observability features without requiring
 external dependencies like Prometheus or OpenTelemetry initially.
 
-NOTE: metrics live in process memory, so under gunicorn each worker keeps its
-own counters and ``/observability/metrics`` reflects only the worker that
-served the scrape. Responses are labelled ``scope: per-worker`` with the worker
-PID to make this explicit. For fleet-wide aggregation use a multiprocess-aware
-collector (e.g. prometheus_client multiprocess mode) rather than backing this
-hot path with a per-request Redis write.
+NOTE: the count/min/max counters in ``_metrics`` live in process memory, so
+under gunicorn each worker keeps its own and ``/observability/metrics``
+labels them ``scope: per-worker`` with the worker PID. Latency histograms
+(``shared.histograms``) are flushed to a shared directory and merged on
+read, so their percentiles and ``/observability/prometheus`` cover every
+worker and job process rather than backing this hot path with a
+per-request Redis write.
 """
 
 from __future__ import annotations
@@ -19,13 +20,14 @@ import time
 from collections import defaultdict
 from typing import Any, Callable, Optional, TypeVar
 
-from flask import Blueprint, Flask, current_app, g, jsonify, request
+from flask import Blueprint, Flask, Response, current_app, g, jsonify, request
+
+from shared import histograms
 
 F = TypeVar('F', bound=Callable[..., Any])
 
 
 # In-memory metrics storage, per worker process (see module docstring).
-# Replace with a Prometheus/StatsD multiprocess collector for cross-worker totals.
 _metrics: dict[str, dict[str, Any]] = defaultdict(lambda: {
     "count": 0,
     "total_time": 0.0,
@@ -105,6 +107,7 @@ def track_time(metric_name: str) -> Callable[[F], F]:
             finally:
                 duration = time.time() - start
                 track_metric(metric_name, duration, error)
+                histograms.observe(histograms.TIMER_FAMILY, duration, name=metric_name)
         return wrapper  # type: ignore
     return decorator
 
@@ -122,6 +125,7 @@ def track_request_metrics() -> None:
     metric_name = f"request.{endpoint}.{method}"
     error = hasattr(g, 'request_error') and g.request_error
     track_metric(metric_name, duration, error)
+    histograms.observe(histograms.REQUEST_FAMILY, duration, endpoint=endpoint, method=method)
     
     # Track by status code
     status = getattr(g, 'response_status', 200)
@@ -133,7 +137,7 @@ def create_observability_blueprint() -> Blueprint:
     """Create blueprint for observability endpoints.
     
     Returns:
-        Flask Blueprint with /metrics and /stats routes
+        Flask Blueprint with /metrics, /prometheus, /queries, /stats and /health routes
     """
     obs_bp = Blueprint("observability", __name__, url_prefix="/observability")
     
@@ -151,13 +155,34 @@ def create_observability_blueprint() -> Blueprint:
             "scope": "per-worker",
             "worker_pid": os.getpid(),
             "metrics": get_metrics(),
+            "histograms": {
+                "scope": "all-workers",
+                "series": histograms.summary(),
+            },
         })
+
+    @obs_bp.route("/prometheus")
+    def prometheus():
+        """Latency histograms for requests, ``track_time`` and jobs, all workers merged."""
+        return Response(histograms.render_prometheus(), content_type="text/plain; version=0.0.4; charset=utf-8")
     
+    @obs_bp.route("/queries")
+    def queries():
+        """Per-endpoint SQL statement counts, DB time and suspected N+1 fingerprints."""
+        from shared.database.query_stats import get_route_query_stats
+
+        return jsonify({
+            "scope": "per-worker",
+            "worker_pid": os.getpid(),
+            "routes": get_route_query_stats(),
+        })
+
     @obs_bp.route("/stats")
     def stats():
         """Return application statistics."""
         from extensions import db
         from shared.circuit_breaker import get_all_circuit_breaker_stats
+        from shared.database.query_stats import get_route_query_stats
         
         # Database connection pool stats
         pool_stats = {}
@@ -183,6 +208,7 @@ def create_observability_blueprint() -> Blueprint:
             "worker_pid": os.getpid(),
             "database": {
                 "pool": pool_stats,
+                "queries": get_route_query_stats(),
             },
             "circuit_breakers": circuit_breakers,
             "metrics": metrics,
@@ -240,6 +266,8 @@ def register_observability(app: Flask) -> None:
     Args:
         app: Flask application instance
     """
+    histograms.configure(app)
+
     # Register blueprint
     obs_bp = create_observability_blueprint()
     app.register_blueprint(obs_bp)
@@ -261,6 +289,10 @@ def register_observability(app: Flask) -> None:
             g.request_error = True
             track_request_metrics()
 
+    # Per-request statement counts, N+1 detection and Server-Timing
+    from shared.database.query_stats import register_query_stats
+    register_query_stats(app)
+
 
 __all__ = [
     "track_metric",
@@ -0,0 +1,253 @@
+"""Deferred startup warmup and per-component readiness.
+
+``create_app`` used to load the Scryfall cache before the worker could serve
+anything; with a large bulk file on a cold container that outlasted
+gunicorn's worker timeout. :func:`start_warmup` now loads the heavy in-memory
+components in a background thread while the worker already accepts traffic,
+and ``/readyz`` reports each one through :func:`readiness`.
+
+Code that needs a component keeps using its usual entry point
+(``ensure_cache_loaded``, ``get_symbol_src_map``, the rules helpers). Those
+call :func:`wait_for`, which waits up to ``WARMUP_WAIT_SECONDS`` (once per
+request and component) for the warmup thread and otherwise tells the caller to
+degrade instead of loading the same data a second time.
+
+``STARTUP_WARMUP`` selects the mode: ``manual`` (default; the caller runs
+:func:`run_warmup`, or components load lazily on first use), ``background``
+or ``inline`` (load before ``create_app`` returns). Only the web server wants
+a warmup thread, so ``gunicorn.conf.py`` opts in to ``background`` when
+workers are not preloaded (a preloading master warms up before forking); CLI
+commands and RQ jobs build the app too and load just what they use.
+"""
+
+from __future__ import annotations
+
+import importlib
+import logging
+import threading
+import time
+from typing import Any, Callable, Optional
+
+from flask import Flask, current_app, g, has_app_context, has_request_context
+
+PENDING = "pending"
+LOADING = "loading"
+READY = "ready"
+UNAVAILABLE = "unavailable"  # loaded fine, but there is no data (e.g. no bulk file yet)
+FAILED = "failed"
+
+DEFAULT_WAIT_SECONDS = 2.0
+_REQUEST_WAITED_KEY = "_dv_warmup_waited"
+_LOG = logging.getLogger(__name__)
+
+# Read-only per-epoch indexes derived from the Scryfall cache; building them
+# here keeps the first request that needs one from paying for it.
+_SCRYFALL_INDEXES = (
+    ("core.domains.decks.services.legality_service", "_legality_index"),
+    ("core.domains.cards.services.card_autocomplete_service", "_name_index"),
+    ("core.domains.cards.services.list_checker_scryfall_service", "_lookup_index"),
+    ("core.domains.decks.services.proxy_decks", "_resolution_map"),
+    ("core.domains.decks.services.budget_alternatives_service", "_candidate_index"),
+    ("core.domains.decks.services.deck_analytics", "_feature_table"),
+)
+
+
+def _symbols_ready() -> bool:
+    from core.shared.utils.symbols_cache import symbols_loaded
+
+    return symbols_loaded()
+
+
+def _load_symbols() -> bool:
+    from core.shared.utils.symbols_cache import ensure_symbols_cache
+
+    return bool(ensure_symbols_cache())
+
+
+def _spellbook_ready() -> bool:
+    # The combo dataset is loaded when the module is imported.
+    from core.domains.decks.services import commander_spellbook_service as spellbook
+
+    return bool(spellbook.SPELLBOOK_EARLY_COMBOS or spellbook.SPELLBOOK_LATE_COMBOS)
+
+
+def _scryfall_ready() -> bool:
+    from core.domains.cards.services import scryfall_cache as sc
+
+    return sc.cache_ready()
+
+
+def _load_scryfall_cache() -> bool:
+    from core.domains.cards.services import scryfall_cache as sc
+
+    if not sc.ensure_cache_loaded():
+        return False
+    epoch = sc.cache_epoch()
+    for module_name, attr in _SCRYFALL_INDEXES:
+        try:
+            getattr(importlib.import_module(module_name), attr)(epoch)
+        except Exception as exc:
+            _LOG.warning("Building %s.%s failed: %s", module_name, attr, exc)
+    return True
+
+
+def _rules_ready() -> bool:
+    from core.shared.utils.rules_cache import rules_loaded
+
+    return rules_loaded()
+
+
+def _load_rules() -> bool:
+    from core.shared.utils.rules_cache import magic_rules_workbook
+
+    return bool(magic_rules_workbook())
+
+
+# name -> (loader, probe); loaders return False when there is nothing to load.
+COMPONENTS: dict[str, tuple[Callable[[], bool], Callable[[], bool]]] = {
+    "symbols": (_load_symbols, _symbols_ready),
+    "spellbook": (_spellbook_ready, _spellbook_ready),
+    "scryfall_cache": (_load_scryfall_cache, _scryfall_ready),
+    "rules": (_load_rules, _rules_ready),
+}
+
+_lock = threading.Lock()
+_state: dict[str, dict[str, Any]] = {}
+_done: dict[str, threading.Event] = {}
+_loaders: dict[str, threading.Thread] = {}
+
+
+def _set_state(name: str, state: str, *, seconds: Optional[float] = None, error: Optional[str] = None) -> None:
+    entry: dict[str, Any] = {"state": state}
+    if seconds is not None:
+        entry["seconds"] = round(seconds, 3)
+    if error:
+        entry["error"] = error
+    with _lock:
+        _state[name] = entry
+        done = _done.setdefault(name, threading.Event())
+        if state == LOADING:
+            _loaders[name] = threading.current_thread()
+            done.clear()
+        else:
+            _loaders.pop(name, None)
+            done.set()
+
+
+def run_warmup(app: Flask) -> dict[str, float]:
+    """Load every component in this thread; return load times in ms."""
+    timings: dict[str, float] = {}
+    with app.app_context():
+        for name, (loader, probe) in COMPONENTS.items():
+            _set_state(name, LOADING)
+            started = time.perf_counter()
+            try:
+                state = READY if (probe() or loader()) else UNAVAILABLE
+                error = None
+            except Exception as exc:
+                app.logger.warning("Warmup of %s failed: %s", name, exc)
+                state, error = FAILED, str(exc)
+            elapsed = time.perf_counter() - started
+            _set_state(name, state, seconds=elapsed, error=error)
+            timings[name] = round(elapsed * 1000, 1)
+    app.logger.info("Startup warmup finished: %s", timings)
+    return timings
+
+
+def _run_in_background(app: Flask) -> None:
+    try:
+        run_warmup(app)
+    finally:
+        # Never leave a component claimed by a thread that is gone.
+        me = threading.current_thread()
+        with _lock:
+            stale = [name for name, loader in _loaders.items() if loader is me]
+        for name in stale:
+            _set_state(name, FAILED, error="warmup thread exited")
+
+
+def start_warmup(app: Flask) -> Optional[threading.Thread]:
+    """Kick off warmup according to ``STARTUP_WARMUP``; returns the thread, if any."""
+    mode = str(app.config.get("STARTUP_WARMUP") or "manual").strip().lower()
+    if mode == "manual":
+        return None
+    if mode == "inline":
+        run_warmup(app)
+        return None
+    thread = threading.Thread(target=_run_in_background, args=(app,), name="dv-warmup", daemon=True)
+    # Claim every component for the thread up front so early requests wait for
+    # it instead of starting a second load.
+    with _lock:
+        for name in COMPONENTS:
+            _state[name] = {"state": LOADING}
+            _loaders[name] = thread
+            _done.setdefault(name, threading.Event()).clear()
+    thread.start()
+    return thread
+
+
+def _wait_seconds() -> float:
+    if has_app_context():
+        try:
+            return float(current_app.config.get("WARMUP_WAIT_SECONDS", DEFAULT_WAIT_SECONDS))
+        except (TypeError, ValueError):
+            pass
+    return DEFAULT_WAIT_SECONDS
+
+
+def wait_for(name: str, timeout: Optional[float] = None) -> bool:
+    """Wait for the warmup thread to finish loading ``name``.
+
+    Returns True when the caller may go ahead (nothing is loading it, the
+    caller is the loader, or loading finished in time) and False when the
+    warmup thread is still busy; the caller should then degrade.
+    """
+    with _lock:
+        loading = (_state.get(name) or {}).get("state") == LOADING
+        loader = _loaders.get(name)
+        event = _done.get(name)
+    if not loading or event is None or loader is threading.current_thread():
+        return True
+    if timeout is None:
+        timeout = _wait_seconds()
+        if has_request_context():
+            waited = g.setdefault(_REQUEST_WAITED_KEY, set())
+            if name in waited:
+                timeout = 0.0
+            waited.add(name)
+    return event.wait(timeout)
+
+
+def readiness() -> dict[str, dict[str, Any]]:
+    """Per-component state; a component loaded lazily since counts as ready."""
+    with _lock:
+        report = {name: dict(_state.get(name) or {"state": PENDING}) for name in COMPONENTS}
+    for name, (_loader, probe) in COMPONENTS.items():
+        if report[name]["state"] in (READY, LOADING):
+            continue
+        try:
+            if probe():
+                report[name]["state"] = READY
+        except Exception:
+            pass
+    return report
+
+
+def is_warming() -> bool:
+    with _lock:
+        return any(entry.get("state") == LOADING for entry in _state.values())
+
+
+__all__ = [
+    "COMPONENTS",
+    "FAILED",
+    "LOADING",
+    "PENDING",
+    "READY",
+    "UNAVAILABLE",
+    "is_warming",
+    "readiness",
+    "run_warmup",
+    "start_warmup",
+    "wait_for",
+]
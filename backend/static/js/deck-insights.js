@@ -77,6 +77,9 @@
       case "manaBase":
         target.innerHTML = renderManaBase(data);
         break;
+      case "consistency":
+        target.innerHTML = renderConsistency(data);
+        break;
       case "budget":
         target.innerHTML = renderBudget(data);
         break;
@@ -211,6 +214,52 @@
       ${warnings ? `<ul class="list-unstyled mt-3 mb-0">${warnings}</ul>` : ""}`;
   }
 
+  function renderConsistency(report) {
+    const pct = (value) => `${Math.round((value || 0) * 100)}%`;
+    const colors = Object.keys(report.color_sources || {});
+    const head = colors.map((letter) => `<th class="text-end">${escapeHtml(letter)}</th>`).join("");
+    const rows = (report.land_drops || [])
+      .map((row, idx) => {
+        const cells = colors
+          .map((letter) => `<td class="text-end">${pct(report.color_sources[letter][idx])}</td>`)
+          .join("");
+        return `
+          <tr>
+            <td>Turn ${row.turn}</td>
+            <td class="text-end">${pct(row.probability)}</td>
+            <td class="text-end text-muted">${row.average_lands.toFixed(1)}</td>
+            ${cells}
+          </tr>`;
+      })
+      .join("");
+    const mulligans = Object.entries(report.mulligan_rates || {})
+      .map(([count, rate]) => `<span class="badge bg-secondary me-1">${count === "0" ? "Keep 7" : `Mull ${escapeHtml(count)}`}: ${pct(rate)}</span>`)
+      .join("");
+    const params = report.params || {};
+    return `
+      <div class="d-flex flex-wrap gap-3 mb-3">
+        <div class="border rounded p-3">
+          <div class="small text-muted text-uppercase fw-semibold">Keepable 7</div>
+          <div class="h4 mb-0">${pct(report.keepable_7_rate)}</div>
+          <div class="small text-muted">${params.min_lands}–${params.max_lands} lands</div>
+        </div>
+        <div class="border rounded p-3 flex-grow-1">
+          <div class="small text-muted text-uppercase fw-semibold mb-1">London mulligans</div>
+          <div>${mulligans}</div>
+          <div class="small text-muted mt-1">Average kept hand: ${report.average_hand_size} cards</div>
+        </div>
+      </div>
+      <div class="table-responsive">
+        <table class="table table-sm align-middle mb-0">
+          <thead><tr><th></th><th class="text-end">Land drop</th><th class="text-end">Avg lands</th>${head}</tr></thead>
+          <tbody>${rows}</tbody>
+        </table>
+      </div>
+      <div class="small text-muted mt-2">
+        ${escapeHtml(report.library_size)} cards, ${escapeHtml(report.land_count)} lands; ${params.on_play ? "on the play" : "on the draw"} over ${escapeHtml(params.iterations)} simulated games. Color columns count land sources only.
+      </div>`;
+  }
+
   function renderBudget(report) {
     const slots = report.suggestions || [];
     if (!slots.length) {
@@ -0,0 +1,6 @@
+"""Synthetic data and timing harness for the hot-path benchmark suite."""
+
+from .hot_paths import compare_reports, run_hot_paths
+from .synthetic import SyntheticSpec
+
+__all__ = ["SyntheticSpec", "compare_reports", "run_hot_paths"]
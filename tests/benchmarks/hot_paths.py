@@ -0,0 +1,283 @@
+"""Micro- and macro-benchmarks for the request and job hot paths.
+
+:func:`run_hot_paths` seeds a :class:`~tests.benchmarks.synthetic.SyntheticSpec`
+into an empty schema, loads the synthetic catalog as the Scryfall cache and
+times each path over a few rounds: the cache load itself, local card search,
+name resolution, the list checker's Scryfall index and a 100-line list
+lookup, print metadata lookup for a collection, CSV import, the oracle
+enrichment rebuild, commander bracket evaluation and the collection browser
+page (cold and warm). The report is plain JSON; :func:`compare_reports`
+flags results whose median got slower than a saved baseline.
+
+Medians are compared rather than means so one noisy round (GC, disk cache)
+does not fail a run.
+"""
+
+from __future__ import annotations
+
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from extensions import cache, db
+from models import Card, Folder
+from core.domains.cards.services import list_checker_scryfall_service
+from core.domains.cards.services import scryfall_cache as sc
+from core.domains.cards.services.csv_importer import process_csv
+from core.domains.decks.services import commander_brackets as cb
+from core.domains.decks.services.commander_bracket_card_service import BracketCard
+from shared.jobs.background.oracle_recompute import recompute_oracle_enrichment
+from shared.mtg import _normalize_name
+from shared.mtg_prints import _bulk_print_lookup
+
+from .synthetic import SyntheticSpec, build_catalog, seed_collection, write_catalog, write_import_csv
+
+__all__ = [
+    "REPORT_VERSION",
+    "compare_reports",
+    "run_hot_paths",
+]
+
+REPORT_VERSION = 1
+DEFAULT_TOLERANCE = 0.25
+# Differences below this are timer noise, whatever the ratio.
+MIN_REGRESSION_MS = 5.0
+LIST_CHECKER_LINES = 100
+
+_SEARCH_QUERIES = (
+    {"name": "drake"},
+    {"name": "of the"},
+    {"typal": "Elf"},
+    {"base_types": ("Instant",)},
+    {"colors": ("G", "U"), "color_mode": "exact"},
+    {"commander_only": True, "order": "cmc", "direction": "desc"},
+    {"set_code": "b001"},
+)
+
+
+def _timed(
+    fn: Callable[[], Any],
+    rounds: int,
+    *,
+    setup: Optional[Callable[[], Any]] = None,
+    teardown: Optional[Callable[[], Any]] = None,
+) -> tuple[dict[str, Any], Any]:
+    """Run ``fn`` ``rounds`` times; ``setup``/``teardown`` are not timed."""
+    samples = []
+    result = None
+    for _ in range(max(1, int(rounds))):
+        if setup:
+            setup()
+        started = time.perf_counter()
+        result = fn()
+        samples.append((time.perf_counter() - started) * 1000)
+        if teardown:
+            teardown()
+    return {
+        "rounds": len(samples),
+        "median_ms": round(statistics.median(samples), 3),
+        "min_ms": round(min(samples), 3),
+        "max_ms": round(max(samples), 3),
+    }, result
+
+
+def _bracket_decks(limit: int) -> list[list[BracketCard]]:
+    folder_ids = [
+        fid
+        for (fid,) in db.session.query(Folder.id)
+        .filter(Folder.category == Folder.CATEGORY_DECK)
+        .order_by(Folder.id)
+        .limit(limit)
+    ]
+    decks: dict[int, list[BracketCard]] = {fid: [] for fid in folder_ids}
+    rows = (
+        db.session.query(Card.folder_id, Card.name, Card.type_line, Card.oracle_text, Card.mana_value, Card.quantity)
+        .filter(Card.folder_id.in_(folder_ids))
+        .all()
+    )
+    for row in rows:
+        decks[row.folder_id].append(
+            BracketCard(
+                name=row.name,
+                type_line=row.type_line or "",
+                oracle_text=row.oracle_text or "",
+                mana_value=row.mana_value,
+                quantity=row.quantity or 1,
+            )
+        )
+    return list(decks.values())
+
+
+def run_hot_paths(
+    app,
+    spec: SyntheticSpec,
+    *,
+    rounds: int = 3,
+    workdir: Optional[str | Path] = None,
+) -> dict[str, Any]:
+    """Seed ``spec`` into the (empty) app database and time every hot path.
+
+    Leaves the synthetic catalog loaded as the Scryfall cache; callers that
+    keep the process around should reload or clear it.
+    """
+    rounds = max(1, int(rounds))
+    workdir = Path(workdir or tempfile.mkdtemp(prefix="dv-bench-"))
+    setup: dict[str, float] = {}
+    results: dict[str, dict[str, Any]] = {}
+
+    with app.app_context():
+        started = time.perf_counter()
+        catalog = build_catalog(spec)
+        catalog_path = write_catalog(catalog, workdir / "default-cards.json")
+        setup["catalog_seconds"] = round(time.perf_counter() - started, 3)
+
+        started = time.perf_counter()
+        seeded = seed_collection(spec, catalog)
+        csv_path = write_import_csv(spec, catalog, workdir / "import.csv", rows=max(100, spec.owned_cards // 10))
+        setup["seed_seconds"] = round(time.perf_counter() - started, 3)
+        names = [p["name"] for p in catalog[:: max(1, len(catalog) // 2000)]]
+        del catalog
+
+        results["ensure_cache_loaded"], loaded = _timed(
+            lambda: sc.ensure_cache_loaded(str(catalog_path), force=True), rounds
+        )
+        if not loaded:
+            raise RuntimeError(f"Synthetic catalog at {catalog_path} did not load.")
+
+        def _search_all():
+            return [sc.search_local_cards(**query) for query in _SEARCH_QUERIES]
+
+        results["search_local_cards"], _ = _timed(_search_all, rounds)
+        results["search_local_cards"]["queries"] = len(_SEARCH_QUERIES)
+
+        results["unique_oracle_by_name"], resolved = _timed(
+            lambda: sum(1 for name in names if sc.unique_oracle_by_name(name)),
+            rounds,
+            setup=sc.unique_oracle_by_name.cache_clear,
+        )
+        results["unique_oracle_by_name"].update(names=len(names), resolved=resolved)
+
+        # The list checker walks ``sc.get_all_prints()``, which reads the default bulk file.
+        default_path, sc.DEFAULT_PATH = sc.DEFAULT_PATH, str(catalog_path)
+        try:
+            results["list_checker_index"], _ = _timed(
+                lambda: list_checker_scryfall_service._lookup_index(sc.cache_epoch()),
+                rounds,
+                setup=list_checker_scryfall_service._lookup_index.cache_clear,
+            )
+            list_keys = list(dict.fromkeys(_normalize_name(name) for name in names))[:LIST_CHECKER_LINES]
+            results["list_checker_lookup"], maps = _timed(
+                lambda: list_checker_scryfall_service.build_scryfall_lookup_maps(list_keys), rounds
+            )
+        finally:
+            sc.DEFAULT_PATH = default_path
+            list_checker_scryfall_service._lookup_index.cache_clear()
+        results["list_checker_lookup"].update(lines=len(list_keys), resolved=len(maps[0].keys() | maps[1].keys()))
+
+        owned = (
+            Card.query.join(Folder, Folder.id == Card.folder_id)
+            .filter(Folder.owner_user_id == seeded.owner_user_id)
+            .all()
+        )
+        results["bulk_print_lookup"], lookup = _timed(lambda: _bulk_print_lookup(owned), rounds)
+        results["bulk_print_lookup"].update(cards=len(owned), resolved=len(lookup))
+        db.session.expunge_all()
+
+        def _import():
+            stats, _ = process_csv(
+                str(csv_path),
+                owner_user_id=seeded.owner_user_id,
+                owner_username=seeded.username,
+                commit=False,
+            )
+            return stats
+
+        results["process_csv"], stats = _timed(_import, rounds, teardown=db.session.rollback)
+        results["process_csv"].update(rows=stats.total_rows, added=stats.added)
+
+        results["recompute_oracle_enrichment"], summary = _timed(recompute_oracle_enrichment, rounds)
+        results["recompute_oracle_enrichment"]["status"] = (summary or {}).get("status")
+
+        decks = _bracket_decks(50)
+        results["evaluate_commander_bracket"], _ = _timed(
+            lambda: [cb.evaluate_commander_bracket(deck) for deck in decks], rounds
+        )
+        results["evaluate_commander_bracket"]["decks"] = len(decks)
+        db.session.remove()
+
+    client = app.test_client()
+    response = client.post("/login", data={"identifier": seeded.username, "password": seeded.password})
+    if response.status_code >= 400:
+        raise RuntimeError(f"Benchmark login failed with HTTP {response.status_code}.")
+
+    def _browse():
+        page = client.get("/cards")
+        if page.status_code != 200:
+            raise RuntimeError(f"/cards returned HTTP {page.status_code}.")
+        return len(page.data)
+
+    def _clear_caches():
+        with app.app_context():
+            cache.clear()
+
+    results["collection_browser_cold"], size = _timed(_browse, rounds, setup=_clear_caches)
+    results["collection_browser_cold"]["bytes"] = size
+    results["collection_browser_warm"], _ = _timed(_browse, rounds)
+
+    with app.app_context():
+        dialect = db.engine.dialect.name
+    return {
+        "version": REPORT_VERSION,
+        "spec": spec.as_dict(),
+        "rounds": rounds,
+        "environment": {
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "database": dialect,
+        },
+        "seeded": {
+            "card_rows": seeded.card_rows,
+            "decks": len(seeded.deck_folder_ids),
+            "collection_folders": len(seeded.collection_folder_ids),
+            "games": seeded.game_count,
+        },
+        "setup": setup,
+        "results": results,
+    }
+
+
+def compare_reports(
+    current: dict[str, Any],
+    baseline: dict[str, Any],
+    *,
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> list[dict[str, Any]]:
+    """Results whose median exceeds the baseline by more than ``tolerance``.
+
+    Only benchmarks present in both reports are compared, and baselines
+    recorded for a different spec are rejected since their timings are not
+    comparable.
+    """
+    if current.get("spec") != baseline.get("spec"):
+        raise ValueError("Baseline was recorded for a different synthetic spec.")
+    regressions = []
+    for name, result in sorted((current.get("results") or {}).items()):
+        previous = (baseline.get("results") or {}).get(name)
+        if not previous:
+            continue
+        now_ms, then_ms = float(result["median_ms"]), float(previous["median_ms"])
+        if now_ms - then_ms < MIN_REGRESSION_MS or now_ms <= then_ms * (1 + tolerance):
+            continue
+        regressions.append(
+            {
+                "name": name,
+                "baseline_ms": then_ms,
+                "current_ms": now_ms,
+                "ratio": round(now_ms / then_ms, 2) if then_ms else None,
+            }
+        )
+    return regressions
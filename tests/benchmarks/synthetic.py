@@ -0,0 +1,537 @@
+"""Deterministic synthetic Scryfall catalog and collection for benchmarks.
+
+Everything is derived from one seeded ``random.Random``, so the same
+:class:`SyntheticSpec` always yields byte-identical catalogs, collections
+and import files. The prints carry the fields the cache indexes, search,
+enrichment and bracket code read (names, faces, type lines, oracle text,
+legalities, prices, image URIs, produced mana), with realistic skew: a few
+basic lands reprinted everywhere, most oracles printed once or twice.
+
+The collection is bulk-inserted with explicit primary keys, so seeding
+expects an empty schema.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+import random
+import uuid
+from dataclasses import asdict, dataclass, field
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import insert, update
+
+from extensions import db
+from models import (
+    Card,
+    Folder,
+    FolderRole,
+    GameDeck,
+    GamePlayer,
+    GameSeat,
+    GameSeatAssignment,
+    GameSession,
+    User,
+)
+from core.domains.cards.services.scryfall_metadata_service import normalize_color_identity
+
+__all__ = [
+    "SeededCollection",
+    "SyntheticSpec",
+    "build_catalog",
+    "seed_collection",
+    "write_catalog",
+    "write_import_csv",
+]
+
+COLORS = "WUBRG"
+BASICS = (
+    ("Plains", "W"),
+    ("Island", "U"),
+    ("Swamp", "B"),
+    ("Mountain", "R"),
+    ("Forest", "G"),
+)
+SEATS_PER_GAME = 4
+BENCH_PASSWORD = "bench-password"
+
+_ADJECTIVES = (
+    "Ancient", "Blazing", "Crimson", "Dread", "Emerald", "Feral", "Gilded", "Hollow", "Iron", "Jade",
+    "Keen", "Lunar", "Molten", "Nimble", "Obsidian", "Primal", "Quiet", "Radiant", "Savage", "Tidal",
+    "Umbral", "Verdant", "Wicked", "Young", "Zealous", "Arcane", "Brazen", "Cursed", "Dusk", "Ember",
+    "Frost", "Grim", "Hallowed", "Ivory", "Jagged", "Kindled", "Lost", "Mirror", "Noble", "Onyx",
+)
+_NOUNS = (
+    "Angel", "Behemoth", "Cleric", "Drake", "Elemental", "Familiar", "Golem", "Hydra", "Invoker", "Juggernaut",
+    "Knight", "Leviathan", "Mystic", "Nomad", "Oracle", "Phoenix", "Quester", "Revenant", "Sentinel", "Titan",
+    "Unicorn", "Vanguard", "Wurm", "Xenagos", "Yeti", "Zephyr", "Archivist", "Bard", "Colossus", "Dervish",
+    "Envoy", "Fury", "Guardian", "Herald", "Inquisitor", "Jester", "Keeper", "Lancer", "Marauder", "Nightmare",
+    "Outrider", "Pilgrim", "Ranger", "Sphinx", "Tyrant", "Usurper", "Vizier", "Warden", "Wyvern", "Zealot",
+)
+_PLACES = (
+    "the Wastes", "Dominaria", "the Deep", "Ravnica", "the Vale", "Kamigawa", "the Spire", "Zendikar",
+    "the Mire", "Innistrad", "the Forge", "Theros", "the Grove", "Ikoria", "the Sky", "Kaldheim",
+    "the Sands", "Alara", "the Tides",
+)
+_RACES = ("Human", "Elf", "Goblin", "Merfolk", "Zombie", "Vampire", "Dragon", "Angel", "Spirit", "Beast", "Sliver", "Faerie")
+_CLASSES = ("Wizard", "Warrior", "Cleric", "Rogue", "Shaman", "Druid", "Knight", "Soldier", "Advisor", "Scout")
+_KEYWORDS = ("Flying", "Trample", "Haste", "Vigilance", "Deathtouch", "Lifelink", "Menace", "Reach", "Flash", "Ward")
+_SPELL_TEXT = (
+    "Draw two cards.",
+    "Destroy target creature.",
+    "Counter target spell.",
+    "Exile target nonland permanent.",
+    "Search your library for a card, put that card into your hand, then shuffle.",
+    "Search your library for a basic land card, put it onto the battlefield tapped, then shuffle.",
+    "Destroy all creatures. They can't be regenerated.",
+    "Take an extra turn after this one.",
+    "Return target creature card from your graveyard to the battlefield.",
+    "Create two 1/1 white Soldier creature tokens.",
+    "Target player sacrifices a creature.",
+    "Deal 3 damage to any target.",
+    "Each opponent discards a card.",
+    "Scry 2, then draw a card.",
+)
+_PERMANENT_TEXT = (
+    "When this creature enters, draw a card.",
+    "Whenever another creature you control dies, each opponent loses 1 life.",
+    "Creatures you control get +1/+1.",
+    "{T}: Add one mana of any color.",
+    "At the beginning of your upkeep, create a 1/1 green Saproling creature token.",
+    "Whenever you cast a noncreature spell, scry 1.",
+    "Spells your opponents cast cost {1} more to cast.",
+    "{2}, Sacrifice this artifact: Draw a card.",
+    "You may play an additional land on each of your turns.",
+    "Whenever a creature enters under your control, you gain 1 life.",
+)
+_RARITIES = ("common", "common", "common", "uncommon", "uncommon", "rare", "mythic")
+_LANGS = ("en",) * 18 + ("ja", "de")
+
+
+@dataclass(frozen=True, slots=True)
+class SyntheticSpec:
+    """Target sizes for the synthetic data; ``scaled`` shrinks them for smoke runs."""
+
+    prints: int = 100_000
+    owned_cards: int = 50_000
+    decks: int = 500
+    games: int = 10_000
+    seed: int = 20261018
+
+    def scaled(self, factor: float) -> "SyntheticSpec":
+        factor = max(0.0, float(factor))
+        return SyntheticSpec(
+            prints=max(200, int(self.prints * factor)),
+            owned_cards=max(100, int(self.owned_cards * factor)),
+            decks=max(2, int(self.decks * factor)),
+            games=max(4, int(self.games * factor)),
+            seed=self.seed,
+        )
+
+    def as_dict(self) -> dict[str, int]:
+        return asdict(self)
+
+
+@dataclass(slots=True)
+class SeededCollection:
+    owner_user_id: int
+    username: str
+    password: str
+    deck_folder_ids: list[int] = field(default_factory=list)
+    collection_folder_ids: list[int] = field(default_factory=list)
+    card_rows: int = 0
+    game_count: int = 0
+
+
+def _uuid(rng: random.Random) -> str:
+    return str(uuid.UUID(int=rng.getrandbits(128), version=4))
+
+
+def _oracle_name(index: int) -> str:
+    adjective = _ADJECTIVES[index % len(_ADJECTIVES)]
+    rest = index // len(_ADJECTIVES)
+    noun = _NOUNS[rest % len(_NOUNS)]
+    rest //= len(_NOUNS)
+    if not rest:
+        return f"{adjective} {noun}"
+    place = _PLACES[(rest - 1) % len(_PLACES)]
+    # Past every adjective/noun/place combination, repeat with an ordinal.
+    lap = (rest - 1) // len(_PLACES)
+    return f"{adjective} {noun} of {place}" + (f" {lap + 1}" if lap else "")
+
+
+def _mana_cost(rng: random.Random, colors: list[str]) -> tuple[str, float]:
+    cmc = rng.choice((1, 2, 2, 3, 3, 3, 4, 4, 5, 6, 7))
+    pips = [color for color in colors for _ in range(rng.randint(1, 2))][:cmc]
+    generic = cmc - len(pips)
+    cost = (f"{{{generic}}}" if generic else "") + "".join(f"{{{pip}}}" for pip in pips)
+    return cost or "{0}", float(cmc)
+
+
+def _oracle(rng: random.Random, index: int) -> dict[str, Any]:
+    """One oracle's shared fields; basics come first."""
+    if index < len(BASICS):
+        name, color = BASICS[index]
+        return {
+            "oracle_id": _uuid(rng),
+            "name": name,
+            "layout": "normal",
+            "type_line": f"Basic Land — {name}",
+            "mana_cost": "",
+            "cmc": 0.0,
+            "colors": [],
+            "color_identity": [color],
+            "oracle_text": f"({{T}}: Add {{{color}}}.)",
+            "keywords": [],
+            "produced_mana": [color],
+        }
+
+    name = _oracle_name(index - len(BASICS))
+    roll = rng.random()
+    colors = sorted(rng.sample(COLORS, rng.choice((0, 1, 1, 1, 2, 2, 3))), key=COLORS.index)
+    if roll < 0.10:
+        pair = sorted(rng.sample(COLORS, 2), key=COLORS.index)
+        return {
+            "oracle_id": _uuid(rng),
+            "name": f"{name} Grounds",
+            "layout": "normal",
+            "type_line": "Land",
+            "mana_cost": "",
+            "cmc": 0.0,
+            "colors": [],
+            "color_identity": pair,
+            "oracle_text": f"{{T}}: Add {{{pair[0]}}} or {{{pair[1]}}}.",
+            "keywords": [],
+            "produced_mana": pair,
+        }
+
+    cost, cmc = _mana_cost(rng, colors)
+    data: dict[str, Any] = {
+        "oracle_id": _uuid(rng),
+        "name": name,
+        "layout": "normal",
+        "mana_cost": cost,
+        "cmc": cmc,
+        "colors": colors,
+        "color_identity": colors,
+        "keywords": [],
+    }
+    if roll < 0.55:
+        legendary = roll < 0.16
+        keywords = sorted(rng.sample(_KEYWORDS, rng.choice((0, 0, 1, 1, 2))))
+        data.update(
+            type_line=f"{'Legendary ' if legendary else ''}Creature — {rng.choice(_RACES)} {rng.choice(_CLASSES)}",
+            oracle_text="\n".join(keywords + [rng.choice(_PERMANENT_TEXT)]),
+            keywords=keywords,
+            power=str(max(0, int(cmc) + rng.randint(-2, 1))),
+            toughness=str(max(1, int(cmc) + rng.randint(-1, 1))),
+        )
+        if not legendary and rng.random() < 0.06:
+            back = _oracle_name(index + 7919)
+            data["layout"] = "transform"
+            data["card_faces"] = [
+                {"name": name, "mana_cost": cost, "type_line": data["type_line"], "oracle_text": data["oracle_text"]},
+                {"name": back, "mana_cost": "", "type_line": "Creature — Horror", "oracle_text": "Trample"},
+            ]
+            data["name"] = f"{name} // {back}"
+    elif roll < 0.80:
+        data.update(type_line=rng.choice(("Instant", "Sorcery")), oracle_text=rng.choice(_SPELL_TEXT))
+    elif roll < 0.90:
+        text = rng.choice(_PERMANENT_TEXT + ("{T}: Add {C}{C}.",))
+        data.update(type_line="Artifact", oracle_text=text)
+        if "Add" in text:
+            data["produced_mana"] = ["C"] if "{C}" in text else list(COLORS)
+    elif roll < 0.98:
+        data.update(type_line="Enchantment", oracle_text=rng.choice(_PERMANENT_TEXT))
+    else:
+        data.update(
+            type_line=f"Legendary Planeswalker — {rng.choice(_NOUNS)}",
+            oracle_text="+1: Draw a card.\n−3: Destroy target creature.",
+            loyalty=str(rng.randint(3, 5)),
+        )
+    return data
+
+
+def build_catalog(spec: SyntheticSpec) -> list[dict[str, Any]]:
+    """Scryfall ``default_cards``-style prints for ``spec``."""
+    rng = random.Random(spec.seed)
+    oracle_count = max(len(BASICS) + 1, spec.prints // 3)
+    oracles = [_oracle(rng, index) for index in range(oracle_count)]
+
+    # Every oracle is printed once; extra prints favour basics, then a long tail.
+    assignments = list(range(oracle_count))
+    extra = max(0, spec.prints - oracle_count)
+    basic_reprints = min(extra, extra // 10)
+    assignments += [rng.randrange(len(BASICS)) for _ in range(basic_reprints)]
+    assignments += [
+        min(int(rng.paretovariate(1.2)) - 1 + len(BASICS), oracle_count - 1)
+        if rng.random() < 0.3
+        else rng.randrange(len(BASICS), oracle_count)
+        for _ in range(extra - basic_reprints)
+    ]
+
+    set_count = max(4, spec.prints // 250)
+    sets = [
+        {
+            "set": f"b{idx:03d}",
+            "set_name": f"Benchmark Set {idx}",
+            "set_type": "expansion" if idx % 7 else "commander",
+            "released_at": (date(1995, 1, 1) + timedelta(days=idx * 11)).isoformat(),
+        }
+        for idx in range(set_count)
+    ]
+    next_number = [1] * set_count
+
+    prints = []
+    for oracle_index in assignments:
+        oracle = oracles[oracle_index]
+        set_idx = rng.randrange(set_count)
+        collector_number = str(next_number[set_idx])
+        next_number[set_idx] += 1
+        print_id = _uuid(rng)
+        image_base = f"https://cards.scryfall.io/{{size}}/front/{print_id[0]}/{print_id[1]}/{print_id}.jpg"
+        usd = round(rng.lognormvariate(-0.5, 1.3), 2)
+        print_data = {
+            "object": "card",
+            "id": print_id,
+            **oracle,
+            **sets[set_idx],
+            "collector_number": collector_number,
+            "lang": rng.choice(_LANGS),
+            "digital": False,
+            "games": ["paper"],
+            "finishes": ["nonfoil", "foil"],
+            "rarity": "common" if oracle_index < len(BASICS) else rng.choice(_RARITIES),
+            "legalities": {
+                "commander": "banned" if oracle_index % 997 == 13 else "legal",
+                "vintage": "legal",
+                "legacy": "legal",
+            },
+            "prices": {
+                "usd": f"{usd:.2f}",
+                "usd_foil": f"{usd * 2.5:.2f}",
+                "eur": f"{usd * 0.9:.2f}",
+                "tix": None,
+            },
+            "image_uris": {size: image_base.format(size=size) for size in ("small", "normal", "large", "art_crop")},
+            "edhrec_rank": oracle_index + 1,
+        }
+        if "card_faces" in oracle:
+            print_data["card_faces"] = [dict(face) for face in oracle["card_faces"]]
+        prints.append(print_data)
+    return prints
+
+
+def write_catalog(prints: list[dict[str, Any]], path: str | Path) -> Path:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8") as handle:
+        json.dump(prints, handle, separators=(",", ":"))
+    return path
+
+
+def _card_row(print_data: dict[str, Any], *, folder_id: int, quantity: int, is_foil: bool) -> dict[str, Any]:
+    identity, mask = normalize_color_identity(print_data.get("color_identity"))
+    colors, _ = normalize_color_identity(print_data.get("colors"))
+    usd = (print_data.get("prices") or {}).get("usd_foil" if is_foil else "usd")
+    return {
+        "name": print_data["name"],
+        "set_code": print_data["set"],
+        "collector_number": print_data["collector_number"],
+        "folder_id": folder_id,
+        "quantity": quantity,
+        "oracle_id": print_data["oracle_id"],
+        "lang": print_data["lang"],
+        "is_foil": is_foil,
+        "type_line": print_data.get("type_line"),
+        "rarity": print_data.get("rarity"),
+        "oracle_text": print_data.get("oracle_text"),
+        "mana_value": print_data.get("cmc"),
+        "colors": colors,
+        "color_identity": identity,
+        "color_identity_mask": mask,
+        "layout": print_data.get("layout"),
+        "faces_json": print_data.get("card_faces"),
+        "unit_price": float(usd) if usd else None,
+        "price_currency": "usd" if usd else None,
+    }
+
+
+def seed_collection(spec: SyntheticSpec, catalog: list[dict[str, Any]]) -> SeededCollection:
+    """Bulk-insert users, folders, owned cards and logged games for ``spec``.
+
+    Roughly 60% of ``owned_cards`` rows are spread over ``decks`` deck
+    folders (each with a legendary commander), the rest over collection
+    binders of about a thousand rows. Every game has four seats split
+    between the owner and three friends, each playing one of the decks.
+    """
+    rng = random.Random(spec.seed + 1)
+    session = db.session
+
+    users = []
+    for idx, username in enumerate(("bench", "bench-friend-1", "bench-friend-2", "bench-friend-3")):
+        user = User(email=f"{username}@example.com", username=username, display_name=username.title())
+        user.set_password(BENCH_PASSWORD)
+        users.append(user)
+    session.add_all(users)
+    session.flush()
+    owner = users[0]
+
+    deck_rows_each = max(1, int(spec.owned_cards * 0.6) // spec.decks)
+    binder_rows = max(0, spec.owned_cards - deck_rows_each * spec.decks)
+    binder_count = max(1, binder_rows // 1000)
+
+    commanders = [
+        idx for idx, p in enumerate(catalog) if p["type_line"].startswith("Legendary Creature") and p["lang"] == "en"
+    ]
+    folders = []
+    deck_commanders: dict[int, int] = {}
+    for idx in range(spec.decks):
+        # Every fifth deck belongs to a friend, so ownership filters have something to exclude.
+        deck_owner = users[1 + idx % 3] if idx % 5 == 4 else owner
+        commander = catalog[commanders[idx % len(commanders)]] if commanders else None
+        if commander:
+            deck_commanders[idx + 1] = commanders[idx % len(commanders)]
+        folders.append(
+            {
+                "id": idx + 1,
+                "name": f"Bench Deck {idx + 1:03d}",
+                "category": Folder.CATEGORY_DECK,
+                "owner_user_id": deck_owner.id,
+                "owner": deck_owner.username,
+                "commander_oracle_id": commander["oracle_id"] if commander else None,
+                "commander_name": commander["name"] if commander else None,
+            }
+        )
+    for idx in range(binder_count):
+        folders.append(
+            {
+                "id": spec.decks + idx + 1,
+                "name": f"Bench Binder {idx + 1:02d}",
+                "category": Folder.CATEGORY_COLLECTION,
+                "owner_user_id": owner.id,
+                "owner": owner.username,
+            }
+        )
+    session.execute(insert(Folder), folders)
+    session.execute(
+        insert(FolderRole),
+        [
+            {
+                "folder_id": folder["id"],
+                "role": FolderRole.ROLE_DECK if folder["category"] == Folder.CATEGORY_DECK else FolderRole.ROLE_COLLECTION,
+            }
+            for folder in folders
+        ],
+    )
+
+    cards = []
+    for position, folder in enumerate(folders):
+        is_deck = position < spec.decks
+        if is_deck:
+            wanted = deck_rows_each
+        else:
+            binder = position - spec.decks
+            wanted = binder_rows // binder_count + (1 if binder < binder_rows % binder_count else 0)
+        picks = rng.sample(range(len(catalog)), min(wanted, len(catalog)))
+        if folder["id"] in deck_commanders:
+            picks[0] = deck_commanders[folder["id"]]
+        seen = set()
+        for pick in picks:
+            print_data = catalog[pick]
+            is_foil = not is_deck and rng.random() < 0.15
+            key = (print_data["name"], print_data["set"], print_data["collector_number"], print_data["lang"], is_foil)
+            if key in seen:
+                continue
+            seen.add(key)
+            quantity = (rng.randint(5, 20) if print_data["type_line"].startswith("Basic") else 1) if is_deck else rng.choice((1, 1, 1, 2, 4))
+            cards.append(_card_row(print_data, folder_id=folder["id"], quantity=quantity, is_foil=is_foil))
+    session.execute(insert(Card), cards)
+
+    players = [{"id": idx + 1, "user_id": user.id, "display_name": user.username} for idx, user in enumerate(users)]
+    session.execute(insert(GamePlayer), players)
+
+    deck_folders = folders[: spec.decks]
+    started = datetime(2024, 1, 1, 18, 0)
+    sessions, seats, decks, assignments = [], [], [], []
+    for game_idx in range(spec.games):
+        session_id = game_idx + 1
+        played_at = started + timedelta(hours=game_idx * 3 + rng.randint(0, 2))
+        sessions.append(
+            {
+                "id": session_id,
+                "owner_user_id": owner.id,
+                "played_at": played_at,
+                "created_at": played_at,
+                "updated_at": played_at,
+                "notes": f"Turn {rng.randint(4, 14)}: {rng.choice(_NOUNS)} took over" if rng.random() < 0.3 else None,
+                "win_via_combo": rng.random() < 0.1,
+            }
+        )
+        order = rng.sample(range(SEATS_PER_GAME), SEATS_PER_GAME)
+        for seat_idx in range(SEATS_PER_GAME):
+            row_id = game_idx * SEATS_PER_GAME + seat_idx + 1
+            folder = rng.choice(deck_folders)
+            seats.append({"id": row_id, "session_id": session_id, "seat_number": seat_idx + 1, "turn_order": order[seat_idx] + 1})
+            decks.append(
+                {
+                    "id": row_id,
+                    "session_id": session_id,
+                    "folder_id": folder["id"],
+                    "deck_name": folder["name"],
+                    "commander_name": folder.get("commander_name"),
+                    "commander_oracle_id": folder.get("commander_oracle_id"),
+                }
+            )
+            assignments.append(
+                {"id": row_id, "session_id": session_id, "seat_id": row_id, "player_id": players[seat_idx]["id"], "deck_id": row_id}
+            )
+    if sessions:
+        session.execute(insert(GameSession), sessions)
+        session.execute(insert(GameSeat), seats)
+        session.execute(insert(GameDeck), decks)
+        session.execute(insert(GameSeatAssignment), assignments)
+        # Winner is a deterministic seat of each game, set once the seats exist.
+        table = GameSession.__table__
+        session.execute(
+            update(table).values(winner_seat_id=(table.c.id - 1) * SEATS_PER_GAME + 1 + table.c.id % SEATS_PER_GAME)
+        )
+    session.commit()
+
+    return SeededCollection(
+        owner_user_id=owner.id,
+        username=owner.username,
+        password=BENCH_PASSWORD,
+        deck_folder_ids=[folder["id"] for folder in deck_folders],
+        collection_folder_ids=[folder["id"] for folder in folders[spec.decks:]],
+        card_rows=len(cards),
+        game_count=len(sessions),
+    )
+
+
+def write_import_csv(spec: SyntheticSpec, catalog: list[dict[str, Any]], path: str | Path, *, rows: int = 5_000) -> Path:
+    """A collection export-style CSV of ``rows`` catalog prints over a few new folders."""
+    rng = random.Random(spec.seed + 2)
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    picks = rng.sample(range(len(catalog)), min(rows, len(catalog)))
+    with path.open("w", encoding="utf-8", newline="") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(["Folder Name", "Card Name", "Set Code", "Collector Number", "Quantity", "Foil", "Language"])
+        for idx, pick in enumerate(picks):
+            print_data = catalog[pick]
+            writer.writerow(
+                [
+                    f"Bench Import {idx % 10 + 1:02d}",
+                    print_data["name"],
+                    print_data["set"].upper(),
+                    print_data["collector_number"],
+                    rng.choice((1, 1, 2, 4)),
+                    "foil" if rng.random() < 0.1 else "",
+                    print_data["lang"],
+                ]
+            )
+    return path
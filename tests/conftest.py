@@ -56,6 +56,8 @@ os.environ["INSTANCE_DIR"] = str(TEST_INSTANCE_DIR)
 os.environ["DATABASE_URL"] = TEST_DATABASE_URL
 os.environ.setdefault("ENABLE_TALISMAN", "0")
 os.environ.setdefault("DISABLE_BACKGROUND_JOBS", "1")
+os.environ.setdefault("STARTUP_WARMUP", "inline")
+os.environ.setdefault("QUERY_BUDGET_STRICT", "1")
 
 import app as dv_app  # noqa: E402  pylint:disable=wrong-import-position
 
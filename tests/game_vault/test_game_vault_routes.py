@@ -29,11 +29,12 @@ def _fake_deck(**over):
 
 
 def _patch_import(monkeypatch, deck):
-    monkeypatch.setattr(vault_service, "import_from_url", lambda url: deck)
-    monkeypatch.setattr(vault_service, "fetch_deck", lambda source, ref: deck)
+    monkeypatch.setattr(vault_service, "import_from_url", lambda url, **kw: deck)
+    monkeypatch.setattr(vault_service, "fetch_deck", lambda source, ref, **kw: deck)
     monkeypatch.setattr(
         vault_service.scryfall_lookup, "lookup_commander", lambda name: (None, None)
     )
+    monkeypatch.setattr(vault_service.scryfall_lookup, "lookup_commanders", lambda names: {})
 
 
 # --------------------------------------------------------------------------- #
@@ -160,6 +161,45 @@ def test_set_deck_bracket_manual(client, create_user, monkeypatch):
     assert deck["bracket_manual"] is False and deck["bracket"] == 3
 
 
+def test_sync_all_replays_validators_and_counts_results(client, create_user, monkeypatch):
+    from core.domains.game_vault.services.importers import DeckNotModified, Validators
+
+    user, password = create_user(email="gv-syncall@example.com", username="gvsyncall")
+    _login(client, user.email, password)
+    _patch_import(monkeypatch, _fake_deck(validators=Validators(etag='"v1"')))
+    pid = client.post("/game-vault/api/players", json={"name": "Ari"}).get_json()["player"]["id"]
+    for ref in ("42", "43", "44"):
+        monkeypatch.setattr(vault_service, "import_from_url", lambda url, **kw: _fake_deck(
+            source_id=url.rsplit("/", 1)[-1], url=url, validators=Validators(etag='"v1"')))
+        client.post(f"/game-vault/api/players/{pid}/decks", json={"url": f"https://archidekt.com/decks/{ref}"})
+
+    seen = {}
+
+    def fake_import(url, *, validators=None):
+        ref = url.rsplit("/", 1)[-1]
+        seen[ref] = validators
+        if ref == "42":
+            raise DeckNotModified(url)
+        if ref == "43":
+            raise vault_service.DeckImportError("Archidekt returned HTTP 500.")
+        return _fake_deck(source_id=ref, url=url, name="Renamed", validators=Validators(etag='"v2"'))
+
+    monkeypatch.setattr(vault_service, "import_from_url", fake_import)
+    result = client.post("/game-vault/api/decks/sync-all").get_json()["result"]
+    assert result == {"synced": 2, "errors": 1, "total": 3}
+    assert {ref: v.etag for ref, v in seen.items()} == {"42": '"v1"', "43": '"v1"', "44": '"v1"'}
+
+    decks = {d["source_id"]: d for d in client.get("/game-vault/api/players").get_json()["players"][0]["decks"]}
+    assert decks["42"]["name"] == "Atraxa Superfriends" and decks["42"]["sync_status"] == "ok"
+    assert decks["43"]["sync_status"] == "error"
+    assert decks["44"]["name"] == "Renamed"
+
+    # A failed deck drops its validators, so the next sync is unconditional.
+    seen.clear()
+    client.post("/game-vault/api/decks/sync-all")
+    assert seen["43"] is None and seen["44"].etag == '"v2"'
+
+
 def test_delete_deck(client, create_user, monkeypatch):
     user, password = create_user(email="gv-deldeck@example.com", username="gvdeldeck")
     _login(client, user.email, password)
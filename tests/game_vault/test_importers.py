@@ -9,15 +9,18 @@ from core.domains.game_vault.services.importers import (
 )
 from core.domains.game_vault.services.importers.base import (
     DeckImportError,
+    DeckNotModified,
+    Validators,
     detect_source,
 )
 
 
 class _Resp:
-    def __init__(self, payload=None, text="", status=200):
+    def __init__(self, payload=None, text="", status=200, headers=None):
         self._payload = payload
         self.text = text
         self.status_code = status
+        self.headers = headers or {}
 
     def json(self):
         if self._payload is None:
@@ -58,6 +61,39 @@ def test_archidekt_fetch(monkeypatch):
     assert deck.card_count == 2  # sol ring + commander
 
 
+def test_archidekt_conditional_fetch(monkeypatch):
+    payload = {"id": 42, "name": "Atraxa", "deckFormat": 3, "edhBracket": 4, "cards": []}
+    sent = []
+
+    def fake_get(url, **kw):
+        sent.append(kw["headers"])
+        if kw["headers"].get("If-None-Match") == '"abc"':
+            return _Resp(status=304)
+        return _Resp(payload=payload, headers={"ETag": '"abc"', "Last-Modified": "Sat, 17 Oct 2026 10:00:00 GMT"})
+
+    monkeypatch.setattr(archidekt, "safe_get", fake_get)
+    deck = archidekt.fetch_deck("42")
+    assert deck.validators == Validators(etag='"abc"', last_modified="Sat, 17 Oct 2026 10:00:00 GMT")
+    assert "If-None-Match" not in sent[0]
+
+    with pytest.raises(DeckNotModified):
+        archidekt.fetch_deck("42", validators=deck.validators)
+    assert sent[-1]["If-Modified-Since"] == "Sat, 17 Oct 2026 10:00:00 GMT"
+
+
+def test_mtggoldfish_unchanged_skips_page_fetch(monkeypatch):
+    urls = []
+
+    def fake_get(url, **kw):
+        urls.append(url)
+        return _Resp(status=304)
+
+    monkeypatch.setattr(mtggoldfish, "safe_get", fake_get)
+    with pytest.raises(DeckNotModified):
+        mtggoldfish.fetch_deck("456", validators=Validators(etag='"x"'))
+    assert urls == ["https://www.mtggoldfish.com/deck/download/456"]
+
+
 def test_archidekt_bad_id():
     with pytest.raises(DeckImportError):
         archidekt.fetch_deck("https://archidekt.com/notadeck")
@@ -0,0 +1,92 @@
+"""Unit tests for Game Vault commander lookup (bulk cache + HTTP mocked)."""
+
+import pytest
+
+from core.domains.cards.services import scryfall_cache as sc
+from core.domains.game_vault.services import scryfall_lookup
+
+
+class _Resp:
+    def __init__(self, payload=None, status=200):
+        self._payload = payload
+        self.status_code = status
+
+    def json(self):
+        return self._payload
+
+
+def _card(name, identity, art):
+    return {"name": name, "color_identity": identity, "image_uris": {"art_crop": art}}
+
+
+@pytest.fixture
+def no_bulk_cache(monkeypatch):
+    monkeypatch.setattr(sc, "ensure_cache_loaded", lambda: False)
+
+
+def test_resolves_from_local_bulk_cache_without_http(app, monkeypatch):
+    prints = (
+        {**_card("Krenko, Mob Boss", ["R"], "https://cards.scryfall.io/digital.jpg"), "digital": True},
+        _card("Krenko, Mob Boss", ["R"], "https://cards.scryfall.io/krenko.jpg"),
+    )
+    monkeypatch.setattr(sc, "ensure_cache_loaded", lambda: True)
+    monkeypatch.setattr(sc, "unique_oracle_by_name", lambda name: "oid-krenko" if "Krenko" in name else None)
+    monkeypatch.setattr(sc, "prints_for_oracle", lambda oid: prints if oid == "oid-krenko" else ())
+
+    def no_http(*args, **kwargs):
+        raise AssertionError("bulk-cache hits must not reach the API")
+
+    monkeypatch.setattr(scryfall_lookup, "safe_post", no_http)
+    with app.app_context():
+        assert scryfall_lookup.lookup_commander("Krenko, Mob Boss") == ("https://cards.scryfall.io/krenko.jpg", "R")
+
+
+def test_batch_falls_back_to_collection_api_and_caches_misses(app, monkeypatch, no_bulk_cache):
+    posts = []
+
+    def fake_post(url, **kwargs):
+        posts.append([i["name"] for i in kwargs["json"]["identifiers"]])
+        return _Resp({
+            "data": [
+                _card("Tymna the Weaver", ["W", "B"], "https://cards.scryfall.io/tymna.jpg"),
+                _card("Thrasios, Triton Hero", ["G", "U"], "https://cards.scryfall.io/thrasios.jpg"),
+            ],
+            "not_found": [{"name": "Not A Real Commander"}],
+        })
+
+    monkeypatch.setattr(scryfall_lookup, "safe_post", fake_post)
+    names = ["Tymna the Weaver // Thrasios, Triton Hero", "Not A Real Commander", "Tymna the Weaver"]
+    with app.app_context():
+        first = scryfall_lookup.lookup_commanders(names)
+        assert first["Tymna the Weaver // Thrasios, Triton Hero"] == ("https://cards.scryfall.io/tymna.jpg", "WUBG")
+        assert first["Not A Real Commander"] == (None, None)
+        assert first["Tymna the Weaver"] == ("https://cards.scryfall.io/tymna.jpg", "WB")
+        assert posts == [["Tymna the Weaver", "Thrasios, Triton Hero", "Not A Real Commander"]]
+
+        # Hits and misses now come from the shared cache.
+        assert scryfall_lookup.lookup_commanders(names) == first
+        assert len(posts) == 1
+
+
+def test_transient_api_failure_is_not_cached(app, monkeypatch, no_bulk_cache):
+    calls = []
+
+    def flaky_post(url, **kwargs):
+        calls.append(url)
+        return _Resp(status=503)
+
+    monkeypatch.setattr(scryfall_lookup, "safe_post", flaky_post)
+    with app.app_context():
+        assert scryfall_lookup.lookup_commander("Edgar Markov") == (None, None)
+        assert scryfall_lookup.lookup_commander("Edgar Markov") == (None, None)
+    assert len(calls) == 2
+
+
+def test_separator_only_names_resolve_to_nothing(app, monkeypatch, no_bulk_cache):
+    def no_http(*args, **kwargs):
+        raise AssertionError("nothing to look up")
+
+    monkeypatch.setattr(scryfall_lookup, "safe_post", no_http)
+    with app.app_context():
+        assert scryfall_lookup.lookup_commanders(["//", " / / "]) == {"//": (None, None), " / / ": (None, None)}
+        assert scryfall_lookup.lookup_commander("//") == (None, None)
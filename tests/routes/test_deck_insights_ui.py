@@ -128,3 +128,31 @@ def test_legality_api_returns_report(client, create_user):
     assert response.status_code == 200
     payload = response.get_json()
     assert payload["data"]["format"]["key"] == "commander"
+
+
+def test_mana_simulation_api_returns_report(client, create_user):
+    user, password = create_user(email="simulation-owner@example.com")
+    folder = Folder(
+        name="Simulated Deck",
+        category=Folder.CATEGORY_DECK,
+        owner_user_id=user.id,
+    )
+    folder.role_entries = [FolderRole(role=FolderRole.ROLE_DECK)]
+    db.session.add(folder)
+    db.session.commit()
+    land = create_card(folder=folder, name="Forest", set_code="znr", collector_number="269", quantity=38)
+    land.type_line = "Basic Land — Forest"
+    spell = create_card(folder=folder, name="Llanowar Elves", set_code="m19", collector_number="314", quantity=61)
+    spell.type_line = "Creature — Elf Druid"
+    db.session.commit()
+
+    _login(client, user.email, password)
+    response = client.get(f"/api/folders/{folder.id}/mana-simulation?iterations=2000&turns=4&on=draw")
+    assert response.status_code == 200
+    data = response.get_json()["data"]
+    assert data["library_size"] == 99
+    assert data["params"]["on_play"] is False
+    assert [row["turn"] for row in data["land_drops"]] == [1, 2, 3, 4]
+
+    response = client.get(f"/api/folders/{folder.id}/mana-simulation?iterations=lots")
+    assert response.status_code == 400
@@ -1,5 +1,8 @@
+import re
+from datetime import datetime, timedelta
+
 from extensions import db
-from models import Folder, FolderRole, GamePod, GameRosterDeck, GameRosterPlayer, GameSession
+from models import Folder, FolderRole, GameDeck, GamePod, GameRosterDeck, GameRosterPlayer, GameSession
 
 
 def _login(client, identifier, password):
@@ -202,6 +205,65 @@ def test_games_public_dashboard_logs_loads(client):
     assert response.status_code == 200
 
 
+def test_games_public_dashboard_logs_paginate_with_keyset_cursor(client, create_user, app):
+    user, _password = create_user(email="games-public-pages@example.com")
+    with app.app_context():
+        base = datetime(2026, 1, 1, 12, 0)
+        # Two games share played_at so the cursor has to fall back to created_at/id.
+        for idx, played_at in enumerate([base, base, base + timedelta(days=1), base + timedelta(days=2)]):
+            db.session.add(GameSession(owner_user_id=user.id, played_at=played_at, notes=f"Public game {idx}"))
+        db.session.commit()
+    app.config["PUBLIC_GAME_DASHBOARD_OWNER_ID"] = str(user.id)
+    app.config["PUBLIC_GAMES_PAGE_SIZE"] = 3
+    try:
+        first = client.get("/gamedashboard?metric=logs")
+        assert first.status_code == 200
+        body = first.get_data(as_text=True)
+        assert set(re.findall(r"Public game \d", body)) == {"Public game 1", "Public game 2", "Public game 3"}
+        cursor = re.search(r'cursor=([A-Za-z0-9_-]+)', body).group(1)
+
+        second = client.get(f"/gamedashboard?metric=logs&cursor={cursor}")
+        page = second.get_data(as_text=True)
+        assert set(re.findall(r"Public game \d", page)) == {"Public game 0"}
+        assert "Older games" not in page
+    finally:
+        app.config["PUBLIC_GAME_DASHBOARD_OWNER_ID"] = None
+        app.config["PUBLIC_GAMES_PAGE_SIZE"] = 50
+
+
+def test_games_public_dashboard_logs_revalidate_with_etag(client, create_user, app):
+    user, _password = create_user(email="games-public-etag@example.com")
+    game_id = _create_game_session(app, user.id, notes="Cached public game")
+    app.config["PUBLIC_GAME_DASHBOARD_OWNER_ID"] = str(user.id)
+    try:
+        # The first response also issues the visitor's CSRF token, which is part of the validator.
+        client.get("/gamedashboard?metric=logs")
+        first = client.get("/gamedashboard?metric=logs")
+        assert first.status_code == 200
+        etag = first.headers["ETag"]
+        assert "no-cache" in first.headers["Cache-Control"]
+
+        repeat = client.get("/gamedashboard?metric=logs", headers={"If-None-Match": etag})
+        assert repeat.status_code == 304
+        assert repeat.headers["ETag"] == etag
+
+        with app.app_context():
+            db.session.get(GameSession, game_id).notes = "Edited public game"
+            db.session.commit()
+        changed = client.get("/gamedashboard?metric=logs", headers={"If-None-Match": etag})
+        assert changed.status_code == 200
+        assert "Edited public game" in changed.get_data(as_text=True)
+
+        # Child rows (decks, seats, players) bump the parent session's updated_at.
+        with app.app_context():
+            before = db.session.get(GameSession, game_id).updated_at
+            db.session.add(GameDeck(session_id=game_id, deck_name="Public deck"))
+            db.session.commit()
+            assert db.session.get(GameSession, game_id).updated_at > before
+    finally:
+        app.config["PUBLIC_GAME_DASHBOARD_OWNER_ID"] = None
+
+
 def test_games_new_form_loads(client, create_user):
     user, password = create_user(email="games-new@example.com")
     _login(client, user.email, password)
@@ -33,3 +33,26 @@ def test_configure_request_logging_sets_stream_and_file_handlers(tmp_path):
     assert isinstance(app.logger.handlers[0].formatter, app_runtime.JsonRequestFormatter)
     assert isinstance(app.logger.handlers[1].formatter, app_runtime.JsonRequestFormatter)
     assert (Path(app.instance_path) / "logs" / "app.log").exists()
+
+
+def test_freeze_for_fork_moves_objects_to_permanent_generation():
+    import gc
+
+    try:
+        assert app_runtime.freeze_for_fork() > 0
+        assert gc.get_freeze_count() > 0
+    finally:
+        gc.unfreeze()
+
+
+def test_reinitialize_after_fork_drops_inherited_state(app):
+    from shared import histograms
+    from shared.events import live_updates
+
+    live_updates._redis_client = object()
+    histograms.observe(histograms.TIMER_FAMILY, 0.01, name="warmup")
+
+    app_runtime.reinitialize_after_fork(app)
+
+    assert live_updates._redis_client is None
+    assert histograms._series == {}
@@ -8,7 +8,7 @@ import pytest
 
 from core.domains.decks.services import budget_alternatives_service
 from extensions import db
-from models import Folder, User
+from models import Folder, OracleCoreRoleTag, User
 from tests.factories import create_card, create_folder
 
 
@@ -17,6 +17,8 @@ def freeze_prices(monkeypatch):
     monkeypatch.setattr(budget_alternatives_service.sc, "cache_ready", lambda: True)
     monkeypatch.setattr(budget_alternatives_service.sc, "ensure_cache_loaded", lambda: True)
     monkeypatch.setattr(budget_alternatives_service.sc, "get_all_prints", lambda: {})
+    monkeypatch.setattr(budget_alternatives_service.sc, "cache_epoch", lambda: 0)
+    budget_alternatives_service._candidate_index.cache_clear()
     registry: dict[str, dict] = {}
 
     def lookup(set_code, collector_number, name, oracle_id=None):  # noqa: ARG001
@@ -129,3 +131,181 @@ def test_find_budget_alternatives_rejects_invalid_threshold(app, db_session, fre
             budget_alternatives_service.find_budget_alternatives(
                 user_id=user.id, folder=deck, threshold_usd=0
             )
+
+
+def _catalog_print(name, oracle_id, *, price_usd, type_line="Creature — Elf", color_identity=("G",)):
+    return {
+        "name": name,
+        "oracle_id": oracle_id,
+        "type_line": type_line,
+        "color_identity": list(color_identity),
+        "prices": {"usd": str(price_usd)},
+    }
+
+
+def _green_deck(registry):
+    user = _create_user()
+    deck = create_folder(name="Elves")
+    deck.owner_user_id = user.id
+    craterhoof = create_card(
+        folder=deck,
+        name="Craterhoof Behemoth",
+        set_code="avr",
+        collector_number="172",
+        oracle_id="oracle-hoof",
+    )
+    craterhoof.type_line = "Creature — Beast"
+    craterhoof.color_identity = "G"
+    _register(registry, craterhoof, price_usd="40.00", color_identity=("G",))
+    db.session.commit()
+    return user, deck
+
+
+def test_cache_alternatives_are_cheapest_within_deck_identity(
+    app, db_session, freeze_prices, monkeypatch
+):
+    catalog = [
+        _catalog_print("Llanowar Elves", "oracle-llanowar", price_usd="0.50"),
+        _catalog_print("Llanowar Elves", "oracle-llanowar", price_usd="0.25"),
+        _catalog_print("Ornithopter", "oracle-thopter", price_usd="0.10", type_line="Artifact Creature — Thopter", color_identity=()),
+        _catalog_print("Snapcaster Mage", "oracle-snap", price_usd="0.05", color_identity=("U",)),
+        _catalog_print("Elvish Mystic", "oracle-mystic", price_usd="0.30"),
+        _catalog_print("Avenger of Zendikar", "oracle-avenger", price_usd="12.00"),
+        _catalog_print("Giant Growth", "oracle-growth", price_usd="0.01", type_line="Instant"),
+    ]
+    monkeypatch.setattr(budget_alternatives_service.sc, "get_all_prints", lambda: catalog)
+    with app.app_context():
+        user, deck = _green_deck(freeze_prices)
+        report = budget_alternatives_service.find_budget_alternatives(
+            user_id=user.id, folder=deck, threshold_usd=Decimal("10"), suggestions_per_card=5
+        )
+
+    alternatives = report.suggestions[0].alternatives
+    assert [alt.name for alt in alternatives] == ["Ornithopter", "Llanowar Elves", "Elvish Mystic"]
+    assert alternatives[1].price_usd == Decimal("0.25")
+    assert not any(alt.in_user_collection for alt in alternatives)
+
+
+def test_cache_alternatives_prefer_shared_core_roles(app, db_session, freeze_prices, monkeypatch):
+    catalog = [
+        _catalog_print("Llanowar Elves", "oracle-llanowar", price_usd="0.25"),
+        _catalog_print("Pathbreaker Ibex", "oracle-ibex", price_usd="2.00"),
+        _catalog_print("End-Raze Forerunners", "oracle-forerunners", price_usd="1.00"),
+    ]
+    monkeypatch.setattr(budget_alternatives_service.sc, "get_all_prints", lambda: catalog)
+    with app.app_context():
+        user, deck = _green_deck(freeze_prices)
+        db.session.add_all(
+            [
+                OracleCoreRoleTag(oracle_id="oracle-hoof", role="finisher"),
+                OracleCoreRoleTag(oracle_id="oracle-hoof", role="overrun"),
+                OracleCoreRoleTag(oracle_id="oracle-ibex", role="finisher"),
+                OracleCoreRoleTag(oracle_id="oracle-ibex", role="overrun"),
+                OracleCoreRoleTag(oracle_id="oracle-forerunners", role="overrun"),
+            ]
+        )
+        db.session.commit()
+        ranked = budget_alternatives_service.find_budget_alternatives(
+            user_id=user.id, folder=deck, threshold_usd=Decimal("10")
+        )
+        by_price = budget_alternatives_service.find_budget_alternatives(
+            user_id=user.id, folder=deck, threshold_usd=Decimal("10"), rank_by_roles=False
+        )
+
+    assert [alt.name for alt in ranked.suggestions[0].alternatives] == [
+        "Pathbreaker Ibex",
+        "End-Raze Forerunners",
+        "Llanowar Elves",
+    ]
+    assert [alt.name for alt in by_price.suggestions[0].alternatives] == [
+        "Llanowar Elves",
+        "End-Raze Forerunners",
+        "Pathbreaker Ibex",
+    ]
+
+
+def test_candidate_index_is_built_once_per_epoch(monkeypatch):
+    calls = []
+
+    def prints():
+        calls.append(1)
+        return [_catalog_print("Llanowar Elves", "oracle-llanowar", price_usd="0.25")]
+
+    monkeypatch.setattr(budget_alternatives_service.sc, "cache_ready", lambda: True)
+    monkeypatch.setattr(budget_alternatives_service.sc, "get_all_prints", prints)
+    budget_alternatives_service._candidate_index.cache_clear()
+
+    first = budget_alternatives_service._candidate_index(41)
+    assert budget_alternatives_service._candidate_index(41) is first
+    assert len(calls) == 1
+    assert first.buckets[("creature", 16)][0].name == "Llanowar Elves"
+    budget_alternatives_service._candidate_index(42)
+    assert len(calls) == 2
+    budget_alternatives_service._candidate_index.cache_clear()
+
+
+def test_candidate_index_uses_embedded_prices_and_reprices_only_picks(monkeypatch):
+    unpriced = _catalog_print("Fyndhorn Elves", "oracle-fyndhorn", price_usd="")
+    catalog = [
+        _catalog_print("Llanowar Elves", "oracle-llanowar", price_usd="0.25"),
+        _catalog_print("Elvish Mystic", "oracle-mystic", price_usd="0.30"),
+        unpriced,
+    ]
+    live_lookups = []
+
+    def live_prices(print_data):
+        live_lookups.append(print_data["name"])
+        return {"usd": "0.20"} if print_data["name"] == "Llanowar Elves" else print_data["prices"]
+
+    monkeypatch.setattr(budget_alternatives_service.sc, "cache_ready", lambda: True)
+    monkeypatch.setattr(budget_alternatives_service.sc, "get_all_prints", lambda: catalog)
+    monkeypatch.setattr(budget_alternatives_service.sc, "cache_epoch", lambda: 0)
+    monkeypatch.setattr(
+        budget_alternatives_service,
+        "prices_for_print",
+        lambda print_data: pytest.fail(f"index priced {print_data['name']} through the fallback chain"),
+    )
+    monkeypatch.setattr(budget_alternatives_service, "prices_for_print_exact", live_prices)
+    budget_alternatives_service._candidate_index.cache_clear()
+
+    picked = budget_alternatives_service._cache_candidates(
+        primary_type="creature",
+        deck_identity={"G"},
+        exclude_oracle_ids=set(),
+        price_ceiling=Decimal("5.00"),
+        limit=1,
+    )
+    budget_alternatives_service._candidate_index.cache_clear()
+
+    assert [(alt.name, alt.price_usd) for alt in picked] == [("Llanowar Elves", Decimal("0.20"))]
+    assert live_lookups == ["Llanowar Elves"]
+
+
+def test_live_quotes_above_the_ceiling_are_dropped_and_picks_re_ranked(monkeypatch):
+    catalog = [
+        _catalog_print("Llanowar Elves", "oracle-llanowar", price_usd="0.10"),
+        _catalog_print("Elvish Mystic", "oracle-mystic", price_usd="0.20"),
+        _catalog_print("Fyndhorn Elves", "oracle-fyndhorn", price_usd="0.30"),
+    ]
+    live = {"Llanowar Elves": "9.00", "Elvish Mystic": "0.50", "Fyndhorn Elves": "0.25"}
+    monkeypatch.setattr(budget_alternatives_service.sc, "cache_ready", lambda: True)
+    monkeypatch.setattr(budget_alternatives_service.sc, "get_all_prints", lambda: catalog)
+    monkeypatch.setattr(budget_alternatives_service.sc, "cache_epoch", lambda: 0)
+    monkeypatch.setattr(
+        budget_alternatives_service, "prices_for_print_exact", lambda print_data: {"usd": live[print_data["name"]]}
+    )
+    budget_alternatives_service._candidate_index.cache_clear()
+
+    picked = budget_alternatives_service._cache_candidates(
+        primary_type="creature",
+        deck_identity={"G"},
+        exclude_oracle_ids=set(),
+        price_ceiling=Decimal("5.00"),
+        limit=2,
+    )
+    budget_alternatives_service._candidate_index.cache_clear()
+
+    assert [(alt.name, alt.price_usd) for alt in picked] == [
+        ("Fyndhorn Elves", Decimal("0.25")),
+        ("Elvish Mystic", Decimal("0.50")),
+    ]
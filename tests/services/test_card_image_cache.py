@@ -0,0 +1,102 @@
+"""Tests for the local card image cache and URL rewriting."""
+
+from __future__ import annotations
+
+import io
+
+import pytest
+
+from core.domains.cards.services import card_image_cache
+from core.domains.cards.services import scryfall_cache as sc
+from extensions import db
+from models import Card, Folder
+from shared.mtg_prints import _img_url_for_print, _small_thumb_for_print
+
+_BOLT = "https://cards.scryfall.io/{size}/front/1/2/12ab-b017.jpg?1700000000"
+_DFC_BACK = "https://cards.scryfall.io/{size}/back/3/4/34cd-300d.jpg?1700000000"
+
+
+def _print(url_template, *, faces=False):
+    uris = {size: url_template.format(size=size) for size in ("small", "normal", "large")}
+    if faces:
+        return {"card_faces": [{"image_uris": uris}]}
+    return {"image_uris": uris}
+
+
+@pytest.fixture
+def image_cache(app, db_session, monkeypatch, tmp_path):
+    monkeypatch.setitem(app.config, "SCRYFALL_DATA_DIR", str(tmp_path))
+    monkeypatch.setattr(
+        card_image_cache,
+        "_snapshot",
+        {"root": None, "checked_at": 0.0, "mtime_ns": None, "entries": {}},
+    )
+    prints = {
+        ("m11", "146"): _print(_BOLT),
+        ("soi", "38"): _print(_DFC_BACK, faces=True),
+    }
+    monkeypatch.setattr(sc, "ensure_cache_loaded", lambda *a, **k: True)
+    monkeypatch.setattr(sc, "find_by_set_cn", lambda set_code, cn, name=None: prints.get((set_code, cn)))
+    with app.app_context():
+        folder = Folder(name="Image Deck", category=Folder.CATEGORY_DECK)
+        db.session.add(folder)
+        db.session.flush()
+        for name, set_code, cn in (("Lightning Bolt", "m11", "146"), ("Lightning Bolt", "m11", "146"), ("Moon", "soi", "38")):
+            db.session.add(Card(name=name, set_code=set_code, collector_number=cn, folder_id=folder.id, quantity=1, lang="en"))
+        db.session.commit()
+        yield tmp_path / "card-images"
+
+
+def test_sync_downloads_each_referenced_image_once_and_localizes(app, image_cache):
+    fetched = []
+
+    def fetch(url):
+        fetched.append(url)
+        return b"\xff\xd8" + url.encode("utf-8") + b"\xff\xd9"
+
+    assert _small_thumb_for_print(_print(_BOLT)) == _BOLT.format(size="small")
+
+    first = card_image_cache.sync_card_images(limit=1, rate_per_second=0, fetch=fetch)
+    assert (first["referenced"], first["downloaded"], first["remaining"]) == (2, 1, 1)
+    second = card_image_cache.sync_card_images(limit=5, rate_per_second=0, fetch=fetch)
+    assert (second["cached"], second["downloaded"], second["remaining"]) == (1, 1, 0)
+    third = card_image_cache.sync_card_images(rate_per_second=0, fetch=fetch)
+    assert third["queued"] == 0
+    assert sorted(fetched) == sorted([_BOLT.format(size="normal"), _DFC_BACK.format(size="normal")])
+
+    local = _img_url_for_print(_print(_BOLT), "large")
+    assert local.startswith("/card-images/originals/") and local.endswith(".jpg")
+    if card_image_cache.Image is None:
+        assert _small_thumb_for_print(_print(_BOLT)) == local
+    assert sc._image_uris(_print(_DFC_BACK, faces=True))["normal"].startswith("/card-images/")
+    # Art crops and unknown prints keep their Scryfall URLs.
+    other = "https://cards.scryfall.io/normal/front/9/9/99ff-other.jpg"
+    assert card_image_cache.localize_image_url(other) == other
+    assert card_image_cache.localize_image_url(_BOLT.format(size="art_crop")) == _BOLT.format(size="art_crop")
+
+    path = card_image_cache.local_image_path(_BOLT.format(size="small"))
+    assert path is not None and path.read_bytes().startswith(b"\xff\xd8")
+
+
+def test_cached_images_are_served_publicly_with_immutable_caching(app, client, image_cache):
+    card_image_cache.sync_card_images(rate_per_second=0, fetch=lambda url: b"\xff\xd8img\xff\xd9")
+    local = card_image_cache.localize_image_url(_BOLT.format(size="normal"))
+
+    response = client.get(local)
+    assert response.status_code == 200
+    assert response.data == b"\xff\xd8img\xff\xd9"
+    assert "immutable" in response.headers["Cache-Control"]
+    assert client.get("/card-images/../index.json").status_code == 404
+
+
+def test_sync_writes_webp_thumbnails_when_pillow_is_available(app, image_cache):
+    image_module = pytest.importorskip("PIL.Image")
+    buffer = io.BytesIO()
+    image_module.new("RGB", (488, 680), (200, 30, 30)).save(buffer, "JPEG")
+
+    card_image_cache.sync_card_images(rate_per_second=0, fetch=lambda url: buffer.getvalue())
+
+    small = card_image_cache.localize_image_url(_BOLT.format(size="small"))
+    assert small.startswith("/card-images/thumbs/small/") and small.endswith(".webp")
+    with image_module.open(image_cache / small.removeprefix("/card-images/")) as thumb:
+        assert thumb.size[0] == 146
@@ -0,0 +1,255 @@
+from flask_login import login_user
+
+from models import Card, Folder, FolderRole, User, db
+
+
+def _seed_collection(user_id: int) -> tuple[int, dict[str, int]]:
+    folder = Folder(
+        name="Binder",
+        category=Folder.CATEGORY_COLLECTION,
+        owner_user_id=user_id,
+    )
+    db.session.add(folder)
+    db.session.flush()
+    db.session.add(FolderRole(folder_id=folder.id, role=FolderRole.ROLE_COLLECTION))
+    cards = {
+        "cheap": Card(name="Llanowar Elves", set_code="M19", collector_number="314", folder_id=folder.id, quantity=4),
+        "pricey": Card(name="Mana Crypt", set_code="2XM", collector_number="270", folder_id=folder.id, quantity=1),
+        "foil": Card(
+            name="Sol Ring",
+            set_code="C21",
+            collector_number="263",
+            folder_id=folder.id,
+            quantity=2,
+            is_foil=True,
+        ),
+        "unpriced": Card(name="Plains", set_code="M21", collector_number="260", folder_id=folder.id, quantity=10),
+    }
+    db.session.add_all(cards.values())
+    db.session.commit()
+    return folder.id, {key: card.id for key, card in cards.items()}
+
+
+def _patch_prices(monkeypatch, card_ids: dict[str, int]):
+    from core.domains.cards.services import card_valuation_service
+
+    prices_by_id = {
+        card_ids["cheap"]: {"prices": {"usd": "0.25"}},
+        card_ids["pricey"]: {"prices": {"usd": "180.00", "usd_foil": "400.00"}},
+        card_ids["foil"]: {"prices": {"usd": "1.50", "usd_foil": "12.00"}},
+        card_ids["unpriced"]: {"prices": {}},
+    }
+    monkeypatch.setattr(card_valuation_service.sc, "cache_ready", lambda: True)
+    monkeypatch.setattr(
+        card_valuation_service,
+        "_bulk_print_lookup",
+        lambda cards, **kwargs: {card.id: prices_by_id.get(card.id, {}) for card in cards},
+    )
+
+
+def test_valuation_prefers_finish_then_currency():
+    from core.domains.cards.services.card_valuation_service import format_valuation
+    from core.domains.cards.services.collection_card_list_view_service import (
+        price_and_currency_from_exact_prices as valuation,
+    )
+
+    assert valuation({"usd": "1.00", "usd_foil": "5.00"}, False) == (1.0, "usd")
+    assert valuation({"usd": "1.00", "usd_foil": "5.00"}, True) == (5.0, "usd")
+    assert valuation({"eur": "2.00", "tix": "0.10"}, False) == (2.0, "eur")
+    assert valuation({"tix": "0.10"}, True) == (0.1, "tix")
+    assert valuation({"usd": "0.00"}, False) == (None, None)
+    assert format_valuation(1234.5, "usd") == "$1234.50"
+    assert format_valuation(2.0, "eur") == "EUR 2.00"
+    assert format_valuation(None, "usd") is None
+
+
+def test_refresh_card_valuations_writes_prices_and_sums_value(app, create_user, monkeypatch):
+    from core.domains.cards.services import card_valuation_service
+
+    user, _password = create_user(email="valuation@example.com", username="valuation")
+    with app.app_context():
+        folder_id, card_ids = _seed_collection(user.id)
+        before_updated_at = db.session.get(Card, card_ids["pricey"]).updated_at
+        _patch_prices(monkeypatch, card_ids)
+
+        written = card_valuation_service.refresh_card_valuations(folder_ids=[folder_id], batch_size=2)
+        db.session.expire_all()
+
+        assert written == 4
+        pricey = db.session.get(Card, card_ids["pricey"])
+        assert pricey.unit_price == 180.0
+        assert pricey.price_currency == "usd"
+        assert pricey.price_updated_at is not None
+        assert pricey.updated_at == before_updated_at
+        assert db.session.get(Card, card_ids["foil"]).unit_price == 12.0
+        unpriced = db.session.get(Card, card_ids["unpriced"])
+        assert unpriced.unit_price is None
+        assert unpriced.price_updated_at is not None
+
+        assert card_valuation_service.collection_values([folder_id]) == {"usd": 4 * 0.25 + 180.0 + 2 * 12.0}
+        assert card_valuation_service.refresh_card_valuations(folder_ids=[folder_id], only_missing=True) == 0
+
+
+def test_refresh_card_valuations_skips_when_cache_unavailable(app, create_user, monkeypatch):
+    from core.domains.cards.services import card_valuation_service
+
+    user, _password = create_user(email="valuation-nocache@example.com", username="valuation-nocache")
+    with app.app_context():
+        folder_id, card_ids = _seed_collection(user.id)
+        monkeypatch.setattr(card_valuation_service.sc, "cache_ready", lambda: False)
+        monkeypatch.setattr(card_valuation_service.sc, "ensure_cache_loaded", lambda: False)
+
+        assert card_valuation_service.refresh_card_valuations(folder_ids=[folder_id]) == 0
+        assert db.session.get(Card, card_ids["cheap"]).price_updated_at is None
+
+
+def test_ensure_card_valuations_prices_inline_without_a_queue(app, create_user, monkeypatch):
+    from core.domains.cards.services import card_valuation_service
+    from extensions import cache
+    from shared.jobs import jobs
+
+    def unavailable(folder_ids):
+        raise RuntimeError("RQ is not installed; unable to queue card valuations.")
+
+    monkeypatch.setattr(jobs, "enqueue_card_valuations", unavailable)
+    user, _password = create_user(email="valuation-inline@example.com", username="valuation-inline")
+    with app.app_context():
+        cache.clear()
+        folder_id, card_ids = _seed_collection(user.id)
+        _patch_prices(monkeypatch, card_ids)
+        # The list shows price-service quotes first; valuations must use the same source.
+        monkeypatch.setattr(
+            card_valuation_service,
+            "prices_for_print_exact",
+            lambda print_data: {"usd": "0.40"} if print_data["prices"].get("usd") == "0.25" else print_data["prices"],
+        )
+
+        assert card_valuation_service.ensure_card_valuations([folder_id]) is True
+        cheap = db.session.get(Card, card_ids["cheap"])
+        assert cheap.price_updated_at is not None
+        assert float(cheap.unit_price) == 0.40
+
+        monkeypatch.setattr(card_valuation_service, "_INLINE_PRICING_LIMIT", 0)
+        db.session.add(Card(name="Island", set_code="M21", collector_number="264", folder_id=folder_id, quantity=1))
+        db.session.commit()
+        assert card_valuation_service.ensure_card_valuations([folder_id]) is False
+
+
+def test_print_change_resets_stored_valuation(app, create_user, monkeypatch):
+    from core.domains.cards.services import card_valuation_service
+
+    user, _password = create_user(email="valuation-edit@example.com", username="valuation-edit")
+    with app.app_context():
+        folder_id, card_ids = _seed_collection(user.id)
+        _patch_prices(monkeypatch, card_ids)
+        card_valuation_service.refresh_card_valuations(folder_ids=[folder_id])
+        db.session.expire_all()
+
+        card = db.session.get(Card, card_ids["cheap"])
+        card.quantity = 5
+        db.session.commit()
+        assert card.unit_price == 0.25
+
+        card.is_foil = True
+        db.session.commit()
+        db.session.expire_all()
+        card = db.session.get(Card, card_ids["cheap"])
+        assert card.unit_price is None
+        assert card.price_updated_at is None
+
+
+def test_collection_values_keeps_currencies_apart(app, create_user, monkeypatch):
+    from core.domains.cards.services import card_valuation_service
+
+    user, _password = create_user(email="valuation-eur@example.com", username="valuation-eur")
+    with app.app_context():
+        folder_id, card_ids = _seed_collection(user.id)
+        _patch_prices(monkeypatch, card_ids)
+        monkeypatch.setattr(
+            card_valuation_service,
+            "_bulk_print_lookup",
+            lambda cards, **kwargs: {card.id: {"prices": {"eur": "3.00"}} for card in cards},
+        )
+        card_valuation_service.refresh_card_valuations(folder_ids=[folder_id])
+
+        assert card_valuation_service.collection_values([folder_id]) == {"eur": 3.0 * (4 + 1 + 2 + 10)}
+
+
+def test_ensure_card_valuations_queues_instead_of_writing(app, create_user, monkeypatch):
+    from core.domains.cards.services import card_valuation_service
+    from extensions import cache
+    from shared.jobs import jobs
+
+    queued = []
+    monkeypatch.setattr(jobs, "enqueue_card_valuations", lambda folder_ids: queued.append(folder_ids) or "job")
+    user, _password = create_user(email="valuation-queue@example.com", username="valuation-queue")
+    with app.app_context():
+        cache.clear()
+        folder_id, card_ids = _seed_collection(user.id)
+
+        assert card_valuation_service.ensure_card_valuations([folder_id]) is True
+        # A second view while the job is pending does not queue another one.
+        assert card_valuation_service.ensure_card_valuations([folder_id]) is False
+        assert queued == [[folder_id]]
+        assert db.session.get(Card, card_ids["cheap"]).price_updated_at is None
+
+
+def test_ensure_card_valuations_prices_inline_without_a_queue(app, create_user, monkeypatch):
+    from core.domains.cards.services import card_valuation_service
+    from extensions import cache
+    from shared.jobs import jobs
+
+    def unavailable(folder_ids):
+        raise RuntimeError("RQ is not installed; unable to queue card valuations.")
+
+    monkeypatch.setattr(jobs, "enqueue_card_valuations", unavailable)
+    user, _password = create_user(email="valuation-inline@example.com", username="valuation-inline")
+    with app.app_context():
+        cache.clear()
+        folder_id, card_ids = _seed_collection(user.id)
+        _patch_prices(monkeypatch, card_ids)
+        # The list shows price-service quotes first; valuations must use the same source.
+        monkeypatch.setattr(
+            card_valuation_service,
+            "prices_for_print_exact",
+            lambda print_data: {"usd": "0.40"} if print_data["prices"].get("usd") == "0.25" else print_data["prices"],
+        )
+
+        assert card_valuation_service.ensure_card_valuations([folder_id]) is True
+        cheap = db.session.get(Card, card_ids["cheap"])
+        assert cheap.price_updated_at is not None
+        assert float(cheap.unit_price) == 0.40
+
+        monkeypatch.setattr(card_valuation_service, "_INLINE_PRICING_LIMIT", 0)
+        db.session.add(Card(name="Island", set_code="M21", collector_number="264", folder_id=folder_id, quantity=1))
+        db.session.commit()
+        assert card_valuation_service.ensure_card_valuations([folder_id]) is False
+
+
+def test_collection_price_sort_uses_stored_valuation(app, create_user, monkeypatch):
+    from core.domains.cards.services import (
+        collection_query_service,
+        collection_request_service,
+    )
+    from extensions import cache
+
+    user, _password = create_user(email="valuation-sort@example.com", username="valuation-sort")
+    with app.app_context():
+        cache.clear()
+        folder_id, card_ids = _seed_collection(user.id)
+        _patch_prices(monkeypatch, card_ids)
+        user = db.session.get(User, user.id)
+    monkeypatch.setattr(
+        collection_query_service,
+        "build_collection_card_list_items",
+        lambda cards, **kwargs: cards,
+    )
+
+    with app.app_context():
+        with app.test_request_context("/cards?sort=price&dir=desc"):
+            login_user(user)
+            params = collection_request_service.parse_collection_browser_request()
+            context = collection_query_service.build_collection_browser_context(params)
+
+    names = [card.name for card in context["cards"]]
+    assert names == ["Mana Crypt", "Sol Ring", "Llanowar Elves", "Plains"]
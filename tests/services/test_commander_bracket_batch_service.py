@@ -0,0 +1,99 @@
+"""Tests for batch commander bracket evaluation on the decks overview."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from sqlalchemy import event
+
+from core.domains.decks.services import commander_bracket_batch_service as batch
+from core.domains.decks.services import deck_gallery_service
+from extensions import db
+from models import Card, CommanderBracketCache, Folder
+
+
+def _hooks(calls):
+    def prints_for_oracle(oracle_id):
+        calls["prints"].append(oracle_id)
+        return [{"name": oracle_id.title(), "type_line": "Artifact", "oracle_text": "{T}: Add {C}{C}.", "cmc": 1}]
+
+    def evaluate(cards, commander):
+        calls["evaluate"].append(commander["name"])
+        return {"level": 2, "label": "Core", "cards": sum(card["quantity"] for card in cards)}
+
+    return SimpleNamespace(
+        sc=SimpleNamespace(),
+        prints_for_oracle=prints_for_oracle,
+        find_by_set_cn=lambda *args: None,
+        evaluate_commander_bracket=evaluate,
+        compute_bracket_signature=deck_gallery_service.compute_bracket_signature,
+        primary_commander_oracle_id=deck_gallery_service.primary_commander_oracle_id,
+        primary_commander_name=deck_gallery_service.primary_commander_name,
+    )
+
+
+def _deck(name, commander):
+    folder = Folder(name=name, category=Folder.CATEGORY_DECK, commander_name=commander)
+    db.session.add(folder)
+    db.session.flush()
+    for card_name, oracle_id in (("Sol Ring", "sol-ring"), ("Arcane Signet", "signet")):
+        db.session.add(Card(name=card_name, oracle_id=oracle_id, set_code="cmm", collector_number=oracle_id, folder_id=folder.id, quantity=1, lang="en"))
+    return folder
+
+
+def test_batch_reuses_stored_brackets_until_a_deck_changes(app, db_session):
+    calls = {"prints": [], "evaluate": []}
+    hooks = _hooks(calls)
+    with app.app_context():
+        first, second = _deck("Batch A", "Alpha"), _deck("Batch B", "Beta")
+        db.session.commit()
+
+        results = batch.evaluate_deck_brackets([first, second], epoch=11, hooks=hooks)
+        assert {fid: ctx["cards"] for fid, ctx in results.items()} == {first.id: 2, second.id: 2}
+        assert sorted(calls["prints"]) == ["signet", "sol-ring"]
+        assert sorted(calls["evaluate"]) == ["Alpha", "Beta"]
+        assert db.session.get(CommanderBracketCache, first.id).source_version
+
+        card_reads = []
+
+        def _count(_conn, _cursor, statement, *_args):
+            if "FROM card" in statement and "GROUP BY" not in statement:
+                card_reads.append(statement)
+
+        event.listen(db.engine, "before_cursor_execute", _count)
+        try:
+            again = batch.evaluate_deck_brackets([first, second], epoch=11, hooks=hooks)
+        finally:
+            event.remove(db.engine, "before_cursor_execute", _count)
+        assert again == results
+        assert card_reads == []
+        assert len(calls["evaluate"]) == 2
+
+        card = Card.query.filter_by(folder_id=second.id, oracle_id="signet").one()
+        card.quantity = 3
+        db.session.commit()
+        changed = batch.evaluate_deck_brackets([first, second], epoch=11, hooks=hooks)
+
+    assert calls["evaluate"][2:] == ["Beta"]
+    assert changed[second.id]["cards"] == 4
+    assert changed[first.id] == results[first.id]
+
+
+def test_batch_restamps_matching_signature_without_evaluating(app, db_session):
+    calls = {"prints": [], "evaluate": []}
+    hooks = _hooks(calls)
+    with app.app_context():
+        folder = _deck("Batch C", "Gamma")
+        db.session.commit()
+        batch.evaluate_deck_brackets([folder], epoch=5, hooks=hooks)
+        row = db.session.get(CommanderBracketCache, folder.id)
+        row.source_version = None
+        db.session.commit()
+
+        result = batch.evaluate_deck_brackets([folder], epoch=5, hooks=hooks)
+        assert result[folder.id]["label"] == "Core"
+        assert calls["evaluate"] == ["Gamma"]
+        assert db.session.get(CommanderBracketCache, folder.id).source_version
+
+        batch.evaluate_deck_brackets([folder], epoch=6, hooks=hooks)
+    assert calls["evaluate"] == ["Gamma", "Gamma"]
@@ -0,0 +1,46 @@
+import random
+import re
+
+from core.domains.decks.services.core_role_logic import (
+    TokenMatcher,
+    _load_core_role_rules,
+    _token_pattern,
+    benchmark_core_roles,
+    derive_core_roles,
+)
+
+
+def test_token_matcher_finds_overlapping_and_prefix_tokens():
+    matcher = TokenMatcher(["add", "add one mana of any", "x", "x treasure", "-x/-x", "exile", "exile target"])
+
+    found = matcher.matched_tokens("create x treasure tokens. target creature gets -x/-x. add one mana of any color")
+    assert found == {"add", "add one mana of any", "x", "x treasure", "-x/-x"}
+    # Plain words need word boundaries on both sides; other tokens are substrings.
+    assert matcher.matched_tokens("maddening exiled") == set()
+    assert matcher.matched_tokens("exile targets") == {"exile", "exile target"}
+
+
+def test_token_matcher_agrees_with_per_token_search():
+    _normalization, _rules, matcher = _load_core_role_rules()
+    tokens = list(matcher.tokens)
+    patterns = {token: re.compile(_token_pattern(token)) for token in tokens}
+    rng = random.Random(7)
+    filler = ["the", "of", "readd", "xx", "re-x", "{t}:", "+", "/"]
+    for _ in range(500):
+        words = [rng.choice(tokens + filler) for _ in range(rng.randint(1, 25))]
+        text = rng.choice([" ", "", ", "]).join(words)
+        expected = {token for token, rx in patterns.items() if rx.search(text)}
+        assert matcher.matched_tokens(text) == expected, text
+
+
+def test_derive_core_roles_matches_per_rule_baseline():
+    assert "treasure" in derive_core_roles(oracle_text="Create a Treasure token.", name="Test")
+    cards = [
+        {"name": "Cultivate", "type_line": "Sorcery", "oracle_text": "Search your library for up to two basic land cards, reveal those cards, put one onto the battlefield tapped and the other into your hand, then shuffle."},
+        {"name": "Counterspell", "type_line": "Instant", "oracle_text": "Counter target spell."},
+        {"name": "Llanowar Elves", "type_line": "Creature — Elf Druid", "oracle_text": "{T}: Add {G}."},
+        {"name": "Smothering Tithe", "type_line": "Enchantment", "oracle_text": "Whenever an opponent draws a card, that player may pay {2}. If the player doesn't, you create a Treasure token."},
+    ]
+    result = benchmark_core_roles(cards, rounds=1)
+    assert result["cards"] == 4
+    assert result["mismatches"] == 0
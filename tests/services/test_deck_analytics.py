@@ -0,0 +1,101 @@
+"""Tests for the shared deck analytics feature table."""
+
+from __future__ import annotations
+
+from core.domains.decks.services import deck_analytics
+
+
+def _print(oracle_id, *, type_line, cmc, mana_cost="", oracle_text="", **extra):
+    return {
+        "oracle_id": oracle_id,
+        "type_line": type_line,
+        "cmc": cmc,
+        "mana_cost": mana_cost,
+        "oracle_text": oracle_text,
+        **extra,
+    }
+
+
+def test_features_from_print_parses_pips_and_production():
+    features = deck_analytics.features_from_print(
+        _print(
+            "o-1",
+            type_line="Artifact Creature — Golem",
+            cmc=3,
+            mana_cost="{1}{W/U}{G}",
+            oracle_text="{T}: Add one mana of any color.",
+        )
+    )
+    assert features.pips == (1, 1, 0, 0, 1)
+    assert features.is_permanent and not features.is_land
+    assert features.produces == frozenset("WUBRG")
+
+    forest = deck_analytics.features_from_row(type_line="Basic Land — Forest", mana_value=0)
+    assert forest.is_land
+    assert forest.produces == frozenset({"G"})
+
+
+def test_produced_colors_reads_only_add_clauses():
+    produced = deck_analytics.produced_colors
+    assert produced("{2}{W}, {T}: Add {G}.", "Land") == frozenset({"G"})
+    assert produced("{T}: Add {C}.\n{1}{W/U}, {T}: Add {W} or {U}.", "Land") == frozenset("CWU")
+    assert produced("As an additional cost to cast this spell, pay {B}.", "Sorcery") == frozenset()
+    assert produced("Whenever a creature is added, scry 1. {R}: Tap target creature.", "Enchantment") == frozenset()
+    assert produced("{T}, Pay 1 life: Add one mana of any color.", "Land") == frozenset("WUBRG")
+
+
+def test_deck_metrics_from_row_fallbacks(monkeypatch):
+    monkeypatch.setattr(deck_analytics, "_current_table", lambda load_cache: deck_analytics._EMPTY_TABLE)
+
+    def row(**kwargs):
+        return lambda: deck_analytics.features_from_row(**kwargs)
+
+    metrics = deck_analytics.deck_metrics(
+        [
+            (2, None, row(type_line="Instant", mana_value=1, faces_json=[{"mana_cost": "{R}"}])),
+            (1, None, row(type_line="Creature", mana_value=8, mana_cost="{6}{G}{G}")),
+            (10, None, row(type_line="Basic Land — Mountain", mana_value=0)),
+            (1, "unknown-oracle", None),
+            (0, None, row(type_line="Sorcery", mana_value=2)),
+        ]
+    )
+
+    assert metrics.total_cards == 14
+    assert metrics.land_count == 10
+    assert metrics.pips_all == {"W": 0, "U": 0, "B": 0, "R": 2, "G": 2}
+    assert metrics.production["R"] == 10
+    assert metrics.curve["1"] == 2
+    assert metrics.curve["7+"] == 1
+    assert metrics.curve_total == 3
+    assert metrics.missing_cmc == 1
+    assert metrics.avg_cmc == (2 * 1 + 8) / 3
+
+
+def test_deck_metrics_prefers_feature_table(monkeypatch):
+    prints = {
+        "a": _print("o-bolt", type_line="Instant", cmc=1, mana_cost="{R}"),
+        "b": _print("o-bolt", type_line="Instant", cmc=1, mana_cost="{R}"),
+        "c": _print("o-signet", type_line="Artifact", cmc=2, mana_cost="{2}", oracle_text="{1}, {T}: Add {U}{B}."),
+    }
+    monkeypatch.setattr(deck_analytics.sc, "cache_ready", lambda: True)
+    monkeypatch.setattr(deck_analytics.sc, "cache_epoch", lambda: -4801)
+    monkeypatch.setattr(deck_analytics.sc, "get_all_prints", lambda: prints)
+    deck_analytics._feature_table.cache_clear()
+    try:
+        table = deck_analytics._feature_table(-4801)
+        assert set(table.index) == {"o-bolt", "o-signet"}
+
+        fallback_calls = []
+        metrics = deck_analytics.deck_metrics(
+            [
+                (4, "o-bolt", lambda: fallback_calls.append("bolt")),
+                (1, "o-signet", None),
+            ]
+        )
+    finally:
+        deck_analytics._feature_table.cache_clear()
+
+    assert fallback_calls == []
+    assert metrics.pips_non_land["R"] == 4
+    assert metrics.production["U"] == 1 and metrics.production["B"] == 1
+    assert metrics.curve["1"] == 4 and metrics.curve["2"] == 1
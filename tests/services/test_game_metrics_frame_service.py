@@ -0,0 +1,103 @@
+"""Tests for the scoped, per-request game metrics frame."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import event, true
+
+from core.domains.games.services import game_metrics_frame_service as metrics_frame
+from core.domains.games.services import game_metrics_query_service as metrics_query
+from core.domains.games.services import game_metrics_support_service as support
+from extensions import db
+from models import GameDeck, GamePlayer, GameSeat, GameSeatAssignment, GameSession
+
+
+def _log_game(owner_id, played_at, seats, *, winner=0, combo=False):
+    session = GameSession(owner_user_id=owner_id, played_at=played_at, win_via_combo=combo)
+    db.session.add(session)
+    db.session.flush()
+    seat_rows = []
+    for index, (player_user_id, player_name, deck_name, commander) in enumerate(seats, start=1):
+        seat = GameSeat(session_id=session.id, seat_number=index, turn_order=index)
+        player = GamePlayer(user_id=player_user_id, display_name=player_name)
+        deck = GameDeck(session_id=session.id, deck_name=deck_name, commander_name=commander)
+        db.session.add_all([seat, player, deck])
+        db.session.flush()
+        db.session.add(
+            GameSeatAssignment(session_id=session.id, seat_id=seat.id, player_id=player.id, deck_id=deck.id)
+        )
+        seat_rows.append(seat)
+    session.winner_seat_id = seat_rows[winner].id
+    db.session.commit()
+
+
+def _seed(owner_id):
+    pod = [
+        (owner_id, "Owner", "Atraxa Superfriends", "Atraxa, Praetors' Voice"),
+        (None, "Guest", "Kinnan Value", "Kinnan, Bonder Prodigy"),
+        (None, "Late", "Edgar Vampires", "Edgar Markov"),
+    ]
+    _log_game(owner_id, datetime(2026, 5, 1, 19, 0), pod, winner=1, combo=True)
+    _log_game(owner_id, datetime(2026, 5, 2, 19, 0), pod, winner=0)
+    _log_game(owner_id, datetime(2026, 5, 3, 19, 0), pod[:2] + [(None, "Other", "Edgar Vampires", "Edgar Markov")], winner=2)
+
+
+def test_player_scoped_metrics_from_frame(app, create_user):
+    owner, _password = create_user(email="frame-owner@example.com", username="frame-owner")
+    with app.app_context():
+        _seed(owner.id)
+        scope = support._merge_scope_filters(None, [support._session_filter_for_player("name:late")])
+
+        payload = metrics_query._metrics_payload(owner.id, scope=scope)
+        assert payload["total_games"] == 2
+        assert payload["combo_wins"] == 1
+        assert payload["avg_players"] == 3.0
+        assert payload["unique_players"] == 3
+        assert payload["top_decks"][0] == {"label": "Atraxa Superfriends", "count": 2}
+
+        stats = metrics_query._player_stats(owner.id, "name:guest", scope=scope)
+        assert stats["games_played"] == 2
+        assert stats["wins"] == 1
+        assert stats["combo_wins"] == 1
+        assert stats["deck_stats"] == [{"label": "Kinnan Value", "plays": 2, "wins": 1, "win_rate": 50.0}]
+
+        turns = metrics_query._turn_order_metrics(owner.id, scope=scope)
+        assert [row["wins"] for row in turns["three_player"]] == [1, 1, 0]
+        assert metrics_query._player_stats(owner.id, "", scope=scope) is None
+
+
+def test_scoped_widgets_share_one_frame_per_request(app, create_user):
+    owner, _password = create_user(email="frame-cache@example.com", username="frame-cache")
+    with app.app_context():
+        _seed(owner.id)
+    statements: list[str] = []
+
+    def _count(_conn, _cursor, statement, *_args):
+        if "game_seats" in statement or "game_sessions" in statement:
+            statements.append(statement)
+
+    with app.test_request_context("/games/metrics"):
+        scope = {"session_filter": true()}
+        event.listen(db.engine, "before_cursor_execute", _count)
+        try:
+            metrics_query._metrics_payload(owner.id, scope=scope)
+            metrics_query._commander_win_rates(owner.id, scope=scope)
+            metrics_query._bracket_stats(owner.id, scope=scope)
+            metrics_query._deck_win_rates(owner.id, scope=scope, player_key="name:guest")
+            metrics_query._player_win_rates(owner.id, scope=scope)
+            metrics_query._turn_order_metrics(owner.id, scope=scope)
+            metrics_query._deck_options(owner.id, scope=scope)
+        finally:
+            event.remove(db.engine, "before_cursor_execute", _count)
+    assert len(statements) == 2
+
+
+def test_scope_signature_distinguishes_bound_values():
+    first = {"session_filter": GamePlayer.display_name == "Guest"}
+    second = {"session_filter": GamePlayer.display_name == "Late"}
+    assert metrics_query._scope_signature(first) != metrics_query._scope_signature(second)
+    assert metrics_query._scope_signature(first) == metrics_query._scope_signature(
+        {"session_filter": GamePlayer.display_name == "Guest"}
+    )
+    assert metrics_frame.MetricsFrame([], []).avg_players is None
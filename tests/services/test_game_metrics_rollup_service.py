@@ -0,0 +1,161 @@
+"""Tests for the per-user daily game metric rollups."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import func, true
+
+from core.domains.games.services import game_metrics_query_service as metrics_query
+from core.domains.games.services import game_metrics_rollup_service as rollup
+from extensions import db
+from models import (
+    GameDeck,
+    GameMetricDay,
+    GameMetricRollupState,
+    GameMetricSeatDay,
+    GamePlayer,
+    GameSeat,
+    GameSeatAssignment,
+    GameSession,
+)
+
+# A no-op session filter forces the scoped frame path for comparison.
+LIVE_SCOPE = {"session_filter": true()}
+
+
+def _log_game(owner_id, played_at, seats, *, winner=0, combo=False):
+    session = GameSession(owner_user_id=owner_id, played_at=played_at, win_via_combo=combo)
+    db.session.add(session)
+    db.session.flush()
+    seat_rows = []
+    for index, (player_user_id, player_name, deck_name, commander, bracket_score) in enumerate(seats, start=1):
+        seat = GameSeat(session_id=session.id, seat_number=index, turn_order=index)
+        player = GamePlayer(user_id=player_user_id, display_name=player_name)
+        deck = GameDeck(
+            session_id=session.id,
+            deck_name=deck_name,
+            commander_name=commander,
+            bracket_label="Core" if bracket_score else None,
+            bracket_score=bracket_score,
+        )
+        db.session.add_all([seat, player, deck])
+        db.session.flush()
+        db.session.add(
+            GameSeatAssignment(session_id=session.id, seat_id=seat.id, player_id=player.id, deck_id=deck.id)
+        )
+        seat_rows.append(seat)
+    if winner is not None:
+        session.winner_seat_id = seat_rows[winner].id
+    db.session.commit()
+    return session.id
+
+
+def _seed(owner_id, friend_id):
+    day_one = datetime(2026, 3, 1, 19, 30)
+    day_two = datetime(2026, 3, 8, 20, 0)
+    pod = [
+        (owner_id, "Owner", "Atraxa Superfriends", "Atraxa, Praetors' Voice", 6.5),
+        (friend_id, "Friend", "Krenko Goblins", "Krenko, Mob Boss", 5.0),
+        (None, "Guest", "Kinnan Value", "Kinnan, Bonder Prodigy", None),
+    ]
+    return [
+        _log_game(owner_id, day_one, pod, winner=0, combo=True),
+        _log_game(owner_id, day_one.replace(hour=22), pod, winner=1),
+        _log_game(owner_id, day_two, pod + [(None, "Late", "Edgar Vampires", "Edgar Markov", 7.0)], winner=3),
+    ]
+
+
+def _snapshot(user_id, start_at=None, end_at=None, scope=None):
+    return {
+        "payload": metrics_query._metrics_payload(user_id, start_at, end_at, scope=scope),
+        "players": metrics_query._top_players_by_plays(user_id, start_at, end_at, scope=scope),
+        "combo": metrics_query._combo_winners(user_id, start_at, end_at, scope=scope),
+        "commanders": metrics_query._commander_win_rates(user_id, start_at, end_at, scope=scope),
+        "brackets": metrics_query._bracket_stats(user_id, start_at, end_at, scope=scope),
+        "turns": metrics_query._turn_order_metrics(user_id, start_at, end_at, scope=scope),
+        "win_rates": metrics_query._player_win_rates(user_id, start_at, end_at, scope=scope),
+        "decks": metrics_query._deck_win_rates(user_id, start_at, end_at, scope=scope),
+        "deck_options": metrics_query._deck_options(user_id, start_at, end_at, scope=scope),
+        "player_stats": metrics_query._player_stats(user_id, "name:guest", start_at, end_at, scope=scope),
+        "player_decks": metrics_query._player_deck_stats(user_id, "name:guest", start_at, end_at, scope=scope),
+        "usage": metrics_query._commander_usage(user_id, start_at, end_at, player_key="name:friend", scope=scope),
+    }
+
+
+def test_rollup_metrics_match_live_queries(app, create_user):
+    owner, _password = create_user(email="rollup-owner@example.com", username="rollup-owner")
+    friend, _password = create_user(email="rollup-friend@example.com", username="rollup-friend")
+    with app.app_context():
+        _seed(owner.id, friend.id)
+
+        assert rollup.rollups_cover(owner.id, None, None, None) is True
+        assert db.session.get(GameMetricRollupState, owner.id) is not None
+        assert _snapshot(owner.id) == _snapshot(owner.id, scope=LIVE_SCOPE)
+
+        march_first = (datetime(2026, 3, 1), datetime.combine(datetime(2026, 3, 1).date(), datetime.max.time()))
+        ranged = _snapshot(owner.id, *march_first)
+        assert ranged == _snapshot(owner.id, *march_first, scope=LIVE_SCOPE)
+        assert ranged["payload"]["total_games"] == 2
+        assert ranged["payload"]["combo_wins"] == 1
+
+        # The registered participant sees the same games through their own buckets.
+        assert _snapshot(friend.id) == _snapshot(friend.id, scope=LIVE_SCOPE)
+        assert metrics_query._metrics_payload(friend.id)["total_games"] == 3
+
+
+def test_rollups_follow_session_edits_and_deletes(app, create_user):
+    owner, _password = create_user(email="rollup-edit@example.com", username="rollup-edit")
+    friend, _password = create_user(email="rollup-edit-friend@example.com", username="rollup-edit-friend")
+    with app.app_context():
+        session_ids = _seed(owner.id, friend.id)
+        assert rollup.rollups_ready(owner.id)
+        assert rollup.rollups_ready(friend.id)
+
+        moved = db.session.get(GameSession, session_ids[0])
+        moved.played_at = datetime(2026, 4, 2, 18, 0)
+        db.session.commit()
+        db.session.delete(db.session.get(GameSession, session_ids[2]))
+        db.session.commit()
+
+        # A new participant's assignment is swapped in for the friend.
+        assignment = (
+            GameSeatAssignment.query.join(GamePlayer, GamePlayer.id == GameSeatAssignment.player_id)
+            .filter(GameSeatAssignment.session_id == session_ids[1], GamePlayer.user_id == friend.id)
+            .one()
+        )
+        replacement = GamePlayer(display_name="Stand-in")
+        db.session.add(replacement)
+        db.session.flush()
+        assignment.player_id = replacement.id
+        db.session.commit()
+
+        for user_id in (owner.id, friend.id):
+            assert _snapshot(user_id) == _snapshot(user_id, scope=LIVE_SCOPE)
+        days = {
+            row.day.isoformat(): row.games
+            for row in GameMetricDay.query.filter_by(user_id=owner.id).all()
+        }
+        assert days == {"2026-03-01": 1, "2026-04-02": 1}
+        assert metrics_query._metrics_payload(friend.id)["total_games"] == 1
+
+
+def test_rebuild_all_rollups_restores_buckets(app, create_user):
+    owner, _password = create_user(email="rollup-rebuild@example.com", username="rollup-rebuild")
+    friend, _password = create_user(email="rollup-rebuild-friend@example.com", username="rollup-rebuild-friend")
+    with app.app_context():
+        _seed(owner.id, friend.id)
+        assert rollup.rollups_ready(owner.id)
+        GameMetricSeatDay.query.filter_by(user_id=owner.id).delete()
+        db.session.commit()
+
+        assert rollup.rebuild_all_rollups() >= 2
+        db.session.commit()
+
+        plays = (
+            db.session.query(func.sum(GameMetricSeatDay.plays))
+            .filter(GameMetricSeatDay.user_id == owner.id)
+            .scalar()
+        )
+        assert plays == 10
+        assert _snapshot(owner.id) == _snapshot(owner.id, scope=LIVE_SCOPE)
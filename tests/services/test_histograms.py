@@ -0,0 +1,81 @@
+"""Tests for the cross-worker latency histograms and Prometheus exposition."""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+
+import pytest
+
+from shared import histograms
+from shared.events.live_updates import emit_job_event
+
+
+@pytest.fixture
+def store(monkeypatch, tmp_path):
+    monkeypatch.setattr(histograms, "_store_dir", tmp_path)
+    histograms.reset()
+    yield tmp_path
+    histograms.reset()
+
+
+def _other_worker_file(directory, name, family, counts, total, **labels):
+    payload = {"pid": 1, "series": [{"family": family, "labels": labels, "counts": counts, "sum": total}]}
+    path = directory / name
+    path.write_text(json.dumps(payload), encoding="utf-8")
+    return path
+
+
+def test_quantiles_interpolate_within_buckets():
+    counts = [0] * (len(histograms.DEFAULT_BUCKETS) + 1)
+    counts[4] = 10  # ten samples in (0.05, 0.1]
+    assert histograms.quantile(0.5, counts) == pytest.approx(0.075)
+    assert histograms.quantile(0.99, counts) == pytest.approx(0.0995)
+    assert histograms.quantile(0.5, [0] * len(counts)) == 0.0
+
+
+def test_collect_merges_worker_files_and_archives_stale_ones(store):
+    for seconds in (0.004, 0.008, 0.008, 3.0):
+        histograms.observe(histograms.REQUEST_FAMILY, seconds, endpoint="views.dashboard", method="GET")
+    other = [0] * (len(histograms.DEFAULT_BUCKETS) + 1)
+    other[1] = 6
+    stale = _other_worker_file(
+        store, "web-2-99999.json", histograms.REQUEST_FAMILY, other, 0.06, endpoint="views.dashboard", method="GET"
+    )
+    old = time.time() - histograms.STALE_SECONDS - 60
+    os.utime(stale, (old, old))
+
+    (key, values), = histograms.collect().items()
+    assert key[0] == histograms.REQUEST_FAMILY
+    assert sum(values[:-1]) == 10 and values[1] == 8
+    assert not stale.exists() and (store / "archive.json").exists()
+
+    # Totals survive compaction, and this process's next flush does not double count.
+    histograms.observe(histograms.REQUEST_FAMILY, 0.02, endpoint="views.dashboard", method="GET")
+    (_, values), = histograms.collect().items()
+    assert sum(values[:-1]) == 11
+
+    text = histograms.render_prometheus()
+    assert "# TYPE dragonsvault_http_request_duration_seconds histogram" in text
+    assert 'dragonsvault_http_request_duration_seconds_bucket{endpoint="views.dashboard",method="GET",le="0.01"} 9' in text
+    assert 'dragonsvault_http_request_duration_seconds_count{endpoint="views.dashboard",method="GET"} 11' in text
+
+
+def test_job_events_and_requests_are_exposed(app, client, store):
+    emit_job_event("scryfall", "queued", job_id="j1", dataset="default_cards")
+    emit_job_event("scryfall", "started", job_id="j1", dataset="default_cards")
+    emit_job_event("scryfall", "completed", job_id="j1", dataset="default_cards")
+    emit_job_event("edhrec", "failed", job_id="never-started", dataset="synergy")
+
+    client.get("/observability/health")
+    response = client.get("/observability/prometheus")
+    assert response.status_code == 200
+    assert response.mimetype == "text/plain"
+    body = response.get_data(as_text=True)
+    assert 'dragonsvault_job_duration_seconds_count{job="scryfall",outcome="completed"} 1' in body
+    assert 'job="edhrec"' not in body
+    assert 'endpoint="observability.health"' in body
+
+    series = client.get("/observability/metrics").get_json()["histograms"]["series"]
+    assert any(row["labels"].get("endpoint") == "observability.health" and row["p95"] > 0 for row in series)
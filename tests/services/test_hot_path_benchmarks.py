@@ -0,0 +1,74 @@
+"""Smoke tests for the synthetic hot-path benchmark suite."""
+
+from __future__ import annotations
+
+import pytest
+
+from core.domains.cards.services import scryfall_cache as sc
+from core.domains.decks.services import oracle_tagging
+from tests.benchmarks import SyntheticSpec, compare_reports, run_hot_paths
+from tests.benchmarks.synthetic import build_catalog
+
+
+@pytest.fixture
+def restore_scryfall_cache(app):
+    """``run_hot_paths`` leaves its synthetic catalog loaded process-wide."""
+    yield
+    with app.app_context():
+        sc.ensure_cache_loaded(force=True)
+    # The enrichment run memoizes the tribal lookup from this test's empty deck-tag table.
+    oracle_tagging._build_tribal_lookup.cache_clear()
+
+
+def test_synthetic_catalog_is_deterministic():
+    spec = SyntheticSpec().scaled(0)
+    first = build_catalog(spec)
+    assert first == build_catalog(spec)
+    assert len(first) == spec.prints
+    assert len({p["id"] for p in first}) == spec.prints
+    assert len({(p["set"], p["collector_number"]) for p in first}) == spec.prints
+    assert {p["name"] for p in first} >= {"Plains", "Island", "Swamp", "Mountain", "Forest"}
+    assert build_catalog(SyntheticSpec(prints=200, seed=1)) != first
+
+
+def test_run_hot_paths_reports_every_path(app, db_session, tmp_path, restore_scryfall_cache):
+    spec = SyntheticSpec().scaled(0)
+    report = run_hot_paths(app, spec, rounds=1, workdir=tmp_path)
+
+    assert report["spec"] == spec.as_dict()
+    assert report["seeded"]["card_rows"] > 0 and report["seeded"]["games"] == spec.games
+    assert set(report["results"]) == {
+        "ensure_cache_loaded",
+        "search_local_cards",
+        "unique_oracle_by_name",
+        "list_checker_index",
+        "list_checker_lookup",
+        "bulk_print_lookup",
+        "process_csv",
+        "recompute_oracle_enrichment",
+        "evaluate_commander_bracket",
+        "collection_browser_cold",
+        "collection_browser_warm",
+    }
+    results = report["results"]
+    assert results["unique_oracle_by_name"]["resolved"] > 0
+    assert results["list_checker_lookup"]["resolved"] == results["list_checker_lookup"]["lines"] > 0
+    assert results["bulk_print_lookup"]["resolved"] == results["bulk_print_lookup"]["cards"]
+    assert results["process_csv"]["added"] > 0
+    assert results["recompute_oracle_enrichment"]["status"] == "ok"
+    assert compare_reports(report, report) == []
+
+
+def test_compare_reports_flags_slower_medians():
+    spec = SyntheticSpec().as_dict()
+    baseline = {"spec": spec, "results": {"a": {"median_ms": 100.0}, "b": {"median_ms": 1.0}, "c": {"median_ms": 50.0}}}
+    current = {"spec": spec, "results": {"a": {"median_ms": 140.0}, "b": {"median_ms": 4.0}, "d": {"median_ms": 9.0}}}
+
+    regressions = compare_reports(current, baseline, tolerance=0.25)
+
+    # "b" quadrupled but stays under the noise floor; "d" has no baseline.
+    assert [item["name"] for item in regressions] == ["a"]
+    assert regressions[0]["ratio"] == 1.4
+    assert compare_reports(current, baseline, tolerance=0.5) == []
+    with pytest.raises(ValueError):
+        compare_reports(current, {**baseline, "spec": {**spec, "seed": 1}})
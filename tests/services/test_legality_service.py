@@ -12,7 +12,7 @@ from typing import Any
 import pytest
 
 from core.domains.decks.services import legality_service
-from extensions import db
+from extensions import cache, db
 from models import Card, Folder
 from tests.factories import create_card, create_folder
 
@@ -41,6 +41,10 @@ def freeze_cache(monkeypatch):
     """Pretend the Scryfall cache is loaded; callers register per-card data."""
     monkeypatch.setattr(legality_service.sc, "cache_ready", lambda: True)
     monkeypatch.setattr(legality_service.sc, "ensure_cache_loaded", lambda: True)
+    monkeypatch.setattr(legality_service.sc, "get_all_prints", lambda: [])
+    monkeypatch.setattr(legality_service.sc, "cache_epoch", lambda: 0)
+    legality_service._legality_index.cache_clear()
+    cache.clear()
 
     registry: dict[tuple[str, str, str], dict[str, Any]] = {}
 
@@ -307,3 +311,85 @@ def test_basic_lands_bypass_singleton(app, db_session, freeze_cache):
 
     assert not any(i.code == "copy_limit" for i in report.issues)
     assert report.mainboard_size == 100
+
+
+def _izzet_deck(registry):
+    folder = create_folder(name="Izzet Matrix")
+    folder.commander_name = "Niv-Mizzet, Parun"
+    folder.commander_oracle_id = "oracle-niv"
+    niv = create_card(folder=folder, name="Niv-Mizzet, Parun", oracle_id="oracle-niv", set_code="grn", collector_number="192")
+    _register(registry, niv, color_identity=("U", "R"), legalities={"modern": "legal", "brawl": "not_legal"})
+    bolt = create_card(folder=folder, name="Lightning Bolt", oracle_id="oracle-bolt", set_code="m11", collector_number="146")
+    _register(registry, bolt, color_identity=("R",), type_line="Instant", legalities={"modern": "legal", "pauper": "legal"})
+    growth = create_card(folder=folder, name="Giant Growth", oracle_id="oracle-growth", set_code="m10", collector_number="186")
+    _register(registry, growth, color_identity=("G",), type_line="Instant", legalities={"modern": "legal"})
+    db.session.commit()
+    return folder, bolt
+
+
+def test_all_formats_matches_single_format_reports(app, db_session, freeze_cache):
+    with app.app_context():
+        folder, _bolt = _izzet_deck(freeze_cache)
+        matrix = legality_service.evaluate_folder_legality_all(folder)
+        singles = [
+            legality_service.evaluate_folder_legality(folder, fmt.key)
+            for fmt in legality_service.SUPPORTED_FORMATS
+        ]
+
+    assert [report.format_key for report in matrix] == [fmt.key for fmt in legality_service.SUPPORTED_FORMATS]
+    assert [report.to_dict() for report in matrix] == [report.to_dict() for report in singles]
+    commander = matrix[0]
+    assert [issue.card_name for issue in commander.issues if issue.code == "color_identity"] == ["Giant Growth"]
+
+
+def test_all_formats_enriches_once_and_caches_by_deck_contents(
+    app, db_session, freeze_cache, monkeypatch
+):
+    lookups = []
+    lookup = legality_service._lookup_print_data
+
+    def counting_lookup(*args, **kwargs):
+        lookups.append(args)
+        return lookup(*args, **kwargs)
+
+    monkeypatch.setattr(legality_service, "_lookup_print_data", counting_lookup)
+    with app.app_context():
+        folder, bolt = _izzet_deck(freeze_cache)
+        first = legality_service.evaluate_folder_legality_all(folder)
+        assert len(lookups) == 3
+        assert legality_service.evaluate_folder_legality_all(folder) == first
+        assert len(lookups) == 3
+
+        bolt.quantity = 5
+        db.session.commit()
+        changed = legality_service.evaluate_folder_legality_all(folder)
+
+    assert len(lookups) == 6
+    modern = changed[legality_service._FORMAT_INDEX["modern"]]
+    assert any(issue.code == "copy_limit" for issue in modern.issues)
+
+
+def test_legality_index_serves_cards_without_print_lookups(app, db_session, freeze_cache, monkeypatch):
+    catalog = [
+        {"oracle_id": "oracle-bolt", "color_identity": ["R"], "legalities": {"modern": "legal", "vintage": "legal"}},
+        {"oracle_id": "oracle-lotus", "color_identity": [], "legalities": {"vintage": "restricted", "modern": "not_legal"}},
+    ]
+    monkeypatch.setattr(legality_service.sc, "get_all_prints", lambda: catalog)
+    monkeypatch.setattr(legality_service.sc, "cache_epoch", lambda: 7)
+
+    def fail_lookup(*_args, **_kwargs):
+        raise AssertionError("indexed cards must not need a print lookup")
+
+    monkeypatch.setattr(legality_service, "_lookup_print_data", fail_lookup)
+    with app.app_context():
+        folder = create_folder(name="Indexed")
+        for name, oracle_id in (("Lightning Bolt", "oracle-bolt"), ("Black Lotus", "oracle-lotus")):
+            card = create_card(folder=folder, name=name, oracle_id=oracle_id, set_code="lea", collector_number="1")
+            card.type_line = "Instant"
+        db.session.commit()
+        reports = {report.format_key: report for report in legality_service.evaluate_folder_legality_all(folder)}
+
+    assert not any(i.code == "card_not_legal" for i in reports["vintage"].issues)
+    banned = [i.card_name for i in reports["modern"].issues if i.code == "card_not_legal"]
+    assert banned == ["Black Lotus"]
+    legality_service._legality_index.cache_clear()
@@ -1,9 +1,26 @@
 from core.domains.cards.services import list_checker_scryfall_service
 from core.domains.cards.services import scryfall_cache
+from shared.mtg import _normalize_name
+
+
+def _patch_catalog(monkeypatch, prints, epoch=777):
+    calls = []
+
+    def _all_prints():
+        calls.append(1)
+        return prints
+
+    monkeypatch.setattr(scryfall_cache, "ensure_cache_loaded", lambda: True)
+    monkeypatch.setattr(scryfall_cache, "get_all_prints", _all_prints)
+    monkeypatch.setattr(scryfall_cache, "cache_epoch", lambda: epoch)
+    list_checker_scryfall_service._lookup_index.cache_clear()
+    return calls
 
 
 def test_build_scryfall_lookup_maps_prefers_english_and_indexes_faces(monkeypatch):
     monkeypatch.setattr(scryfall_cache, "ensure_cache_loaded", lambda: True)
+    monkeypatch.setattr(scryfall_cache, "cache_epoch", lambda: 777)
+    list_checker_scryfall_service._lookup_index.cache_clear()
     monkeypatch.setattr(
         scryfall_cache,
         "get_all_prints",
@@ -36,3 +53,57 @@ def test_build_scryfall_lookup_maps_prefers_english_and_indexes_faces(monkeypatc
     assert face_to_sid["tear"][0] == "en-print"
     assert name_to_meta["wear // tear"]["lang"] == "en"
     assert face_to_meta["wear"]["type"] == "Instant"
+
+
+def _synthetic_catalog(card_count=6000, prints_per_card=4):
+    prints = []
+    for idx in range(card_count):
+        name = f"Card {idx} // Back {idx}" if idx % 10 == 0 else f"Card {idx}"
+        for copy in range(prints_per_card):
+            prints.append(
+                {
+                    "id": f"print-{idx}-{copy}",
+                    "name": name,
+                    "lang": "ja" if copy == 0 else "en",
+                    "oracle_id": f"oid-{idx}",
+                    "rarity": ("common", "uncommon", "rare", "mythic")[idx % 4],
+                    "color_identity": [("W", "U", "B", "R", "G")[idx % 5]],
+                    "type_line": "Creature — Goblin",
+                }
+            )
+    return prints
+
+
+def test_lookup_index_is_built_once_per_epoch(monkeypatch):
+    calls = _patch_catalog(monkeypatch, _synthetic_catalog(card_count=50))
+
+    first = list_checker_scryfall_service.lookup_cards(["card 3", "back 10", "nope"])
+    list_checker_scryfall_service.build_scryfall_lookup_maps(["card 4"])
+    assert len(calls) == 1
+    assert set(first) == {"card 3", "back 10"}
+    assert first["card 3"].sid == "print-3-1"  # first English print beats the earlier Japanese one
+    assert first["back 10"].rarity == "Rare" and first["back 10"].type == "Creature"
+
+    # Only the requested keys are materialized for a list check.
+    name_to_sid, face_to_sid, _name_meta, face_to_meta = list_checker_scryfall_service.build_scryfall_lookup_maps(
+        ["card 7", "card 10"]
+    )
+    assert set(name_to_sid) == {"card 7"} and set(face_to_sid) == {"card 10"}
+    assert face_to_meta["card 10"]["color_identity"] == "W"
+
+    monkeypatch.setattr(scryfall_cache, "cache_epoch", lambda: 778)
+    list_checker_scryfall_service.lookup_cards(["card 3"])
+    assert len(calls) == 2
+
+
+def test_100_line_list_lookups_reuse_the_index(monkeypatch):
+    """A 100-line list resolves from the cached index, not by rescanning the catalog."""
+    calls = _patch_catalog(monkeypatch, _synthetic_catalog())
+    pasted = [_normalize_name(f"Card {idx * 37 % 6000}") for idx in range(100)]
+
+    list_checker_scryfall_service.lookup_cards(pasted)
+    for _ in range(20):
+        maps = list_checker_scryfall_service.build_scryfall_lookup_maps(pasted)
+
+    assert len(calls) == 1
+    assert len(set(maps[0]) | set(maps[1])) == 100
@@ -0,0 +1,93 @@
+"""Tests for the Monte Carlo mana-consistency simulator."""
+
+from __future__ import annotations
+
+from math import comb
+
+import numpy as np
+import pytest
+
+from core.domains.decks.services import deck_analytics, mana_simulation_service
+from core.domains.decks.services.mana_simulation_service import SimulationParams
+from extensions import db
+from tests.factories import create_card, create_folder
+
+
+def _deck(lands: int, spells: int, *, land_mask: int = 1):
+    return (
+        np.array([spells, lands]),
+        np.array([False, True]),
+        np.array([0, land_mask]),
+    )
+
+
+def test_keepable_rate_matches_hypergeometric():
+    counts, is_land, masks = _deck(lands=38, spells=61)
+    report = mana_simulation_service.simulate_deck(
+        counts,
+        is_land,
+        masks,
+        params=SimulationParams(iterations=50_000, min_lands=2, max_lands=5),
+        colors=["W"],
+        seed=7,
+    )
+    expected = sum(comb(38, k) * comb(61, 7 - k) for k in range(2, 6)) / comb(99, 7)
+    assert report["keepable_7_rate"] == pytest.approx(expected, abs=0.01)
+    assert report["mulligan_rates"]["0"] == report["keepable_7_rate"]
+    assert report["library_size"] == 99 and report["land_count"] == 38
+    assert len(report["land_drops"]) == 7
+    # Every land makes W, so W availability by turn N is "saw at least one land".
+    assert report["color_sources"]["W"][0] >= report["land_drops"][0]["probability"]
+
+
+def test_london_mulligan_bottoms_cards_and_is_reproducible():
+    counts, is_land, masks = _deck(lands=10, spells=89)
+    params = SimulationParams(iterations=5_000, min_lands=3, max_lands=5, max_mulligans=2)
+    first = mana_simulation_service.simulate_deck(counts, is_land, masks, params=params, colors=["W"], seed=3)
+    again = mana_simulation_service.simulate_deck(counts, is_land, masks, params=params, colors=["W"], seed=3)
+    assert first == again
+
+    rates = first["mulligan_rates"]
+    assert set(rates) == {"0", "1", "2"}
+    assert sum(rates.values()) == pytest.approx(1.0, abs=0.001)
+    # A land-light deck mulligans a lot, and each mulligan bottoms a card.
+    assert rates["2"] > 0.5
+    assert first["average_hand_size"] < 6
+
+    free = mana_simulation_service.simulate_deck(
+        counts, is_land, masks, params=SimulationParams(**{**first["params"], "free_mulligan": True}), colors=["W"], seed=3
+    )
+    assert free["average_hand_size"] > first["average_hand_size"]
+
+
+def test_all_land_deck_hits_every_drop():
+    counts, is_land, masks = _deck(lands=60, spells=0, land_mask=0b10)
+    report = mana_simulation_service.simulate_deck(
+        counts, is_land, masks, params=SimulationParams(iterations=1_000, on_play=False), colors=["U"]
+    )
+    assert report["keepable_7_rate"] == 0.0
+    assert all(row["probability"] == 1.0 for row in report["land_drops"])
+    assert report["color_sources"]["U"] == [1.0] * 7
+
+
+def test_simulate_folder_excludes_commander_and_caches(app, db_session, monkeypatch):
+    monkeypatch.setattr(deck_analytics, "_current_table", lambda load_cache: deck_analytics._EMPTY_TABLE)
+    with app.app_context():
+        folder = create_folder(name="Mono-Blue")
+        folder.commander_oracle_id = "cmdr-oracle"
+        commander = create_card(folder=folder, name="Commander", collector_number="1", oracle_id="cmdr-oracle")
+        commander.type_line = "Legendary Creature — Merfolk"
+        island = create_card(folder=folder, name="Island", collector_number="2", quantity=36)
+        island.type_line = "Basic Land — Island"
+        spell = create_card(folder=folder, name="Brainstorm", collector_number="3", quantity=63)
+        spell.type_line = "Instant"
+        spell.faces_json = [{"mana_cost": "{U}"}]
+        db.session.commit()
+
+        report = mana_simulation_service.simulate_folder(folder, SimulationParams(iterations=2_000))
+        cached = mana_simulation_service.simulate_folder(folder, SimulationParams(iterations=2_000))
+
+    assert report["library_size"] == 99
+    assert report["land_count"] == 36
+    assert list(report["color_sources"]) == ["U"]
+    assert cached == report
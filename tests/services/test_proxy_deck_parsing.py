@@ -1,7 +1,12 @@
+from types import SimpleNamespace
+
+from core.domains.decks.services import proxy_decks
 from core.domains.decks.services.proxy_decks import (
     fetch_goldfish_deck,
     _normalize_goldfish_url,
 )
+from extensions import cache
+from shared.cache import http_cache
 
 
 def test_normalize_goldfish_url_removes_fragment_and_defaults():
@@ -19,7 +24,7 @@ def test_fetch_goldfish_deck_rejects_untrusted_host(monkeypatch):
     def _should_not_be_called(*args, **kwargs):  # pragma: no cover - defensive
         raise AssertionError("External request attempted for hostile host")
 
-    monkeypatch.setattr("core.domains.decks.services.proxy_decks.requests.get", _should_not_be_called)
+    monkeypatch.setattr("core.domains.decks.services.proxy_decks.cached_get", _should_not_be_called)
 
     deck_name, owner, commander, lines, errors = fetch_goldfish_deck("https://example.com/deck/123")
 
@@ -34,9 +39,83 @@ def test_fetch_goldfish_deck_rejects_untrusted_port(monkeypatch):
     def _should_not_be_called(*args, **kwargs):  # pragma: no cover - defensive
         raise AssertionError("External request attempted for hostile port")
 
-    monkeypatch.setattr("core.domains.decks.services.proxy_decks.requests.get", _should_not_be_called)
+    monkeypatch.setattr("core.domains.decks.services.proxy_decks.cached_get", _should_not_be_called)
 
     _, _, _, lines, errors = fetch_goldfish_deck("https://www.mtggoldfish.com:444/deck/123")
 
     assert lines == []
     assert errors and "mtggoldfish" in errors[0].lower()
+
+
+def _patch_catalog(monkeypatch, epoch):
+    calls = {"names": [], "prints": []}
+    oracles = {"solring": "oracle-sol", "arcanesignet": "oracle-signet", "fireice": "oracle-fire-ice"}
+
+    def unique_oracle(name):
+        calls["names"].append(name)
+        return oracles.get(name.replace(" ", "").replace("/", "").lower())
+
+    def prints(oracle_id):
+        calls["prints"].append(oracle_id)
+        return [
+            {"name": oracle_id, "oracle_id": oracle_id, "set": "sld", "collector_number": "1", "lang": "en", "digital": True},
+            {"name": oracle_id, "oracle_id": oracle_id, "set": "cmm", "collector_number": "2", "lang": "en"},
+        ]
+
+    monkeypatch.setattr(proxy_decks, "ensure_cache_loaded", lambda: True)
+    monkeypatch.setattr(proxy_decks.sc, "cache_epoch", lambda: epoch)
+    monkeypatch.setattr(proxy_decks, "unique_oracle_by_name", unique_oracle)
+    monkeypatch.setattr(proxy_decks, "prints_for_oracle", prints)
+    proxy_decks._resolution_map.cache_clear()
+    return calls
+
+
+def test_resolve_proxy_cards_dedupes_and_memoizes_names(monkeypatch):
+    calls = _patch_catalog(monkeypatch, epoch=301)
+    lines = ["1 Sol Ring", "1 sol ring", "2x Arcane Signet", "Fire // Ice", "1 Missing Card"]
+
+    cards, errors = proxy_decks.resolve_proxy_cards(lines)
+
+    assert errors == []
+    assert [(card.name, card.quantity, card.set_code) for card in cards] == [
+        ("oracle-sol", 1, "CMM"),
+        ("oracle-sol", 1, "CMM"),
+        ("oracle-signet", 2, "CMM"),
+        ("oracle-fire-ice", 1, "CMM"),
+        ("Missing Card", 1, "CSTM"),
+    ]
+    assert calls["names"] == ["solring", "arcanesignet", "Fire // Ice", "missingcard"]
+    assert calls["prints"] == ["oracle-sol", "oracle-signet", "oracle-fire-ice"]
+
+    proxy_decks.resolve_proxy_cards(["3 SOL RING", "1 Missing Card", "Fire // Ice"])
+    # Misses are looked up again rather than memoized, so pasted junk cannot grow the map.
+    assert calls["names"][4:] == ["missingcard", "Fire // Ice"]
+    assert set(proxy_decks._resolution_map(301)) == {"solring", "arcanesignet"}
+    proxy_decks._resolution_map.cache_clear()
+
+
+def test_cached_get_serves_fresh_entries_and_revalidates(app, monkeypatch):
+    requests_seen = []
+    responses = [
+        SimpleNamespace(status_code=200, text="1 Sol Ring", headers={"ETag": '"v1"'}),
+        SimpleNamespace(status_code=304, text="", headers={}),
+    ]
+
+    def fake_get(url, timeout=None, headers=None):
+        requests_seen.append(dict(headers or {}))
+        return responses.pop(0)
+
+    monkeypatch.setattr(http_cache, "safe_get", fake_get)
+    url = "https://www.mtggoldfish.com/deck/download/42"
+    with app.app_context():
+        cache.delete(http_cache._cache_key(url))
+        first = http_cache.cached_get(url, fresh_for=60)
+        second = http_cache.cached_get(url, fresh_for=60)
+        revalidated = http_cache.cached_get(url, fresh_for=0)
+        cache.delete(http_cache._cache_key(url))
+
+    assert (first.text, first.from_cache) == ("1 Sol Ring", False)
+    assert (second.text, second.from_cache) == ("1 Sol Ring", True)
+    assert revalidated.text == "1 Sol Ring" and revalidated.status_code == 200
+    assert len(requests_seen) == 2
+    assert requests_seen[1]["If-None-Match"] == '"v1"'
@@ -2,12 +2,21 @@
 
 from __future__ import annotations
 
+import re
+
 from core.domains.decks.services.proxy_pdf_service import (
     ProxySlot,
+    iter_proxy_pdf,
     render_proxy_pdf,
 )
 
 
+def _tiny_jpeg(width: int, height: int) -> bytes:
+    """SOI + a baseline SOF0 header + EOI: enough for the header parser."""
+    sof = b"\x08" + height.to_bytes(2, "big") + width.to_bytes(2, "big") + b"\x03" + b"\x01\x22\x00" * 3
+    return b"\xff\xd8\xff\xe0\x00\x04JF\xff\xc0" + (len(sof) + 2).to_bytes(2, "big") + sof + b"\xff\xd9"
+
+
 def test_render_proxy_pdf_emits_valid_pdf_header():
     slots = [(ProxySlot(name="Sol Ring", set_code="c20", collector_number="278"), 1)]
     pdf = render_proxy_pdf(slots, title="Test Deck")
@@ -39,5 +48,43 @@ def test_render_proxy_pdf_escapes_special_characters():
 def test_render_proxy_pdf_quantity_expands_into_multiple_slots():
     slots = [(ProxySlot(name="Plains"), 4)]
     pdf = render_proxy_pdf(slots)
-    # "Plains" should appear four times in content streams.
-    assert pdf.count(b"(Plains)") == 4
+    # One shared card form, drawn four times.
+    assert pdf.count(b"(Plains)") == 1
+    assert pdf.count(b"/C1 Do Q") == 4
+
+
+def test_iter_proxy_pdf_xref_offsets_point_at_objects():
+    slots = [(ProxySlot(name=f"Card {i % 4}", set_code="m21"), 3) for i in range(8)]
+    chunks = list(iter_proxy_pdf(slots, title="Stream"))
+    assert len(chunks) > 10
+    pdf = b"".join(chunks)
+    startxref = int(pdf.rsplit(b"startxref\n", 1)[1].split(b"\n", 1)[0])
+    assert pdf[startxref:].startswith(b"xref\n")
+    size = int(re.search(rb"/Size (\d+)", pdf).group(1))
+    entries = pdf[startxref:].split(b"\n")[3 : 3 + size - 1]
+    for object_id, entry in enumerate(entries, start=1):
+        offset = int(entry[:10])
+        assert pdf[offset:].startswith(b"%d 0 obj\n" % object_id)
+    # 24 copies of 4 distinct cards over 3 pages: one form per card.
+    assert pdf.count(b"/Subtype /Form") == 4
+    assert pdf.count(b"/Type /Page ") == 3
+
+
+def test_render_proxy_pdf_embeds_each_image_once(tmp_path):
+    art = tmp_path / "bolt.jpg"
+    art.write_bytes(_tiny_jpeg(488, 680))
+    slots = [
+        (ProxySlot(name="Lightning Bolt", set_code="m11"), 4),
+        (ProxySlot(name="Lightning Bolt", set_code="2xm"), 8),
+        (ProxySlot(name="Mountain"), 12),
+    ]
+
+    def image_for(slot):
+        return art if slot.name == "Lightning Bolt" else None
+
+    pdf = render_proxy_pdf(slots, image_for=image_for)
+    assert pdf.count(b"/Subtype /Image") == 1
+    assert b"/Width 488 /Height 680 /ColorSpace /DeviceRGB" in pdf
+    assert pdf.count(b"/Subtype /Form") == 3
+    assert pdf.count(b"(Mountain)") == 1
+    assert pdf.count(b"(Lightning Bolt)") == 0
@@ -0,0 +1,61 @@
+"""Tests for per-request SQL statement stats and query budgets."""
+
+from __future__ import annotations
+
+import pytest
+
+from extensions import db
+from models import Folder
+from shared.database import query_stats
+from shared.database.query_stats import QueryBudgetExceeded, collect_queries, fingerprint
+
+
+def _login(client, identifier, password):
+    return client.post("/login", data={"identifier": identifier, "password": password}, follow_redirects=True)
+
+
+def test_fingerprint_collapses_literals_and_in_lists():
+    assert fingerprint("SELECT * FROM folder WHERE id = 12") == fingerprint("SELECT *  FROM folder\nWHERE id = 7")
+    assert fingerprint("SELECT name FROM card WHERE name = 'Bolt'") == "SELECT name FROM card WHERE name = ?"
+    assert fingerprint("SELECT id FROM card WHERE id IN (?, ?, ?)") == fingerprint("SELECT id FROM card WHERE id IN (?)")
+
+
+def test_collect_queries_flags_repeated_statements_and_enforces_budget(app, db_session):
+    with app.app_context():
+        folders = [Folder(name=f"Deck {idx}", category=Folder.CATEGORY_DECK) for idx in range(12)]
+        db.session.add_all(folders)
+        db.session.commit()
+        ids = [folder.id for folder in folders]
+
+        with collect_queries() as stats:
+            for folder_id in ids:
+                db.session.get(Folder, folder_id, populate_existing=True)
+        assert stats.count == 12
+        (repeated_fp, repeated_count), = stats.repeated(10)
+        assert repeated_count == 12 and "FROM folder" in repeated_fp
+        assert stats.as_dict()["suspected_n_plus_one"][0]["count"] == 12
+
+        with pytest.raises(QueryBudgetExceeded):
+            with collect_queries(max_queries=2):
+                for folder_id in ids[:3]:
+                    db.session.get(Folder, folder_id, populate_existing=True)
+
+
+def test_requests_report_server_timing_and_route_stats(app, client, create_user, monkeypatch):
+    query_stats.reset_route_query_stats()
+    user, password = create_user(email="stats@example.com", username="stats")
+    _login(client, user.email, password)
+
+    response = client.get("/observability/health")
+    assert response.status_code == 200
+    assert response.headers["Server-Timing"].startswith("db;dur=")
+    assert "queries" in response.headers["Server-Timing"]
+
+    routes = client.get("/observability/queries").get_json()["routes"]
+    assert routes["observability.health"]["requests"] == 1
+    assert routes["observability.health"]["max_queries"] >= 1
+
+    monkeypatch.setitem(app.config, "QUERY_BUDGETS", "observability.health=0")
+    monkeypatch.setitem(app.config, "QUERY_BUDGET_STRICT", True)
+    with pytest.raises(QueryBudgetExceeded):
+        client.get("/observability/health")
@@ -0,0 +1,107 @@
+"""Tests for single-flight cache_fetch and collection generation keys."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+from flask_login import login_user
+
+from core.domains.cards.services.collection_facets_service import card_browser_facets
+from extensions import db
+from models import Card, Folder, UserFriend
+from shared.cache import runtime_cache
+
+
+def _add_card(folder_id, name, set_code):
+    db.session.add(Card(name=name, set_code=set_code, collector_number="1", folder_id=folder_id, quantity=1, lang="en"))
+    db.session.commit()
+
+
+def test_cache_fetch_computes_a_missing_key_once_under_concurrency(app):
+    calls = []
+    results = []
+
+    def factory():
+        calls.append(1)
+        time.sleep(0.1)
+        return {"value": 42}
+
+    def worker():
+        with app.app_context():
+            results.append(runtime_cache.cache_fetch("single-flight-test", 60, factory))
+
+    threads = [threading.Thread(target=worker) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert results == [{"value": 42}] * 6
+    assert runtime_cache._inflight == {}
+
+
+def test_collection_generation_tracks_visible_owners_only(app, create_user):
+    viewer, _ = create_user(email="gen-viewer@example.com", username="genviewer")
+    friend, _ = create_user(email="gen-friend@example.com", username="genfriend")
+    stranger, _ = create_user(email="gen-stranger@example.com", username="genstranger")
+    with app.app_context():
+        folders = {}
+        for user in (viewer, friend, stranger):
+            folder = Folder(name=f"{user.username} deck", category=Folder.CATEGORY_DECK, owner_user_id=user.id)
+            db.session.add(folder)
+            db.session.flush()
+            folders[user.id] = folder.id
+        db.session.add(UserFriend(user_id=viewer.id, friend_user_id=friend.id))
+        db.session.commit()
+
+        token = runtime_cache.collection_generation(viewer.id)
+        _add_card(folders[stranger.id], "Stranger Card", "aaa")
+        assert runtime_cache.collection_generation(viewer.id) == token
+
+        _add_card(folders[friend.id], "Friend Card", "bbb")
+        after_friend = runtime_cache.collection_generation(viewer.id)
+        assert after_friend != token
+
+        _add_card(folders[viewer.id], "Own Card", "ccc")
+        assert runtime_cache.collection_generation(viewer.id) != after_friend
+
+
+def test_facets_reflect_new_cards_without_waiting_for_ttl(app, create_user):
+    user, _ = create_user(email="facets@example.com", username="facetsuser")
+    with app.app_context():
+        folder = Folder(name="Facet Deck", category=Folder.CATEGORY_DECK, owner_user_id=user.id)
+        db.session.add(folder)
+        db.session.commit()
+        _add_card(folder.id, "First", "one")
+        folder_id = folder.id
+
+    with app.test_request_context("/"):
+        login_user(user)
+        sets, _, _ = card_browser_facets()
+        assert sets == ["one"]
+        assert card_browser_facets()[0] == ["one"]
+        _add_card(folder_id, "Second", "two")
+        assert card_browser_facets()[0] == ["one", "two"]
+
+
+def test_valuation_refresh_only_invalidates_the_priced_owners(app, create_user, monkeypatch):
+    from core.domains.cards.services import card_valuation_service
+
+    owner, _ = create_user(email="gen-priced@example.com", username="genpriced")
+    other, _ = create_user(email="gen-other@example.com", username="genother")
+    monkeypatch.setattr(card_valuation_service.sc, "cache_ready", lambda: True)
+    monkeypatch.setattr(card_valuation_service, "_bulk_print_lookup", lambda cards: {})
+    with app.app_context():
+        folder = Folder(name="Priced Deck", category=Folder.CATEGORY_DECK, owner_user_id=owner.id)
+        db.session.add(folder)
+        db.session.commit()
+        _add_card(folder.id, "Priced Card", "prc")
+
+        owner_token = runtime_cache.collection_generation(owner.id)
+        other_token = runtime_cache.collection_generation(other.id)
+        assert card_valuation_service.refresh_card_valuations(folder_ids=[folder.id]) == 1
+
+        assert runtime_cache.collection_generation(other.id) == other_token
+        assert runtime_cache.collection_generation(owner.id) != owner_token
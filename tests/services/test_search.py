@@ -0,0 +1,34 @@
+"""Tests for the dialect-aware search predicates."""
+
+from __future__ import annotations
+
+from sqlalchemy.dialects import postgresql, sqlite
+
+from models import Card
+from models.role import OracleCoreRoleTag
+from shared.database import search
+
+
+def _sql(clause, dialect):
+    return str(clause.compile(dialect=dialect, compile_kwargs={"literal_binds": True}))
+
+
+def test_ilike_any_keeps_bare_columns_for_trigram_indexes():
+    pg = _sql(search.ilike_any(Card.type_line, ["druid%", "% druid%"]), postgresql.dialect())
+    assert pg == "cards.type_line ILIKE 'druid%%' OR cards.type_line ILIKE '%% druid%%'"
+    tag = _sql(search.ilike_any(OracleCoreRoleTag.role, ["ramp%"]), postgresql.dialect())
+    assert "lower(" not in tag
+    # SQLite keeps its case-insensitive lower() LIKE form.
+    assert "lower(cards.type_line) LIKE lower(" in _sql(search.ilike_any(Card.type_line, ["druid%"]), sqlite.dialect())
+
+
+def test_notes_match_uses_tsvector_only_when_available(app, monkeypatch):
+    with app.app_context():
+        assert search.notes_match("craterhoof") is None
+
+        monkeypatch.setattr(search, "notes_tsvector_available", lambda: True)
+        clause = search.notes_match("craterhoof win")
+        compiled = clause.compile(dialect=postgresql.dialect())
+        assert "game_sessions.notes_tsv @@ plainto_tsquery('simple', %(notes_query)s)" in str(compiled)
+        assert compiled.params == {"notes_query": "craterhoof win"}
+        assert search.notes_match("") is None
@@ -0,0 +1,58 @@
+"""Tests for the precompiled mana-symbol renderer."""
+
+from __future__ import annotations
+
+import pytest
+
+from core.shared.utils import symbols_cache
+
+_SYMBOLS = {
+    "{W}": {"symbol": "{W}", "svg_uri": "https://svgs.scryfall.io/card-symbols/W.svg"},
+    "{2/U}": {"symbol": "{2/U}", "svg_uri": "https://svgs.scryfall.io/card-symbols/2U.svg"},
+    "{T}": {"symbol": "{T}", "svg_uri": "https://svgs.scryfall.io/card-symbols/T.svg"},
+}
+
+
+@pytest.fixture
+def symbols(monkeypatch):
+    for name in ("_SYMBOL_MAP", "_SRC_MAP_LOCAL", "_SRC_MAP_REMOTE", "_HTML_TABLES"):
+        monkeypatch.setattr(symbols_cache, name, getattr(symbols_cache, name))
+    symbols_cache._install_symbol_map(dict(_SYMBOLS))
+    yield
+    symbols_cache._render_cached.cache_clear()
+
+
+def test_render_matches_img_markup_and_escapes_text(symbols):
+    html = str(symbols_cache.render_oracle_html("{T}: Add {W}.\n<b>{Q}</b> & {2/U}", use_local=False))
+    assert html == (
+        '<img class="mana" src="https://svgs.scryfall.io/card-symbols/T.svg" alt="{T}" title="{T}">'
+        ': Add <img class="mana" src="https://svgs.scryfall.io/card-symbols/W.svg" alt="{W}" title="{W}">.'
+        "<br>&lt;b&gt;{Q}&lt;/b&gt; &amp; "
+        '<img class="mana" src="https://svgs.scryfall.io/card-symbols/2U.svg" alt="{2/U}" title="{2/U}">'
+    )
+    assert str(symbols_cache.render_mana_html("{W}{W}", use_local=True)).count('src="/static/symbols/W.svg"') == 2
+    assert str(symbols_cache.render_mana_html("line\nbreak")) == "line\nbreak"
+    assert symbols_cache.render_mana_html("") == "—"
+
+
+def test_render_is_memoized_per_text_and_source(symbols):
+    symbols_cache.render_oracle_html("Flying\n{W}", use_local=True)
+    symbols_cache.render_oracle_html("Flying\n{W}", use_local=True)
+    symbols_cache.render_oracle_html("Flying\n{W}", use_local=False)
+    info = symbols_cache._render_cached.cache_info()
+    assert (info.hits, info.currsize) == (1, 2)
+
+    symbols_cache._install_symbol_map({})
+    assert symbols_cache._render_cached.cache_info().currsize == 0
+    assert str(symbols_cache.render_oracle_html("Flying\n{W}")) == "Flying<br>{W}"
+
+
+def test_render_helpers_use_remote_or_local_symbols(app, symbols):
+    with app.test_request_context("/"):
+        cost = str(symbols_cache.render_mana_html("{T}", use_local=False))
+        text = str(symbols_cache.render_oracle_html("a\nb"))
+    assert cost.startswith('<img class="mana" src="https://svgs.scryfall.io/card-symbols/T.svg"')
+    assert text == "a<br>b"
+
+    stats = symbols_cache.benchmark_render(["{T}: Add {W}.", "Vigilance", ""], rounds=2)
+    assert stats["texts"] == 2 and stats["cache_entries"] == 2
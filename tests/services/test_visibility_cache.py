@@ -0,0 +1,95 @@
+"""Tests for the cached per-user visible-folder id sets."""
+
+from __future__ import annotations
+
+from extensions import db
+from models import Card, Folder, FolderShare, UserFriend
+from shared.cache import visibility_cache
+from shared.database.query_stats import collect_queries
+
+
+def _login(client, identifier, password):
+    return client.post("/login", data={"identifier": identifier, "password": password}, follow_redirects=True)
+
+
+def _folder(owner, name, **kwargs):
+    folder = Folder(name=name, category=Folder.CATEGORY_DECK, owner_user_id=owner.id, **kwargs)
+    db.session.add(folder)
+    db.session.flush()
+    db.session.add(Card(name=f"{name} Card", set_code="TST", collector_number="1", folder_id=folder.id, quantity=1, lang="en"))
+    return folder
+
+
+def test_cached_set_follows_share_friend_and_public_changes(app, create_user):
+    owner, _ = create_user(email="vis-owner@example.com", username="visowner")
+    viewer, _ = create_user(email="vis-viewer@example.com", username="visviewer")
+    with app.app_context():
+        own = _folder(viewer, "Mine")
+        shared = _folder(owner, "Shared")
+        friends_only = _folder(owner, "Friends")
+        flip = _folder(owner, "Flip")
+        db.session.commit()
+
+        assert visibility_cache.visible_folder_ids(viewer.id) == {own.id}
+        # Served from the shared cache until something relevant commits.
+        assert visibility_cache.visible_folder_ids(viewer.id) == {own.id}
+
+        db.session.add(FolderShare(folder_id=shared.id, shared_user_id=viewer.id))
+        db.session.commit()
+        assert visibility_cache.visible_folder_ids(viewer.id) == {own.id, shared.id}
+
+        db.session.add(UserFriend(user_id=viewer.id, friend_user_id=owner.id))
+        db.session.commit()
+        assert visibility_cache.visible_folder_ids(viewer.id) == {own.id, shared.id, friends_only.id, flip.id}
+
+        UserFriend.query.filter_by(user_id=viewer.id).delete(synchronize_session=False)
+        flip.is_public = True
+        db.session.commit()
+        assert visibility_cache.visible_folder_ids(viewer.id) == {own.id, shared.id, flip.id}
+
+        stats = visibility_cache.benchmark_visibility(viewer.id, rounds=1, synthetic_cards=50)
+        assert stats["counts_match"] and stats["visible_cards"] == 53
+        assert Card.query.filter(Card.set_code == "bch").count() == 0
+
+
+def test_request_filter_uses_id_set_instead_of_exists(app, client, create_user):
+    owner, _ = create_user(email="vis-a@example.com", username="visa")
+    viewer, password = create_user(email="vis-b@example.com", username="visb")
+    with app.app_context():
+        hidden = _folder(owner, "Hidden")
+        public = _folder(owner, "Open", is_public=True)
+        db.session.commit()
+        hidden_id, public_id = hidden.id, public.id
+    _login(client, viewer.email, password)
+
+    with app.test_request_context("/"):
+        from flask import g
+
+        g._visibility_user_id = viewer.id
+        with collect_queries() as stats:
+            names = {card.name for card in Card.query.all()}
+            folder_ids = {folder.id for folder in Folder.query.all()}
+    assert names == {"Open Card"}
+    assert public_id in folder_ids and hidden_id not in folder_ids
+    assert not any("EXISTS" in fp.upper() for fp in stats.fingerprints)
+
+
+def test_folder_flushed_mid_request_is_visible_to_later_queries(app, create_user):
+    user, _ = create_user(email="vis-flush@example.com", username="visflush")
+    with app.test_request_context("/"):
+        from flask import g
+
+        g._visibility_user_id = user.id
+        existing = _folder(user, "Existing")
+        db.session.commit()
+        assert {folder.id for folder in Folder.query.all()} == {existing.id}
+
+        created = Folder(name="Created Mid-Request", category=Folder.CATEGORY_DECK, owner_user_id=user.id)
+        db.session.add(created)
+        db.session.flush()
+        assert Folder.query.filter_by(name="Created Mid-Request").one().id == created.id
+
+        db.session.rollback()
+        assert {folder.id for folder in Folder.query.all()} == {existing.id}
+        # Nothing computed from the rolled-back flush leaked into the shared cache.
+        assert visibility_cache.visible_folder_ids(user.id) == {existing.id}
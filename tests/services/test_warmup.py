@@ -0,0 +1,78 @@
+"""Tests for the deferred startup warmup and component readiness."""
+
+from __future__ import annotations
+
+import threading
+
+from markupsafe import Markup
+
+from core.domains.cards.services import scryfall_cache as sc
+from core.shared.utils import symbols_cache
+from shared import warmup
+
+
+def test_background_warmup_gates_readyz_until_components_load(app, client, monkeypatch):
+    release = threading.Event()
+    loaded = []
+
+    def slow_loader():
+        release.wait(5)
+        loaded.append(True)
+        return True
+
+    monkeypatch.setattr(warmup, "COMPONENTS", {"slow": (slow_loader, lambda: bool(loaded))})
+    monkeypatch.setitem(app.config, "STARTUP_WARMUP", "background")
+
+    thread = warmup.start_warmup(app)
+    try:
+        assert warmup.wait_for("slow", timeout=0.01) is False
+        response = client.get("/readyz")
+        assert response.status_code == 503
+        assert response.get_json()["components"]["slow"]["state"] == warmup.LOADING
+    finally:
+        release.set()
+        thread.join(5)
+
+    assert warmup.wait_for("slow", timeout=0.01) is True
+    response = client.get("/readyz")
+    payload = response.get_json()
+    assert response.status_code == 200
+    assert payload["status"] == "ok" and payload["degraded"] == []
+    assert payload["components"]["slow"]["state"] == warmup.READY
+
+
+def test_entry_points_degrade_while_another_thread_loads(app, monkeypatch):
+    claimed, release = threading.Event(), threading.Event()
+
+    def loader():
+        warmup._set_state("symbols", warmup.LOADING)
+        warmup._set_state("scryfall_cache", warmup.LOADING)
+        claimed.set()
+        release.wait(5)
+        warmup._set_state("symbols", warmup.READY)
+        warmup._set_state("scryfall_cache", warmup.READY)
+
+    monkeypatch.setattr(symbols_cache, "_SYMBOL_MAP", None)
+    monkeypatch.setattr(sc, "_cache_loaded", False)
+    monkeypatch.setitem(app.config, "WARMUP_WAIT_SECONDS", 0.01)
+    thread = threading.Thread(target=loader)
+    thread.start()
+    claimed.wait(5)
+    try:
+        with app.test_request_context("/"):
+            assert symbols_cache.render_oracle_html("{T}: Add {G}.\nDraw") == Markup("{T}: Add {G}.<br>Draw")
+            assert sc.ensure_cache_loaded() is False
+    finally:
+        release.set()
+        thread.join(5)
+    assert symbols_cache._SYMBOL_MAP is None
+
+
+def test_unset_mode_starts_no_warmup_thread(app, monkeypatch):
+    calls = []
+    monkeypatch.setattr(warmup, "COMPONENTS", {"slow": (lambda: calls.append(1) or True, lambda: False)})
+    monkeypatch.delitem(app.config, "STARTUP_WARMUP", raising=False)
+
+    assert warmup.start_warmup(app) is None
+    assert calls == []
+    assert not any(thread.name == "dv-warmup" for thread in threading.enumerate())
@@ -1,4 +1,5 @@
 from models import Card, Folder, db
+from shared.cache.visibility_cache import invalidate_visible_folder_ids
 
 
 def _login(client, email, password):
@@ -32,3 +33,32 @@ def test_manual_import_creates_cards(client, create_user, app):
         card = Card.query.filter_by(folder_id=folder.id, name="Manual Test Card").first()
         assert card is not None
         assert card.quantity == 2
+
+
+def test_manual_import_reuses_folder_created_earlier_in_the_request(client, create_user, app):
+    user, password = create_user(email="manual-two@example.com", username="manualtwo")
+    with app.app_context():
+        # Ids restart with each test database; drop sets cached by earlier tests.
+        invalidate_visible_folder_ids()
+    _login(client, user.email, password)
+
+    payload = {"action": "import", "entry_ids": "0,1"}
+    for idx, (name, number) in enumerate((("First Card", "001"), ("Second Card", "002"))):
+        payload.update(
+            {
+                f"entry-{idx}-name": name,
+                f"entry-{idx}-quantity": "1",
+                f"entry-{idx}-printing": f"TST::{number}::EN",
+                f"entry-{idx}-finish": "nonfoil",
+                f"entry-{idx}-folder_name": "Shared New Folder",
+            }
+        )
+
+    resp = client.post("/import/manual", data=payload)
+    assert resp.status_code == 302
+
+    with app.app_context():
+        folders = Folder.query.filter_by(name="Shared New Folder", owner_user_id=user.id).all()
+        assert len(folders) == 1
+        names = {card.name for card in Card.query.filter_by(folder_id=folders[0].id)}
+        assert names == {"First Card", "Second Card"}